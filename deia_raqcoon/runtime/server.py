@@ -42,6 +42,7 @@ async def startup_event():
 async def shutdown_event():
     """Clean up background services on server shutdown."""
     stop_minder_thread()
+    _message_store.close()
 
 
 _message_store = MessageStore()
@@ -297,8 +298,24 @@ async def post_message(request: MessageRequest) -> Dict:
 
 
 @app.get("/api/messages")
-def get_messages(channel_id: Optional[str] = None) -> Dict:
-    return {"messages": _message_store.get_messages(channel_id=channel_id)}
+def get_messages(
+    channel_id: Optional[str] = None, limit: int = 200, before_id: Optional[int] = None
+) -> Dict:
+    messages = _message_store.get_messages(channel_id=channel_id, limit=limit, before_id=before_id)
+    next_before_id = messages[0]["id"] if messages and len(messages) == limit else None
+    return {"messages": messages, "next_before_id": next_before_id}
+
+
+@app.get("/api/messages/search")
+def search_messages(
+    q: str,
+    channel_id: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 20,
+) -> Dict:
+    results = _message_store.search(q, channel_id=channel_id, since=since, until=until, limit=limit)
+    return {"query": q, "results": results, "count": len(results)}
 
 
 @app.get("/api/summary")
@@ -308,8 +325,7 @@ def get_summary() -> Dict:
 
 @app.get("/api/channels")
 def get_channels() -> Dict:
-    channels = sorted({m["channel_id"] for m in _message_store.get_messages()})
-    return {"channels": channels}
+    return {"channels": _message_store.get_channels()}
 
 
 @app.get("/api/kb/entities")
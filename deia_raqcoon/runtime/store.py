@@ -1,22 +1,81 @@
 from __future__ import annotations
 
+import atexit
 import sqlite3
+import threading
+import time
+import weakref
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+_COLUMNS = "channel_id, author, content, timestamp, lane, provider, token_count"
+_INSERT = f"INSERT INTO messages ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+)
+
+
+def fts_query(text: str) -> str:
+    """Quote each word so FTS5 syntax is literal; keep trailing * as prefix match."""
+    terms = []
+    for word in text.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            terms.append(f'"{word}"*' if prefix else f'"{word}"')
+    return " ".join(terms)
 
 
 class MessageStore:
-    """SQLite-backed message store for local-first persistence."""
+    """SQLite-backed message store for local-first persistence.
 
-    def __init__(self, db_path: Optional[Path] = None) -> None:
+    WAL mode with a connection per thread. Writes are buffered and inserted
+    in batches by a writer thread; reads flush the buffer first. Content is
+    indexed with FTS5 (maintained by triggers) for search().
+    """
+
+    BATCH_SIZE = 1000
+    FLUSH_INTERVAL = 0.05
+
+    def __init__(self, db_path: Optional[Path] = None, write_behind: bool = True) -> None:
         if db_path is None:
             db_path = Path.cwd() / ".deia" / "raqcoon_messages.db"
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self.write_behind = write_behind
+        self._pending: List[Tuple] = []
+        self._pending_cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._closed = False
         self._init_schema()
+        self._writer: Optional[threading.Thread] = None
+        if write_behind:
+            self._writer = threading.Thread(target=self._writer_loop, name="raqcoon-store-writer", daemon=True)
+            self._writer.start()
+            # The writer is a daemon thread; drain its buffer before exit
+            atexit.register(_close_at_exit, weakref.ref(self))
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
 
     def _init_schema(self) -> None:
         cur = self.conn.cursor()
@@ -41,14 +100,56 @@ class MessageStore:
                 "token_count": "INTEGER",
             }
         )
+        # (channel_id, id) serves channel filters and keyset pagination
         cur.execute(
-            "CREATE INDEX IF NOT EXISTS idx_messages_channel ON messages(channel_id)"
+            "CREATE INDEX IF NOT EXISTS idx_messages_channel_id ON messages(channel_id, id)"
         )
+        cur.execute("DROP INDEX IF EXISTS idx_messages_channel")
         cur.execute(
             "CREATE INDEX IF NOT EXISTS idx_messages_time ON messages(timestamp)"
         )
+        self.fts_enabled = self._init_fts(cur)
         self.conn.commit()
 
+    def _init_fts(self, cur: sqlite3.Cursor) -> bool:
+        exists = cur.execute("SELECT 1 FROM sqlite_master WHERE name = 'messages_fts'").fetchone()
+        try:
+            cur.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+                    content, content='messages', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+                """
+            )
+        except sqlite3.OperationalError:
+            return False  # SQLite built without FTS5; search() uses LIKE
+        cur.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+                INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content);
+            END
+            """
+        )
+        cur.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+                INSERT INTO messages_fts(messages_fts, rowid, content) VALUES ('delete', old.id, old.content);
+            END
+            """
+        )
+        cur.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF content ON messages BEGIN
+                INSERT INTO messages_fts(messages_fts, rowid, content) VALUES ('delete', old.id, old.content);
+                INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content);
+            END
+            """
+        )
+        if not exists:
+            cur.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
+        return True
+
     def _ensure_columns(self, columns: Dict[str, str]) -> None:
         cur = self.conn.cursor()
         cur.execute("PRAGMA table_info(messages)")
@@ -68,15 +169,14 @@ class MessageStore:
         token_count: Optional[int] = None,
     ) -> Dict:
         timestamp = datetime.now(timezone.utc).isoformat()
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO messages (channel_id, author, content, timestamp, lane, provider, token_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (channel_id, author, content, timestamp, lane, provider, token_count),
-        )
-        self.conn.commit()
+        with self._pending_cond:
+            if self._closed:
+                raise RuntimeError("MessageStore is closed")
+            self._pending.append((channel_id, author, content, timestamp, lane, provider, token_count))
+            if len(self._pending) == 1 or len(self._pending) >= self.BATCH_SIZE:
+                self._pending_cond.notify()
+        if not self.write_behind:
+            self.flush()
         return {
             "channel_id": channel_id,
             "author": author,
@@ -87,33 +187,136 @@ class MessageStore:
             "token_count": token_count,
         }
 
-    def get_messages(self, channel_id: Optional[str] = None, limit: int = 200) -> List[Dict]:
+    def flush(self) -> int:
+        """Insert buffered messages in one transaction; returns the count written."""
+        with self._write_lock:
+            with self._pending_cond:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            try:
+                with self.conn as conn:
+                    conn.executemany(_INSERT, batch)
+            except sqlite3.Error:
+                # Keep the batch (ahead of newer messages) for the next flush
+                with self._pending_cond:
+                    self._pending[:0] = batch
+                raise
+            return len(batch)
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self._pending_cond:
+                while not self._pending and not self._closed:
+                    self._pending_cond.wait()
+                if not self._pending:
+                    break
+                if len(self._pending) < self.BATCH_SIZE and not self._closed:
+                    self._pending_cond.wait(self.FLUSH_INTERVAL)
+            try:
+                self.flush()
+            except sqlite3.Error:
+                if self._closed:
+                    break
+                time.sleep(self.FLUSH_INTERVAL)
+
+    def get_messages(
+        self,
+        channel_id: Optional[str] = None,
+        limit: int = 200,
+        before_id: Optional[int] = None,
+    ) -> List[Dict]:
+        """Latest `limit` messages (optionally older than `before_id`), oldest first."""
+        self.flush()
+        clauses = []
+        params: List = []
+        if channel_id:
+            clauses.append("channel_id = ?")
+            params.append(channel_id)
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(before_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         cur = self.conn.cursor()
+        cur.execute(
+            f"""
+            SELECT id, {_COLUMNS}
+            FROM messages
+            {where}
+            ORDER BY id DESC
+            LIMIT ?
+            """,
+            (*params, limit),
+        )
+        rows = cur.fetchall()
+        return [dict(row) for row in reversed(rows)]
+
+    def search(
+        self,
+        query: str,
+        channel_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 20,
+        highlight: Tuple[str, str] = ("[", "]"),
+    ) -> List[Dict]:
+        """Ranked full-text search (best first) with highlighted snippets."""
+        match = fts_query(query)
+        if not match:
+            return []
+        self.flush()
+        filters: List[str] = []
+        params: List = []
         if channel_id:
+            filters.append("m.channel_id = ?")
+            params.append(channel_id)
+        if since:
+            filters.append("m.timestamp >= ?")
+            params.append(since)
+        if until:
+            filters.append("m.timestamp < ?")
+            params.append(until)
+        cur = self.conn.cursor()
+        if self.fts_enabled:
+            where = "".join(f" AND {f}" for f in filters)
             cur.execute(
-                """
-                SELECT channel_id, author, content, timestamp, lane, provider, token_count
-                FROM messages
-                WHERE channel_id = ?
-                ORDER BY id ASC
+                f"""
+                SELECT m.id, m.channel_id, m.author, m.timestamp, m.lane, m.provider,
+                       snippet(messages_fts, 0, ?, ?, '...', 16) AS snippet,
+                       bm25(messages_fts) AS rank
+                FROM messages_fts
+                JOIN messages m ON m.id = messages_fts.rowid
+                WHERE messages_fts MATCH ?{where}
+                ORDER BY rank
                 LIMIT ?
                 """,
-                (channel_id, limit),
+                (highlight[0], highlight[1], match, *params, limit),
             )
         else:
+            words = [w.rstrip("*") for w in query.split() if w.rstrip("*")]
+            filters = ["m.content LIKE ?" for _ in words] + filters
+            params = [f"%{w}%" for w in words] + params
             cur.execute(
-                """
-                SELECT channel_id, author, content, timestamp, lane, provider, token_count
-                FROM messages
-                ORDER BY id ASC
+                f"""
+                SELECT m.id, m.channel_id, m.author, m.timestamp, m.lane, m.provider,
+                       m.content AS snippet, 0.0 AS rank
+                FROM messages m
+                WHERE {" AND ".join(filters)}
+                ORDER BY m.id DESC
                 LIMIT ?
                 """,
-                (limit,),
+                (*params, limit),
             )
-        rows = cur.fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in cur.fetchall()]
+
+    def get_channels(self) -> List[str]:
+        self.flush()
+        cur = self.conn.cursor()
+        cur.execute("SELECT DISTINCT channel_id FROM messages ORDER BY channel_id")
+        return [row["channel_id"] for row in cur.fetchall()]
 
     def get_summary(self) -> Dict:
+        self.flush()
         cur = self.conn.cursor()
         cur.execute(
             """
@@ -146,3 +349,27 @@ class MessageStore:
         )
         summary["by_lane"] = {r["lane"]: r["count"] for r in cur.fetchall()}
         return summary
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        with self._pending_cond:
+            self._closed = True
+            self._pending_cond.notify_all()
+        if self._writer:
+            self._writer.join()
+        self.flush()
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+def _close_at_exit(store_ref) -> None:
+    store = store_ref()
+    if store is not None:
+        try:
+            store.close()
+        except Exception:
+            pass
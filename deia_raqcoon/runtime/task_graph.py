@@ -5,7 +5,9 @@ Features:
 - Dependency resolution
 - Topological sorting for execution order
 - Circular dependency detection
-- Task status tracking
+- Task status tracking (incremental: completing a task costs O(out-degree))
+- Critical-path ordering of ready tasks
+- Persist/restore graph state
 - Task file creation
 """
 
@@ -15,7 +17,9 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set
 from pathlib import Path
 from datetime import datetime
+import heapq
 import json
+import os
 
 from deia_raqcoon.core.task_files import write_task
 
@@ -32,6 +36,7 @@ class TaskNode:
     files: List[str] = field(default_factory=list)
     priority: str = "P1"
     status: str = "pending"  # pending, ready, in_progress, complete, blocked
+    estimate: float = 1.0  # Relative effort, used for critical-path ordering
 
     def to_dict(self) -> Dict:
         """Serialize to dictionary."""
@@ -45,38 +50,113 @@ class TaskNode:
             "files": self.files,
             "priority": self.priority,
             "status": self.status,
+            "estimate": self.estimate,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TaskNode":
+        """Deserialize from dictionary."""
+        return cls(
+            task_id=data["task_id"],
+            title=data.get("title", ""),
+            intent=data.get("intent", "code"),
+            summary=data.get("summary", ""),
+            depends_on=list(data.get("depends_on", [])),
+            assignee=data.get("assignee"),
+            files=list(data.get("files", [])),
+            priority=data.get("priority", "P1"),
+            status=data.get("status", "pending"),
+            estimate=data.get("estimate", 1.0),
+        )
+
+
+_OPEN_STATUSES = ('pending', 'ready')
+
 
 @dataclass
 class TaskGraph:
     """
     A directed acyclic graph of tasks with dependency tracking.
+
+    Readiness is tracked incrementally: each task keeps a count of
+    dependencies that are not yet complete, and a reverse adjacency list
+    maps every task to its dependents, so completing a task touches only
+    its out-edges. Ready tasks are ordered by critical path (longest chain
+    of estimated work still behind them), then priority, then execution
+    order, which keeps the longest chain moving and minimizes makespan.
+
+    Call reindex() after editing nodes or dependencies directly.
     """
     spec_id: str
     title: str
     nodes: Dict[str, TaskNode] = field(default_factory=dict)
     execution_order: List[str] = field(default_factory=list)
+    # Derived from nodes by reindex()
+    dependents: Dict[str, List[str]] = field(default_factory=dict, init=False, repr=False)
+    critical_path: Dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _waiting_on: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _ready: Set[str] = field(default_factory=set, init=False, repr=False)
+    _order: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _indexed: bool = field(default=False, init=False, repr=False)
+
+    def reindex(self) -> None:
+        """Rebuild dependency counts, reverse edges and critical paths: O(V + E)."""
+        if not self.execution_order or set(self.execution_order) != set(self.nodes):
+            self.execution_order = _topological_sort(self.nodes)
+        self._order = {tid: i for i, tid in enumerate(self.execution_order)}
+
+        self.dependents = {tid: [] for tid in self.nodes}
+        self._waiting_on = {}
+        for tid, node in self.nodes.items():
+            deps = _known_deps(node, self.nodes)
+            for dep in deps:
+                self.dependents[dep].append(tid)
+            self._waiting_on[tid] = sum(1 for d in deps if self.nodes[d].status != 'complete')
+
+        # Longest remaining chain of work, computed sinks-first
+        self.critical_path = {}
+        for tid in reversed(self.execution_order):
+            tail = max((self.critical_path[c] for c in self.dependents[tid]), default=0.0)
+            self.critical_path[tid] = self.nodes[tid].estimate + tail
+
+        self._ready = {
+            tid for tid, node in self.nodes.items()
+            if node.status in _OPEN_STATUSES and self._waiting_on[tid] == 0
+        }
+        self._indexed = True
+
+    def _ensure_index(self) -> None:
+        if not self._indexed:
+            self.reindex()
+
+    def _dispatch_key(self, task_id: str):
+        return (-self.critical_path[task_id], self.nodes[task_id].priority, self._order[task_id])
 
     def get_ready_tasks(self) -> List[TaskNode]:
         """
-        Return tasks that are ready to execute.
+        Return tasks that are ready to execute, most critical first.
         A task is ready if:
         - Status is 'pending' or 'ready'
         - All dependencies are 'complete'
         """
-        ready = []
-        for task_id, node in self.nodes.items():
-            if node.status not in ('pending', 'ready'):
-                continue
-            deps_complete = all(
-                self.nodes[dep].status == 'complete'
-                for dep in node.depends_on
-                if dep in self.nodes
-            )
-            if deps_complete:
-                ready.append(node)
-        return ready
+        self._ensure_index()
+        return [self.nodes[tid] for tid in sorted(self._ready, key=self._dispatch_key)]
+
+    def _set_status(self, task_id: str, status: str) -> None:
+        """Change a task's status, keeping dependency counts and the ready set in sync."""
+        node = self.nodes[task_id]
+        was_complete = node.status == 'complete'
+        node.status = status
+
+        if status in _OPEN_STATUSES and self._waiting_on[task_id] == 0:
+            self._ready.add(task_id)
+        else:
+            self._ready.discard(task_id)
+
+        if was_complete and status != 'complete':
+            for child in self.dependents[task_id]:
+                self._waiting_on[child] += 1
+                self._ready.discard(child)
 
     def mark_complete(self, task_id: str) -> List[str]:
         """
@@ -84,38 +164,39 @@ class TaskGraph:
         """
         if task_id not in self.nodes:
             return []
+        self._ensure_index()
+        if self.nodes[task_id].status == 'complete':
+            return []
 
-        self.nodes[task_id].status = 'complete'
+        self._set_status(task_id, 'complete')
 
-        # Find tasks that were waiting on this one
         newly_ready = []
-        for tid, node in self.nodes.items():
-            if node.status != 'pending':
-                continue
-            if task_id in node.depends_on:
-                # Check if all deps now complete
-                all_complete = all(
-                    self.nodes[d].status == 'complete'
-                    for d in node.depends_on
-                    if d in self.nodes
-                )
-                if all_complete:
-                    node.status = 'ready'
-                    newly_ready.append(tid)
-
+        for child in self.dependents[task_id]:
+            self._waiting_on[child] -= 1
+            if self._waiting_on[child] == 0:
+                child_node = self.nodes[child]
+                if child_node.status in _OPEN_STATUSES:
+                    self._ready.add(child)
+                if child_node.status == 'pending':
+                    child_node.status = 'ready'
+                    newly_ready.append(child)
+
+        newly_ready.sort(key=self._dispatch_key)
         return newly_ready
 
     def mark_in_progress(self, task_id: str) -> bool:
         """Mark a task as in progress."""
         if task_id in self.nodes:
-            self.nodes[task_id].status = 'in_progress'
+            self._ensure_index()
+            self._set_status(task_id, 'in_progress')
             return True
         return False
 
     def mark_blocked(self, task_id: str) -> bool:
         """Mark a task as blocked."""
         if task_id in self.nodes:
-            self.nodes[task_id].status = 'blocked'
+            self._ensure_index()
+            self._set_status(task_id, 'blocked')
             return True
         return False
 
@@ -123,28 +204,23 @@ class TaskGraph:
         """
         Return groups of tasks that can run in parallel.
         Each group contains tasks at the same "depth" in the graph.
+        Within a group, tasks are ordered most critical first.
         """
         if not self.execution_order:
             return []
+        self._ensure_index()
 
         # Calculate depth for each task
         depths: Dict[str, int] = {}
         for task_id in self.execution_order:
-            node = self.nodes[task_id]
-            if not node.depends_on:
-                depths[task_id] = 0
-            else:
-                max_dep_depth = max(
-                    depths.get(d, 0) for d in node.depends_on
-                    if d in self.nodes
-                )
-                depths[task_id] = max_dep_depth + 1
+            deps = _known_deps(self.nodes[task_id], self.nodes)
+            depths[task_id] = max((depths[d] for d in deps), default=-1) + 1
 
         # Group by depth
         max_depth = max(depths.values()) if depths else 0
         groups = [[] for _ in range(max_depth + 1)]
-        for task_id, depth in depths.items():
-            groups[depth].append(task_id)
+        for task_id in sorted(depths, key=self._dispatch_key):
+            groups[depths[task_id]].append(task_id)
 
         return groups
 
@@ -156,37 +232,69 @@ class TaskGraph:
             "nodes": {tid: node.to_dict() for tid, node in self.nodes.items()},
             "execution_order": self.execution_order,
             "parallel_groups": self.get_parallel_groups(),
+            "critical_path": dict(self.critical_path),
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TaskGraph":
+        """Restore a graph (including task statuses) from to_dict() output."""
+        graph = cls(
+            spec_id=data.get("spec_id", "UNKNOWN"),
+            title=data.get("title", "Untitled Spec"),
+            nodes={tid: TaskNode.from_dict(node) for tid, node in data.get("nodes", {}).items()},
+            execution_order=list(data.get("execution_order", [])),
+        )
+        graph.reindex()
+        return graph
+
+    def save(self, path: Path) -> None:
+        """Persist graph state to a JSON file (atomic replace)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "TaskGraph":
+        """Load graph state saved with save()."""
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def _known_deps(node: TaskNode, nodes: Dict[str, TaskNode]) -> Set[str]:
+    """Dependencies that exist in the graph (unknown IDs are ignored)."""
+    return {dep for dep in node.depends_on if dep in nodes}
+
 
 def _topological_sort(nodes: Dict[str, TaskNode]) -> List[str]:
     """
     Topological sort using Kahn's algorithm.
+    Ties are broken by task ID so the order is deterministic.
     Raises ValueError if circular dependency detected.
     """
-    # Build adjacency and in-degree
-    in_degree: Dict[str, int] = {tid: 0 for tid in nodes}
+    # Build reverse adjacency and in-degree
+    in_degree: Dict[str, int] = {}
+    dependents: Dict[str, List[str]] = {tid: [] for tid in nodes}
     for tid, node in nodes.items():
-        for dep in node.depends_on:
-            if dep in nodes:
-                in_degree[tid] += 1
+        deps = _known_deps(node, nodes)
+        in_degree[tid] = len(deps)
+        for dep in deps:
+            dependents[dep].append(tid)
 
     # Start with nodes that have no dependencies
     queue = [tid for tid, deg in in_degree.items() if deg == 0]
+    heapq.heapify(queue)
     result = []
 
     while queue:
-        # Sort to ensure deterministic order
-        queue.sort()
-        current = queue.pop(0)
+        current = heapq.heappop(queue)
         result.append(current)
 
         # Reduce in-degree for dependent tasks
-        for tid, node in nodes.items():
-            if current in node.depends_on:
-                in_degree[tid] -= 1
-                if in_degree[tid] == 0:
-                    queue.append(tid)
+        for tid in dependents[current]:
+            in_degree[tid] -= 1
+            if in_degree[tid] == 0:
+                heapq.heappush(queue, tid)
 
     # Check for circular dependency
     if len(result) != len(nodes):
@@ -225,7 +333,8 @@ def build_task_graph(spec: Dict) -> TaskGraph:
             assignee=task_data.get('assignee'),
             files=task_data.get('files', []),
             priority=task_data.get('priority', 'P1'),
-            status='pending'
+            status='pending',
+            estimate=float(task_data.get('estimate', 1.0))
         )
         graph.nodes[node.task_id] = node
 
@@ -238,6 +347,7 @@ def build_task_graph(spec: Dict) -> TaskGraph:
         if not node.depends_on:
             node.status = 'ready'
 
+    graph.reindex()
     return graph
 
 
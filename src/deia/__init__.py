@@ -9,6 +9,13 @@ __version__ = "0.1.0"
 __author__ = "Dave E."
 __license__ = "MIT"
 
-from .cli import main
-
 __all__ = ["main"]
+
+
+def __getattr__(name):
+    # The CLI (click, rich, ...) is only imported when `deia.main` is used,
+    # so importing the library or its services stays cheap.
+    if name == "main":
+        from .cli import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -459,6 +459,7 @@ class BotRunner:
         # Log shutdown event and save final stats
         self.activity_logger.log_shutdown("graceful")
         self.activity_logger.save_stats()
+        self.activity_logger.close()
 
     def get_status(self) -> Dict[str, Any]:
         """
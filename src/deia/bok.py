@@ -3,8 +3,177 @@ Book of Knowledge (BOK) management and search
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 import json
+import os
+import re
+
+
+INDEX_VERSION = 1
+INDEX_FILENAME = 'bok-search-index.json'
+_TOKEN_RE = re.compile(r'\w+')
+
+# Indexes already loaded in this process, keyed by BOK path
+_indexes: Dict[Path, 'BokIndex'] = {}
+
+
+class BokIndex:
+    """
+    Persistent search index over a BOK directory.
+
+    Stores each entry's parsed metadata and its set of lowercased word
+    tokens, plus an inverted index (token -> entry paths). The index is
+    built on first use and kept current by comparing file mtimes/sizes, so
+    only new or changed files are re-read and re-parsed.
+
+    Matching keeps search_bok's substring semantics: a query word matches
+    any indexed token containing it. Queries that are more than a single
+    word (phrases, punctuation) are confirmed against the text of the
+    candidate files only.
+    """
+
+    def __init__(self, bok_path: Path, index_path: Optional[Path] = None):
+        """
+        Args:
+            bok_path: BOK root directory
+            index_path: Where to persist the index (None = in-memory only)
+        """
+        self.bok_path = Path(bok_path)
+        self.index_path = Path(index_path) if index_path else None
+        self.entries: Dict[str, Dict] = {}
+        self.postings: Dict[str, List[str]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.index_path or not self.index_path.exists():
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get('version') != INDEX_VERSION or data.get('bok_path') != str(self.bok_path):
+            return
+        self.entries = data.get('entries', {})
+        self.postings = data.get('postings', {})
+
+    def _save(self) -> None:
+        if not self.index_path:
+            return
+        data = {
+            'version': INDEX_VERSION,
+            'bok_path': str(self.bok_path),
+            'entries': self.entries,
+            'postings': self.postings,
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+            tmp_path.write_text(json.dumps(data, default=str), encoding='utf-8')
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass  # Read-only location: keep using the in-memory index
+
+    def refresh(self) -> bool:
+        """
+        Re-index new/changed files and drop deleted ones.
+
+        Returns:
+            True if the index changed
+        """
+        seen = set()
+        changed = False
+
+        for entry_file in self.bok_path.glob('**/*.md'):
+            rel = entry_file.relative_to(self.bok_path).as_posix()
+            seen.add(rel)
+            try:
+                stat = entry_file.stat()
+            except OSError:
+                continue
+            cached = self.entries.get(rel)
+            if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                continue
+
+            content = entry_file.read_text(encoding='utf-8')
+            self.entries[rel] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                # Round-trip so in-memory metadata matches what reloads from disk
+                'meta': json.loads(json.dumps(_parse_bok_entry(content), default=str)),
+                'tokens': sorted(set(_TOKEN_RE.findall(content.lower()))),
+            }
+            changed = True
+
+        for rel in set(self.entries) - seen:
+            del self.entries[rel]
+            changed = True
+
+        if changed:
+            postings: Dict[str, List[str]] = {}
+            for rel in sorted(self.entries):
+                for token in self.entries[rel]['tokens']:
+                    postings.setdefault(token, []).append(rel)
+            self.postings = postings
+            self._save()
+
+        return changed
+
+    def _candidates(self, query_lower: str) -> Set[str]:
+        """Entries containing every query word as part of some token."""
+        candidates = None
+        for word in set(_TOKEN_RE.findall(query_lower)):
+            postings = self.postings.get(word)
+            matched = set(postings) if postings else set()
+            for token, token_postings in self.postings.items():
+                if word in token and token != word:
+                    matched.update(token_postings)
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return set()
+        return set(self.entries) if candidates is None else candidates
+
+    def search(self, query: str, platform: Optional[str] = None,
+               category: Optional[str] = None) -> List[Dict]:
+        """Search the index; same results as a full scan of the BOK."""
+        query_lower = query.lower()
+        # A single word is answered exactly by the token index
+        exact = query_lower == '' or _TOKEN_RE.fullmatch(query_lower) is not None
+
+        results = []
+        for rel in sorted(self._candidates(query_lower)):
+            meta = self.entries[rel]['meta']
+            if isinstance(meta, dict):
+                # Apply filters
+                if platform and meta.get('platform') != platform:
+                    continue
+                if category and meta.get('category') != category:
+                    continue
+            elif platform or category:
+                continue
+
+            if not exact:
+                try:
+                    content = (self.bok_path / rel).read_text(encoding='utf-8')
+                except OSError:
+                    continue
+                if query_lower not in content.lower():
+                    continue
+
+            entry = dict(meta) if isinstance(meta, dict) else {}
+            entry['file'] = Path(rel).name
+            results.append(entry)
+
+        return results
+
+
+def get_bok_index(bok_path: Path, index_path: Optional[Path] = None) -> BokIndex:
+    """Return the (refreshed) index for a BOK directory, reusing it within the process."""
+    bok_path = Path(bok_path)
+    index = _indexes.get(bok_path)
+    if index is None or index.index_path != (Path(index_path) if index_path else None):
+        index = _indexes[bok_path] = BokIndex(bok_path, index_path)
+    index.refresh()
+    return index
 
 
 def search_bok(query: str, platform: Optional[str] = None,
@@ -12,6 +181,9 @@ def search_bok(query: str, platform: Optional[str] = None,
     """
     Search the local BOK
 
+    Uses a persistent index in .deia/cache/ that is built on first use and
+    refreshed from file mtimes, so only changed files are re-read.
+
     Args:
         query: Search terms
         platform: Filter by platform (optional)
@@ -26,35 +198,16 @@ def search_bok(query: str, platform: Optional[str] = None,
     try:
         project_root = find_project_root()
         bok_path = project_root / 'bok'
+        index_path = project_root / '.deia' / 'cache' / INDEX_FILENAME
     except FileNotFoundError:
         # Not in a project, check package data
         bok_path = Path(__file__).parent / 'data' / 'bok'
+        index_path = None
 
     if not bok_path.exists():
         return []
 
-    results = []
-    query_lower = query.lower()
-
-    # Search through BOK files (recursively in all subdirectories)
-    for entry_file in bok_path.glob('**/*.md'):
-        content = entry_file.read_text(encoding='utf-8')
-
-        # Simple search: check if query appears in content
-        if query_lower in content.lower():
-            # Extract metadata (if present)
-            entry = _parse_bok_entry(content)
-            entry['file'] = entry_file.name
-
-            # Apply filters
-            if platform and entry.get('platform') != platform:
-                continue
-            if category and entry.get('category') != category:
-                continue
-
-            results.append(entry)
-
-    return results
+    return get_bok_index(bok_path, index_path).search(query, platform=platform, category=category)
 
 
 def sync_bok() -> Dict[str, int]:
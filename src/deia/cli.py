@@ -1,40 +1,29 @@
 """
 DEIA CLI - Command-line interface for the DEIA toolkit
+
+Startup cost matters here: every `deia` invocation (even `--help`) imports
+this module. Heavy dependencies (rich, services, installer) are imported
+inside the commands that use them, and self-contained command groups live
+in their own cli_* modules that LazyGroup imports only when invoked.
 """
 
 import click
 from pathlib import Path
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.panel import Panel
-from rich.markdown import Markdown
 import sys
 import stat
 import textwrap
-import time
-import socket
-import webbrowser
 from typing import Optional
 
-from .core import (
-    init_project,
-    create_session_log,
-    sanitize_file,
-    validate_file,
-    find_project_root,
-)
-from .bok import search_bok, sync_bok
-from .config import load_config, save_config
-from .logger import ConversationLogger
-from .installer import install_global, init_project as installer_init_project
-from .cli_utils import safe_print
-from .minutes import MinutesManager
-from .services.telemetry_etl import maybe_autorun_on_launch, autorun as analytics_autorun
+from .cli_utils import LazyConsole, LazyGroup, safe_print
 
-console = Console()
+console = LazyConsole()
 
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_subcommands={
+    'admin': '.cli_admin:admin',
+    'doctor': '.cli_doctor:doctor',
+    'librarian': '.cli_librarian:librarian',
+})
 @click.version_option()
 def main():
     """
@@ -52,6 +41,8 @@ def main():
               help='Enable auto-logging by default (default: enabled)')
 def install(username, auto_log):
     """Install DEIA globally (run once per user)"""
+    from rich.panel import Panel
+    from .installer import install_global
 
     console.print(Panel.fit(
         "[bold cyan]Installing DEIA[/bold cyan]\n"
@@ -82,6 +73,9 @@ def install(username, auto_log):
               help='Project directory (default: current directory)')
 def init(project_name, auto_log, path):
     """Initialize DEIA for a project"""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+    from .installer import install_global, init_project as installer_init_project
 
     console.print(Panel.fit(
         "[bold cyan]Initializing DEIA[/bold cyan]\n"
@@ -142,6 +136,9 @@ def minutes():
 @click.option('--interval', type=int, default=60, help='Tick interval in seconds (default: 60)')
 @click.option('--loop/--no-loop', default=False, help='Run a ticking loop until Ctrl+C')
 def minutes_start(topic, interval, loop):
+    from .minutes import MinutesManager
+    from .services.telemetry_etl import maybe_autorun_on_launch
+
     mgr = MinutesManager()
     path = mgr.start(topic=topic, interval=interval, loop=loop)
     safe_print(console, f"[green]Minutes started[/green]: {path}")
@@ -157,6 +154,8 @@ def minutes_start(topic, interval, loop):
 @minutes.command('write')
 @click.argument('text', nargs=-1)
 def minutes_write(text):
+    from .minutes import MinutesManager
+
     mgr = MinutesManager()
     msg = " ".join(text).strip()
     if not msg:
@@ -171,6 +170,8 @@ def minutes_write(text):
 
 @minutes.command('tick')
 def minutes_tick():
+    from .minutes import MinutesManager
+
     mgr = MinutesManager()
     mgr.tick()
     safe_print(console, "[green]Tick recorded[/green]")
@@ -178,6 +179,8 @@ def minutes_tick():
 
 @minutes.command('stop')
 def minutes_stop():
+    from .minutes import MinutesManager
+
     mgr = MinutesManager()
     path = mgr.stop()
     safe_print(console, f"[green]Minutes stopped[/green]: {path}")
@@ -185,6 +188,8 @@ def minutes_stop():
 
 @minutes.command('report')
 def minutes_report():
+    from .minutes import MinutesManager
+
     mgr = MinutesManager()
     path = mgr.report()
     safe_print(console, f"[green]Report event emitted[/green]; minutes file: {path}")
@@ -197,6 +202,8 @@ def analytics():
 @analytics.command("autorun")
 def analytics_run_autorun():
     """Ensure analytics setup and run a lightweight ETL into staging."""
+    from .services.telemetry_etl import autorun as analytics_autorun
+
     try:
         res = analytics_autorun(Path.cwd())
         count = len(res.get("written", {}))
@@ -212,6 +219,8 @@ def analytics_run_autorun():
               help='Type of session')
 def log_create(topic, type):
     """Create a new session log from template"""
+    from rich.prompt import Confirm
+    from .core import create_session_log
 
     try:
         log_path = create_session_log(topic, type)
@@ -238,6 +247,9 @@ def log_conversation(context, transcript):
 
     This saves your conversation to .deia/sessions/ so you never lose context.
     """
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    from .logger import ConversationLogger
 
     logger = ConversationLogger()
 
@@ -300,6 +312,8 @@ def log_conversation(context, transcript):
 @click.option('--from-file', type=click.Path(exists=True), help='Log conversation from file')
 def log(from_clipboard, from_file):
     """Log a conversation to DEIA sessions"""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
     from .logger import ConversationLogger
     import pyperclip
 
@@ -390,6 +404,8 @@ def log(from_clipboard, from_file):
               help='Open sanitized file for manual review')
 def sanitize(file_path, output, auto_open):
     """Sanitize a session log for public sharing"""
+    from rich.panel import Panel
+    from .core import sanitize_file
 
     console.print(Panel.fit(
         "[bold]Sanitization Process[/bold]\n\n"
@@ -424,6 +440,7 @@ def sanitize(file_path, output, auto_open):
 @click.argument('file_path', type=click.Path(exists=True))
 def validate(file_path):
     """Validate a sanitized file is ready for submission"""
+    from .core import validate_file
 
     console.print("[bold]Validating...[/bold]\n")
 
@@ -450,6 +467,9 @@ def validate(file_path):
 @click.option('--skip-validation', is_flag=True, help='Skip validation (not recommended)')
 def submit(file_path, skip_validation):
     """Submit a sanitized session to the DEIA community"""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+    from .core import validate_file
 
     if not skip_validation:
         console.print("[dim]Running validation...[/dim]")
@@ -496,6 +516,8 @@ def bok():
 @click.option('--category', help='Filter by category (pattern, anti-pattern, etc.)')
 def bok_search(query, platform, category):
     """Search the community Book of Knowledge"""
+    from rich.panel import Panel
+    from .bok import search_bok
 
     try:
         results = search_bok(query, platform=platform, category=category)
@@ -523,6 +545,7 @@ def bok_search(query, platform, category):
 @bok.command('sync')
 def bok_sync():
     """Sync latest community Book of Knowledge"""
+    from .bok import sync_bok
 
     console.print("[bold]Syncing BOK from community...[/bold]")
 
@@ -539,420 +562,6 @@ def bok_sync():
         sys.exit(1)
 
 
-@main.group()
-def doctor():
-    """Diagnose and repair DEIA installation and documentation"""
-    pass
-
-
-@doctor.command('install')
-@click.option('--repair', is_flag=True, help='Attempt automatic repair of issues')
-def doctor_install(repair):
-    """Diagnose and repair DEIA installation"""
-    from .doctor import DEIADoctor
-
-    doctor_instance = DEIADoctor()
-
-    if repair:
-        doctor_instance.repair()
-    else:
-        doctor_instance.check_all()
-
-        if doctor_instance.issues:
-            console.print("\n[bold]TIP:[/bold] Run [cyan]deia doctor install --repair[/cyan] to attempt automatic fixes")
-
-
-@doctor.command('docs')
-@click.option('--fix', is_flag=True, help='Apply recommended fixes automatically')
-@click.option('--save-report', is_flag=True, default=True, help='Save audit report to docs/audits/')
-def doctor_docs(fix, save_report):
-    """Audit documentation for accuracy and redundancy"""
-    import subprocess
-    from pathlib import Path
-    from datetime import datetime
-
-    console.print(Panel.fit(
-        "[bold cyan]Documentation Audit[/bold cyan]\n"
-        "Verifying accuracy and identifying redundancies...",
-        border_style="cyan"
-    ))
-
-    # Phase 1: Inventory
-    console.print("\n[bold]Phase 1: Inventory[/bold]")
-
-    try:
-        result = subprocess.run(
-            ['find', '.', '-name', '*.md', '-not', '-path', '*/node_modules/*',
-             '-not', '-path', '*/.git/*', '-not', '-path', '*/.deia/*'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode == 0:
-            md_files = [f for f in result.stdout.strip().split('\n') if f]
-            console.print(f"Found {len(md_files)} markdown files")
-
-            # Categorize
-            core = [f for f in md_files if '/' not in f[2:] and any(x in f.lower() for x in ['readme', 'quickstart', 'roadmap'])]
-            setup = [f for f in md_files if any(x in f.lower() for x in ['setup', 'install', 'integration', 'memory'])]
-            reference = [f for f in md_files if '/docs/' in f or '/bok/' in f]
-
-            console.print(f"  • Core: {len(core)} files")
-            console.print(f"  • Setup: {len(setup)} files")
-            console.print(f"  • Reference: {len(reference)} files")
-        else:
-            console.print("[yellow]Could not enumerate files (using fallback)[/yellow]")
-            md_files = []
-    except Exception as e:
-        console.print(f"[yellow]Inventory failed: {e}[/yellow]")
-        md_files = []
-
-    # Phase 2: Verification
-    console.print("\n[bold]Phase 2: Verification[/bold]")
-
-    issues = []
-
-    # Check if CLI commands in docs exist
-    console.print("Checking CLI command references...")
-    try:
-        help_result = subprocess.run(
-            ['python', '-c', 'import sys; sys.path.insert(0, "src"); from deia.cli import main; main(["--help"])'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-
-        if help_result.returncode == 0:
-            available_commands = help_result.stdout
-            console.print("  [green]OK[/green] CLI accessible")
-        else:
-            issues.append({"severity": "medium", "message": "CLI not accessible for verification"})
-    except Exception as e:
-        issues.append({"severity": "medium", "message": f"Could not verify CLI: {e}"})
-
-    # Check for common issues
-    console.print("Checking for common documentation issues...")
-
-    # Check if ROADMAP exists
-    if not Path('ROADMAP.md').exists():
-        issues.append({"severity": "high", "message": "ROADMAP.md missing - cannot verify feature claims"})
-
-    # Check for backup files
-    backup_files = list(Path('.').rglob('*.backup')) + list(Path('.').rglob('*.bak'))
-    if backup_files:
-        issues.append({"severity": "low", "message": f"Found {len(backup_files)} backup files to clean up: {', '.join(str(f) for f in backup_files[:3])}"})
-
-    # Check for BOK_MOVED.md specifically (from our audit)
-    if Path('BOK_MOVED.md').exists():
-        issues.append({"severity": "critical", "message": "BOK_MOVED.md exists but BOK is in bok/ directory - file is incorrect"})
-
-    # Phase 3: Redundancy
-    console.print("\n[bold]Phase 3: Redundancy Analysis[/bold]")
-
-    quickstart_variants = [f for f in md_files if 'quickstart' in f.lower() or 'quick' in f.lower()]
-    if len(quickstart_variants) > 1:
-        issues.append({"severity": "medium", "message": f"Multiple quickstart guides: {', '.join(quickstart_variants)}"})
-        console.print(f"  [yellow]WARNING[/yellow] Found {len(quickstart_variants)} quickstart-related files")
-
-    setup_variants = [f for f in md_files if 'setup' in f.lower() or 'integration' in f.lower()]
-    if len(setup_variants) > 2:
-        issues.append({"severity": "low", "message": f"Many setup guides ({len(setup_variants)}) - consider consolidation"})
-        console.print(f"  [cyan]INFO[/cyan] Found {len(setup_variants)} setup-related files")
-
-    # Phase 4: Report
-    console.print("\n[bold]Phase 4: Summary[/bold]")
-
-    critical = [i for i in issues if i['severity'] == 'critical']
-    high = [i for i in issues if i['severity'] == 'high']
-    medium = [i for i in issues if i['severity'] == 'medium']
-    low = [i for i in issues if i['severity'] == 'low']
-
-    if not issues:
-        console.print("[green]PASS - No issues found! Documentation looks good.[/green]")
-        grade = "A"
-    else:
-        console.print(f"\n[bold]Issues Found:[/bold]")
-
-        if critical:
-            console.print(f"\n[red]Critical ({len(critical)}):[/red]")
-            for issue in critical:
-                console.print(f"  • {issue['message']}")
-
-        if high:
-            console.print(f"\n[yellow]High Priority ({len(high)}):[/yellow]")
-            for issue in high:
-                console.print(f"  • {issue['message']}")
-
-        if medium:
-            console.print(f"\n[cyan]Medium Priority ({len(medium)}):[/cyan]")
-            for issue in medium:
-                console.print(f"  • {issue['message']}")
-
-        if low:
-            console.print(f"\n[dim]Low Priority ({len(low)}):[/dim]")
-            for issue in low:
-                console.print(f"  • {issue['message']}")
-
-        # Assign grade
-        if critical:
-            grade = "D"
-        elif high:
-            grade = "C"
-        elif len(medium) > 3:
-            grade = "B-"
-        elif medium:
-            grade = "B"
-        else:
-            grade = "A-"
-
-    console.print(f"\n[bold]Overall Grade:[/bold] {grade}")
-
-    # Save report
-    if save_report and issues:
-        audit_dir = Path('docs/audits')
-        audit_dir.mkdir(parents=True, exist_ok=True)
-
-        report_file = audit_dir / f"{datetime.now().strftime('%Y-%m-%d')}-audit.md"
-
-        report_content = f"""# Documentation Audit Report
-**Date:** {datetime.now().strftime('%Y-%m-%d')}
-**Files Audited:** {len(md_files)}
-**Grade:** {grade}
-
-## Summary
-
-Issues found: {len(issues)} ({len(critical)} critical, {len(high)} high, {len(medium)} medium, {len(low)} low)
-
-## Critical Issues
-
-"""
-        for issue in critical:
-            report_content += f"- {issue['message']}\n"
-
-        report_content += "\n## High Priority\n\n"
-        for issue in high:
-            report_content += f"- {issue['message']}\n"
-
-        report_content += "\n## Medium Priority\n\n"
-        for issue in medium:
-            report_content += f"- {issue['message']}\n"
-
-        report_content += "\n## Low Priority\n\n"
-        for issue in low:
-            report_content += f"- {issue['message']}\n"
-
-        report_content += f"\n## Recommendations\n\nFor detailed audit process, see: `bok/patterns/documentation/documentation-audit.md`\n\nFor AI-assisted audit, run: `/doc-audit` in Claude Code\n"
-
-        report_file.write_text(report_content, encoding='utf-8')
-        console.print(f"\n[green]Report saved:[/green] {report_file}")
-
-    # Apply fixes if requested
-    if fix and issues:
-        console.print("\n[bold]Applying fixes...[/bold]")
-
-        for issue in critical + high:
-            if 'BOK_MOVED.md' in issue['message']:
-                if Confirm.ask("Delete BOK_MOVED.md (factually incorrect)?"):
-                    Path('BOK_MOVED.md').unlink()
-                    console.print("  [green]OK[/green] Deleted BOK_MOVED.md")
-
-            if 'backup files' in issue['message']:
-                if Confirm.ask(f"Delete {len(backup_files)} backup files?"):
-                    for f in backup_files:
-                        f.unlink()
-                    console.print(f"  [green]OK[/green] Deleted {len(backup_files)} backup files")
-
-    console.print("\n[bold]Next Steps:[/bold]")
-    console.print("  1. Review the audit report")
-    console.print("  2. For detailed guided audit: /doc-audit in Claude Code")
-    console.print("  3. See pattern: bok/patterns/documentation/documentation-audit.md")
-
-
-@main.group()
-def admin():
-    """Admin tools for BOK quality control (maintainers only)"""
-    pass
-
-
-@admin.command('scan')
-@click.argument('file_path', type=click.Path(exists=True))
-def admin_scan(file_path):
-    """Security scan a file for secrets and malicious code"""
-    from .admin import SecurityScanner
-
-    scanner = SecurityScanner()
-    result = scanner.scan_file(file_path)
-
-    console.print(f"\n[bold]Security Scan: {file_path}[/bold]\n")
-
-    if result.get('error'):
-        console.print(f"[red]Error:[/red] {result['error']}")
-        sys.exit(1)
-
-    # Show secrets found
-    secrets = result['secrets_found']
-    if secrets:
-        console.print(f"[red]🔒 Secrets found: {len(secrets)}[/red]")
-        for secret in secrets:
-            console.print(f"  Line {secret['line']}: {secret['type']} - {secret['match']}")
-        console.print()
-
-    # Show malicious patterns
-    malicious = result['malicious_patterns']
-    if malicious:
-        safe_print(console, f"[red]⚠️  Malicious patterns: {len(malicious)}[/red]")
-        for pattern in malicious:
-            console.print(f"  Line {pattern['line']}: {pattern['type']} - {pattern['context']}")
-        console.print()
-
-    # Show risk score and recommendation
-    risk_score = result['risk_score']
-    recommendation = result['recommendation']
-
-    if risk_score >= 80:
-        color = 'red'
-    elif risk_score >= 50:
-        color = 'yellow'
-    else:
-        color = 'green'
-
-    console.print(f"[{color}]Risk Score: {risk_score}/100[/{color}]")
-    console.print(f"Recommendation: [{color}]{recommendation}[/{color}]")
-
-
-@admin.command('quality')
-@click.argument('file_path', type=click.Path(exists=True))
-def admin_quality(file_path):
-    """Quality check a file"""
-    from .admin import QualityChecker
-
-    checker = QualityChecker()
-    result = checker.check_file(file_path)
-
-    console.print(f"\n[bold]Quality Check: {file_path}[/bold]\n")
-
-    if result.get('error'):
-        console.print(f"[red]Error:[/red] {result['error']}")
-        sys.exit(1)
-
-    issues = result['issues']
-    if issues:
-        console.print("[yellow]Issues found:[/yellow]")
-        for issue in issues:
-            console.print(f"  • {issue}")
-        console.print()
-
-    quality_score = result['quality_score']
-    recommendation = result['recommendation']
-
-    color = 'green' if quality_score >= 70 else 'yellow'
-    console.print(f"[{color}]Quality Score: {quality_score}/100[/{color}]")
-    console.print(f"Recommendation: [{color}]{recommendation}[/{color}]")
-
-
-@admin.command('review')
-@click.argument('file_path', type=click.Path(exists=True))
-def admin_review(file_path):
-    """Full review (security + quality)"""
-    from .admin import AIReviewer
-
-    reviewer = AIReviewer()
-    result = reviewer.review_file(file_path)
-
-    console.print(f"\n[bold]Full Review: {file_path}[/bold]\n")
-
-    console.print(result['summary'])
-    console.print()
-
-    risk_score = result['risk_score']
-    recommendation = result['recommendation']
-
-    if risk_score >= 80:
-        color = 'red'
-    elif risk_score >= 50:
-        color = 'yellow'
-    else:
-        color = 'green'
-
-    console.print(f"[{color}]Overall Risk: {risk_score}/100[/{color}]")
-    console.print(f"[{color}]Recommendation: {recommendation}[/{color}]")
-
-
-@admin.command('ban-user')
-@click.argument('username')
-@click.option('--reason', default='No reason provided', help='Ban reason')
-@click.option('--duration', default='permanent', help='Ban duration')
-def admin_ban_user(username, reason, duration):
-    """Ban a user from BOK submissions"""
-    from .admin import UserManager
-
-    manager = UserManager()
-    manager.ban_user(username, reason, duration)
-
-
-@admin.command('unban-user')
-@click.argument('username')
-def admin_unban_user(username):
-    """Unban a user"""
-    from .admin import UserManager
-
-    manager = UserManager()
-    manager.unban_user(username)
-
-
-@admin.command('flag-user')
-@click.argument('username')
-@click.option('--reason', default='No reason provided', help='Flag reason')
-def admin_flag_user(username, reason):
-    """Flag a user for review"""
-    from .admin import UserManager
-
-    manager = UserManager()
-    manager.flag_user(username, reason)
-
-
-@admin.command('list-banned')
-def admin_list_banned():
-    """List all banned users"""
-    from .admin import UserManager
-
-    manager = UserManager()
-    banned = manager.list_banned()
-
-    if not banned:
-        console.print("No banned users")
-        return
-
-    console.print("\n[bold]Banned Users:[/bold]\n")
-    for username, data in banned.items():
-        console.print(f"[red]{username}[/red]")
-        console.print(f"  Reason: {data['reason']}")
-        console.print(f"  Duration: {data['duration']}")
-        console.print(f"  Banned at: {data['banned_at']}")
-        console.print()
-
-
-@admin.command('list-flagged')
-def admin_list_flagged():
-    """List all flagged users"""
-    from .admin import UserManager
-
-    manager = UserManager()
-    flagged = manager.list_flagged()
-
-    if not flagged:
-        console.print("No flagged users")
-        return
-
-    console.print("\n[bold]Flagged Users:[/bold]\n")
-    for username, flags in flagged.items():
-        console.print(f"[yellow]{username}[/yellow] ({len(flags)} flag(s))")
-        for flag in flags:
-            console.print(f"  • {flag['reason']} ({flag['flagged_at']})")
-        console.print()
-
-
 @main.command()
 def status():
     """Show current DEIA status and configuration"""
@@ -1458,6 +1067,7 @@ def hive_join(hive_file, role):
       deia hive join .deia/hive-recipe.json          # Auto-assign role
       deia hive join hive.json --role BOT-00002      # Claim specific bot
     """
+    from rich.panel import Panel
     from .hive import HiveManager, HiveJoinError
 
     console.print(Panel.fit(
@@ -1507,6 +1117,7 @@ def hive_launch(hive_file, no_queen):
       deia hive launch .deia/hive-recipe.json        # Launch and become Queen
       deia hive launch hive.json --no-queen          # Just initialize structure
     """
+    from rich.panel import Panel
     from .hive import HiveManager, HiveLaunchError
 
     console.print(Panel.fit(
@@ -1555,6 +1166,10 @@ def hive_launch(hive_file, no_queen):
 @click.option('--no-browser', is_flag=True, help='Do not open browser automatically')
 def chat(port, host, no_browser):
     """Start the chat interface with bot selector on specified port"""
+    import socket
+    import time
+    import webbrowser
+
     # Check if port is available
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     result = sock.connect_ex((host, port))
@@ -1683,6 +1298,8 @@ def cleanup_temp_staging_cmd(config: Optional[Path]):
 @click.option("--force", is_flag=True, help="Overwrite an existing post-commit hook.")
 def install_cleanup_hook(force: bool):
     """Install git post-commit hook to purge temp staging after commits."""
+    from .core import find_project_root
+
     project_root = find_project_root()
     git_dir = project_root / ".git"
     if not git_dir.exists():
@@ -1738,64 +1355,6 @@ def _make_hook_executable(hook_path: Path) -> None:
     hook_path.chmod(current_mode | stat.S_IEXEC)
 
 
-@main.group()
-def librarian():
-    """Master Librarian - Query and manage the Global Commons index"""
-    pass
-
-
-@librarian.command('query')
-@click.argument('query', nargs=-1, required=True)
-@click.option('--urgency', type=click.Choice(['critical', 'high', 'medium', 'low']),
-              help='Filter by urgency level')
-@click.option('--platform', help='Filter by platform (e.g., netlify, windows)')
-@click.option('--audience', type=click.Choice(['beginner', 'intermediate', 'advanced']),
-              help='Filter by audience level')
-@click.option('--no-fuzzy', is_flag=True,
-              help='Disable fuzzy matching (enabled by default)')
-@click.option('--limit', type=int, default=5,
-              help='Number of results to show (default: 5)')
-def librarian_query(query, urgency, platform, audience, no_fuzzy, limit):
-    """
-    Query the Global Commons index with advanced search
-
-    Supports fuzzy matching, AND/OR logic, and multiple filters.
-
-    Examples:
-      deia librarian query "deployment failed"
-      deia librarian query "DNS not working" --urgency critical
-      deia librarian query "python encoding" --platform windows
-      deia librarian query "coordination" AND "governance"
-      deia librarian query "deployment" OR "release"
-    """
-    import subprocess
-
-    # Build command for query.py
-    cmd = [sys.executable, str(Path(__file__).parent / 'tools' / 'query.py')]
-    cmd.extend(query)
-
-    if urgency:
-        cmd.extend(['--urgency', urgency])
-    if platform:
-        cmd.extend(['--platform', platform])
-    if audience:
-        cmd.extend(['--audience', audience])
-    if no_fuzzy:
-        cmd.append('--no-fuzzy')
-    cmd.extend(['--limit', str(limit)])
-
-    try:
-        result = subprocess.run(cmd, check=True)
-        sys.exit(result.returncode)
-    except subprocess.CalledProcessError as e:
-        console.print(f"[red]Query failed:[/red] {e}")
-        sys.exit(1)
-    except FileNotFoundError:
-        console.print("[red]Error:[/red] Query tool not found")
-        console.print("Expected location: src/deia/tools/query.py")
-        sys.exit(1)
-
-
 def get_editor():
     """Get system default editor"""
     import os
@@ -0,0 +1,241 @@
+"""
+CLI commands for diagnosing DEIA installation and documentation
+"""
+
+import click
+from pathlib import Path
+
+from .cli_utils import LazyConsole
+
+console = LazyConsole()
+
+
+@click.group()
+def doctor():
+    """Diagnose and repair DEIA installation and documentation"""
+    pass
+
+
+@doctor.command('install')
+@click.option('--repair', is_flag=True, help='Attempt automatic repair of issues')
+def doctor_install(repair):
+    """Diagnose and repair DEIA installation"""
+    from .doctor import DEIADoctor
+
+    doctor_instance = DEIADoctor()
+
+    if repair:
+        doctor_instance.repair()
+    else:
+        doctor_instance.check_all()
+
+        if doctor_instance.issues:
+            console.print("\n[bold]TIP:[/bold] Run [cyan]deia doctor install --repair[/cyan] to attempt automatic fixes")
+
+
+@doctor.command('docs')
+@click.option('--fix', is_flag=True, help='Apply recommended fixes automatically')
+@click.option('--save-report', is_flag=True, default=True, help='Save audit report to docs/audits/')
+def doctor_docs(fix, save_report):
+    """Audit documentation for accuracy and redundancy"""
+    import subprocess
+    from datetime import datetime
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
+    console.print(Panel.fit(
+        "[bold cyan]Documentation Audit[/bold cyan]\n"
+        "Verifying accuracy and identifying redundancies...",
+        border_style="cyan"
+    ))
+
+    # Phase 1: Inventory
+    console.print("\n[bold]Phase 1: Inventory[/bold]")
+
+    try:
+        result = subprocess.run(
+            ['find', '.', '-name', '*.md', '-not', '-path', '*/node_modules/*',
+             '-not', '-path', '*/.git/*', '-not', '-path', '*/.deia/*'],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+
+        if result.returncode == 0:
+            md_files = [f for f in result.stdout.strip().split('\n') if f]
+            console.print(f"Found {len(md_files)} markdown files")
+
+            # Categorize
+            core = [f for f in md_files if '/' not in f[2:] and any(x in f.lower() for x in ['readme', 'quickstart', 'roadmap'])]
+            setup = [f for f in md_files if any(x in f.lower() for x in ['setup', 'install', 'integration', 'memory'])]
+            reference = [f for f in md_files if '/docs/' in f or '/bok/' in f]
+
+            console.print(f"  • Core: {len(core)} files")
+            console.print(f"  • Setup: {len(setup)} files")
+            console.print(f"  • Reference: {len(reference)} files")
+        else:
+            console.print("[yellow]Could not enumerate files (using fallback)[/yellow]")
+            md_files = []
+    except Exception as e:
+        console.print(f"[yellow]Inventory failed: {e}[/yellow]")
+        md_files = []
+
+    # Phase 2: Verification
+    console.print("\n[bold]Phase 2: Verification[/bold]")
+
+    issues = []
+
+    # Check if CLI commands in docs exist
+    console.print("Checking CLI command references...")
+    try:
+        help_result = subprocess.run(
+            ['python', '-c', 'import sys; sys.path.insert(0, "src"); from deia.cli import main; main(["--help"])'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+
+        if help_result.returncode == 0:
+            available_commands = help_result.stdout
+            console.print("  [green]OK[/green] CLI accessible")
+        else:
+            issues.append({"severity": "medium", "message": "CLI not accessible for verification"})
+    except Exception as e:
+        issues.append({"severity": "medium", "message": f"Could not verify CLI: {e}"})
+
+    # Check for common issues
+    console.print("Checking for common documentation issues...")
+
+    # Check if ROADMAP exists
+    if not Path('ROADMAP.md').exists():
+        issues.append({"severity": "high", "message": "ROADMAP.md missing - cannot verify feature claims"})
+
+    # Check for backup files
+    backup_files = list(Path('.').rglob('*.backup')) + list(Path('.').rglob('*.bak'))
+    if backup_files:
+        issues.append({"severity": "low", "message": f"Found {len(backup_files)} backup files to clean up: {', '.join(str(f) for f in backup_files[:3])}"})
+
+    # Check for BOK_MOVED.md specifically (from our audit)
+    if Path('BOK_MOVED.md').exists():
+        issues.append({"severity": "critical", "message": "BOK_MOVED.md exists but BOK is in bok/ directory - file is incorrect"})
+
+    # Phase 3: Redundancy
+    console.print("\n[bold]Phase 3: Redundancy Analysis[/bold]")
+
+    quickstart_variants = [f for f in md_files if 'quickstart' in f.lower() or 'quick' in f.lower()]
+    if len(quickstart_variants) > 1:
+        issues.append({"severity": "medium", "message": f"Multiple quickstart guides: {', '.join(quickstart_variants)}"})
+        console.print(f"  [yellow]WARNING[/yellow] Found {len(quickstart_variants)} quickstart-related files")
+
+    setup_variants = [f for f in md_files if 'setup' in f.lower() or 'integration' in f.lower()]
+    if len(setup_variants) > 2:
+        issues.append({"severity": "low", "message": f"Many setup guides ({len(setup_variants)}) - consider consolidation"})
+        console.print(f"  [cyan]INFO[/cyan] Found {len(setup_variants)} setup-related files")
+
+    # Phase 4: Report
+    console.print("\n[bold]Phase 4: Summary[/bold]")
+
+    critical = [i for i in issues if i['severity'] == 'critical']
+    high = [i for i in issues if i['severity'] == 'high']
+    medium = [i for i in issues if i['severity'] == 'medium']
+    low = [i for i in issues if i['severity'] == 'low']
+
+    if not issues:
+        console.print("[green]PASS - No issues found! Documentation looks good.[/green]")
+        grade = "A"
+    else:
+        console.print(f"\n[bold]Issues Found:[/bold]")
+
+        if critical:
+            console.print(f"\n[red]Critical ({len(critical)}):[/red]")
+            for issue in critical:
+                console.print(f"  • {issue['message']}")
+
+        if high:
+            console.print(f"\n[yellow]High Priority ({len(high)}):[/yellow]")
+            for issue in high:
+                console.print(f"  • {issue['message']}")
+
+        if medium:
+            console.print(f"\n[cyan]Medium Priority ({len(medium)}):[/cyan]")
+            for issue in medium:
+                console.print(f"  • {issue['message']}")
+
+        if low:
+            console.print(f"\n[dim]Low Priority ({len(low)}):[/dim]")
+            for issue in low:
+                console.print(f"  • {issue['message']}")
+
+        # Assign grade
+        if critical:
+            grade = "D"
+        elif high:
+            grade = "C"
+        elif len(medium) > 3:
+            grade = "B-"
+        elif medium:
+            grade = "B"
+        else:
+            grade = "A-"
+
+    console.print(f"\n[bold]Overall Grade:[/bold] {grade}")
+
+    # Save report
+    if save_report and issues:
+        audit_dir = Path('docs/audits')
+        audit_dir.mkdir(parents=True, exist_ok=True)
+
+        report_file = audit_dir / f"{datetime.now().strftime('%Y-%m-%d')}-audit.md"
+
+        report_content = f"""# Documentation Audit Report
+**Date:** {datetime.now().strftime('%Y-%m-%d')}
+**Files Audited:** {len(md_files)}
+**Grade:** {grade}
+
+## Summary
+
+Issues found: {len(issues)} ({len(critical)} critical, {len(high)} high, {len(medium)} medium, {len(low)} low)
+
+## Critical Issues
+
+"""
+        for issue in critical:
+            report_content += f"- {issue['message']}\n"
+
+        report_content += "\n## High Priority\n\n"
+        for issue in high:
+            report_content += f"- {issue['message']}\n"
+
+        report_content += "\n## Medium Priority\n\n"
+        for issue in medium:
+            report_content += f"- {issue['message']}\n"
+
+        report_content += "\n## Low Priority\n\n"
+        for issue in low:
+            report_content += f"- {issue['message']}\n"
+
+        report_content += f"\n## Recommendations\n\nFor detailed audit process, see: `bok/patterns/documentation/documentation-audit.md`\n\nFor AI-assisted audit, run: `/doc-audit` in Claude Code\n"
+
+        report_file.write_text(report_content, encoding='utf-8')
+        console.print(f"\n[green]Report saved:[/green] {report_file}")
+
+    # Apply fixes if requested
+    if fix and issues:
+        console.print("\n[bold]Applying fixes...[/bold]")
+
+        for issue in critical + high:
+            if 'BOK_MOVED.md' in issue['message']:
+                if Confirm.ask("Delete BOK_MOVED.md (factually incorrect)?"):
+                    Path('BOK_MOVED.md').unlink()
+                    console.print("  [green]OK[/green] Deleted BOK_MOVED.md")
+
+            if 'backup files' in issue['message']:
+                if Confirm.ask(f"Delete {len(backup_files)} backup files?"):
+                    for f in backup_files:
+                        f.unlink()
+                    console.print(f"  [green]OK[/green] Deleted {len(backup_files)} backup files")
+
+    console.print("\n[bold]Next Steps:[/bold]")
+    console.print("  1. Review the audit report")
+    console.print("  2. For detailed guided audit: /doc-audit in Claude Code")
+    console.print("  3. See pattern: bok/patterns/documentation/documentation-audit.md")
@@ -0,0 +1,70 @@
+"""
+CLI commands for the Master Librarian (Global Commons index)
+"""
+
+import sys
+from pathlib import Path
+
+import click
+
+from .cli_utils import LazyConsole
+
+console = LazyConsole()
+
+
+@click.group()
+def librarian():
+    """Master Librarian - Query and manage the Global Commons index"""
+    pass
+
+
+@librarian.command('query')
+@click.argument('query', nargs=-1, required=True)
+@click.option('--urgency', type=click.Choice(['critical', 'high', 'medium', 'low']),
+              help='Filter by urgency level')
+@click.option('--platform', help='Filter by platform (e.g., netlify, windows)')
+@click.option('--audience', type=click.Choice(['beginner', 'intermediate', 'advanced']),
+              help='Filter by audience level')
+@click.option('--no-fuzzy', is_flag=True,
+              help='Disable fuzzy matching (enabled by default)')
+@click.option('--limit', type=int, default=5,
+              help='Number of results to show (default: 5)')
+def librarian_query(query, urgency, platform, audience, no_fuzzy, limit):
+    """
+    Query the Global Commons index with advanced search
+
+    Supports fuzzy matching, AND/OR logic, and multiple filters.
+
+    Examples:
+      deia librarian query "deployment failed"
+      deia librarian query "DNS not working" --urgency critical
+      deia librarian query "python encoding" --platform windows
+      deia librarian query "coordination" AND "governance"
+      deia librarian query "deployment" OR "release"
+    """
+    import subprocess
+
+    # Build command for query.py
+    cmd = [sys.executable, str(Path(__file__).parent / 'tools' / 'query.py')]
+    cmd.extend(query)
+
+    if urgency:
+        cmd.extend(['--urgency', urgency])
+    if platform:
+        cmd.extend(['--platform', platform])
+    if audience:
+        cmd.extend(['--audience', audience])
+    if no_fuzzy:
+        cmd.append('--no-fuzzy')
+    cmd.extend(['--limit', str(limit)])
+
+    try:
+        result = subprocess.run(cmd, check=True)
+        sys.exit(result.returncode)
+    except subprocess.CalledProcessError as e:
+        console.print(f"[red]Query failed:[/red] {e}")
+        sys.exit(1)
+    except FileNotFoundError:
+        console.print("[red]Error:[/red] Query tool not found")
+        console.print("Expected location: src/deia/tools/query.py")
+        sys.exit(1)
@@ -4,8 +4,13 @@ CLI Utility Functions
 Helper functions for DEIA CLI commands
 """
 
-from typing import Any
-from rich.console import Console
+import importlib
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 # Unicode symbol mappings for fallback
@@ -40,7 +45,7 @@ def emergency_print(message: str):
     print(plain, file=sys.stderr)
 
 
-def safe_print(console: Console, message: str, **kwargs) -> bool:
+def safe_print(console: "Console", message: str, **kwargs) -> bool:
     """
     Print message to console with Unicode fallback for Windows terminals
 
@@ -117,3 +122,66 @@ def get_symbol(symbol_name: str, fallback_ascii: bool = False) -> str:
 
     unicode_sym, ascii_sym = symbols[symbol_name]
     return ascii_sym if fallback_ascii else unicode_sym
+
+
+class LazyConsole:
+    """
+    Stand-in for a Rich Console that creates the real one on first use
+
+    Importing rich costs tens of milliseconds, which every `deia` invocation
+    would pay at startup. CLI modules keep one of these at module level
+    instead, so rich is only imported once something is actually printed.
+
+    Args:
+        **kwargs: Arguments passed to rich.console.Console()
+    """
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._console = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console(**self._kwargs)
+        return getattr(self._console, name)
+
+
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported only when invoked
+
+    Lazy subcommands are given as "module:attribute" import paths; module
+    paths starting with "." are resolved relative to the deia package.
+    Regular subcommands added with @group.command() keep working as usual.
+
+    Example:
+        >>> @click.group(cls=LazyGroup, lazy_subcommands={
+        ...     'doctor': '.cli_doctor:doctor',
+        ... })
+        ... def main():
+        ...     pass
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(':')
+        module = importlib.import_module(module_name, package=__package__)
+        command = getattr(module, attr_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy subcommand '{cmd_name}' ({self.lazy_subcommands[cmd_name]}) "
+                f"is not a click command"
+            )
+        return command
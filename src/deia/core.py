@@ -124,15 +124,10 @@ def sanitize_file(input_path: str, output_path: str = None) -> Path:
     else:
         output_file = Path(output_path)
 
-    content = input_file.read_text(encoding='utf-8')
-
-    # Run sanitization rules
+    # Run sanitization rules, streaming so large logs aren't held in memory
     from .sanitizer import Sanitizer
     sanitizer = Sanitizer()
-    sanitized_content, warnings = sanitizer.sanitize(content)
-
-    # Write sanitized content
-    output_file.write_text(sanitized_content, encoding='utf-8')
+    warnings = sanitizer.sanitize_file(input_file, output_file)
 
     # Log warnings if any
     if warnings:
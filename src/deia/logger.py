@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 import json
 
+from .logger_realtime import StepJournal
+
 
 class ConversationLogger:
     """Logs Claude Code conversations to .deia/sessions/"""
@@ -22,6 +24,39 @@ class ConversationLogger:
         self.sessions_dir = self.project_root / ".deia" / "sessions"
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
         self.index_file = self.sessions_dir / "INDEX.md"
+        self._step_journal: Optional[StepJournal] = None
+
+    @property
+    def step_journal(self) -> StepJournal:
+        """Real-time step journal (created on first use)"""
+        if self._step_journal is None:
+            self._step_journal = StepJournal(self.sessions_dir, self.project_root / "project_resume.md")
+        return self._step_journal
+
+    @property
+    def current_session_file(self) -> Optional[Path]:
+        """Markdown file for this logger's real-time steps, once one was logged"""
+        return self._step_journal.current_session_file if self._step_journal else None
+
+    def log_step(self, action: str, files_modified: Optional[list[str]] = None,
+                 decision: Optional[str] = None, next_step: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Log a single step in real-time (for auto_log mode)
+
+        Appends to .deia/sessions/steps.jsonl and the realtime session file;
+        project_resume.md's recent-steps view is refreshed shortly after
+        (or via self.step_journal.materialize()).
+
+        Args:
+            action: What was done in this step
+            files_modified: Files created/modified in this step
+            decision: Key decision made (if any)
+            next_step: What comes next (if known)
+
+        Returns:
+            The journal record
+        """
+        return self.step_journal.log_step(action, files_modified, decision, next_step)
 
     def create_session_log(
         self,
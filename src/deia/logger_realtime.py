@@ -1,48 +1,201 @@
 """
-Real-time logging extension for DEIA
-
-Add this to logger.py:
-
-1. In __init__, add:
-   self.current_session_file = None
-
-2. Add this method to ConversationLogger class:
+Real-time step logging for DEIA (auto_log mode)
+
+Steps are appended to an append-only JSONL journal (.deia/sessions/steps.jsonl)
+and to the current realtime session markdown file, so logging a step costs
+one append no matter how long the session runs.
+
+The "Current Session (Real-Time)" section of project_resume.md is a bounded
+view of the most recent steps. It is rewritten on demand (materialize()),
+after a short debounce once steps stop arriving, and at exit - never once
+per step.
+
+Usage (via ConversationLogger):
+    logger = ConversationLogger()
+    logger.log_step(
+        action="Created authentication module",
+        files_modified=["src/auth.py"],
+        decision="Using JWT tokens instead of sessions",
+        next_step="Add rate limiting"
+    )
 """
 
+import atexit
+import json
+import os
+import threading
+import weakref
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-
-def log_step(self, action: str, files_modified: Optional[list[str]] = None,
-             decision: Optional[str] = None, next_step: Optional[str] = None):
-    """
-    Log a single step in real-time (for auto_log mode)
-
-    Usage:
-        logger = ConversationLogger()
-        logger.log_step(
-            action="Created authentication module",
-            files_modified=["src/auth.py"],
-            decision="Using JWT tokens instead of sessions",
-            next_step="Add rate limiting"
-        )
-
-    Args:
-        action: What was done in this step
-        files_modified: Files created/modified in this step
-        decision: Key decision made (if any)
-        next_step: What comes next (if known)
-    """
-    timestamp = datetime.now()
-
-    # Create a session file if we don't have one yet
-    if self.current_session_file is None or not self.current_session_file.exists():
-        filename = timestamp.strftime("%Y%m%d-%H%M%S-realtime.md")
-        self.current_session_file = self.sessions_dir / filename
-
-        # Initialize the session file
-        header = f"""# DEIA Real-Time Session Log
+from typing import Any, Dict, List, Optional
+
+RESUME_SECTION = "## Current Session (Real-Time)"
+
+
+class StepJournal:
+    """Append-only journal of realtime steps with a bounded recent-steps view."""
+
+    # Steps shown in project_resume.md
+    RECENT_STEPS = 20
+
+    # Quiet period before the resume view is rewritten
+    DEBOUNCE_SECONDS = 2.0
+
+    def __init__(
+        self,
+        sessions_dir: Path,
+        resume_file: Path,
+        recent_steps: int = RECENT_STEPS,
+        debounce_seconds: Optional[float] = DEBOUNCE_SECONDS
+    ):
+        """
+        Initialize step journal
+
+        Args:
+            sessions_dir: Directory for the journal and realtime session files
+            resume_file: project_resume.md to keep the recent-steps view in
+            recent_steps: Number of steps in the resume view
+            debounce_seconds: Rewrite the view this long after the last step
+                (None = only on materialize()/close())
+        """
+        self.sessions_dir = Path(sessions_dir)
+        self.resume_file = Path(resume_file)
+        self.journal_file = self.sessions_dir / "steps.jsonl"
+        self.recent_limit = recent_steps
+        self.debounce_seconds = debounce_seconds
+        self.current_session_file: Optional[Path] = None
+
+        self._lock = threading.RLock()
+        self._recent: Optional[deque] = None
+        self._journal = None
+        self._session = None
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+
+        # Short-lived processes exit before the debounce fires
+        atexit.register(_close_at_exit, weakref.ref(self))
+
+    def log_step(
+        self,
+        action: str,
+        files_modified: Optional[List[str]] = None,
+        decision: Optional[str] = None,
+        next_step: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Log a single step in real-time
+
+        Args:
+            action: What was done in this step
+            files_modified: Files created/modified in this step
+            decision: Key decision made (if any)
+            next_step: What comes next (if known)
+
+        Returns:
+            The journal record
+        """
+        timestamp = datetime.now()
+        with self._lock:
+            self._open_session(timestamp)
+            step = {
+                "timestamp": timestamp.isoformat(),
+                "session": self.current_session_file.name,
+                "action": action,
+                "files_modified": files_modified or [],
+                "decision": decision,
+                "next_step": next_step
+            }
+
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'a', encoding='utf-8')
+            self._journal.write(json.dumps(step) + "\n")
+            self._journal.flush()
+
+            self._session.write(self._format_step(step, timestamp))
+            self._session.flush()
+
+            self._recent_steps().append(step)
+            self._dirty = True
+            self._schedule()
+        return step
+
+    def recent_steps(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Most recent steps, newest first."""
+        with self._lock:
+            steps = list(reversed(self._recent_steps()))
+        return steps[:limit] if limit else steps
+
+    def materialize(self) -> Path:
+        """Rewrite the recent-steps section of project_resume.md now."""
+        with self._lock:
+            self._cancel_timer()
+            self._dirty = False
+            return self._write_resume(list(reversed(self._recent_steps())))
+
+    def _write_resume(self, steps: List[Dict[str, Any]]) -> Path:
+        timestamp = datetime.now()
+        lines = [RESUME_SECTION, ""]
+        lines += [self._format_summary(step) for step in steps]
+        lines.append("")
+
+        if self.resume_file.exists():
+            content = self.resume_file.read_text(encoding='utf-8').split('\n')
+        else:
+            content = [
+                "# DEIA Project Resume",
+                "",
+                "**Quick Start for Claude Code:** This file tracks the most recent work in real-time.",
+                "",
+                f"**Last Updated:** {timestamp.isoformat()}",
+                "",
+                "---",
+                ""
+            ]
+
+        for i, line in enumerate(content):
+            if line.startswith('**Last Updated:**'):
+                content[i] = f'**Last Updated:** {timestamp.isoformat()}'
+                break
+
+        # Replace the section (up to the next "## " header), or add it at the end
+        start = next((i for i, line in enumerate(content) if line.startswith('## Current Session')), None)
+        if start is None:
+            if content and content[-1].strip():
+                content.append("")
+            content += lines
+        else:
+            end = next(
+                (i for i in range(start + 1, len(content)) if content[i].startswith('## ')),
+                len(content)
+            )
+            content[start:end] = lines
+
+        temp_file = self.resume_file.with_name(self.resume_file.name + ".tmp")
+        temp_file.write_text('\n'.join(content), encoding='utf-8')
+        os.replace(temp_file, self.resume_file)
+        return self.resume_file
+
+    def close(self):
+        """Materialize pending steps and close open files."""
+        with self._lock:
+            if self._dirty:
+                self.materialize()
+            self._cancel_timer()
+            for handle in (self._journal, self._session):
+                if handle is not None:
+                    handle.close()
+            self._journal = None
+            self._session = None
+
+    def _open_session(self, timestamp: datetime):
+        """Create this logger's realtime session file on the first step."""
+        if self._session is not None:
+            return
+        if self.current_session_file is None or not self.current_session_file.exists():
+            filename = timestamp.strftime("%Y%m%d-%H%M%S-realtime.md")
+            self.current_session_file = self.sessions_dir / filename
+            self.current_session_file.write_text(f"""# DEIA Real-Time Session Log
 
 **Started:** {timestamp.isoformat()}
 **Status:** Active (real-time logging)
@@ -51,84 +204,89 @@ def log_step(self, action: str, files_modified: Optional[list[str]] = None,
 
 ## Session Steps
 
-"""
-        self.current_session_file.write_text(header, encoding='utf-8')
-
-    # Append this step
-    files_text = ", ".join(f"`{f}`" for f in files_modified) if files_modified else "None"
-
-    step_content = f"""### [{timestamp.strftime('%H:%M:%S')}] {action}
-
-"""
-    if files_modified:
-        step_content += f"**Files:** {files_text}\n\n"
-    if decision:
-        step_content += f"**Decision:** {decision}\n\n"
-    if next_step:
-        step_content += f"**Next:** {next_step}\n\n"
-
-    step_content += "---\n\n"
-
-    # Append to session file
-    with open(self.current_session_file, 'a', encoding='utf-8') as f:
-        f.write(step_content)
-
-    # Also update project_resume in real-time
-    self._update_resume_with_step(action, files_modified, decision)
-
-
-def _update_resume_with_step(self, action: str, files_modified: Optional[list[str]],
-                              decision: Optional[str]):
-    """Update project_resume.md with the latest step"""
-    resume_file = self.project_root / "project_resume.md"
-    timestamp = datetime.now()
-
-    # Create if doesn't exist
-    if not resume_file.exists():
-        template = f"""# DEIA Project Resume
-
-**Quick Start for Claude Code:** This file tracks the most recent work in real-time.
-
-**Last Updated:** {timestamp.isoformat()}
-
----
-
-## Current Session (Real-Time)
-
-"""
-        resume_file.write_text(template, encoding='utf-8')
-
-    # Read current content
-    content = resume_file.read_text(encoding='utf-8')
-
-    # Update timestamp
-    lines = content.split('\n')
-    for i, line in enumerate(lines):
-        if line.startswith('**Last Updated:**'):
-            lines[i] = f'**Last Updated:** {timestamp.isoformat()}'
-            break
-
-    # Find where to insert (after "## Current Session" header)
-    current_session_idx = None
-    for i, line in enumerate(lines):
-        if '## Current Session' in line:
-            current_session_idx = i + 1
-            break
-
-    if current_session_idx is not None:
-        # Build step summary
-        step_line = f"- **[{timestamp.strftime('%H:%M')}]** {action}"
-        if decision:
-            step_line += f" → *{decision}*"
-        if files_modified:
-            step_line += f" ({', '.join(f'`{f}`' for f in files_modified)})"
-
-        # Insert after the header (but skip blank line if present)
-        insert_idx = current_session_idx
-        if insert_idx < len(lines) and lines[insert_idx].strip() == '':
-            insert_idx += 1
-
-        lines.insert(insert_idx, step_line)
-
-    # Write back
-    resume_file.write_text('\n'.join(lines), encoding='utf-8')
+""", encoding='utf-8')
+        self._session = open(self.current_session_file, 'a', encoding='utf-8')
+
+    def _recent_steps(self) -> deque:
+        """Recent steps oldest-first, seeded from the journal's tail."""
+        if self._recent is None:
+            self._recent = deque(maxlen=self.recent_limit)
+            for line in reversed(self._tail_lines(self.journal_file, self.recent_limit)):
+                try:
+                    self._recent.append(json.loads(line))
+                except ValueError:
+                    continue
+        return self._recent
+
+    @staticmethod
+    def _tail_lines(path: Path, count: int, block_size: int = 8192) -> List[bytes]:
+        """Last `count` non-empty lines of a file, newest first."""
+        lines: List[bytes] = []
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return lines
+        with f:
+            position = f.seek(0, os.SEEK_END)
+            tail = b""
+            while position > 0 and len(lines) < count:
+                size = min(block_size, position)
+                position -= size
+                f.seek(position)
+                chunk = (f.read(size) + tail).split(b"\n")
+                tail = chunk[0]
+                lines += [line for line in reversed(chunk[1:]) if line.strip()]
+            if position == 0 and tail.strip():
+                lines.append(tail)
+        return lines[:count]
+
+    def _schedule(self):
+        """(Re)start the debounce timer for materialize()."""
+        if self.debounce_seconds is None:
+            return
+        self._cancel_timer()
+        self._timer = threading.Timer(self.debounce_seconds, self._materialize_if_dirty)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _materialize_if_dirty(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self.materialize()
+
+    @staticmethod
+    def _format_step(step: Dict[str, Any], timestamp: datetime) -> str:
+        """Markdown block for the session file."""
+        content = f"### [{timestamp.strftime('%H:%M:%S')}] {step['action']}\n\n"
+        if step["files_modified"]:
+            content += f"**Files:** {', '.join(f'`{f}`' for f in step['files_modified'])}\n\n"
+        if step["decision"]:
+            content += f"**Decision:** {step['decision']}\n\n"
+        if step["next_step"]:
+            content += f"**Next:** {step['next_step']}\n\n"
+        return content + "---\n\n"
+
+    @staticmethod
+    def _format_summary(step: Dict[str, Any]) -> str:
+        """One-line summary for the resume view."""
+        line = f"- **[{step['timestamp'][11:16]}]** {step['action']}"
+        if step.get("decision"):
+            line += f" → *{step['decision']}*"
+        if step.get("files_modified"):
+            line += f" ({', '.join(f'`{f}`' for f in step['files_modified'])})"
+        return line
+
+
+def _close_at_exit(journal_ref):
+    journal = journal_ref()
+    if journal is not None:
+        try:
+            journal.close()
+        except Exception:
+            pass
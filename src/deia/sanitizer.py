@@ -1,9 +1,103 @@
 """
 Automated sanitization of session logs
+
+All redaction patterns are compiled into one alternation, so content is
+redacted and counted in a single pass; a second pass over the result
+checks for high-entropy strings and likely personal names. Large
+transcripts can be sanitized in chunks (StreamingSanitizer) and whole
+session directories in parallel (sanitize_directory).
 """
 
+import math
 import re
-from typing import Tuple, List
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .services.telemetry_etl import map_batches, resolve_workers
+
+
+# Capitalized words that are common in coding sessions and not names
+NAME_EXCLUDE = frozenset({
+    'Python', 'JavaScript', 'TypeScript', 'React', 'Vue', 'Angular',
+    'Django', 'Flask', 'FastAPI', 'Express', 'Node', 'MongoDB',
+    'PostgreSQL', 'Redis', 'Docker', 'Kubernetes', 'Git', 'GitHub',
+    'Claude', 'Cursor', 'Copilot', 'VSCode', 'Windows', 'Linux', 'Mac',
+    'Chrome', 'Firefox', 'Safari', 'Edge', 'Netflix', 'Amazon', 'Google',
+    'Microsoft', 'Apple', 'Meta', 'Twitter', 'Facebook', 'OpenAI',
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday',
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+})
+
+# Alphanumeric words; long ones are entropy candidates, capitalized ones name candidates
+_WORD = re.compile(r'\b[A-Za-z0-9]{3,}\b')
+_CAPITALIZED = re.compile(r'[A-Z][a-z]{2,}')
+_GROUP_REF = re.compile(r'\\(\d+)')
+
+ENTROPY_MIN_LENGTH = 20
+ENTROPY_THRESHOLD = 4.0
+NAME_REPEAT_THRESHOLD = 3
+
+# Default chunk size for streaming files, and how much trailing text is held
+# back between chunks so matches spanning a chunk boundary are still found
+STREAM_CHUNK_SIZE = 1 << 20
+STREAM_OVERLAP = 4096
+
+# Replaces the part of an overlapping match that runs past the winning match
+REDACTED = '[redacted]'
+
+
+def _shannon_entropy(text: str) -> float:
+    length = len(text)
+    return -sum(
+        (count / length) * math.log2(count / length)
+        for count in Counter(text).values()
+    )
+
+
+class ScanReport:
+    """Running counts for one sanitization (whole content or a stream)"""
+
+    def __init__(self, pattern_names: Iterable[str]):
+        self.counts: Dict[str, int] = {name: 0 for name in pattern_names}
+        self.high_entropy: List[str] = []
+        self.name_counts: Counter = Counter()
+
+    def scan_output(self, text: str) -> None:
+        """Record entropy and name candidates in sanitized text (one pass)."""
+        for word in _WORD.findall(text):
+            # High entropy suggests randomness (like API keys)
+            if len(word) >= ENTROPY_MIN_LENGTH and _shannon_entropy(word) > ENTROPY_THRESHOLD:
+                self.high_entropy.append(word)
+            # Repeated capitalized words that aren't common coding terms
+            if _CAPITALIZED.fullmatch(word) and word not in NAME_EXCLUDE:
+                self.name_counts[word] += 1
+
+    @property
+    def likely_names(self) -> bool:
+        return any(count >= NAME_REPEAT_THRESHOLD for count in self.name_counts.values())
+
+    def warnings(self) -> List[str]:
+        warnings = [
+            f"Found {count} {name} pattern(s)"
+            for name, count in self.counts.items() if count
+        ]
+
+        # Check for high-entropy strings (potential secrets)
+        if self.high_entropy:
+            warnings.append(
+                f"Found {len(self.high_entropy)} high-entropy strings (potential secrets). "
+                "Review manually."
+            )
+
+        # Check for common name patterns
+        if self.likely_names:
+            warnings.append(
+                "Content may contain personal names. Review manually."
+            )
+
+        return warnings
 
 
 class Sanitizer:
@@ -11,6 +105,7 @@ class Sanitizer:
 
     def __init__(self):
         self.patterns = self._load_patterns()
+        self._scanner, self._replacements = self._compile(self.patterns)
 
     def _load_patterns(self) -> dict:
         """Load sanitization patterns"""
@@ -65,6 +160,96 @@ class Sanitizer:
             ),
         }
 
+    @staticmethod
+    def _compile(patterns: dict):
+        """
+        Combine all patterns into one named alternation.
+
+        Replacements are literal text unless they reference groups (\\1),
+        which are renumbered to the pattern's groups inside the combined regex.
+
+        A trailing word boundary also matches where a URL starts: URLs are
+        replaced with a bracketed placeholder, so text glued to one (an IP
+        in "10.0.0.1http://...") is still redacted.
+        """
+        alternatives = []
+        for name, (pattern, _) in patterns.items():
+            if pattern.startswith('(?i)'):
+                # Global flags must lead the regex; scope them to this alternative
+                pattern = f'(?i:{pattern[4:]})'
+            if pattern.endswith(r'\b'):
+                pattern = pattern[:-2] + r'(?:\b|(?=https?://))'
+            alternatives.append(f'(?P<{name}>{pattern})')
+        scanner = re.compile('|'.join(alternatives))
+
+        replacements = {}
+        for name, (_, replacement) in patterns.items():
+            if _GROUP_REF.search(replacement):
+                offset = scanner.groupindex[name]
+                template = _GROUP_REF.sub(lambda m: f'\\g<{offset + int(m.group(1))}>', replacement)
+                replacements[name] = (template, True)
+            else:
+                replacements[name] = (replacement, False)
+        return scanner, replacements
+
+    def new_report(self) -> ScanReport:
+        return ScanReport(self.patterns)
+
+    def redact(self, text: str, report: ScanReport, limit: Optional[int] = None) -> Tuple[str, int]:
+        """
+        Redact matches in text in one pass, counting them in report.
+
+        Where patterns overlap, the leftmost match wins (earlier patterns
+        first at the same position) and is counted once. A match that starts
+        inside the winning match but runs past its end (e.g. a
+        "password= value" tail after a database URL) is counted too, and the
+        part past the end is redacted, so overlaps never expose text that
+        applying the patterns one after another would have hidden.
+
+        Args:
+            text: Text to redact
+            report: Report to record match counts in
+            limit: For streaming - stop before any match ending past this
+                offset, since more input could still change it
+
+        Returns:
+            Tuple of (redacted text, number of input characters consumed)
+        """
+        parts = []
+        pos = 0
+        cut = len(text) if limit is None else limit
+        match = self._scanner.search(text)
+        while match is not None:
+            name = match.lastgroup
+            replacement, is_template = self._replacements[name]
+            spans = [(name, match.start(), match.end(), match.expand(replacement) if is_template else replacement)]
+            # Matches starting inside the current span and ending past it
+            end = match.end()
+            following = self._scanner.search(text, match.start() + 1)
+            while following is not None and following.start() < end:
+                if following.end() > end:
+                    tail = text[end:following.end()]
+                    lead = tail[:len(tail) - len(tail.lstrip())]
+                    spans.append((following.lastgroup, end, following.end(), lead + REDACTED))
+                    end = following.end()
+                following = self._scanner.search(text, following.start() + 1)
+
+            if limit is not None and end > limit:
+                cut = min(match.start(), limit)
+                break
+            parts.append(text[pos:match.start()])
+            for span_name, _, _, redacted in spans:
+                parts.append(redacted)
+                report.counts[span_name] += 1
+            pos = end
+            # `following` is the leftmost match at or after `end`
+            match = following
+
+        if limit is not None:
+            cut = max(pos, _whitespace_cut(text, pos, cut))
+        parts.append(text[pos:cut])
+        return ''.join(parts), cut
+
     def sanitize(self, content: str) -> Tuple[str, List[str]]:
         """
         Sanitize content
@@ -76,82 +261,141 @@ class Sanitizer:
             Tuple of (sanitized_content, warnings)
         """
 
-        sanitized = content
-        warnings = []
+        report = self.new_report()
+        sanitized, _ = self.redact(content, report)
+        report.scan_output(sanitized)
+        return sanitized, report.warnings()
 
-        # Apply each pattern
-        for name, (pattern, replacement) in self.patterns.items():
-            matches = re.findall(pattern, sanitized)
-            if matches:
-                warnings.append(f"Found {len(matches)} {name} pattern(s)")
-                sanitized = re.sub(pattern, replacement, sanitized)
-
-        # Check for high-entropy strings (potential secrets)
-        high_entropy = self._find_high_entropy_strings(sanitized)
-        if high_entropy:
-            warnings.append(
-                f"Found {len(high_entropy)} high-entropy strings (potential secrets). "
-                "Review manually."
-            )
-
-        # Check for common name patterns
-        if self._contains_likely_names(sanitized):
-            warnings.append(
-                "Content may contain personal names. Review manually."
-            )
+    def sanitize_stream(self, chunks: Iterable[str], report: Optional[ScanReport] = None,
+                        overlap: int = STREAM_OVERLAP) -> Iterator[str]:
+        """
+        Sanitize an iterable of text chunks, yielding sanitized text.
 
-        return sanitized, warnings
+        Pass a ScanReport (see new_report()) to collect warnings once the
+        stream is exhausted.
+        """
+        stream = StreamingSanitizer(self, overlap=overlap, report=report)
+        for chunk in chunks:
+            out = stream.feed(chunk)
+            if out:
+                yield out
+        out = stream.close()
+        if out:
+            yield out
+
+    def sanitize_file(self, input_path: Path, output_path: Path,
+                      chunk_size: int = STREAM_CHUNK_SIZE) -> List[str]:
+        """Stream input_path to output_path in chunks; returns warnings."""
+        report = self.new_report()
+        with open(input_path, 'r', encoding='utf-8') as src, \
+                open(output_path, 'w', encoding='utf-8') as dst:
+            chunks = iter(lambda: src.read(chunk_size), '')
+            for out in self.sanitize_stream(chunks, report):
+                dst.write(out)
+        return report.warnings()
 
     def _find_high_entropy_strings(self, content: str) -> List[str]:
         """Find strings with high entropy (potential secrets)"""
-
-        import math
-        from collections import Counter
-
-        candidates = re.findall(r'\b[A-Za-z0-9]{20,}\b', content)
-        high_entropy = []
-
-        for candidate in candidates:
-            # Calculate Shannon entropy
-            counter = Counter(candidate)
-            length = len(candidate)
-            entropy = -sum(
-                (count / length) * math.log2(count / length)
-                for count in counter.values()
-            )
-
-            # High entropy suggests randomness (like API keys)
-            if entropy > 4.0:  # Threshold
-                high_entropy.append(candidate)
-
-        return high_entropy
+        report = self.new_report()
+        report.scan_output(content)
+        return report.high_entropy
 
     def _contains_likely_names(self, content: str) -> bool:
         """Check if content contains likely personal names"""
-
-        # Simple heuristic: capitalized words that appear frequently
-        # This will have false positives (coding terms, framework names)
-        # But better to warn and let human review
-
-        capitalized = re.findall(r'\b[A-Z][a-z]{2,}\b', content)
-
-        # Exclude common coding terms
-        exclude = {
-            'Python', 'JavaScript', 'TypeScript', 'React', 'Vue', 'Angular',
-            'Django', 'Flask', 'FastAPI', 'Express', 'Node', 'MongoDB',
-            'PostgreSQL', 'Redis', 'Docker', 'Kubernetes', 'Git', 'GitHub',
-            'Claude', 'Cursor', 'Copilot', 'VSCode', 'Windows', 'Linux', 'Mac',
-            'Chrome', 'Firefox', 'Safari', 'Edge', 'Netflix', 'Amazon', 'Google',
-            'Microsoft', 'Apple', 'Meta', 'Twitter', 'Facebook', 'OpenAI',
-            'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday',
-            'January', 'February', 'March', 'April', 'May', 'June',
-            'July', 'August', 'September', 'October', 'November', 'December'
-        }
-
-        potential_names = [w for w in capitalized if w not in exclude]
-
-        # If same capitalized word appears multiple times, likely a name
-        from collections import Counter
-        counter = Counter(potential_names)
-
-        return any(count >= 3 for count in counter.values())
+        report = self.new_report()
+        report.scan_output(content)
+        return report.likely_names
+
+
+def _whitespace_cut(text: str, start: int, end: int) -> int:
+    """Move a chunk cut back to just after the last whitespace in text[start:end].
+
+    Cutting between words keeps word boundaries (\\b) and word-based checks
+    identical to scanning the whole text at once.
+    """
+    best = max(text.rfind(ws, start, end) for ws in (' ', '\n', '\t', '\r'))
+    return best + 1 if best >= start else end
+
+
+class StreamingSanitizer:
+    """
+    Incremental sanitizer for content that arrives in chunks
+
+    Each feed() returns the sanitized text that is now final. The last
+    `overlap` characters (and any match that reaches into them) are held
+    back until more input or close() arrives, so a match split across
+    chunks is found as long as it is shorter than `overlap`.
+    """
+
+    def __init__(self, sanitizer: Optional[Sanitizer] = None, overlap: int = STREAM_OVERLAP,
+                 report: Optional[ScanReport] = None):
+        self.sanitizer = sanitizer or Sanitizer()
+        self.overlap = overlap
+        self.report = report if report is not None else self.sanitizer.new_report()
+        self._carry = ''
+
+    def feed(self, chunk: str) -> str:
+        buffer = self._carry + chunk
+        limit = len(buffer) - self.overlap
+        if limit <= 0:
+            self._carry = buffer
+            return ''
+        out, consumed = self.sanitizer.redact(buffer, self.report, limit)
+        self._carry = buffer[consumed:]
+        self.report.scan_output(out)
+        return out
+
+    def close(self) -> str:
+        out, _ = self.sanitizer.redact(self._carry, self.report)
+        self._carry = ''
+        self.report.scan_output(out)
+        return out
+
+    def warnings(self) -> List[str]:
+        return self.report.warnings()
+
+
+def _sanitized_path(input_file: Path, output_dir: Optional[Path]) -> Path:
+    target_dir = output_dir if output_dir is not None else input_file.parent
+    return target_dir / f"{input_file.stem}_SANITIZED{input_file.suffix}"
+
+
+def _sanitize_one(args: Tuple[str, Optional[str]]) -> Tuple[str, List[str]]:
+    """Process-pool worker: sanitize one file, write output and warnings."""
+    input_path, output_dir = args
+    input_file = Path(input_path)
+    output_file = _sanitized_path(input_file, Path(output_dir) if output_dir else None)
+    warnings = Sanitizer().sanitize_file(input_file, output_file)
+    if warnings:
+        warning_file = output_file.parent / f"{output_file.stem}_WARNINGS.txt"
+        warning_file.write_text('\n'.join(warnings), encoding='utf-8')
+    return input_path, warnings
+
+
+def sanitize_directory(directory: Path, output_dir: Optional[Path] = None,
+                       pattern: str = '*.md', workers: Optional[int] = None) -> Dict[str, List[str]]:
+    """
+    Sanitize every matching file in a directory, in parallel.
+
+    Outputs follow sanitize_file naming (<stem>_SANITIZED<suffix>, plus
+    <stem>_SANITIZED_WARNINGS.txt when there are warnings), next to the
+    input or in output_dir. Files that are already sanitized are skipped.
+
+    Args:
+        directory: Directory containing session files
+        output_dir: Where to write sanitized files (default: alongside inputs)
+        pattern: Glob for files to sanitize
+        workers: Process count (None/0 = auto; 1 = serial)
+
+    Returns:
+        Dict of input path -> warnings, in sorted path order
+    """
+    files = sorted(
+        p for p in Path(directory).glob(pattern)
+        if p.is_file() and not p.stem.endswith('_SANITIZED') and not p.stem.endswith('_WARNINGS')
+    )
+    if output_dir is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+    jobs = [(str(p), str(output_dir) if output_dir is not None else None) for p in files]
+
+    return dict(map_batches(_sanitize_one, jobs, resolve_workers(workers)))
@@ -9,12 +9,18 @@ Violations:
 - Major (full RCA): hallucination, stealing work, lying, scope violation
 
 Bot writes their own mea culpa when violations detected.
+
+Each cycle indexes the responses dir once for all bots, reuses the last
+verdict for bots whose heartbeat, responses and status entry are
+unchanged, and runs the remaining LLM checks concurrently.
 """
 
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 import json
+import re
 import time
 import os
 import yaml
@@ -43,14 +49,31 @@ class ScrumMaster:
         "out of scope"
     ]
 
+    # Heartbeat age after which a bot counts as not checking in
+    HEARTBEAT_STALE_MINUTES = 5
+
+    # Re-ask the LLM about an unchanged bot after this long
+    VERDICT_TTL_SECONDS = 1800
+
+    # Recent responses included per bot
+    RECENT_RESPONSES = 3
+
     def __init__(
         self,
         work_dir: Path,
         queen_id: str = "CLAUDE-CODE-001",
         scrum_id: str = "SCRUM-MASTER-001",
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        max_workers: int = 8,
+        client=None
     ):
-        """Initialize ScrumMaster."""
+        """
+        Initialize ScrumMaster.
+
+        Args:
+            max_workers: Concurrent compliance checks per cycle
+            client: Pre-built Anthropic-compatible client (skips API key setup)
+        """
         self.work_dir = Path(work_dir)
         self.queen_id = queen_id
         self.scrum_id = scrum_id
@@ -73,14 +96,18 @@ class ScrumMaster:
 
         # Initialize Claude API
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
-        if not self.api_key:
-            raise EnvironmentError("ANTHROPIC_API_KEY not set")
+        if client is not None:
+            self.client = client
+        else:
+            if not self.api_key:
+                raise EnvironmentError("ANTHROPIC_API_KEY not set")
 
-        try:
-            from anthropic import Anthropic
-            self.client = Anthropic(api_key=self.api_key)
-        except ImportError:
-            raise ImportError("pip install anthropic")
+            try:
+                from anthropic import Anthropic
+                self.client = Anthropic(api_key=self.api_key)
+            except ImportError:
+                raise ImportError("pip install anthropic")
+        self.max_workers = max(1, max_workers)
 
         # Load playbook
         self.playbook = self._load_playbook()
@@ -90,6 +117,15 @@ class ScrumMaster:
         self.violation_counts: Dict[str, Dict[str, int]] = {}  # bot_id -> {violation_type -> count}
         self.out_of_order_bots: set = set()  # Bots marked as out of order
 
+        # Change detection: bot_id -> (fingerprint, verdict, checked_at)
+        self.verdicts: Dict[str, Tuple[str, Dict, float]] = {}
+        # (mtime_ns, size) -> parsed value, per path
+        self._heartbeat_cache: Dict[Path, Tuple[Tuple[int, int], Optional[Dict]]] = {}
+        self._response_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        # Response filename -> bot ids it belongs to
+        self._response_owners: Dict[str, List[str]] = {}
+        self._owner_bots: frozenset = frozenset()
+
     def _load_playbook(self) -> str:
         """Load CHECKIN.md protocol."""
         if self.checkin_protocol.exists():
@@ -111,9 +147,12 @@ class ScrumMaster:
             "compliant": [],
             "violations": {},
             "pokes_sent": 0,
-            "reports_sent": 0
+            "reports_sent": 0,
+            "llm_checks": 0,
+            "unchanged": 0
         }
 
+        active = {}
         for bot_id, bot_info in bots.items():
             if bot_id == self.queen_id:
                 continue
@@ -123,12 +162,44 @@ class ScrumMaster:
                 self._log(f"Skipping {bot_id}: OUT OF ORDER")
                 continue
 
-            self._log(f"Checking: {bot_id}")
+            active[bot_id] = bot_info
+
+        responses = self._index_responses(list(active))
+
+        # Gather state; reuse verdicts for bots with nothing new
+        gathered = {}
+        to_check = []
+        now = time.time()
+        for bot_id, bot_info in active.items():
+            bot_data = self._gather_bot_data(bot_id, bot_info, responses)
+            fingerprint = self._fingerprint(bot_data)
+            gathered[bot_id] = (bot_data, fingerprint)
+            cached = self.verdicts.get(bot_id)
+            if cached is None or cached[0] != fingerprint or now - cached[2] > self.VERDICT_TTL_SECONDS:
+                to_check.append(bot_id)
+
+        # Ask the LLM about changed bots concurrently
+        fresh: Dict[str, Dict] = {}
+        if to_check:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(to_check))) as pool:
+                checks = pool.map(lambda b: self._check_compliance(b, gathered[b][0]), to_check)
+                for bot_id, compliance in zip(to_check, checks):
+                    fresh[bot_id] = compliance
+                    if "error" not in compliance:
+                        self.verdicts[bot_id] = (gathered[bot_id][1], compliance, now)
+        results["llm_checks"] = len(to_check)
+
+        for bot_id in active:
+            bot_data = gathered[bot_id][0]
+            if bot_id in fresh:
+                self._log(f"Checking: {bot_id}")
+                compliance = fresh[bot_id]
+            else:
+                self._log(f"Checking: {bot_id} (unchanged, reusing verdict)")
+                compliance = self.verdicts[bot_id][1]
+                results["unchanged"] += 1
             results["bots_checked"] += 1
 
-            bot_data = self._gather_bot_data(bot_id, bot_info)
-            compliance = self._check_compliance(bot_id, bot_data)
-
             if compliance["compliant"]:
                 results["compliant"].append(bot_id)
                 self._log(f"  [PASS] {bot_id}")
@@ -163,10 +234,107 @@ class ScrumMaster:
                     self._alert_queen(bot_id, violations)
                     results["reports_sent"] += 1
 
-        self._log(f"Cycle complete: {results['pokes_sent']} pokes, {results['reports_sent']} alerts")
+        self._log(
+            f"Cycle complete: {results['llm_checks']} LLM checks, "
+            f"{results['pokes_sent']} pokes, {results['reports_sent']} alerts"
+        )
         return results
 
-    def _gather_bot_data(self, bot_id: str, bot_info: Dict) -> Dict:
+    def _fingerprint(self, bot_data: Dict) -> str:
+        """Everything a verdict depends on, minus the ticking heartbeat age."""
+        age = bot_data["time_since_heartbeat_min"]
+        state = dict(bot_data, time_since_heartbeat_min=None)
+        state["heartbeat_stale"] = age is None or age > self.HEARTBEAT_STALE_MINUTES
+        return json.dumps(state, sort_keys=True, default=str)
+
+    def _index_responses(self, bot_ids: List[str]) -> Dict[str, List[Path]]:
+        """
+        Most recent response files per bot, from one scan of the responses dir.
+
+        A file belongs to every bot whose id appears as "-{bot_id}-" in its name.
+        """
+        bot_set = frozenset(bot_ids)
+        if bot_set != self._owner_bots:
+            self._response_owners = {}
+            self._owner_bots = bot_set
+
+        files: Dict[str, List[Tuple[float, str]]] = {bot_id: [] for bot_id in bot_ids}
+        seen = set()
+        try:
+            entries = list(os.scandir(self.response_dir))
+        except OSError:
+            entries = []
+        for entry in entries:
+            name = entry.name
+            seen.add(name)
+            owners = self._response_owners.get(name)
+            if owners is None:
+                owners = [b for b in bot_ids if f"-{b}-" in name]
+                self._response_owners[name] = owners
+            if not owners:
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            for bot_id in owners:
+                files[bot_id].append((mtime, name))
+
+        # Forget deleted files
+        for name in set(self._response_owners) - seen:
+            del self._response_owners[name]
+            self._response_cache.pop(name, None)
+
+        return {
+            bot_id: [self.response_dir / name for _, name in sorted(items, reverse=True)[:self.RECENT_RESPONSES]]
+            for bot_id, items in files.items()
+        }
+
+    @staticmethod
+    def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _read_heartbeat(self, hb_file: Path) -> Optional[Dict]:
+        """Parsed heartbeat YAML, re-read only when the file changes."""
+        key = self._stat_key(hb_file)
+        if key is None:
+            self._heartbeat_cache.pop(hb_file, None)
+            return None
+        cached = self._heartbeat_cache.get(hb_file)
+        if cached is None or cached[0] != key:
+            try:
+                hb = yaml.safe_load(hb_file.read_text())
+            except Exception:
+                hb = None
+            cached = (key, hb)
+            self._heartbeat_cache[hb_file] = cached
+        return cached[1]
+
+    def _read_response(self, path: Path) -> Optional[str]:
+        """First 300 chars of a response, re-read only when the file changes."""
+        key = self._stat_key(path)
+        if key is None:
+            return None
+        cached = self._response_cache.get(path.name)
+        if cached is None or cached[0] != key:
+            try:
+                text = path.read_text(encoding="utf-8")[:300]
+            except (OSError, UnicodeDecodeError):
+                return None
+            cached = (key, text)
+            self._response_cache[path.name] = cached
+        return cached[1]
+
+    def _gather_bot_data(
+        self,
+        bot_id: str,
+        bot_info: Dict,
+        responses: Optional[Dict[str, List[Path]]] = None
+    ) -> Dict:
         """Gather bot data for analysis."""
         data = {
             "bot_id": bot_id,
@@ -180,28 +348,27 @@ class ScrumMaster:
 
         # Get heartbeat
         hb_file = self.heartbeat_dir / f"{bot_id}-heartbeat.yaml"
-        if hb_file.exists():
+        hb = self._read_heartbeat(hb_file)
+        if hb is not None:
+            data["last_heartbeat"] = hb
             try:
-                hb = yaml.safe_load(hb_file.read_text())
-                data["last_heartbeat"] = hb
                 if "timestamp" in hb:
-                    hb_time = datetime.fromisoformat(hb["timestamp"])
+                    hb_time = datetime.fromisoformat(str(hb["timestamp"]))
                     data["time_since_heartbeat_min"] = (datetime.now() - hb_time).total_seconds() / 60
-            except:
+            except (TypeError, ValueError):
                 pass
 
         # Get recent responses
-        responses = sorted(
-            self.response_dir.glob(f"*-{bot_id}-*"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )[:3]
-
-        for resp in responses:
-            data["recent_responses"].append({
-                "file": resp.name,
-                "content": resp.read_text(encoding="utf-8")[:300]
-            })
+        if responses is None:
+            responses = self._index_responses([bot_id])
+
+        for resp in responses.get(bot_id, []):
+            content = self._read_response(resp)
+            if content is not None:
+                data["recent_responses"].append({
+                    "file": resp.name,
+                    "content": content
+                })
 
         return data
 
@@ -245,7 +412,6 @@ Major: stealing work, lying, scope violation, hallucination
 
             text = response.content[0].text
 
-            import re
             json_match = re.search(r'\{.*\}', text, re.DOTALL)
             if json_match:
                 return json.loads(json_match.group(0))
@@ -254,7 +420,8 @@ Major: stealing work, lying, scope violation, hallucination
 
         except Exception as e:
             self._log(f"LLM check failed: {e}")
-            return {"compliant": True, "violations": [], "severity": "minor"}
+            # "error" keeps this default out of the verdict cache
+            return {"compliant": True, "violations": [], "severity": "minor", "error": str(e)}
 
     def _record_violation(self, bot_id: str, violations: List[str], bot_data: Dict) -> None:
         """Record violation to analytics."""
@@ -12,16 +12,23 @@ Methods:
 - Trend analysis
 - Probabilistic alerting (80% confidence threshold)
 - Root cause suggestions
+
+Baselines are streaming: each recorded value updates Welford mean/variance,
+an EWMA and a quantile sketch in O(1), over a time-bucketed window of
+HISTORY_WINDOW_HOURS. Baselines can be exported, persisted and merged
+across bots.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
+from collections.abc import Mapping
 import json
-import statistics
 from collections import defaultdict
 
+from .streaming_stats import WindowedStats
+
 
 @dataclass
 class AnomalyEvent:
@@ -51,6 +58,60 @@ class BaselineStats:
     max: float
     p95: float
     p99: float
+    ewma: float = 0.0
+
+
+class _BaselineMap(Mapping):
+    """
+    Read-only view of current baselines, materialized on access.
+
+    Recording stays O(1); BaselineStats (including sketch percentiles) is only
+    built when a baseline is read, and cached until the metric changes.
+    """
+
+    def __init__(self, detector: "AnomalyDetector"):
+        self._detector = detector
+        self._cache: Dict[str, tuple] = {}
+
+    def _ready(self, metric_name: str) -> Optional[WindowedStats]:
+        window = self._detector.metric_windows.get(metric_name)
+        if window is None:
+            return None
+        window.expire(datetime.now().timestamp())
+        if window.stats.count < self._detector.MIN_SAMPLES_FOR_BASELINE:
+            return None
+        return window
+
+    def __getitem__(self, metric_name: str) -> BaselineStats:
+        window = self._ready(metric_name)
+        if window is None:
+            raise KeyError(metric_name)
+        cached = self._cache.get(metric_name)
+        if cached and cached[0] == window.version:
+            return cached[1]
+        stats, sketch = window.stats, window.sketch
+        baseline = BaselineStats(
+            metric_name=metric_name,
+            count=stats.count,
+            mean=stats.mean,
+            std=stats.std,
+            min=stats.min,
+            max=stats.max,
+            p95=sketch.quantile(0.95),
+            p99=sketch.quantile(0.99),
+            ewma=stats.ewma
+        )
+        self._cache[metric_name] = (window.version, baseline)
+        return baseline
+
+    def __contains__(self, metric_name: object) -> bool:
+        return isinstance(metric_name, str) and self._ready(metric_name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in list(self._detector.metric_windows) if name in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
 
 
 class AnomalyDetector:
@@ -68,7 +129,8 @@ class AnomalyDetector:
     CONFIDENCE_THRESHOLD = 0.80  # 80% to alert
     MIN_SAMPLES_FOR_BASELINE = 10
     HISTORY_WINDOW_HOURS = 24
-    DECAY_FACTOR = 0.9  # Recent data weighted more heavily
+    WINDOW_BUCKETS = 24  # Window granularity (1h buckets at 24h history)
+    DECAY_FACTOR = 0.9  # Recent data weighted more heavily (EWMA alpha = 1 - DECAY_FACTOR)
 
     # Severity mapping
     SEVERITY_THRESHOLDS = {
@@ -90,34 +152,38 @@ class AnomalyDetector:
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
         self.anomaly_log = self.log_dir / "anomalies-detected.jsonl"
+        self.baseline_file = self.log_dir / "anomaly-baselines.json"
 
-        # Track baselines per metric
-        self.baselines: Dict[str, BaselineStats] = {}
+        # Streaming window per metric (replaces raw value lists)
+        self.metric_windows: Dict[str, WindowedStats] = {}
 
-        # Track values for baseline calculation
-        self.metric_values: Dict[str, List[float]] = defaultdict(list)
+        # Baselines per metric, derived from the windows on access
+        self.baselines = _BaselineMap(self)
 
         # Track detected anomalies
         self.anomalies: List[AnomalyEvent] = []
 
-    def record_metric(self, metric_name: str, value: float) -> None:
+    def record_metric(
+        self,
+        metric_name: str,
+        value: float,
+        timestamp: Optional[datetime] = None
+    ) -> None:
         """
         Record a metric value for baseline calculation.
 
         Args:
             metric_name: Name of the metric
             value: Metric value
+            timestamp: When the value was observed (default: now)
         """
-        self.metric_values[metric_name].append(value)
-
-        # Keep only recent history
-        cutoff_time = datetime.now() - timedelta(hours=self.HISTORY_WINDOW_HOURS)
-        if len(self.metric_values[metric_name]) > 1000:
-            self.metric_values[metric_name] = self.metric_values[metric_name][-1000:]
+        window = self.metric_windows.get(metric_name)
+        if window is None:
+            window = self._new_window()
+            self.metric_windows[metric_name] = window
 
-        # Update baseline periodically
-        if len(self.metric_values[metric_name]) >= self.MIN_SAMPLES_FOR_BASELINE:
-            self._update_baseline(metric_name)
+        ts = (timestamp or datetime.now()).timestamp()
+        window.add(float(value), ts)
 
     def detect_anomaly(
         self,
@@ -226,7 +292,7 @@ class AnomalyDetector:
             "by_type": dict(by_type),
             "by_severity": dict(by_severity),
             "baseline_count": len(self.baselines),
-            "metrics_tracked": len(self.metric_values),
+            "metrics_tracked": len(self.metric_windows),
             "timestamp": datetime.now().isoformat()
         }
 
@@ -246,34 +312,61 @@ class AnomalyDetector:
         baseline = self.baselines[metric_name]
         return asdict(baseline)
 
-    def _update_baseline(self, metric_name: str) -> None:
-        """Update baseline statistics for a metric."""
-        values = self.metric_values[metric_name]
-        if len(values) < self.MIN_SAMPLES_FOR_BASELINE:
-            return
-
-        # Calculate stats
-        mean = statistics.mean(values)
-        std = statistics.stdev(values) if len(values) > 1 else 0
-        min_val = min(values)
-        max_val = max(values)
-
-        # Percentiles
-        sorted_vals = sorted(values)
-        p95_idx = int(len(sorted_vals) * 0.95)
-        p99_idx = int(len(sorted_vals) * 0.99)
-        p95 = sorted_vals[p95_idx] if p95_idx < len(sorted_vals) else max_val
-        p99 = sorted_vals[p99_idx] if p99_idx < len(sorted_vals) else max_val
-
-        self.baselines[metric_name] = BaselineStats(
-            metric_name=metric_name,
-            count=len(values),
-            mean=mean,
-            std=std,
-            min=min_val,
-            max=max_val,
-            p95=p95,
-            p99=p99
+    def export_baselines(self) -> Dict[str, Any]:
+        """
+        Export streaming baseline state for persistence or sharing.
+
+        Returns:
+            Serializable dict of metric name -> window state
+        """
+        return {name: window.to_dict() for name, window in self.metric_windows.items()}
+
+    def merge_baselines(self, state: Dict[str, Any]) -> None:
+        """
+        Merge baseline state exported by another detector (e.g. another bot).
+
+        Args:
+            state: Output of export_baselines()
+        """
+        for name, data in state.items():
+            incoming = WindowedStats.from_dict(data)
+            window = self.metric_windows.get(name)
+            if window is None:
+                self.metric_windows[name] = incoming
+            else:
+                window.merge(incoming)
+
+    def save_baselines(self, path: Optional[Path] = None) -> Path:
+        """Persist baseline state to JSON (default: bot-logs/anomaly-baselines.json)."""
+        path = Path(path) if path else self.baseline_file
+        with open(path, "w") as f:
+            json.dump(self.export_baselines(), f)
+        return path
+
+    def load_baselines(self, path: Optional[Path] = None) -> bool:
+        """
+        Load and merge persisted baseline state.
+
+        Returns:
+            True if state was loaded
+        """
+        path = Path(path) if path else self.baseline_file
+        if not path.exists():
+            return False
+        try:
+            with open(path, "r") as f:
+                self.merge_baselines(json.load(f))
+            return True
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[ANOMALY-DETECTOR] Failed to load baselines: {e}")
+            return False
+
+    def _new_window(self) -> WindowedStats:
+        """Create an empty streaming window for a metric."""
+        return WindowedStats(
+            window_seconds=self.HISTORY_WINDOW_HOURS * 3600,
+            num_buckets=self.WINDOW_BUCKETS,
+            ewma_alpha=1 - self.DECAY_FACTOR
         )
 
     def _z_score_to_confidence(self, z_score: float) -> float:
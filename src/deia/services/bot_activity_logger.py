@@ -4,17 +4,31 @@ Bot Activity Logger - Structured JSON logging for all bot operations.
 Logs all bot events (startup, shutdown, task received, task completed, errors)
 in JSON format with timestamps, bot ID, operation, and result.
 Implements log rotation to manage disk space.
+
+Each log segment (the active .jsonl and every rotated .jsonl.gz) has a
+sidecar .idx.json mapping task_id and event_type to line offsets, so
+queries jump straight to matching lines, skip segments without a match,
+and read newest-first.
 """
 
 import json
 import gzip
 import os
+import shutil
+import threading
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
+# Keys indexed per segment: {"task_id": {value: [offsets]}, "event_type": {...}}
+INDEXED_FIELDS = ("task_id", "event_type")
+
+# Block size for reading the active log backwards
+READ_BLOCK_BYTES = 64 * 1024
+
 
 class EventType(Enum):
     """Types of bot events."""
@@ -51,9 +65,14 @@ class BotActivityLogger:
     Features:
     - JSON-formatted logs for easy parsing
     - Queryable format with timestamp, bot_id, event_type
-    - Log rotation with compression
+    - Log rotation with compression; queries span rotated segments
+    - Sidecar index by task_id / event_type, newest-first reads
     - No PII in logs (configurable redaction)
     - Metrics and statistics
+
+    Writes go through one open file handle. With buffer_events > 1 lines
+    are flushed every buffer_events events (and before queries, stats
+    saves, rotation and close()), trading durability for throughput.
     """
 
     # Maximum size before rotation (100MB)
@@ -63,7 +82,8 @@ class BotActivityLogger:
         self,
         bot_id: str,
         work_dir: Path,
-        max_log_size_mb: int = 100
+        max_log_size_mb: int = 100,
+        buffer_events: int = 1
     ):
         """
         Initialize activity logger.
@@ -72,6 +92,7 @@ class BotActivityLogger:
             bot_id: Bot identifier
             work_dir: Working directory for logs
             max_log_size_mb: Maximum log file size before rotation (default 100MB)
+            buffer_events: Events to buffer before flushing to disk (default 1)
         """
         self.bot_id = bot_id
         self.work_dir = Path(work_dir)
@@ -83,6 +104,16 @@ class BotActivityLogger:
 
         self.activity_log_file = self.log_dir / f"BOT-{bot_id}-activity.jsonl"
         self.stats_file = self.log_dir / f"BOT-{bot_id}-stats.json"
+        self.index_file = self.log_dir / f"BOT-{bot_id}-activity.idx.json"
+
+        self.buffer_events = max(1, buffer_events)
+        self._lock = threading.RLock()
+        self._handle = None
+        self._unflushed = 0
+        self._log_size = self.activity_log_file.stat().st_size \
+            if self.activity_log_file.exists() else 0
+        # Index of the active log; loaded lazily on first query
+        self._index: Optional[Dict[str, Any]] = None
 
         # Statistics
         self.stats = {
@@ -133,14 +164,15 @@ class BotActivityLogger:
             context=context or {}
         )
 
-        # Write to log file
-        self._write_log(event)
+        with self._lock:
+            # Write to log file
+            self._write_log(event)
 
-        # Update statistics
-        self._update_stats(event)
+            # Update statistics
+            self._update_stats(event)
 
-        # Check for rotation
-        self._check_rotation()
+            # Check for rotation
+            self._check_rotation()
 
     def log_startup(self, adapter_type: str) -> None:
         """Log bot startup."""
@@ -268,9 +300,27 @@ class BotActivityLogger:
 
     def save_stats(self) -> None:
         """Save statistics to file."""
+        self.flush()
         with open(self.stats_file, "w") as f:
             json.dump(self.get_stats(), f, indent=2)
 
+    def flush(self) -> None:
+        """Write buffered events to disk."""
+        with self._lock:
+            if self._handle is not None and self._unflushed:
+                self._handle.flush()
+                self._unflushed = 0
+
+    def close(self) -> None:
+        """Flush and close the log, persisting the active segment's index."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+                self._unflushed = 0
+            if self._index is not None:
+                self._save_index(self._index, self.index_file)
+
     def query_events(
         self,
         event_type: Optional[EventType] = None,
@@ -278,7 +328,10 @@ class BotActivityLogger:
         limit: int = 100
     ) -> list[Dict[str, Any]]:
         """
-        Query logged events.
+        Query logged events, most recent first.
+
+        Searches the active log, then rotated segments from newest to
+        oldest, stopping once `limit` events match.
 
         Args:
             event_type: Filter by event type (optional)
@@ -286,30 +339,38 @@ class BotActivityLogger:
             limit: Maximum number of events to return
 
         Returns:
-            List of matching events
+            List of matching events (most recent first)
         """
-        events = []
-
-        try:
-            with open(self.activity_log_file, "r") as f:
-                for line in f:
-                    if line.strip():
-                        event = json.loads(line)
-
-                        # Apply filters
-                        if event_type and event["event_type"] != event_type.value:
-                            continue
-                        if task_id and event.get("task_id") != task_id:
-                            continue
-
-                        events.append(event)
-
-                        if len(events) >= limit:
-                            break
-        except FileNotFoundError:
-            pass
-
-        return list(reversed(events))  # Most recent first
+        events: List[Dict[str, Any]] = []
+        if limit <= 0:
+            return events
+
+        # Look up by the most selective indexed key, filter on the other
+        if task_id:
+            key = ("task_id", task_id)
+        elif event_type:
+            key = ("event_type", event_type.value)
+        else:
+            key = None
+
+        def matches(event: Dict[str, Any]) -> bool:
+            if event_type and event.get("event_type") != event_type.value:
+                return False
+            if task_id and event.get("task_id") != task_id:
+                return False
+            return True
+
+        with self._lock:
+            self.flush()
+            index = self._active_index()
+            events.extend(self._query_active(index, key, matches, limit))
+
+        for segment in self._rotated_segments():
+            if len(events) >= limit:
+                break
+            events.extend(self._query_segment(segment, key, matches, limit - len(events)))
+
+        return events[:limit]
 
     def get_task_history(self, task_id: str) -> list[Dict[str, Any]]:
         """
@@ -323,10 +384,191 @@ class BotActivityLogger:
         """
         return self.query_events(task_id=task_id, limit=1000)
 
+    # ----- reading -----
+
+    @staticmethod
+    def _new_index() -> Dict[str, Any]:
+        return {"size": 0, **{name: {} for name in INDEXED_FIELDS}}
+
+    @staticmethod
+    def _index_line(index: Dict[str, Any], offset: int, event: Dict[str, Any]) -> None:
+        for name in INDEXED_FIELDS:
+            value = event.get(name)
+            if value is not None:
+                index[name].setdefault(value, []).append(offset)
+
+    def _build_index(self, lines: Iterator[bytes], index: Dict[str, Any]) -> Dict[str, Any]:
+        """Extend `index` with (offset-tracked) lines starting at index["size"]."""
+        offset = index["size"]
+        for line in lines:
+            if not line.endswith(b"\n"):
+                break  # Partial trailing line: index it once complete
+            try:
+                self._index_line(index, offset, json.loads(line))
+            except ValueError:
+                pass  # Skip corrupt lines
+            offset += len(line)
+        index["size"] = offset
+        return index
+
+    def _active_index(self) -> Dict[str, Any]:
+        """Index of the active log: sidecar, plus any lines written since."""
+        # Other loggers may append to the same file; size it from disk
+        try:
+            self._log_size = self.activity_log_file.stat().st_size
+        except FileNotFoundError:
+            self._log_size = 0
+        index = self._index
+        if index is None:
+            index = self._load_index(self.index_file)
+        if index is None or index["size"] > self._log_size:
+            index = self._new_index()
+        if index["size"] < self._log_size:
+            with open(self.activity_log_file, "rb") as f:
+                f.seek(index["size"])
+                self._build_index(f, index)
+        self._index = index
+        return index
+
+    def _query_active(self, index, key, matches, limit) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        if not self._log_size:
+            return events
+        with open(self.activity_log_file, "rb") as f:
+            if key is not None:
+                lines = self._read_at(f, reversed(index[key[0]].get(key[1], [])))
+            else:
+                lines = self._read_reverse(f, self._log_size)
+            for event in self._parse(lines):
+                if matches(event):
+                    events.append(event)
+                    if len(events) >= limit:
+                        break
+        return events
+
+    def _query_segment(self, segment: Path, key, matches, limit) -> List[Dict[str, Any]]:
+        """Newest-first matches from a rotated .jsonl.gz segment."""
+        index = self._segment_index(segment)
+        if key is not None:
+            wanted = set(index[key[0]].get(key[1], []))
+            if not wanted:
+                return []  # Nothing for this key in the segment
+            found = []
+            offset = 0
+            with gzip.open(segment, "rb") as f:
+                for line in f:
+                    if offset in wanted:
+                        found.append(line)
+                    offset += len(line)
+            lines = reversed(found)
+        else:
+            with gzip.open(segment, "rb") as f:
+                lines = reversed(deque(f, maxlen=limit))
+        events = [event for event in self._parse(lines) if matches(event)]
+        return events[:limit]
+
+    def _segment_index(self, segment: Path) -> Dict[str, Any]:
+        index_path = self._segment_index_path(segment)
+        index = self._load_index(index_path)
+        if index is None:
+            # Segment rotated before indexing existed
+            with gzip.open(segment, "rb") as f:
+                index = self._build_index(f, self._new_index())
+            self._save_index(index, index_path)
+        return index
+
+    def _rotated_segments(self) -> List[Path]:
+        """Rotated segments, newest first."""
+        prefix = len(f"BOT-{self.bot_id}-activity-")
+
+        def rotation_order(segment: Path):
+            # "<date>-<time>" plus "-NN" for rotations within the same second
+            parts = segment.name[prefix:-len(".jsonl.gz")].split("-")
+            return parts[:2], int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0
+
+        return sorted(
+            self.log_dir.glob(f"BOT-{self.bot_id}-activity-*.jsonl.gz"),
+            key=rotation_order,
+            reverse=True
+        )
+
+    @staticmethod
+    def _segment_index_path(segment: Path) -> Path:
+        return segment.with_name(segment.name[:-len(".jsonl.gz")] + ".idx.json")
+
+    @staticmethod
+    def _read_at(f, offsets: Iterator[int]) -> Iterator[bytes]:
+        for offset in offsets:
+            f.seek(offset)
+            yield f.readline()
+
+    @staticmethod
+    def _read_reverse(f, end: int) -> Iterator[bytes]:
+        """Yield lines from `end` backwards, reading in blocks."""
+        position = end
+        tail = b""
+        while position > 0:
+            size = min(READ_BLOCK_BYTES, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + tail).split(b"\n")
+            tail = lines[0]
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if tail.strip():
+            yield tail
+
+    @staticmethod
+    def _parse(lines: Iterator[bytes]) -> Iterator[Dict[str, Any]]:
+        for line in lines:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+    @staticmethod
+    def _load_index(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r") as f:
+                index = json.load(f)
+            if all(name in index for name in ("size", *INDEXED_FIELDS)):
+                return index
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _save_index(index: Dict[str, Any], path: Path) -> None:
+        temp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(index, f)
+            os.replace(temp_path, path)
+        except OSError:
+            pass  # Index is rebuilt from the log when missing
+
+    # ----- writing -----
+
     def _write_log(self, event: ActivityEvent) -> None:
         """Write event to log file."""
-        with open(self.activity_log_file, "a") as f:
-            f.write(json.dumps(asdict(event)) + "\n")
+        record = asdict(event)
+        data = (json.dumps(record) + "\n").encode()
+        if self._handle is None:
+            self._handle = open(self.activity_log_file, "ab")
+        self._handle.write(data)
+        self._log_size += len(data)
+        self._unflushed += 1
+        if self._unflushed >= self.buffer_events:
+            self.flush()
+            # Only a flushed line has a known offset; the handle's position is
+            # the real end of file even if another logger appended meanwhile
+            end = self._handle.tell()
+            self._log_size = end
+            offset = end - len(data)
+            if self._index is not None and self._index["size"] == offset:
+                self._index_line(self._index, offset, record)
+                self._index["size"] = end
 
     def _update_stats(self, event: ActivityEvent) -> None:
         """Update statistics based on event."""
@@ -351,12 +593,7 @@ class BotActivityLogger:
 
     def _check_rotation(self) -> None:
         """Check if log file needs rotation."""
-        if not self.activity_log_file.exists():
-            return
-
-        file_size = self.activity_log_file.stat().st_size
-
-        if file_size > self.max_log_size:
+        if self._log_size > self.max_log_size:
             self._rotate_logs()
 
     def _rotate_logs(self) -> None:
@@ -364,15 +601,30 @@ class BotActivityLogger:
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         backup_name = f"BOT-{self.bot_id}-activity-{timestamp}.jsonl.gz"
         backup_path = self.log_dir / backup_name
+        suffix = 1
+        while backup_path.exists():
+            backup_name = f"BOT-{self.bot_id}-activity-{timestamp}-{suffix:02d}.jsonl.gz"
+            backup_path = self.log_dir / backup_name
+            suffix += 1
 
         # Compress and move current log
         try:
+            self.flush()
+            index = self._active_index()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
             with open(self.activity_log_file, "rb") as f_in:
                 with gzip.open(backup_path, "wb") as f_out:
-                    f_out.writelines(f_in)
+                    shutil.copyfileobj(f_in, f_out)
+            self._save_index(index, self._segment_index_path(backup_path))
 
             # Clear original file
             self.activity_log_file.unlink()
+            self.index_file.unlink(missing_ok=True)
+            self._log_size = 0
+            self._index = self._new_index()
 
             # Log rotation event
             self.log_event(
@@ -404,5 +656,6 @@ class BotActivityLogger:
             if log_file.stat().st_mtime < cutoff:
                 try:
                     log_file.unlink()
+                    self._segment_index_path(log_file).unlink(missing_ok=True)
                 except Exception as e:
                     print(f"Failed to delete old log {log_file}: {e}")
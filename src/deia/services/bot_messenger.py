@@ -3,13 +3,20 @@ Bot Messenger - Inter-bot direct messaging system.
 
 Enables bots to communicate directly with priority queuing, delivery tracking,
 and retry logic. Supports both synchronous and asynchronous messaging patterns.
+
+Inboxes index messages by id and by priority, outgoing delivery is a heap
+ordered by priority then expiry (O(log n) per message), and message history
+is bounded.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from datetime import datetime, timedelta
 from pathlib import Path
+from collections import OrderedDict
+import heapq
+import itertools
 import json
 import uuid
 
@@ -67,44 +74,141 @@ class Message:
         """Check if message can be delivered (not expired, hasn't exceeded retries)."""
         return not self.is_expired() and self.retry_count < self.max_retries
 
+    def expires_at(self) -> float:
+        """Expiry time as epoch seconds."""
+        created = datetime.fromisoformat(self.created_at) if self.created_at else datetime.now()
+        return created.timestamp() + self.ttl_seconds
+
+
+PRIORITY_RANK = {p: rank for rank, p in enumerate(MessagePriority)}
+HANDLED_STATUSES = (MessageStatus.READ, MessageStatus.DELIVERED)
+
 
-@dataclass
 class MessageBox:
-    """Message inbox for a bot."""
-    bot_id: str
-    messages: List[Message] = field(default_factory=list)
+    """
+    Message inbox for a bot.
+
+    Messages are indexed by id (insertion ordered) and by priority, with a
+    min-heap of expiry times so expired messages are found without scanning.
+    """
+
+    def __init__(self, bot_id: str, messages: Optional[List[Message]] = None):
+        self.bot_id = bot_id
+        self._by_id: Dict[str, Message] = {}
+        self._by_priority: Dict[MessagePriority, Dict[str, Message]] = {p: {} for p in MessagePriority}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._expired_handled: Dict[str, Message] = {}  # Expired but kept (read/delivered)
+        for message in messages or []:
+            self.add_message(message)
+
+    @property
+    def messages(self) -> List[Message]:
+        """All messages in arrival order."""
+        return list(self._by_id.values())
+
+    @messages.setter
+    def messages(self, messages: List[Message]) -> None:
+        self._by_id.clear()
+        for index in self._by_priority.values():
+            index.clear()
+        self._expiry_heap = []
+        self._expired_handled.clear()
+        for message in messages:
+            self.add_message(message)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
 
     def add_message(self, message: Message) -> None:
         """Add message to inbox."""
-        self.messages.append(message)
+        self._by_id[message.message_id] = message
+        self._by_priority[message.priority][message.message_id] = message
+        heapq.heappush(self._expiry_heap, (message.expires_at(), message.message_id))
+
+    def get(self, message_id: str) -> Optional[Message]:
+        """Get message by id."""
+        return self._by_id.get(message_id)
+
+    def remove(self, message_id: str) -> Optional[Message]:
+        """Remove a message by id. Stale heap entries are skipped lazily."""
+        message = self._by_id.pop(message_id, None)
+        if message is not None:
+            self._by_priority[message.priority].pop(message_id, None)
+            self._expired_handled.pop(message_id, None)
+        return message
 
     def get_unread(self) -> List[Message]:
         """Get all unread messages."""
-        return [m for m in self.messages if m.status == MessageStatus.PENDING]
+        return [m for m in self._by_id.values() if m.status == MessageStatus.PENDING]
 
     def get_by_priority(self, priority: MessagePriority) -> List[Message]:
         """Get messages by priority."""
-        return [m for m in self.messages if m.priority == priority]
+        return list(self._by_priority[priority].values())
 
     def mark_read(self, message_id: str) -> bool:
         """Mark message as read."""
-        for msg in self.messages:
-            if msg.message_id == message_id:
-                msg.status = MessageStatus.READ
-                msg.read_at = datetime.now().isoformat()
-                return True
-        return False
-
-    def remove_expired(self) -> List[str]:
-        """Remove expired messages. Returns list of removed message IDs."""
+        msg = self._by_id.get(message_id)
+        if msg is None:
+            return False
+        msg.status = MessageStatus.READ
+        msg.read_at = datetime.now().isoformat()
+        return True
+
+    def remove_expired(self, include_handled: bool = False) -> List[str]:
+        """
+        Remove expired messages. Returns list of removed message IDs.
+
+        Read/delivered messages are kept unless include_handled is set.
+        """
         removed = []
-        self.messages = [
-            m for m in self.messages
-            if not m.is_expired() or m.status in [MessageStatus.READ, MessageStatus.DELIVERED]
-        ]
+        now = datetime.now().timestamp()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, message_id = heapq.heappop(self._expiry_heap)
+            message = self._by_id.get(message_id)
+            if message is None:
+                continue
+            if include_handled or message.status not in HANDLED_STATUSES:
+                self.remove(message_id)
+                removed.append(message_id)
+            else:
+                self._expired_handled[message_id] = message
+        if include_handled:
+            for message_id in list(self._expired_handled):
+                self.remove(message_id)
+                removed.append(message_id)
         return removed
 
 
+class DeliveryQueue:
+    """Outgoing messages as a heap ordered by priority, then expiry, then send order."""
+
+    def __init__(self):
+        self._heap: List[Tuple[int, float, int, Message]] = []
+        self._seq = itertools.count()
+
+    def push(self, message: Message) -> None:
+        heapq.heappush(
+            self._heap,
+            (PRIORITY_RANK[message.priority], message.expires_at(), next(self._seq), message)
+        )
+
+    def pop(self) -> Message:
+        return heapq.heappop(self._heap)[-1]
+
+    def append(self, message: Message) -> None:
+        self.push(message)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def __iter__(self) -> Iterator[Message]:
+        """Iterate queued messages in delivery order (does not consume)."""
+        return (entry[-1] for entry in sorted(self._heap))
+
+
 class BotMessenger:
     """
     Inter-bot messaging system.
@@ -118,12 +222,15 @@ class BotMessenger:
     - JSON logging of all message events
     """
 
-    def __init__(self, work_dir: Path):
+    DEFAULT_MAX_HISTORY = 10000
+
+    def __init__(self, work_dir: Path, max_history: int = DEFAULT_MAX_HISTORY):
         """
         Initialize bot messenger.
 
         Args:
             work_dir: Working directory for logs and state
+            max_history: Max messages kept in message_history (oldest dropped first)
         """
         self.work_dir = Path(work_dir)
         self.log_dir = self.work_dir / ".deia" / "bot-logs"
@@ -135,10 +242,11 @@ class BotMessenger:
         self.inboxes: Dict[str, MessageBox] = {}
 
         # Outgoing message queue (pending delivery)
-        self.outgoing_queue: List[Message] = []
+        self.outgoing_queue = DeliveryQueue()
 
-        # Message history (all messages ever sent/received)
-        self.message_history: Dict[str, Message] = {}
+        # Message history (most recent max_history messages sent/received)
+        self.max_history = max_history
+        self.message_history: "OrderedDict[str, Message]" = OrderedDict()
 
     def send_message(
         self,
@@ -181,10 +289,10 @@ class BotMessenger:
         )
 
         # Add to outgoing queue
-        self.outgoing_queue.append(message)
+        self.outgoing_queue.push(message)
 
         # Store in history
-        self.message_history[message_id] = message
+        self._remember(message)
 
         # Log event
         self._log_event("message_queued", message)
@@ -231,11 +339,13 @@ class BotMessenger:
                 pass
 
         # Mark as delivered
+        log_entries = []
         for msg in messages:
             if msg.status == MessageStatus.PENDING:
                 msg.status = MessageStatus.DELIVERED
                 msg.delivered_at = datetime.now().isoformat()
-                self._log_event("message_delivered", msg)
+                log_entries.append(self._event_entry("message_delivered", msg))
+        self._write_log(log_entries)
 
         return [m.to_dict() for m in messages]
 
@@ -253,30 +363,39 @@ class BotMessenger:
         inbox = self.get_inbox(bot_id)
         success = inbox.mark_read(message_id)
 
-        if success and message_id in self.message_history:
-            self._log_event("message_read", self.message_history[message_id])
+        if success:
+            self._log_event("message_read", inbox.get(message_id))
 
         return success
 
-    def process_outgoing_queue(self) -> Dict[str, Any]:
+    def process_outgoing_queue(self, max_messages: Optional[int] = None) -> Dict[str, Any]:
         """
         Process outgoing message queue, delivering to inboxes.
 
+        Messages are delivered highest priority first (then soonest to expire).
         Handles retries for failed deliveries.
 
+        Args:
+            max_messages: Optional cap on messages handled in this pass
+
         Returns:
             Summary of delivery results
         """
         delivered = []
         failed = []
         retried = []
+        retry_later = []
+        log_entries = []
+        limit = len(self.outgoing_queue) if max_messages is None else max_messages
+
+        while self.outgoing_queue and limit > 0:
+            limit -= 1
+            message = self.outgoing_queue.pop()
 
-        for message in self.outgoing_queue[:]:
             # Check expiration
             if message.is_expired():
                 message.status = MessageStatus.EXPIRED
-                self._log_event("message_expired", message)
-                self.outgoing_queue.remove(message)
+                log_entries.append(self._event_entry("message_expired", message))
                 continue
 
             # Deliver to recipient inbox
@@ -287,23 +406,28 @@ class BotMessenger:
                 message.delivered_at = datetime.now().isoformat()
                 delivered.append(message.message_id)
 
-                self._log_event("message_delivered", message)
-                self.outgoing_queue.remove(message)
+                log_entries.append(self._event_entry("message_delivered", message))
 
             except Exception as e:
                 # Retry logic
                 if message.retry_count < message.max_retries:
                     message.retry_count += 1
                     retried.append(message.message_id)
-                    self._log_event("message_retry", message, {
+                    retry_later.append(message)
+                    log_entries.append(self._event_entry("message_retry", message, {
                         "attempt": message.retry_count,
                         "error": str(e)
-                    })
+                    }))
                 else:
                     message.status = MessageStatus.FAILED
                     failed.append(message.message_id)
-                    self._log_event("message_failed", message, {"error": str(e)})
-                    self.outgoing_queue.remove(message)
+                    log_entries.append(self._event_entry("message_failed", message, {"error": str(e)}))
+
+        # Requeue retries after the pass so they are not retried in a tight loop
+        for message in retry_later:
+            self.outgoing_queue.push(message)
+
+        self._write_log(log_entries)
 
         return {
             "delivered": delivered,
@@ -383,10 +507,12 @@ class BotMessenger:
         cleanup_stats = {}
 
         for bot_id, inbox in self.inboxes.items():
-            # Remove all expired messages (regardless of read status)
-            initial_count = len(inbox.messages)
-            inbox.messages = [m for m in inbox.messages if not m.is_expired()]
-            removed_count = initial_count - len(inbox.messages)
+            # Remove all expired messages (regardless of read status). Full
+            # sweep so messages whose timestamps changed after queuing are caught.
+            removed_count = len(inbox.remove_expired(include_handled=True))
+            for message in [m for m in inbox.messages if m.is_expired()]:
+                inbox.remove(message.message_id)
+                removed_count += 1
 
             if removed_count > 0:
                 cleanup_stats[bot_id] = removed_count
@@ -394,6 +520,12 @@ class BotMessenger:
         self._log_event("cleanup_completed", None, {"stats": cleanup_stats})
         return cleanup_stats
 
+    def _remember(self, message: Message) -> None:
+        """Add message to bounded history, dropping the oldest entries."""
+        self.message_history[message.message_id] = message
+        while len(self.message_history) > self.max_history:
+            self.message_history.popitem(last=False)
+
     def _log_event(
         self,
         event: str,
@@ -408,7 +540,16 @@ class BotMessenger:
             message: Associated message (if any)
             details: Additional details
         """
-        entry = {
+        self._write_log([self._event_entry(event, message, details)])
+
+    def _event_entry(
+        self,
+        event: str,
+        message: Optional[Message] = None,
+        details: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Build a log entry for a messaging event."""
+        return {
             "timestamp": datetime.now().isoformat(),
             "event": event,
             "message_id": message.message_id if message else None,
@@ -419,8 +560,12 @@ class BotMessenger:
             "details": details or {}
         }
 
+    def _write_log(self, entries: List[Dict[str, Any]]) -> None:
+        """Append log entries with a single file write."""
+        if not entries:
+            return
         try:
             with open(self.messaging_log, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+                f.write("".join(json.dumps(entry) + "\n" for entry in entries))
         except Exception as e:
             print(f"[BOT-MESSENGER] Failed to log event: {e}")
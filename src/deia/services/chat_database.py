@@ -2,9 +2,21 @@
 Chat Database - Persistent storage for chat history
 
 Uses SQLite for simple deployment, but architecture supports PostgreSQL/MySQL.
+
+The database runs in WAL mode with one connection per thread. Messages are
+written behind: add_message() buffers them and a writer thread inserts them
+in batches, one transaction per batch. Reads flush the buffer first, so they
+always see earlier writes.
+
+Message content is indexed with SQLite FTS5 (kept in sync by triggers) for
+ranked full-text search; without FTS5 support, search falls back to LIKE.
 """
 
+import atexit
 import sqlite3
+import threading
+import time
+import weakref
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -14,6 +26,22 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def fts_query(text: str) -> str:
+    """
+    Turn free text into a safe FTS5 query: every word must match.
+
+    Words are quoted so FTS5 operators and punctuation are taken literally;
+    a trailing * keeps prefix matching (e.g. "deploy*").
+    """
+    terms = []
+    for word in text.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            terms.append(f'"{word}"*' if prefix else f'"{word}"')
+    return " ".join(terms)
+
+
 class ChatMessage:
     """Represents a single chat message"""
     def __init__(self, bot_id: str, role: str, content: str, timestamp: Optional[str] = None):
@@ -39,24 +67,68 @@ class ChatDatabase:
     - sessions: bot_id, started_at, ended_at, message_count
     """
 
-    def __init__(self, db_path: str = ".deia/chat_history.db"):
+    # Write-behind batching: the writer waits up to FLUSH_INTERVAL seconds
+    # for more messages, or less once BATCH_SIZE are buffered
+    BATCH_SIZE = 1000
+    FLUSH_INTERVAL = 0.05
+
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",     # Safe with WAL; fsync at checkpoints only
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-16000",      # ~16 MB page cache per connection
+    )
+
+    def __init__(self, db_path: str = ".deia/chat_history.db", write_behind: bool = True):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            write_behind: Buffer writes and insert them in batches from a
+                background thread (False = insert on every add_message call)
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create connection
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        # One connection per thread, all tracked so close() can release them
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # Write-behind buffer; _write_lock keeps batches in insertion order
+        self.write_behind = write_behind
+        self._pending: List[tuple] = []
+        self._pending_cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._closed = False
 
         # Initialize schema
         self._init_schema()
+
+        self._writer: Optional[threading.Thread] = None
+        if write_behind:
+            self._writer = threading.Thread(target=self._writer_loop, name="chat-db-writer", daemon=True)
+            self._writer.start()
+            # The writer is a daemon thread; drain its buffer before exit
+            atexit.register(_close_at_exit, weakref.ref(self))
         logger.info(f"ChatDatabase initialized at {self.db_path}")
 
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """This thread's connection (opened on first use)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            for pragma in self.PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
     def _init_schema(self):
         """Create tables if they don't exist"""
         cursor = self.conn.cursor()
@@ -84,20 +156,64 @@ class ChatDatabase:
             )
         """)
 
-        # Create indexes for performance
+        # Create indexes for performance. (bot_id, id) serves both the
+        # bot filter and keyset pagination; it supersedes idx_messages_bot_id.
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_messages_bot_id
-            ON messages(bot_id)
+            CREATE INDEX IF NOT EXISTS idx_messages_bot_id_id
+            ON messages(bot_id, id)
         """)
+        cursor.execute("DROP INDEX IF EXISTS idx_messages_bot_id")
 
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_messages_timestamp
             ON messages(timestamp)
         """)
 
+        self.fts_enabled = self._init_fts(cursor)
+
         self.conn.commit()
         logger.info("Database schema initialized")
 
+    def _init_fts(self, cursor) -> bool:
+        """Create the FTS5 index and its sync triggers; False if FTS5 is unavailable."""
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'messages_fts'"
+        ).fetchone()
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+                    content,
+                    content='messages',
+                    content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 not available - chat search uses LIKE scans: {e}")
+            return False
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+                INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+                INSERT INTO messages_fts(messages_fts, rowid, content) VALUES ('delete', old.id, old.content);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF content ON messages BEGIN
+                INSERT INTO messages_fts(messages_fts, rowid, content) VALUES ('delete', old.id, old.content);
+                INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content);
+            END
+        """)
+
+        if not exists:
+            # Index history written before search existed
+            cursor.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
+        return True
+
     def add_message(self, bot_id: str, role: str, content: str, timestamp: Optional[str] = None):
         """
         Add a message to chat history.
@@ -113,35 +229,164 @@ class ChatDatabase:
 
         timestamp = timestamp or datetime.now().isoformat()
 
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO messages (bot_id, role, content, timestamp)
-            VALUES (?, ?, ?, ?)
-        """, (bot_id, role, content, timestamp))
-        self.conn.commit()
+        with self._pending_cond:
+            if self._closed:
+                raise RuntimeError("ChatDatabase is closed")
+            self._pending.append((bot_id, role, content, timestamp))
+            # Wake the writer when it is idle or a batch is full
+            if len(self._pending) == 1 or len(self._pending) >= self.BATCH_SIZE:
+                self._pending_cond.notify()
+
+        if not self.write_behind:
+            self.flush()
         logger.debug(f"Added message for {bot_id}: {role}")
 
-    def get_messages(self, bot_id: str, limit: int = 100) -> List[Dict]:
+    def flush(self) -> int:
+        """
+        Insert all buffered messages in one transaction.
+
+        Returns:
+            Number of messages written
+        """
+        with self._write_lock:
+            with self._pending_cond:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            try:
+                with self.conn as conn:
+                    conn.executemany("""
+                        INSERT INTO messages (bot_id, role, content, timestamp)
+                        VALUES (?, ?, ?, ?)
+                    """, batch)
+            except sqlite3.Error:
+                # Keep the batch (ahead of newer messages) for the next flush
+                with self._pending_cond:
+                    self._pending[:0] = batch
+                raise
+            return len(batch)
+
+    def _writer_loop(self):
+        """Background writer: flush whenever a batch fills or FLUSH_INTERVAL passes."""
+        while True:
+            with self._pending_cond:
+                while not self._pending and not self._closed:
+                    self._pending_cond.wait()
+                if not self._pending:
+                    break
+                if len(self._pending) < self.BATCH_SIZE and not self._closed:
+                    self._pending_cond.wait(self.FLUSH_INTERVAL)
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to write chat messages, will retry: {e}")
+                if self._closed:
+                    break
+                time.sleep(self.FLUSH_INTERVAL)
+
+    def get_messages(self, bot_id: str, limit: int = 100, before_id: Optional[int] = None) -> List[Dict]:
         """
-        Get messages for a bot.
+        Get the latest messages for a bot, oldest first.
+
+        Pages backwards with a keyset cursor: pass the "id" of the first
+        message of a page as before_id to get the page before it.
 
         Args:
             bot_id: Bot ID
             limit: Max messages to return
+            before_id: Only return messages older than this id
 
         Returns:
-            List of message dicts with role, content, timestamp
+            List of message dicts with id, role, content, timestamp
         """
+        self.flush()
         cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT role, content, timestamp FROM messages
-            WHERE bot_id = ?
-            ORDER BY timestamp ASC
-            LIMIT ?
-        """, (bot_id, limit))
+        if before_id is None:
+            cursor.execute("""
+                SELECT id, role, content, timestamp FROM messages
+                WHERE bot_id = ?
+                ORDER BY id DESC
+                LIMIT ?
+            """, (bot_id, limit))
+        else:
+            cursor.execute("""
+                SELECT id, role, content, timestamp FROM messages
+                WHERE bot_id = ? AND id < ?
+                ORDER BY id DESC
+                LIMIT ?
+            """, (bot_id, before_id, limit))
 
         rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in reversed(rows)]
+
+    def search(
+        self,
+        query: str,
+        bot_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 20,
+        highlight: tuple = ("[", "]"),
+    ) -> List[Dict]:
+        """
+        Full-text search over message content, best matches first.
+
+        Args:
+            query: Words to search for (all must match; "word*" for prefixes)
+            bot_id: Only search this bot's messages
+            since: Only messages with timestamp >= this ISO timestamp
+            until: Only messages with timestamp < this ISO timestamp
+            limit: Max results
+            highlight: Markers placed around matched terms in the snippet
+
+        Returns:
+            List of dicts with id, bot_id, role, timestamp, snippet, rank
+            (lower rank = better match)
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        self.flush()
+
+        filters = []
+        params: List = []
+        if bot_id:
+            filters.append("m.bot_id = ?")
+            params.append(bot_id)
+        if since:
+            filters.append("m.timestamp >= ?")
+            params.append(since)
+        if until:
+            filters.append("m.timestamp < ?")
+            params.append(until)
+
+        cursor = self.conn.cursor()
+        if self.fts_enabled:
+            where = "".join(f" AND {f}" for f in filters)
+            cursor.execute(f"""
+                SELECT m.id, m.bot_id, m.role, m.timestamp,
+                       snippet(messages_fts, 0, ?, ?, '...', 16) AS snippet,
+                       bm25(messages_fts) AS rank
+                FROM messages_fts
+                JOIN messages m ON m.id = messages_fts.rowid
+                WHERE messages_fts MATCH ?{where}
+                ORDER BY rank
+                LIMIT ?
+            """, (highlight[0], highlight[1], match, *params, limit))
+            return [dict(row) for row in cursor.fetchall()]
+
+        # Fallback without FTS5: newest messages containing every word
+        words = [w.rstrip("*") for w in query.split() if w.rstrip("*")]
+        filters = ["m.content LIKE ?" for _ in words] + filters
+        params = [f"%{w}%" for w in words] + params
+        cursor.execute(f"""
+            SELECT m.id, m.bot_id, m.role, m.timestamp, m.content AS snippet, 0.0 AS rank
+            FROM messages m
+            WHERE {" AND ".join(filters)}
+            ORDER BY m.id DESC
+            LIMIT ?
+        """, (*params, limit))
+        return [dict(row) for row in cursor.fetchall()]
 
     def clear_messages(self, bot_id: str):
         """
@@ -150,6 +395,7 @@ class ChatDatabase:
         Args:
             bot_id: Bot ID
         """
+        self.flush()
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM messages WHERE bot_id = ?", (bot_id,))
         self.conn.commit()
@@ -157,6 +403,7 @@ class ChatDatabase:
 
     def get_session_count(self, bot_id: str) -> int:
         """Get number of sessions for a bot"""
+        self.flush()
         cursor = self.conn.cursor()
         cursor.execute("""
             SELECT COUNT(*) as count FROM messages WHERE bot_id = ?
@@ -165,7 +412,27 @@ class ChatDatabase:
         return result["count"] if result else 0
 
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
-            logger.info("Database connection closed")
+        """Flush buffered messages and close all connections"""
+        if self._closed:
+            return
+        with self._pending_cond:
+            self._closed = True
+            self._pending_cond.notify_all()
+        if self._writer:
+            # The writer drains the buffer before exiting
+            self._writer.join()
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+        logger.info("Database connection closed")
+
+
+def _close_at_exit(db_ref):
+    db = db_ref()
+    if db is not None:
+        try:
+            db.close()
+        except Exception:
+            pass
@@ -1,11 +1,13 @@
 """Chat Interface App"""
 
+import asyncio
 import json
 import logging
 import subprocess
 import os
 import sys
 import signal
+import time
 from typing import Dict, List, Optional
 from pathlib import Path
 from datetime import datetime
@@ -14,7 +16,7 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Body
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-import requests
+import httpx
 
 from deia.services.agent_coordinator import AgentCoordinator
 from deia.services.agent_status import AgentStatusTracker
@@ -77,7 +79,8 @@ except Exception as e:
 
 try:
     logger.info("Initializing chat database...")
-    chat_db = ChatDatabase()  # SQLite persistent chat history
+    # SQLite persistent chat history (DEIA_CHAT_DB overrides the location)
+    chat_db = ChatDatabase(os.getenv("DEIA_CHAT_DB", ".deia/chat_history.db"))
 except Exception as e:
     logger.error(f"Failed to initialize ChatDatabase: {e}")
     chat_db = None
@@ -94,6 +97,18 @@ logger.info("Commander service initialization complete")
 # Legacy: chat_history dict is replaced by chat_db
 chat_history = {}
 
+# Bot HTTP calls share one pooled client (keep-alive, bounded connections per bot)
+BOT_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30)
+BOT_MAX_CONNECTIONS_PER_HOST = 4
+BOT_STATUS_TIMEOUT = 2.0       # per-bot /status request
+BOT_STATUS_DEADLINE = 3.0      # whole /api/bots/status refresh
+BOT_STATUS_CACHE_TTL = 1.5     # seconds a polled status is reused
+
+_bot_client: Optional[httpx.AsyncClient] = None
+_bot_client_loop = None
+_bot_host_limits: Dict[str, asyncio.Semaphore] = {}
+_bot_status_cache: Dict[str, tuple] = {}  # bot_id -> (expires_at, live status or None)
+
 # Pydantic models for API requests
 class BotLaunchRequest(BaseModel):
     bot_id: str
@@ -220,6 +235,60 @@ def spawn_bot_process(bot_id: str, adapter_type: str = "api", port: Optional[int
         logger.error(f"[{bot_id}] Failed to spawn bot process: {e}", exc_info=True)
         return None
 
+def get_bot_client() -> httpx.AsyncClient:
+    """
+    Shared async HTTP client for bot calls.
+
+    Connections are pooled and kept alive between calls. The client is bound
+    to the running event loop, so a new one is created if the loop changes.
+    """
+    global _bot_client, _bot_client_loop
+    loop = asyncio.get_running_loop()
+    if _bot_client is None or _bot_client_loop is not loop:
+        _bot_client = httpx.AsyncClient(timeout=30, limits=BOT_HTTP_LIMITS)
+        _bot_client_loop = loop
+        _bot_host_limits.clear()
+    return _bot_client
+
+
+async def bot_request(method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    Send a request to a bot through the shared client.
+
+    At most BOT_MAX_CONNECTIONS_PER_HOST requests are in flight per bot.
+    """
+    client = get_bot_client()
+    target = httpx.URL(url)
+    host = f"{target.host}:{target.port}"
+    limit = _bot_host_limits.get(host)
+    if limit is None:
+        limit = _bot_host_limits[host] = asyncio.Semaphore(BOT_MAX_CONNECTIONS_PER_HOST)
+    async with limit:
+        return await client.request(method, url, **kwargs)
+
+
+async def close_bot_client():
+    """Close the shared bot HTTP client."""
+    global _bot_client, _bot_client_loop
+    if _bot_client is not None:
+        await _bot_client.aclose()
+    _bot_client = None
+    _bot_client_loop = None
+    _bot_host_limits.clear()
+
+
+app.router.on_shutdown.append(close_bot_client)
+
+
+async def close_chat_db():
+    """Flush buffered chat messages and close the database."""
+    if chat_db is not None:
+        chat_db.close()
+
+
+app.router.on_shutdown.append(close_chat_db)
+
+
 async def call_bot_task(bot_id: str, command: str) -> Dict:
     """
     Call the bot's task endpoint by making an HTTP request to its assigned port.
@@ -232,8 +301,6 @@ async def call_bot_task(bot_id: str, command: str) -> Dict:
         Response from task endpoint
     """
     try:
-        import httpx
-
         # Get bot info to find its assigned port
         bot_info = service_registry.get_bot(bot_id)
         if not bot_info:
@@ -241,14 +308,14 @@ async def call_bot_task(bot_id: str, command: str) -> Dict:
 
         bot_port = bot_info.get("port", 8000)
 
-        # Call the task endpoint via HTTP on the bot's assigned port using async httpx
+        # Call the task endpoint via HTTP on the bot's assigned port
         # Bot HTTP server listens on /api/task endpoint
         url = f"http://localhost:{bot_port}/api/task"
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                url,
-                json={"command": command, "task_id": f"task-{bot_id}"}
-            )
+        response = await bot_request(
+            "POST",
+            url,
+            json={"command": command, "task_id": f"task-{bot_id}"}
+        )
         return response.json()
     except Exception as e:
         logger.error(f"Error calling bot task on {bot_id}: {e}")
@@ -858,11 +925,13 @@ async def stop_bot(bot_id: str):
                 "timestamp": datetime.now().isoformat()
             }
 
+        _bot_status_cache.pop(bot_id, None)
+
         # Try to stop via bot's /terminate endpoint first
         bot_url = service_registry.get_bot_url(bot_id)
         if bot_url:
             try:
-                response = requests.post(f"{bot_url}/terminate", timeout=5)
+                response = await bot_request("POST", f"{bot_url}/terminate", timeout=5)
                 if response.status_code == 200:
                     logger.info(f"Bot {bot_id} stopped gracefully via /terminate")
                     service_registry.unregister(bot_id)
@@ -871,7 +940,7 @@ async def stop_bot(bot_id: str):
                         "bot_id": bot_id,
                         "timestamp": datetime.now().isoformat()
                     }
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            except httpx.TransportError:
                 logger.warning(f"Could not reach bot {bot_id} at {bot_url}, killing process")
 
         # Fallback: kill process
@@ -927,12 +996,62 @@ async def stop_bot(bot_id: str):
         }
 
 
+async def _poll_bot_status(bot_id: str, bot_url: str) -> Optional[Dict]:
+    """Fetch a bot's live /status, reusing results younger than BOT_STATUS_CACHE_TTL."""
+    now = time.monotonic()
+    cached = _bot_status_cache.get(bot_id)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    live_status = None
+    try:
+        response = await bot_request("GET", f"{bot_url}/status", timeout=BOT_STATUS_TIMEOUT)
+        if response.status_code == 200:
+            live_status = response.json()
+    except (httpx.HTTPError, ValueError):
+        pass  # Use registry status as fallback
+
+    _bot_status_cache[bot_id] = (time.monotonic() + BOT_STATUS_CACHE_TTL, live_status)
+    return live_status
+
+
+async def _poll_bot_statuses(bot_urls: Dict[str, str]) -> Dict[str, Optional[Dict]]:
+    """
+    Poll bots concurrently, bounded by BOT_STATUS_DEADLINE overall.
+
+    Bots that have not answered by the deadline are reported as None, and
+    cached that way so a hung bot does not hold up the next refresh.
+    """
+    if not bot_urls:
+        return {}
+    tasks = {
+        bot_id: asyncio.ensure_future(_poll_bot_status(bot_id, bot_url))
+        for bot_id, bot_url in bot_urls.items()
+    }
+    _, pending = await asyncio.wait(tasks.values(), timeout=BOT_STATUS_DEADLINE)
+    for task in pending:
+        task.cancel()
+
+    results = {}
+    for bot_id, task in tasks.items():
+        if task in pending:
+            logger.warning(f"Bot {bot_id} status timed out after {BOT_STATUS_DEADLINE}s")
+            _bot_status_cache[bot_id] = (time.monotonic() + BOT_STATUS_CACHE_TTL, None)
+            results[bot_id] = None
+        else:
+            results[bot_id] = task.result()
+    return results
+
+
 @app.get("/api/bots/status")
 async def get_bots_status():
     """
     Get status of all bots (enhanced version of /api/bots).
 
-    Polls each bot's /status endpoint for real-time info.
+    Polls each bot's /status endpoint for real-time info. Bots are polled
+    concurrently, so a refresh takes as long as the slowest bot (capped at
+    BOT_STATUS_DEADLINE), and recent results are reused for
+    BOT_STATUS_CACHE_TTL seconds.
     Falls back to registry if bot unreachable.
 
     Returns: Same as /api/bots but with more details
@@ -948,6 +1067,13 @@ async def get_bots_status():
                 "timestamp": datetime.now().isoformat()
             }
 
+        bot_urls = {}
+        for bot_id in all_bots:
+            bot_url = service_registry.get_bot_url(bot_id)
+            if bot_url:
+                bot_urls[bot_id] = bot_url
+        live_statuses = await _poll_bot_statuses(bot_urls)
+
         bots_list = {}
         for bot_id, bot_info in all_bots.items():
             # Reset error status to ready for mock bots
@@ -962,17 +1088,11 @@ async def get_bots_status():
                 "current_task": None
             }
 
-            # Try to get live status from bot service
-            bot_url = service_registry.get_bot_url(bot_id)
-            if bot_url:
-                try:
-                    response = requests.get(f"{bot_url}/status", timeout=2)
-                    if response.status_code == 200:
-                        live_status = response.json()
-                        bot_status["status"] = live_status.get("status", status)
-                        bot_status["current_task"] = live_status.get("current_task")
-                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-                    pass  # Use registry status as fallback
+            # Prefer live status from bot service
+            live_status = live_statuses.get(bot_id)
+            if live_status:
+                bot_status["status"] = live_status.get("status", status)
+                bot_status["current_task"] = live_status.get("current_task")
 
             bots_list[bot_id] = bot_status
 
@@ -991,16 +1111,20 @@ async def get_bots_status():
 
 
 @app.get("/api/chat/history")
-async def get_chat_history(bot_id: Optional[str] = None, limit: int = 100):
+async def get_chat_history(bot_id: Optional[str] = None, limit: int = 100, before_id: Optional[int] = None):
     """
     Get chat message history for a bot.
 
+    Returns the latest messages, oldest first. To page back, pass the
+    returned next_before_id as before_id.
+
     Args:
         bot_id: Bot ID to get history for
         limit: Maximum messages to return (default: 100)
+        before_id: Only return messages older than this message id
 
     Returns:
-        {"messages": [...], "count": 0, "timestamp": "..."}
+        {"messages": [...], "count": 0, "next_before_id": ..., "timestamp": "..."}
     """
     try:
         if not bot_id:
@@ -1011,13 +1135,14 @@ async def get_chat_history(bot_id: Optional[str] = None, limit: int = 100):
             }
 
         # Get messages from database
-        messages = chat_db.get_messages(bot_id, limit)
+        messages = chat_db.get_messages(bot_id, limit, before_id=before_id)
 
         return {
             "success": True,
             "bot_id": bot_id,
             "messages": messages,
             "count": len(messages),
+            "next_before_id": messages[0]["id"] if messages and len(messages) == limit else None,
             "timestamp": datetime.now().isoformat()
         }
 
@@ -1030,6 +1155,54 @@ async def get_chat_history(bot_id: Optional[str] = None, limit: int = 100):
         }
 
 
+@app.get("/api/chat/search")
+async def search_chat_history(
+    q: Optional[str] = None,
+    bot_id: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 20
+):
+    """
+    Full-text search across chat history.
+
+    Args:
+        q: Words to search for (all must match; "word*" for prefixes)
+        bot_id: Only search this bot's messages
+        since: Only messages at or after this ISO timestamp
+        until: Only messages before this ISO timestamp
+        limit: Maximum results (default: 20)
+
+    Returns:
+        {"results": [{id, bot_id, role, timestamp, snippet, rank}], "count": 0, "timestamp": "..."}
+    """
+    try:
+        if not q or not q.strip():
+            return {
+                "success": False,
+                "error": "q parameter required",
+                "timestamp": datetime.now().isoformat()
+            }
+
+        results = chat_db.search(q, bot_id=bot_id, since=since, until=until, limit=limit)
+
+        return {
+            "success": True,
+            "query": q,
+            "results": results,
+            "count": len(results),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    except Exception as e:
+        logger.error(f"Error searching chat history: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        }
+
+
 @app.post("/api/bot/{bot_id}/task")
 async def send_bot_task(bot_id: str, request: BotTaskRequest):
     """
@@ -3,15 +3,42 @@ Correlation Analyzer - Find what factors affect system behavior.
 
 Analyzes historical patterns and identifies correlations between metrics.
 Predicts system behavior based on observed correlations.
+
+Metric history is stored in array-backed, time-ordered series with running
+sums, so recording and expiry are O(1) amortized. Each series also keeps
+per-bucket sums (one bucket per BUCKET_SECONDS of wall time), and metrics are
+correlated over the buckets both series share, so metrics sampled at
+different rates still line up. All-pairs correlation is computed as one
+masked matrix product (NumPy when available).
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from collections import defaultdict
+from array import array
+from bisect import bisect_left, bisect_right
 import json
-import statistics
+import logging
+
+# Optional dependencies (graceful degradation)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_numpy_warning_logged = False
+
+
+def _numpy_available() -> bool:
+    """Report NumPy availability, warning once on first use if it is missing."""
+    global _numpy_warning_logged
+    if not NUMPY_AVAILABLE and not _numpy_warning_logged:
+        logging.warning("numpy not available - correlation matrix computed pairwise")
+        _numpy_warning_logged = True
+    return NUMPY_AVAILABLE
 
 
 @dataclass
@@ -36,6 +63,125 @@ class Prediction:
     time_period: str
 
 
+class MetricSeries:
+    """
+    Time-ordered metric samples in contiguous arrays.
+
+    Behaves like a list of (datetime, value) tuples for appending, iterating
+    and len(), but keeps timestamps/values in `array('d')` buffers with a head
+    offset, so expiring old samples is a pointer move and the values can be
+    handed to NumPy without conversion. Running sum/sum-of-squares are kept
+    up to date for O(1) mean/variance over the retained samples.
+
+    Samples are also folded into fixed-width time buckets as they arrive:
+    each bucket keeps a running sum and count, so bucket means are ready for
+    correlation without rescanning the samples. A sample older than the
+    newest one is inserted in time order and merged into its bucket, so the
+    bisect-based lookups stay valid; only in-order appends are O(1).
+    """
+
+    COMPACT_THRESHOLD = 1024
+
+    def __init__(self, bucket_seconds: float = 60.0):
+        self.bucket_seconds = float(bucket_seconds)
+        self._ts = array("d")
+        self._values = array("d")
+        self._head = 0
+        self.sum = 0.0
+        self.sum_sq = 0.0
+        self._bucket_ids = array("q")
+        self._bucket_sums = array("d")
+        self._bucket_counts = array("q")
+        self._bucket_head = 0
+
+    def append(self, sample: Tuple[datetime, float]) -> None:
+        ts, value = sample
+        value = float(value)
+        ts = ts.timestamp() if isinstance(ts, datetime) else float(ts)
+        if len(self) and ts < self._ts[-1]:
+            index = bisect_right(self._ts, ts, self._head)
+            self._ts.insert(index, ts)
+            self._values.insert(index, value)
+        else:
+            self._ts.append(ts)
+            self._values.append(value)
+        self.sum += value
+        self.sum_sq += value * value
+
+        bucket = int(ts // self.bucket_seconds)
+        index = bisect_left(self._bucket_ids, bucket, self._bucket_head)
+        if index < len(self._bucket_ids) and self._bucket_ids[index] == bucket:
+            self._bucket_sums[index] += value
+            self._bucket_counts[index] += 1
+        else:
+            self._bucket_ids.insert(index, bucket)
+            self._bucket_sums.insert(index, value)
+            self._bucket_counts.insert(index, 1)
+
+    def expire(self, cutoff: datetime) -> int:
+        """Drop samples at or before cutoff; returns number dropped."""
+        start = bisect_right(self._ts, cutoff.timestamp(), self._head)
+        dropped = start - self._head
+        for i in range(self._head, start):
+            value = self._values[i]
+            self.sum -= value
+            self.sum_sq -= value * value
+            # Samples and buckets share one order, so expired samples always
+            # come out of the oldest live bucket
+            self._bucket_sums[self._bucket_head] -= value
+            self._bucket_counts[self._bucket_head] -= 1
+            if self._bucket_counts[self._bucket_head] == 0:
+                self._bucket_head += 1
+        self._head = start
+        if self._head >= self.COMPACT_THRESHOLD and self._head * 2 >= len(self._ts):
+            del self._ts[:self._head]
+            del self._values[:self._head]
+            self._head = 0
+            del self._bucket_ids[:self._bucket_head]
+            del self._bucket_sums[:self._bucket_head]
+            del self._bucket_counts[:self._bucket_head]
+            self._bucket_head = 0
+        if len(self) == 0:
+            self.sum = self.sum_sq = 0.0
+        return dropped
+
+    def _first_bucket(self, cutoff: datetime) -> int:
+        """Index of the first bucket that starts after cutoff."""
+        first_id = int(cutoff.timestamp() // self.bucket_seconds) + 1
+        return bisect_left(self._bucket_ids, first_id, self._bucket_head)
+
+    def bucket_count_since(self, cutoff: datetime) -> int:
+        return len(self._bucket_ids) - self._first_bucket(cutoff)
+
+    def bucket_means_since(self, cutoff: datetime) -> Dict[int, float]:
+        """{bucket_id: mean value} for buckets that start after cutoff."""
+        start = self._first_bucket(cutoff)
+        return {
+            self._bucket_ids[i]: self._bucket_sums[i] / self._bucket_counts[i]
+            for i in range(start, len(self._bucket_ids))
+        }
+
+    def bucket_arrays_since(self, cutoff: datetime):
+        """(bucket_ids, bucket_means) after cutoff as NumPy arrays (copies)."""
+        start = self._first_bucket(cutoff)
+        ids = np.array(self._bucket_ids[start:], dtype=np.int64)
+        means = np.array(self._bucket_sums[start:], dtype=np.float64)
+        means /= np.array(self._bucket_counts[start:], dtype=np.float64)
+        return ids, means
+
+    @property
+    def mean(self) -> float:
+        n = len(self)
+        return self.sum / n if n else 0.0
+
+    def __len__(self) -> int:
+        return len(self._ts) - self._head
+
+    def __iter__(self) -> Iterator[Tuple[datetime, float]]:
+        for i in range(self._head, len(self._ts)):
+            yield datetime.fromtimestamp(self._ts[i]), self._values[i]
+
+
 class CorrelationAnalyzer:
     """
     Analyze correlations between metrics and predict system behavior.
@@ -46,7 +192,13 @@ class CorrelationAnalyzer:
     - Predictive correlations
     """
 
-    def __init__(self, work_dir: Path):
+    BUCKET_SECONDS = 60.0
+    MIN_SHARED_BUCKETS = 5
+    # Variance below this fraction of the sum of squares is rounding noise:
+    # the series is constant over the shared buckets
+    CONSTANT_TOLERANCE = 1e-12
+
+    def __init__(self, work_dir: Path, bucket_seconds: float = BUCKET_SECONDS):
         """Initialize correlation analyzer."""
         self.work_dir = Path(work_dir)
         self.log_dir = self.work_dir / ".deia" / "bot-logs"
@@ -54,23 +206,28 @@ class CorrelationAnalyzer:
 
         self.correlation_log = self.log_dir / "correlation-analysis.jsonl"
 
-        # Store metric history (last 30 days)
-        self.metric_history: Dict[str, List[Tuple[datetime, float]]] = defaultdict(list)
+        # Store metric history (last 30 days), bucketed for time alignment
+        self.bucket_seconds = bucket_seconds
+        self.metric_history: Dict[str, MetricSeries] = defaultdict(
+            lambda: MetricSeries(self.bucket_seconds)
+        )
 
         # Cache correlation results
         self.correlations: List[CorrelationResult] = []
 
-    def record_metric(self, metric_name: str, value: float) -> None:
-        """Record metric value with timestamp."""
+    def record_metric(
+        self,
+        metric_name: str,
+        value: float,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Record metric value with timestamp (defaults to now)."""
         now = datetime.now()
-        self.metric_history[metric_name].append((now, value))
+        series = self.metric_history[metric_name]
+        series.append((timestamp or now, value))
 
         # Keep only 30 days of history
-        cutoff = now - timedelta(days=30)
-        self.metric_history[metric_name] = [
-            (ts, v) for ts, v in self.metric_history[metric_name]
-            if ts > cutoff
-        ]
+        series.expire(now - timedelta(days=30))
 
     def analyze_correlations(self, period_days: int = 7) -> List[CorrelationResult]:
         """
@@ -84,15 +241,16 @@ class CorrelationAnalyzer:
         """
         results = []
         metric_names = list(self.metric_history.keys())
+        coefficients = self._correlation_coefficients(metric_names, period_days)
 
-        # Analyze each pair of metrics
+        # Emit pairs in metric order
         for i, metric1 in enumerate(metric_names):
             for metric2 in metric_names[i+1:]:
-                corr = self._calculate_correlation(metric1, metric2, period_days)
-                if corr:
-                    results.append(corr)
-                    self._log_correlation(corr)
+                entry = coefficients.get((metric1, metric2))
+                if entry is not None:
+                    results.append(self._build_result(metric1, metric2, entry[0], entry[1], period_days))
 
+        self._log_correlations(results)
         self.correlations = results
         return results
 
@@ -125,8 +283,7 @@ class CorrelationAnalyzer:
         if len(history) < 10:
             return None
 
-        values = [v for _, v in history]
-        baseline_mean = statistics.mean(values)
+        baseline_mean = history.mean
 
         # Find correlating factors
         influences = []
@@ -144,9 +301,9 @@ class CorrelationAnalyzer:
 
         for factor, correlation in influences:
             if factor in context:
-                factor_history = self.metric_history[factor]
+                factor_history = self.metric_history.get(factor)
                 if factor_history:
-                    factor_mean = statistics.mean([v for _, v in factor_history])
+                    factor_mean = factor_history.mean
                     delta = context[factor] - factor_mean
                     predicted += delta * correlation * 0.1
                     total_weight += abs(correlation)
@@ -185,35 +342,140 @@ class CorrelationAnalyzer:
             "timestamp": datetime.now().isoformat()
         }
 
-    def _calculate_correlation(
+    def _correlation_coefficients(
         self,
-        metric1: str,
-        metric2: str,
+        metric_names: List[str],
         period_days: int
-    ) -> Optional[CorrelationResult]:
-        """Calculate Pearson correlation between two metrics."""
-        now = datetime.now()
-        cutoff = now - timedelta(days=period_days)
+    ) -> Dict[Tuple[str, str], Tuple[float, int]]:
+        """
+        Pearson correlation for every pair of metrics over shared time buckets.
 
-        values1 = [v for ts, v in self.metric_history[metric1] if ts > cutoff]
-        values2 = [v for ts, v in self.metric_history[metric2] if ts > cutoff]
+        Each metric contributes one value per bucket (the mean of its samples
+        in that bucket). A pair is correlated over the buckets where both
+        metrics have samples, and needs at least MIN_SHARED_BUCKETS of them.
 
-        if len(values1) < 5 or len(values2) < 5 or len(values1) != len(values2):
-            return None
+        Returns:
+            {(metric_1, metric_2): (coefficient, shared_bucket_count)} for valid pairs
+        """
+        cutoff = datetime.now() - timedelta(days=period_days)
+        names = [
+            name for name in metric_names
+            if self.metric_history[name].bucket_count_since(cutoff) >= self.MIN_SHARED_BUCKETS
+        ]
+        if len(names) < 2:
+            return {}
 
-        # Pearson correlation coefficient
-        mean1 = statistics.mean(values1)
-        mean2 = statistics.mean(values2)
+        if _numpy_available():
+            matrix = self._matrix_numpy(names, cutoff)
+        else:
+            matrix = self._matrix_python(names, cutoff)
+
+        coefficients: Dict[Tuple[str, str], Tuple[float, int]] = {}
+        for i, metric1 in enumerate(names):
+            for j in range(i + 1, len(names)):
+                entry = matrix[i][j]
+                if entry is None:
+                    continue
+                coefficients[(metric1, names[j])] = entry
+                coefficients[(names[j], metric1)] = entry
+        return coefficients
+
+    def _matrix_numpy(
+        self,
+        names: List[str],
+        cutoff: datetime
+    ) -> List[List[Optional[Tuple[float, int]]]]:
+        """
+        Pairwise-complete correlation matrix in one vectorized pass.
 
-        numerator = sum((v1 - mean1) * (v2 - mean2) for v1, v2 in zip(values1, values2))
-        denom1 = sum((v1 - mean1) ** 2 for v1 in values1) ** 0.5
-        denom2 = sum((v2 - mean2) ** 2 for v2 in values2) ** 0.5
+        Bucket means are laid out on the union of bucket ids with a presence
+        mask; masked matrix products then give, for every pair at once, the
+        shared-bucket count, sums, sums of squares and cross-products.
+        """
+        series = [self.metric_history[name].bucket_arrays_since(cutoff) for name in names]
+        bucket_ids = np.unique(np.concatenate([ids for ids, _ in series]))
+
+        values = np.zeros((len(names), len(bucket_ids)))
+        present = np.zeros_like(values)
+        for row, (ids, means) in enumerate(series):
+            cols = np.searchsorted(bucket_ids, ids)
+            # Centre each series first; correlation is shift-invariant and
+            # this keeps the sums-of-squares formula numerically stable
+            values[row, cols] = means - means.mean()
+            present[row, cols] = 1.0
+
+        shared = present @ present.T
+        sums = values @ present.T  # sums[i, j]: sum of series i over buckets shared with j
+        sums_sq = (values * values) @ present.T
+        cross = values @ values.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = cross - sums * sums.T / shared
+            var = sums_sq - sums * sums / shared
+            corr = cov / np.sqrt(var * var.T)
+        corr = np.clip(corr, -1.0, 1.0)
+        varies = var > self.CONSTANT_TOLERANCE * sums_sq
+        valid = (shared >= self.MIN_SHARED_BUCKETS) & varies & varies.T
+
+        size = len(names)
+        return [
+            [(float(corr[i, j]), int(shared[i, j])) if i != j and valid[i, j] else None
+             for j in range(size)]
+            for i in range(size)
+        ]
 
-        if denom1 == 0 or denom2 == 0:
-            return None
+    def _matrix_python(
+        self,
+        names: List[str],
+        cutoff: datetime
+    ) -> List[List[Optional[Tuple[float, int]]]]:
+        """Pure-Python fallback: intersect bucket ids per pair, then Pearson."""
+        buckets = [self.metric_history[name].bucket_means_since(cutoff) for name in names]
+
+        size = len(names)
+        matrix: List[List[Optional[Tuple[float, int]]]] = [[None] * size for _ in range(size)]
+        for i in range(size):
+            for j in range(i + 1, size):
+                common = buckets[i].keys() & buckets[j].keys()
+                n = len(common)
+                if n < self.MIN_SHARED_BUCKETS:
+                    continue
+                xs = [buckets[i][b] for b in common]
+                ys = [buckets[j][b] for b in common]
+                mean_x = sum(xs) / n
+                mean_y = sum(ys) / n
+                cx = [x - mean_x for x in xs]
+                cy = [y - mean_y for y in ys]
+                var_x = sum(x * x for x in cx)
+                var_y = sum(y * y for y in cy)
+                if (var_x <= self.CONSTANT_TOLERANCE * sum(x * x for x in xs)
+                        or var_y <= self.CONSTANT_TOLERANCE * sum(y * y for y in ys)):
+                    continue
+                numerator = sum(x * y for x, y in zip(cx, cy))
+                corr = max(-1.0, min(1.0, numerator / (var_x * var_y) ** 0.5))
+                matrix[i][j] = matrix[j][i] = (corr, n)
+        return matrix
 
-        correlation = numerator / (denom1 * denom2)
+    def _calculate_correlation(
+        self,
+        metric1: str,
+        metric2: str,
+        period_days: int
+    ) -> Optional[CorrelationResult]:
+        """Calculate Pearson correlation between two metrics."""
+        entry = self._correlation_coefficients([metric1, metric2], period_days).get((metric1, metric2))
+        if entry is None:
+            return None
+        return self._build_result(metric1, metric2, entry[0], entry[1], period_days)
 
+    def _build_result(
+        self,
+        metric1: str,
+        metric2: str,
+        correlation: float,
+        sample_count: int,
+        period_days: int
+    ) -> CorrelationResult:
+        """Classify a coefficient into a CorrelationResult."""
         # Classify strength
         abs_corr = abs(correlation)
         if abs_corr < 0.3:
@@ -235,25 +497,35 @@ class CorrelationAnalyzer:
             correlation_coefficient=correlation,
             strength=strength,
             direction=direction,
-            sample_count=len(values1),
+            sample_count=sample_count,
             time_period=f"{period_days}d"
         )
 
     def _log_correlation(self, correlation: CorrelationResult) -> None:
         """Log correlation analysis."""
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "metric_1": correlation.metric_1,
-            "metric_2": correlation.metric_2,
-            "correlation_coefficient": correlation.correlation_coefficient,
-            "strength": correlation.strength,
-            "direction": correlation.direction,
-            "sample_count": correlation.sample_count,
-            "time_period": correlation.time_period
-        }
+        self._log_correlations([correlation])
+
+    def _log_correlations(self, correlations: List[CorrelationResult]) -> None:
+        """Log a batch of correlation results with a single file write."""
+        if not correlations:
+            return
+        timestamp = datetime.now().isoformat()
+        lines = []
+        for correlation in correlations:
+            entry = {
+                "timestamp": timestamp,
+                "metric_1": correlation.metric_1,
+                "metric_2": correlation.metric_2,
+                "correlation_coefficient": correlation.correlation_coefficient,
+                "strength": correlation.strength,
+                "direction": correlation.direction,
+                "sample_count": correlation.sample_count,
+                "time_period": correlation.time_period
+            }
+            lines.append(json.dumps(entry) + "\n")
 
         try:
             with open(self.correlation_log, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+                f.writelines(lines)
         except Exception as e:
             print(f"[CORRELATION-ANALYZER] Failed to log: {e}")
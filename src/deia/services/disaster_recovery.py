@@ -4,16 +4,37 @@ Disaster Recovery - Backup and restore system state on crashes.
 Periodically backs up critical system state (registry, queue, bot assignments).
 On startup, automatically detects and recovers from crashes.
 Ensures zero data loss through regular backups and integrity validation.
+
+Backups are stored as content-addressed chunks (named by the SHA256 of
+their contents) shared between backups, so frequent backups of mostly
+unchanged state only write the chunks that changed.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Iterable
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from datetime import datetime, timedelta
 from enum import Enum
+import gzip
 import json
+import os
 import shutil
 import hashlib
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Chunk file suffix per compression codec
+CODEC_SUFFIXES = {"zstd": ".zst", "gzip": ".gz", "none": ""}
+
+# Backup storage formats (BackupMetadata.format_version)
+LEGACY_FORMAT = 1    # Single <backup_id>.json file
+CHUNKED_FORMAT = 2   # Content-addressed chunks listed in `chunks`
+EMPTY_CHECKSUM = hashlib.sha256(b"").hexdigest()
 
 
 class BackupType(Enum):
@@ -35,6 +56,10 @@ class BackupMetadata:
     item_count: int
     checksum: str                  # SHA256 for integrity
     tags: Dict[str, str] = field(default_factory=dict)
+    chunks: List[str] = field(default_factory=list)  # Chunk hashes, in order
+    stored_bytes: int = 0          # New bytes written to disk for this backup
+    base_id: Optional[str] = None  # Backup this one is a delta against
+    format_version: int = LEGACY_FORMAT  # How the data is stored (see *_FORMAT)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -65,6 +90,7 @@ class DisasterRecovery:
     - Backup integrity validation
     - Automatic cleanup of old backups
     - Comprehensive logging
+    - Deduplicated, compressed chunk storage with streaming restore
     """
 
     # Backup retention policy
@@ -72,15 +98,27 @@ class DisasterRecovery:
     AUTO_BACKUP_INTERVAL_MINUTES = 10  # Backup every 10 minutes
     MAX_BACKUPS_PER_TYPE = 100
 
-    def __init__(self, work_dir: Path):
+    # Chunking: data is serialized one top-level key per line, and a chunk
+    # ends after a line whose hash hits the boundary mask once the chunk is
+    # at least CHUNK_MIN_BYTES. Boundaries depend only on line content, so an
+    # edit to one key only changes the chunk(s) around it.
+    CHUNK_MIN_BYTES = 4 * 1024
+    CHUNK_MAX_BYTES = 64 * 1024
+    CHUNK_BOUNDARY_MASK = 0x3
+
+    def __init__(self, work_dir: Path, compression: Optional[str] = "auto"):
         """
         Initialize disaster recovery system.
 
         Args:
             work_dir: Working directory
+            compression: Chunk codec - "zstd", "gzip", None for uncompressed,
+                or "auto" (zstd if installed, otherwise gzip)
         """
         self.work_dir = Path(work_dir)
+        self.codec = self._resolve_codec(compression)
         self.backup_dir = self.work_dir / ".deia" / "backups"
+        self.chunk_dir = self.backup_dir / "chunks"
         self.log_dir = self.work_dir / ".deia" / "bot-logs"
         self.state_dir = self.work_dir / ".deia" / "state"
 
@@ -96,6 +134,12 @@ class DisasterRecovery:
         self.backups: Dict[str, BackupMetadata] = {}
         self.restore_points: Dict[str, RestorePoint] = {}
 
+        # Chunk reference counts and on-disk sizes, so cleanup and disk
+        # usage never have to walk the chunk store
+        self.chunk_refs: Dict[str, int] = {}
+        self.chunk_sizes: Dict[str, int] = {}
+        self._stored_bytes = 0
+
         # Load existing backup index
         self._load_backup_index()
 
@@ -107,16 +151,22 @@ class DisasterRecovery:
         backup_type: BackupType,
         data: Dict[str, Any],
         source: str = "",
-        tags: Optional[Dict[str, str]] = None
+        tags: Optional[Dict[str, str]] = None,
+        base_id: Optional[str] = None
     ) -> Tuple[bool, str]:
         """
         Create a backup of data.
 
+        Only chunks not already in the store are written, so a backup of
+        mostly unchanged data costs little more than its chunk list.
+
         Args:
             backup_type: Type of backup
             data: Data to backup
             source: Description of source
             tags: Optional tags for organizing backups
+            base_id: Previous backup of the same data; recorded so the
+                backup can be reported as a delta against it
 
         Returns:
             (success, backup_id)
@@ -126,17 +176,23 @@ class DisasterRecovery:
         try:
             backup_id = str(uuid.uuid4())
 
-            # Serialize data
-            data_json = json.dumps(data, indent=2)
-            data_bytes = data_json.encode('utf-8')
+            # Serialize and store chunk by chunk
+            checksum = hashlib.sha256()
+            chunks = []
+            size_bytes = 0
+            stored_bytes = 0
+            for chunk in self._chunk_lines(self._serialize(data)):
+                checksum.update(chunk)
+                size_bytes += len(chunk)
+                digest = hashlib.sha256(chunk).hexdigest()
+                stored_bytes += self._store_chunk(digest, chunk)
+                chunks.append(digest)
 
-            # Calculate checksum
-            checksum = hashlib.sha256(data_bytes).hexdigest()
+            for digest in chunks:
+                self.chunk_refs[digest] = self.chunk_refs.get(digest, 0) + 1
 
-            # Save backup file
-            backup_file = self.backup_dir / f"{backup_id}.json"
-            with open(backup_file, 'wb') as f:
-                f.write(data_bytes)
+            base = self.backups.get(base_id) if base_id else None
+            base_chunks = set(base.chunks) if base else set()
 
             # Create metadata
             metadata = BackupMetadata(
@@ -144,10 +200,14 @@ class DisasterRecovery:
                 backup_type=backup_type,
                 timestamp=datetime.now().isoformat(),
                 source=source or f"backup-{backup_type.value}",
-                size_bytes=len(data_bytes),
+                size_bytes=size_bytes,
                 item_count=self._count_items(data),
-                checksum=checksum,
-                tags=tags or {}
+                checksum=checksum.hexdigest(),
+                tags=tags or {},
+                chunks=chunks,
+                stored_bytes=stored_bytes,
+                base_id=base.backup_id if base else None,
+                format_version=CHUNKED_FORMAT
             )
 
             # Store metadata
@@ -157,8 +217,12 @@ class DisasterRecovery:
             self._log_event("backup_created", {
                 "backup_id": backup_id,
                 "type": backup_type.value,
-                "size_bytes": len(data_bytes),
-                "checksum": checksum
+                "size_bytes": size_bytes,
+                "stored_bytes": stored_bytes,
+                "chunks": len(chunks),
+                "changed_chunks": sum(1 for d in chunks if d not in base_chunks) if base else len(chunks),
+                "base_id": metadata.base_id,
+                "checksum": metadata.checksum
             })
 
             return True, backup_id
@@ -185,23 +249,15 @@ class DisasterRecovery:
                 self._log_event("restore_failed", {"reason": "backup_not_found"})
                 return False, None
 
-            backup_file = self.backup_dir / f"{backup_id}.json"
-            if not backup_file.exists():
+            try:
+                data = dict(self.iter_backup(backup_id))
+            except FileNotFoundError:
                 self._log_event("restore_failed", {"reason": "backup_file_missing"})
                 return False, None
-
-            # Verify integrity
-            with open(backup_file, 'rb') as f:
-                data_bytes = f.read()
-
-            checksum = hashlib.sha256(data_bytes).hexdigest()
-            if checksum != self.backups[backup_id].checksum:
+            except ValueError:
                 self._log_event("restore_failed", {"reason": "checksum_mismatch"})
                 return False, None
 
-            # Load data
-            data = json.loads(data_bytes.decode('utf-8'))
-
             self._log_event("restore_successful", {
                 "backup_id": backup_id,
                 "type": self.backups[backup_id].backup_type.value
@@ -213,6 +269,41 @@ class DisasterRecovery:
             self._log_event("restore_failed", {"error": str(e)})
             return False, None
 
+    def iter_backup(self, backup_id: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream a backup's top-level (key, value) pairs without loading it whole.
+
+        Each chunk is verified against its hash before anything in it is
+        yielded; the whole-backup checksum is verified after the last item.
+
+        Raises:
+            KeyError: Unknown backup
+            FileNotFoundError: Backup data missing from disk
+            ValueError: Integrity check failed
+        """
+        metadata = self.backups[backup_id]
+
+        if metadata.format_version == LEGACY_FORMAT:
+            # Single-file backup from before chunk storage
+            backup_file = self.backup_dir / f"{backup_id}.json"
+            data_bytes = backup_file.read_bytes()
+            if hashlib.sha256(data_bytes).hexdigest() != metadata.checksum:
+                raise ValueError(f"Checksum mismatch for backup {backup_id}")
+            yield from json.loads(data_bytes.decode('utf-8')).items()
+            return
+
+        checksum = hashlib.sha256()
+        pending = b""
+        for digest in metadata.chunks:
+            chunk = self._read_chunk(digest)
+            checksum.update(chunk)
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                yield from json.loads(line).items()
+
+        if pending or checksum.hexdigest() != metadata.checksum:
+            raise ValueError(f"Checksum mismatch for backup {backup_id}")
+
     def create_restore_point(
         self,
         registry_data: Dict = None,
@@ -240,12 +331,21 @@ class DisasterRecovery:
             restore_id = str(uuid.uuid4())
             backup_ids = []
 
+            # Each component is a delta against its backup in the latest restore point
+            bases = {}
+            latest = self._get_latest_restore_point()
+            if latest:
+                for bid in self.restore_points[latest].backups:
+                    if bid in self.backups:
+                        bases[self.backups[bid].backup_type] = bid
+
             # Backup each component
             if registry_data:
                 success, backup_id = self.create_backup(
                     BackupType.REGISTRY,
                     registry_data,
-                    "registry-backup"
+                    "registry-backup",
+                    base_id=bases.get(BackupType.REGISTRY)
                 )
                 if success:
                     backup_ids.append(backup_id)
@@ -254,7 +354,8 @@ class DisasterRecovery:
                 success, backup_id = self.create_backup(
                     BackupType.QUEUE,
                     queue_data,
-                    "queue-backup"
+                    "queue-backup",
+                    base_id=bases.get(BackupType.QUEUE)
                 )
                 if success:
                     backup_ids.append(backup_id)
@@ -263,7 +364,8 @@ class DisasterRecovery:
                 success, backup_id = self.create_backup(
                     BackupType.BOT_ASSIGNMENTS,
                     assignments_data,
-                    "assignments-backup"
+                    "assignments-backup",
+                    base_id=bases.get(BackupType.BOT_ASSIGNMENTS)
                 )
                 if success:
                     backup_ids.append(backup_id)
@@ -514,11 +616,126 @@ class DisasterRecovery:
         return count
 
     def _calculate_disk_usage(self) -> int:
-        """Calculate total disk usage of backups in bytes."""
-        total = 0
-        for backup in self.backups.values():
-            total += backup.size_bytes
-        return total
+        """Calculate total disk usage of backups in bytes (kept as a running total)."""
+        return self._stored_bytes
+
+    @staticmethod
+    def _resolve_codec(compression: Optional[str]) -> str:
+        """Map the compression option to a codec name."""
+        if compression == "auto":
+            return "zstd" if zstandard is not None else "gzip"
+        codec = compression or "none"
+        if codec not in CODEC_SUFFIXES:
+            raise ValueError(f"Unknown compression: {compression}")
+        if codec == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+        return codec
+
+    def _serialize(self, data: Dict[str, Any]) -> Iterator[bytes]:
+        """Serialize data as one JSON object per top-level key, one per line."""
+        for key, value in data.items():
+            yield json.dumps({key: value}, separators=(",", ":")).encode('utf-8') + b"\n"
+
+    def _chunk_lines(self, lines: Iterable[bytes]) -> Iterator[bytes]:
+        """Group lines into content-defined chunks (lines over the max are split)."""
+        buffer = []
+        size = 0
+        for line in lines:
+            if len(line) > self.CHUNK_MAX_BYTES:
+                if buffer:
+                    yield b"".join(buffer)
+                    buffer, size = [], 0
+                for start in range(0, len(line), self.CHUNK_MAX_BYTES):
+                    yield line[start:start + self.CHUNK_MAX_BYTES]
+                continue
+            if size + len(line) > self.CHUNK_MAX_BYTES:
+                yield b"".join(buffer)
+                buffer, size = [], 0
+            buffer.append(line)
+            size += len(line)
+            if size >= self.CHUNK_MIN_BYTES and not zlib.crc32(line) & self.CHUNK_BOUNDARY_MASK:
+                yield b"".join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield b"".join(buffer)
+
+    def _chunk_path(self, digest: str, codec: str) -> Path:
+        return self.chunk_dir / digest[:2] / f"{digest}{CODEC_SUFFIXES[codec]}"
+
+    def _find_chunk(self, digest: str) -> Optional[Path]:
+        """Locate a chunk file, whichever codec it was written with."""
+        for codec in CODEC_SUFFIXES:
+            path = self._chunk_path(digest, codec)
+            if path.exists():
+                return path
+        return None
+
+    def _store_chunk(self, digest: str, chunk: bytes) -> int:
+        """Write a chunk unless already stored; returns bytes written."""
+        if digest in self.chunk_refs:
+            return 0
+        existing = self._find_chunk(digest)
+        if existing:
+            # Left on disk by an earlier backup (or earlier in this one)
+            if digest not in self.chunk_sizes:
+                self.chunk_sizes[digest] = existing.stat().st_size
+                self._stored_bytes += self.chunk_sizes[digest]
+            return 0
+
+        if self.codec == "zstd":
+            payload = zstandard.ZstdCompressor().compress(chunk)
+        elif self.codec == "gzip":
+            payload = gzip.compress(chunk, mtime=0)
+        else:
+            payload = chunk
+
+        path = self._chunk_path(digest, self.codec)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(path.name + ".tmp")
+        with open(temp, 'wb') as f:
+            f.write(payload)
+        os.replace(temp, path)
+
+        self.chunk_sizes[digest] = len(payload)
+        self._stored_bytes += len(payload)
+        return len(payload)
+
+    def _read_chunk(self, digest: str) -> bytes:
+        """Read, decompress and verify a chunk."""
+        path = self._find_chunk(digest)
+        if path is None:
+            raise FileNotFoundError(f"Backup chunk {digest} is missing")
+
+        if path.suffix == ".zst" and zstandard is None:
+            raise RuntimeError("zstd backup chunk found but zstandard is not installed")
+
+        payload = path.read_bytes()
+        try:
+            if path.suffix == ".zst":
+                chunk = zstandard.ZstdDecompressor().decompress(payload)
+            elif path.suffix == ".gz":
+                chunk = gzip.decompress(payload)
+            else:
+                chunk = payload
+        except Exception as e:
+            raise ValueError(f"Corrupt backup chunk {digest}: {e}")
+
+        if hashlib.sha256(chunk).hexdigest() != digest:
+            raise ValueError(f"Checksum mismatch for backup chunk {digest}")
+        return chunk
+
+    def _release_chunks(self, chunks: List[str]) -> None:
+        """Drop one reference to each chunk, deleting chunks nothing uses."""
+        for digest in chunks:
+            refs = self.chunk_refs.get(digest, 0) - 1
+            if refs > 0:
+                self.chunk_refs[digest] = refs
+                continue
+            self.chunk_refs.pop(digest, None)
+            self._stored_bytes -= self.chunk_sizes.pop(digest, 0)
+            path = self._find_chunk(digest)
+            if path:
+                path.unlink()
 
     def _cleanup_old_backups(self) -> None:
         """Remove backups older than retention period."""
@@ -532,9 +749,14 @@ class DisasterRecovery:
 
         for backup_id in to_delete:
             try:
-                backup_file = self.backup_dir / f"{backup_id}.json"
-                if backup_file.exists():
-                    backup_file.unlink()
+                metadata = self.backups[backup_id]
+                if metadata.format_version == LEGACY_FORMAT:
+                    backup_file = self.backup_dir / f"{backup_id}.json"
+                    if backup_file.exists():
+                        backup_file.unlink()
+                    self._stored_bytes -= metadata.size_bytes
+                else:
+                    self._release_chunks(metadata.chunks)
                 del self.backups[backup_id]
                 self._log_event("backup_deleted_old", {"backup_id": backup_id})
             except Exception as e:
@@ -551,6 +773,13 @@ class DisasterRecovery:
 
             for backup_id, metadata_dict in data.get("backups", {}).items():
                 backup_type = BackupType[metadata_dict["backup_type"].upper()]
+                chunks = metadata_dict.get("chunks", [])
+                # Entries without a format are legacy, unless they list chunks
+                # or are an empty chunked backup (checksum of no bytes)
+                format_version = metadata_dict.get("format_version")
+                if format_version is None:
+                    chunked = chunks or metadata_dict["checksum"] == EMPTY_CHECKSUM
+                    format_version = CHUNKED_FORMAT if chunked else LEGACY_FORMAT
                 metadata = BackupMetadata(
                     backup_id=backup_id,
                     backup_type=backup_type,
@@ -559,10 +788,29 @@ class DisasterRecovery:
                     size_bytes=metadata_dict["size_bytes"],
                     item_count=metadata_dict["item_count"],
                     checksum=metadata_dict["checksum"],
-                    tags=metadata_dict.get("tags", {})
+                    tags=metadata_dict.get("tags", {}),
+                    chunks=chunks,
+                    stored_bytes=metadata_dict.get("stored_bytes", 0),
+                    base_id=metadata_dict.get("base_id"),
+                    format_version=format_version
                 )
                 self.backups[backup_id] = metadata
 
+                for digest in metadata.chunks:
+                    self.chunk_refs[digest] = self.chunk_refs.get(digest, 0) + 1
+                if metadata.format_version == LEGACY_FORMAT:
+                    self._stored_bytes += metadata.size_bytes
+
+            self.chunk_sizes = {
+                digest: size for digest, size in data.get("chunk_sizes", {}).items()
+                if digest in self.chunk_refs
+            }
+            for digest in self.chunk_refs:
+                if digest not in self.chunk_sizes:
+                    path = self._find_chunk(digest)
+                    self.chunk_sizes[digest] = path.stat().st_size if path else 0
+            self._stored_bytes += sum(self.chunk_sizes.values())
+
             for restore_id, rp_dict in data.get("restore_points", {}).items():
                 restore_point = RestorePoint(
                     restore_id=restore_id,
@@ -592,7 +840,8 @@ class DisasterRecovery:
                 "restore_points": {
                     rpid: asdict(rp)
                     for rpid, rp in self.restore_points.items()
-                }
+                },
+                "chunk_sizes": self.chunk_sizes
             }
 
             with open(self.metadata_index, 'w') as f:
@@ -8,20 +8,28 @@ Features:
 - Latency analysis (p50, p95, p99)
 - Error tracking in traces
 - Query/visualization support
-- Sampling strategies
+- Sampling strategies (head-based rate, tail-based keep for errors/slow traces)
+- Bounded LRU trace store that retains error traces preferentially
+- Streaming per-operation latency sketches (no per-query sort)
+- Batched background span/trace export
 """
 
 import json
 import uuid
 import logging
 import time
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Iterator
 from dataclasses import dataclass, asdict, field
 from enum import Enum
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import threading
+import atexit
+import weakref
+
+from .streaming_stats import RunningStats, QuantileSketch
 
 logging.basicConfig(
     level=logging.INFO,
@@ -116,6 +124,7 @@ class Trace:
     spans: Dict[str, Span] = field(default_factory=dict)
     duration_ms: float = 0.0
     error_count: int = 0
+    sampled: bool = True  # Head-based sampling decision
 
     def finish(self):
         """Mark trace as finished."""
@@ -136,20 +145,231 @@ class Trace:
             "end_time": self.end_time,
             "duration_ms": self.duration_ms,
             "error_count": self.error_count,
+            "sampled": self.sampled,
             "span_count": len(self.spans),
             "spans": [s.to_dict() for s in self.spans.values()]
         }
 
 
+@dataclass
+class SamplingPolicy:
+    """Which traces are exported and retained.
+
+    Head sampling decides at trace start from a hash of the trace ID, so every
+    service sees the same decision for a propagated trace. Tail sampling
+    rescues head-dropped traces at finish if they errored or were slow.
+    """
+    sample_rate: float = 1.0  # Head-based: fraction of traces sampled
+    keep_errors: bool = True  # Tail-based: always keep traces with errors
+    slow_trace_ms: Optional[float] = None  # Tail-based: keep traces at least this slow
+
+    def head_sampled(self, trace_id: str) -> bool:
+        """Deterministic head sampling decision for a trace ID."""
+        if self.sample_rate >= 1.0:
+            return True
+        if self.sample_rate <= 0.0:
+            return False
+        return zlib.crc32(trace_id.encode("utf-8")) / 0xFFFFFFFF < self.sample_rate
+
+    def tail_keep(self, trace: Trace) -> bool:
+        """Whether a finished trace should be kept regardless of head sampling."""
+        if self.keep_errors and trace.error_count > 0:
+            return True
+        return self.slow_trace_ms is not None and trace.duration_ms >= self.slow_trace_ms
+
+
+class TraceStore:
+    """Bounded in-memory trace store.
+
+    Active traces, finished traces and error traces live in separate LRU
+    maps. When over capacity, finished non-error traces are evicted first, so
+    error traces survive longest; error traces have their own cap.
+    """
+
+    def __init__(self, max_traces: int = 10000, max_error_traces: int = 1000):
+        self.max_traces = max_traces
+        self.max_error_traces = max_error_traces
+        self._active: "OrderedDict[str, Trace]" = OrderedDict()
+        self._completed: "OrderedDict[str, Trace]" = OrderedDict()
+        self._errors: "OrderedDict[str, Trace]" = OrderedDict()
+        self.evicted = 0
+
+    def _bucket(self, trace_id: str) -> Optional["OrderedDict[str, Trace]"]:
+        for bucket in (self._active, self._completed, self._errors):
+            if trace_id in bucket:
+                return bucket
+        return None
+
+    def add(self, trace: Trace) -> List[Trace]:
+        """Add an active trace; returns traces evicted to make room."""
+        self._active[trace.trace_id] = trace
+        evicted = []
+        while len(self._active) > self.max_traces:
+            evicted.append(self._active.popitem(last=False)[1])
+        self.evicted += len(evicted)
+        return evicted
+
+    def complete(self, trace: Trace) -> List[Trace]:
+        """Move a finished trace out of the active set; returns evicted traces."""
+        self._active.pop(trace.trace_id, None)
+        target = self._errors if trace.error_count > 0 else self._completed
+        target[trace.trace_id] = trace
+        evicted = []
+        while len(self._errors) > self.max_error_traces:
+            evicted.append(self._errors.popitem(last=False)[1])
+        while len(self._completed) + len(self._errors) > self.max_traces:
+            source = self._completed if self._completed else self._errors
+            evicted.append(source.popitem(last=False)[1])
+        self.evicted += len(evicted)
+        return evicted
+
+    def get(self, trace_id: str, default=None) -> Optional[Trace]:
+        """Look up a trace, marking it recently used."""
+        bucket = self._bucket(trace_id)
+        if bucket is None:
+            return default
+        bucket.move_to_end(trace_id)
+        return bucket[trace_id]
+
+    def pop(self, trace_id: str, default=None) -> Optional[Trace]:
+        bucket = self._bucket(trace_id)
+        return bucket.pop(trace_id) if bucket is not None else default
+
+    def __getitem__(self, trace_id: str) -> Trace:
+        trace = self.get(trace_id)
+        if trace is None:
+            raise KeyError(trace_id)
+        return trace
+
+    def __setitem__(self, trace_id: str, trace: Trace) -> None:
+        self.pop(trace_id)
+        self.add(trace)
+
+    def __contains__(self, trace_id: object) -> bool:
+        return self._bucket(trace_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._active) + len(self._completed) + len(self._errors)
+
+    def values(self) -> Iterator[Trace]:
+        yield from list(self._active.values())
+        yield from list(self._completed.values())
+        yield from list(self._errors.values())
+
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
+
+    def error_traces(self) -> List[Trace]:
+        """Traces with errors: active ones that already recorded one, then finished ones."""
+        active = [trace for trace in list(self._active.values()) if trace.error_count > 0]
+        return active + list(self._errors.values())
+
+
+_EXPORTERS: "weakref.WeakSet" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_exporters():
+    """Flush queued records from live exporters at interpreter exit."""
+    for exporter in list(_EXPORTERS):
+        exporter.flush()
+
+
+class SpanExporter:
+    """Batched, background writer for span/trace JSONL records.
+
+    Records are queued in memory and appended by a daemon thread once a batch
+    fills up or the flush interval passes, so finishing a span costs a list
+    append instead of a file open/write.
+    """
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 1.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: Dict[Path, List[str]] = defaultdict(list)
+        self._pending_count = 0
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        _EXPORTERS.add(self)
+
+    def submit(self, path: Path, record: Dict) -> None:
+        """Queue a record for appending to path."""
+        line = json.dumps(record) + '\n'
+        with self._cond:
+            self._pending[path].append(line)
+            self._pending_count += 1
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+                self._thread.start()
+            if self._pending_count >= self.batch_size:
+                self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._closed and self._pending_count < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                # Exit when idle or closing; submit() starts a new thread on demand
+                done = self._closed or self._pending_count == 0
+                if done:
+                    self._thread = None
+            self.flush()
+            if done:
+                return
+
+    def flush(self) -> int:
+        """Write all queued records now. Returns number of records written."""
+        with self._cond:
+            pending, self._pending = self._pending, defaultdict(list)
+            self._pending_count = 0
+        written = 0
+        with self._write_lock:
+            for path, lines in pending.items():
+                try:
+                    with open(path, 'a', encoding='utf-8') as f:
+                        f.writelines(lines)
+                    written += len(lines)
+                except Exception as e:
+                    logger.error(f"Failed to export {len(lines)} records to {path}: {e}")
+        return written
+
+    def close(self):
+        """Flush remaining records and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        self.flush()
+
+
 class DistributedTracer:
     """Core distributed tracing implementation."""
 
-    def __init__(self, service_name: str, project_root: Path = None):
+    def __init__(
+        self,
+        service_name: str,
+        project_root: Path = None,
+        sampling: Optional[SamplingPolicy] = None,
+        max_traces: int = 10000,
+        max_error_traces: int = 1000,
+        export_batch_size: int = 100,
+        export_interval: float = 1.0
+    ):
         """Initialize tracer.
 
         Args:
             service_name: Service name for this tracer
             project_root: Project root for trace storage
+            sampling: Sampling policy (default: keep everything)
+            max_traces: Max traces held in memory
+            max_error_traces: Max error traces held in memory
+            export_batch_size: Records per background export batch
+            export_interval: Seconds between background export flushes
         """
         if project_root is None:
             project_root = Path(__file__).parent.parent.parent.parent
@@ -165,17 +385,27 @@ class DistributedTracer:
         self.metrics_log.parent.mkdir(parents=True, exist_ok=True)
 
         # In-memory structures
-        self.traces: Dict[str, Trace] = {}  # trace_id -> Trace
+        self.sampling = sampling or SamplingPolicy()
+        self.traces = TraceStore(max_traces, max_error_traces)  # trace_id -> Trace
         self.active_spans: Dict[str, Dict[str, Span]] = defaultdict(dict)  # trace_id -> {span_id -> Span}
         self.service_deps: set = set()  # (service_from, service_to) tuples
         self.lock = threading.RLock()
+        self.exporter = SpanExporter(export_batch_size, export_interval)
+
+        # Streaming latency stats for completed traces, per operation and overall
+        self.latency_stats: Dict[str, RunningStats] = defaultdict(RunningStats)
+        self.latency_sketches: Dict[str, QuantileSketch] = defaultdict(QuantileSketch)
+        self._all_latency_stats = RunningStats()
+        self._all_latency_sketch = QuantileSketch()
 
         # Metrics
         self.metrics = {
             "traces_started": 0,
             "spans_created": 0,
             "traces_completed": 0,
-            "errors": 0
+            "errors": 0,
+            "traces_dropped": 0,
+            "traces_evicted": 0
         }
 
         logger.info(f"DistributedTracer initialized for service '{service_name}'")
@@ -197,7 +427,8 @@ class DistributedTracer:
             trace = Trace(
                 trace_id=trace_id,
                 service_name=self.service_name,
-                operation_name=operation_name
+                operation_name=operation_name,
+                sampled=self.sampling.head_sampled(trace_id)
             )
 
             # Start root span
@@ -211,7 +442,7 @@ class DistributedTracer:
             trace.spans[root_span.id] = root_span
             self.active_spans[trace_id][root_span.id] = root_span
 
-            self.traces[trace_id] = trace
+            self._forget(self.traces.add(trace))
             self.metrics["traces_started"] += 1
 
             logger.info(f"Trace {trace_id} started")
@@ -276,16 +507,23 @@ class DistributedTracer:
                 logger.warning(f"Span {span_id} not found in trace {trace_id}")
                 return
 
-            span = self.traces[trace_id].spans[span_id]
+            trace = self.traces[trace_id]
+            span = trace.spans[span_id]
 
             if error:
+                if not span.error:
+                    # Keep the count live so unfinished traces show their errors
+                    trace.error_count += 1
                 span.set_error(error, error_stack)
                 self.metrics["errors"] += 1
             else:
                 span.finish(duration_ms)
 
-            # Persist span
-            self._persist_span(span)
+            self.active_spans.get(trace_id, {}).pop(span_id, None)
+
+            # Persist span (head-dropped traces wait for the tail decision)
+            if trace.sampled:
+                self._persist_span(span)
 
     def finish_trace(self, trace_id: str):
         """Finish a trace.
@@ -301,9 +539,27 @@ class DistributedTracer:
             trace = self.traces[trace_id]
             trace.finish()
             self.metrics["traces_completed"] += 1
+            self.active_spans.pop(trace_id, None)
+
+            if trace.status == "completed":
+                self._record_latency(trace)
+
+            if trace.sampled:
+                self._persist_trace(trace)
+            elif self.sampling.tail_keep(trace):
+                # Tail-sampled: export the spans held back during the trace
+                trace.sampled = True
+                for span in trace.spans.values():
+                    if span.end_time is not None:
+                        self._persist_span(span)
+                self._persist_trace(trace)
+            else:
+                self.traces.pop(trace_id)
+                self.metrics["traces_dropped"] += 1
+                logger.debug(f"Trace {trace_id} dropped by sampling")
+                return
 
-            # Persist trace
-            self._persist_trace(trace)
+            self._forget(self.traces.complete(trace))
 
             logger.info(f"Trace {trace_id} finished (duration: {trace.duration_ms:.2f}ms)")
 
@@ -331,27 +587,25 @@ class DistributedTracer:
             Dict with p50, p95, p99 latencies
         """
         with self.lock:
-            durations = []
-
-            for trace in self.traces.values():
-                if trace.status == "completed":
-                    if operation_name is None or trace.operation_name == operation_name:
-                        durations.append(trace.duration_ms)
-
-            if not durations:
+            if operation_name is None:
+                stats, sketch = self._all_latency_stats, self._all_latency_sketch
+            elif operation_name in self.latency_stats:
+                stats = self.latency_stats[operation_name]
+                sketch = self.latency_sketches[operation_name]
+            else:
                 return {"count": 0}
 
-            durations.sort()
-            count = len(durations)
+            if stats.count == 0:
+                return {"count": 0}
 
             return {
-                "count": count,
-                "p50": durations[int(count * 0.5)] if count > 0 else 0,
-                "p95": durations[int(count * 0.95)] if count > 1 else durations[0],
-                "p99": durations[int(count * 0.99)] if count > 1 else durations[0],
-                "min": durations[0],
-                "max": durations[-1],
-                "avg": sum(durations) / len(durations)
+                "count": stats.count,
+                "p50": sketch.quantile(0.50),
+                "p95": sketch.quantile(0.95),
+                "p99": sketch.quantile(0.99),
+                "min": stats.min,
+                "max": stats.max,
+                "avg": stats.mean
             }
 
     def get_error_traces(self) -> List[Dict]:
@@ -362,7 +616,7 @@ class DistributedTracer:
         """
         with self.lock:
             errors = []
-            for trace in self.traces.values():
+            for trace in self.traces.error_traces():
                 if trace.error_count > 0:
                     errors.append({
                         "trace_id": trace.trace_id,
@@ -382,35 +636,51 @@ class DistributedTracer:
             return {
                 "timestamp": datetime.utcnow().isoformat() + "Z",
                 "metrics": self.metrics.copy(),
-                "active_traces": len([t for t in self.traces.values() if t.status == "pending"]),
+                "active_traces": self.traces.active_count,
                 "completed_traces": len([t for t in self.traces.values() if t.status == "completed"]),
-                "error_traces": len([t for t in self.traces.values() if t.error_count > 0]),
+                "error_traces": len(self.traces.error_traces()),
                 "services_in_dep_graph": len(set(list(zip(*self.service_deps))[0] if self.service_deps else []))
             }
 
+    def flush(self) -> int:
+        """Write all queued spans/traces to disk now."""
+        return self.exporter.flush()
+
+    def close(self):
+        """Flush pending exports and stop the export thread."""
+        self.exporter.close()
+
+    def _record_latency(self, trace: Trace):
+        """Update streaming latency stats for a completed trace."""
+        self.latency_stats[trace.operation_name].add(trace.duration_ms)
+        self.latency_sketches[trace.operation_name].add(trace.duration_ms)
+        self._all_latency_stats.add(trace.duration_ms)
+        self._all_latency_sketch.add(trace.duration_ms)
+
+    def _forget(self, evicted: List[Trace]):
+        """Drop bookkeeping for traces evicted from the store."""
+        for trace in evicted:
+            self.active_spans.pop(trace.trace_id, None)
+            self.metrics["traces_evicted"] += 1
+
     def _persist_trace(self, trace: Trace):
-        """Persist trace to log."""
-        try:
-            with open(self.traces_log, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(trace.to_dict()) + '\n')
-        except Exception as e:
-            logger.error(f"Failed to persist trace: {e}")
+        """Queue trace for export to log."""
+        self.exporter.submit(self.traces_log, trace.to_dict())
 
     def _persist_span(self, span: Span):
-        """Persist span to log."""
-        try:
-            with open(self.spans_log, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(span.to_dict()) + '\n')
-        except Exception as e:
-            logger.error(f"Failed to persist span: {e}")
+        """Queue span for export to log."""
+        self.exporter.submit(self.spans_log, span.to_dict())
 
 
 class TracingService:
     """High-level tracing service for applications."""
 
-    def __init__(self, service_name: str, project_root: Path = None):
-        """Initialize tracing service."""
-        self.tracer = DistributedTracer(service_name, project_root)
+    def __init__(self, service_name: str, project_root: Path = None, **tracer_options):
+        """Initialize tracing service.
+
+        Extra keyword arguments (sampling, max_traces, ...) go to DistributedTracer.
+        """
+        self.tracer = DistributedTracer(service_name, project_root, **tracer_options)
 
     def start_request(self, operation_name: str, trace_id: Optional[str] = None) -> Trace:
         """Start tracing a request."""
@@ -448,3 +718,7 @@ class TracingService:
     def status(self) -> Dict:
         """Get tracing system status."""
         return self.tracer.get_metrics()
+
+    def flush(self) -> int:
+        """Write queued spans/traces to disk."""
+        return self.tracer.flush()
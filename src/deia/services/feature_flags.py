@@ -1,16 +1,31 @@
 #!/usr/bin/env python3
-"""Feature Flags & A/B Testing: Enable/disable features, gradual rollouts."""
+"""Feature Flags & A/B Testing: Enable/disable features, gradual rollouts.
+
+Flags and A/B tests are compiled into an immutable snapshot (target sets,
+bucket thresholds) that is swapped atomically on change, so evaluate() and
+get_variant() read without locking. Evaluations are counted per thread and
+flushed to the evaluations log as aggregates every `flush_interval` seconds.
+
+Snapshot contract: each manager keeps a version that its own methods bump,
+as do adding or removing entries in `manager.flags` / `manager.ab_tests`
+and assigning an attribute of a flag, test or variant the manager has
+compiled. Mutating a container in place (e.g. flag.target_users.append(...))
+is not seen; call manager.refresh() afterwards.
+"""
 
 import json
 import logging
 import uuid
+import bisect
+import itertools
+import weakref
+import zlib
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 import threading
-import hashlib
 
 logging.basicConfig(
     level=logging.INFO,
@@ -18,6 +33,69 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rollouts and variants assign each user one of BUCKETS buckets (0.01% steps)
+BUCKETS = 10000
+
+
+class _Tracked:
+    """Mixin: attribute assignment invalidates snapshots that compiled the object."""
+
+    _owners = ()  # Managers whose snapshot includes this object
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        for manager in list(self._owners):
+            manager._changed()
+
+    def _attach(self, manager: "FeatureFlagManager") -> None:
+        if not self._owners:
+            object.__setattr__(self, "_owners", weakref.WeakSet())
+        self._owners.add(manager)
+
+
+class _Registry(dict):
+    """Name -> flag/test mapping that invalidates its manager's snapshot on change."""
+
+    def __init__(self, on_change):
+        super().__init__()
+        self._on_change = on_change
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._on_change()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._on_change()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._on_change()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._on_change()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._on_change()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._on_change()
+
+    def clear(self):
+        super().clear()
+        self._on_change()
+
+
+def _bucket(user_id: str, seed: int) -> int:
+    """Stable bucket for a user, salted per flag/test (CRC32, not crypto)."""
+    return zlib.crc32(user_id.encode(), seed) % BUCKETS
+
 
 class RolloutStrategy(Enum):
     """Rollout strategies."""
@@ -28,7 +106,7 @@ class RolloutStrategy(Enum):
 
 
 @dataclass
-class FeatureFlag:
+class FeatureFlag(_Tracked):
     """Feature flag configuration."""
     name: str
     enabled: bool = False
@@ -45,7 +123,7 @@ class FeatureFlag:
 
 
 @dataclass
-class Variant:
+class Variant(_Tracked):
     """A/B test variant."""
     name: str
     weight: float = 0.5  # 0-1
@@ -57,7 +135,7 @@ class Variant:
 
 
 @dataclass
-class ABTest:
+class ABTest(_Tracked):
     """A/B test configuration."""
     name: str
     feature_name: str
@@ -72,10 +150,74 @@ class ABTest:
             raise ValueError(f"Variant weights must sum to 1.0, got {total_weight}")
 
 
+class _CompiledFlag:
+    """Immutable, evaluation-ready form of a FeatureFlag."""
+
+    __slots__ = ("enabled", "targets", "threshold", "seed")
+
+    def __init__(self, flag: FeatureFlag):
+        self.enabled = flag.enabled
+        self.targets = frozenset(flag.target_users) if flag.target_users else None
+        self.threshold = round(flag.rollout_percentage * BUCKETS / 100)
+        self.seed = zlib.crc32(flag.name.encode())
+
+    def evaluate(self, user_id: Optional[str]) -> bool:
+        if not self.enabled:
+            return False
+        # Check user targeting
+        if self.targets is not None and user_id and user_id not in self.targets:
+            return False
+        # Check rollout percentage
+        if self.threshold < BUCKETS and user_id:
+            return _bucket(user_id, self.seed) < self.threshold
+        return True
+
+
+class _CompiledTest:
+    """Immutable, evaluation-ready form of an ABTest."""
+
+    __slots__ = ("enabled", "variants", "bounds", "seed")
+
+    def __init__(self, test: ABTest):
+        self.enabled = test.enabled
+        self.variants = tuple(test.variants)
+        cumulative = itertools.accumulate(v.weight for v in test.variants)
+        self.bounds = [round(c * BUCKETS) for c in cumulative]
+        self.seed = zlib.crc32(test.name.encode())
+
+    def assign(self, user_id: str) -> Optional[Variant]:
+        if not self.variants:
+            return None
+        index = bisect.bisect_right(self.bounds, _bucket(user_id, self.seed))
+        return self.variants[min(index, len(self.variants) - 1)]
+
+
+class _Snapshot:
+    __slots__ = ("version", "flags", "tests")
+
+    def __init__(self, version: int, flags: Dict[str, _CompiledFlag], tests: Dict[str, _CompiledTest]):
+        self.version = version
+        self.flags = flags
+        self.tests = tests
+
+
+def _flush_periodically(manager_ref, interval: float, stop: threading.Event):
+    """Background flusher; exits when the manager is closed or collected."""
+    while not stop.wait(interval):
+        manager = manager_ref()
+        if manager is None:
+            return
+        manager.flush_evaluations()
+        del manager
+
+
 class FeatureFlagManager:
     """Feature flag management."""
 
-    def __init__(self, project_root: Path = None):
+    # Seconds between evaluation-count flushes (None = only on flush_evaluations())
+    FLUSH_INTERVAL = 60.0
+
+    def __init__(self, project_root: Path = None, flush_interval: Optional[float] = FLUSH_INTERVAL):
         """Initialize feature flag manager."""
         if project_root is None:
             project_root = Path(__file__).parent.parent.parent.parent
@@ -88,12 +230,86 @@ class FeatureFlagManager:
         self.evaluations_log = project_root / ".deia" / "logs" / "flag-evaluations.jsonl"
         self.evaluations_log.parent.mkdir(parents=True, exist_ok=True)
 
-        self.flags: Dict[str, FeatureFlag] = {}
-        self.ab_tests: Dict[str, ABTest] = {}
+        # Snapshot version; see the module docstring for what bumps it
+        self._versions = itertools.count(1)
+        self._version = 0
+        self._snapshot = _Snapshot(-1, {}, {})
+        self.flags: Dict[str, FeatureFlag] = _Registry(self._changed)
+        self.ab_tests: Dict[str, ABTest] = _Registry(self._changed)
         self.lock = threading.RLock()
 
+        # Per-thread evaluation counters {(flag, result): count}; never reset,
+        # flushes write the difference from the last flushed totals. Counters
+        # of finished threads are folded into _retired_counts.
+        self._local = threading.local()
+        self._thread_counts: List[Tuple[threading.Thread, Dict[Tuple[str, bool], int]]] = []
+        self._retired_counts: Dict[Tuple[str, bool], int] = {}
+        self._flushed: Dict[Tuple[str, bool], int] = {}
+        self._flush_lock = threading.Lock()
+        self._last_flush = datetime.utcnow().isoformat() + "Z"
+
+        self._stop_flusher = threading.Event()
+        if flush_interval:
+            threading.Thread(
+                target=_flush_periodically,
+                args=(weakref.ref(self), flush_interval, self._stop_flusher),
+                name="feature-flag-flusher",
+                daemon=True
+            ).start()
+
         logger.info("FeatureFlagManager initialized")
 
+    def _changed(self) -> None:
+        """Invalidate the compiled snapshot."""
+        self._version = next(self._versions)
+
+    def refresh(self) -> None:
+        """Recompile on next use, e.g. after mutating flag.target_users in place."""
+        self._changed()
+
+    def _compile(self) -> _Snapshot:
+        """Rebuild the snapshot from the current flags and tests."""
+        with self.lock:
+            snapshot = self._snapshot
+            if snapshot.version == self._version:
+                return snapshot
+            version = self._version
+            # Watch everything compiled in, so direct attribute edits are seen
+            for flag in self.flags.values():
+                flag._attach(self)
+            for test in self.ab_tests.values():
+                test._attach(self)
+                for variant in test.variants:
+                    variant._attach(self)
+            snapshot = _Snapshot(
+                version,
+                {name: _CompiledFlag(flag) for name, flag in self.flags.items()},
+                {name: _CompiledTest(test) for name, test in self.ab_tests.items()}
+            )
+            self._snapshot = snapshot
+            return snapshot
+
+    def _counts(self) -> Dict[Tuple[str, bool], int]:
+        try:
+            return self._local.counts
+        except AttributeError:
+            counts = self._local.counts = {}
+            with self._flush_lock:
+                self._retire_dead_threads()
+                self._thread_counts.append((threading.current_thread(), counts))
+            return counts
+
+    def _retire_dead_threads(self) -> None:
+        """Fold counters of finished threads into _retired_counts (caller holds _flush_lock)."""
+        live = []
+        for thread, counts in self._thread_counts:
+            if thread.is_alive():
+                live.append((thread, counts))
+                continue
+            for key, count in counts.items():
+                self._retired_counts[key] = self._retired_counts.get(key, 0) + count
+        self._thread_counts = live
+
     def create_flag(self, name: str, enabled: bool = False,
                    strategy: RolloutStrategy = RolloutStrategy.IMMEDIATE,
                    rollout_percentage: float = 0.0) -> FeatureFlag:
@@ -112,36 +328,21 @@ class FeatureFlagManager:
 
     def evaluate(self, flag_name: str, user_id: Optional[str] = None,
                 context: Optional[Dict] = None) -> bool:
-        """Evaluate feature flag for user."""
-        with self.lock:
-            if flag_name not in self.flags:
-                logger.warning(f"Flag '{flag_name}' not found")
-                return False
-
-            flag = self.flags[flag_name]
-
-            # Check if globally disabled
-            if not flag.enabled:
-                self._log_evaluation(flag_name, user_id, False)
-                return False
+        """Evaluate feature flag for user (lock-free)."""
+        snapshot = self._snapshot
+        if snapshot.version != self._version:
+            snapshot = self._compile()
+
+        compiled = snapshot.flags.get(flag_name)
+        if compiled is None:
+            logger.warning(f"Flag '{flag_name}' not found")
+            return False
 
-            # Check user targeting
-            if flag.target_users and user_id and user_id not in flag.target_users:
-                self._log_evaluation(flag_name, user_id, False)
-                return False
-
-            # Check rollout percentage
-            if flag.rollout_percentage < 100:
-                if user_id:
-                    # Consistent hashing for user
-                    user_hash = int(hashlib.md5(user_id.encode()).hexdigest(), 16)
-                    user_percentage = (user_hash % 100) / 100.0
-                    if user_percentage > flag.rollout_percentage / 100.0:
-                        self._log_evaluation(flag_name, user_id, False)
-                        return False
-
-            self._log_evaluation(flag_name, user_id, True)
-            return True
+        result = compiled.evaluate(user_id)
+        counts = self._counts()
+        key = (flag_name, result)
+        counts[key] = counts.get(key, 0) + 1
+        return result
 
     def enable_flag(self, name: str) -> bool:
         """Enable a flag."""
@@ -150,6 +351,7 @@ class FeatureFlagManager:
                 return False
             self.flags[name].enabled = True
             self.flags[name].updated_at = datetime.utcnow().isoformat() + "Z"
+            self._changed()
             self._persist_flag(self.flags[name])
             logger.info(f"Flag '{name}' enabled")
             return True
@@ -161,6 +363,7 @@ class FeatureFlagManager:
                 return False
             self.flags[name].enabled = False
             self.flags[name].updated_at = datetime.utcnow().isoformat() + "Z"
+            self._changed()
             self._persist_flag(self.flags[name])
             logger.info(f"Flag '{name}' disabled")
             return True
@@ -174,6 +377,7 @@ class FeatureFlagManager:
                 return False
             self.flags[name].rollout_percentage = percentage
             self.flags[name].updated_at = datetime.utcnow().isoformat() + "Z"
+            self._changed()
             self._persist_flag(self.flags[name])
             logger.info(f"Flag '{name}' rollout set to {percentage}%")
             return True
@@ -187,27 +391,15 @@ class FeatureFlagManager:
             return test
 
     def get_variant(self, test_name: str, user_id: str) -> Optional[Variant]:
-        """Get variant for user in A/B test."""
-        with self.lock:
-            if test_name not in self.ab_tests:
-                return None
-
-            test = self.ab_tests[test_name]
-            if not test.enabled:
-                return None
-
-            # Consistent hashing for variant assignment
-            user_hash = int(hashlib.md5(user_id.encode()).hexdigest(), 16)
-            user_value = (user_hash % 100) / 100.0
+        """Get variant for user in A/B test (lock-free)."""
+        snapshot = self._snapshot
+        if snapshot.version != self._version:
+            snapshot = self._compile()
 
-            cumulative = 0.0
-            for variant in test.variants:
-                cumulative += variant.weight
-                if user_value <= cumulative:
-                    logger.debug(f"User {user_id} assigned to variant '{variant.name}' in test '{test_name}'")
-                    return variant
-
-            return test.variants[-1]  # Fallback
+        test = snapshot.tests.get(test_name)
+        if test is None or not test.enabled:
+            return None
+        return test.assign(user_id)
 
     def get_flag(self, name: str) -> Optional[FeatureFlag]:
         """Get flag by name."""
@@ -227,19 +419,64 @@ class FeatureFlagManager:
         except Exception as e:
             logger.error(f"Failed to persist flag: {e}")
 
-    def _log_evaluation(self, flag_name: str, user_id: Optional[str], result: bool):
-        """Log flag evaluation."""
-        try:
-            entry = {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "flag": flag_name,
-                "user_id": user_id,
-                "result": result
-            }
-            with open(self.evaluations_log, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(entry) + '\n')
-        except Exception as e:
-            logger.error(f"Failed to log evaluation: {e}")
+    def get_evaluation_counts(self) -> Dict[str, Dict[str, int]]:
+        """Total evaluations per flag since startup: {flag: {"enabled": n, "disabled": n}}."""
+        with self._flush_lock:
+            totals = self._total_counts()
+        stats: Dict[str, Dict[str, int]] = {}
+        for (flag_name, result), count in totals.items():
+            entry = stats.setdefault(flag_name, {"enabled": 0, "disabled": 0})
+            entry["enabled" if result else "disabled"] += count
+        return stats
+
+    def _total_counts(self) -> Dict[Tuple[str, bool], int]:
+        """Sum per-thread counters (caller holds _flush_lock)."""
+        self._retire_dead_threads()
+        totals = dict(self._retired_counts)
+        for _, counts in self._thread_counts:
+            for key, count in list(counts.items()):
+                totals[key] = totals.get(key, 0) + count
+        return totals
+
+    def flush_evaluations(self) -> int:
+        """
+        Append aggregated evaluation counts since the last flush to the log.
+
+        Writes one line per flag: {"window_start", "timestamp", "flag",
+        "enabled", "disabled"}. Returns the number of lines written.
+        """
+        with self._flush_lock:
+            totals = self._total_counts()
+            per_flag: Dict[str, Dict[str, int]] = {}
+            for key, total in totals.items():
+                delta = total - self._flushed.get(key, 0)
+                if delta:
+                    entry = per_flag.setdefault(key[0], {"enabled": 0, "disabled": 0})
+                    entry["enabled" if key[1] else "disabled"] += delta
+
+            now = datetime.utcnow().isoformat() + "Z"
+            if per_flag:
+                try:
+                    with open(self.evaluations_log, 'a', encoding='utf-8') as f:
+                        for flag_name, entry in per_flag.items():
+                            f.write(json.dumps({
+                                "window_start": self._last_flush,
+                                "timestamp": now,
+                                "flag": flag_name,
+                                **entry
+                            }) + '\n')
+                except Exception as e:
+                    logger.error(f"Failed to log evaluations: {e}")
+                    return 0
+
+            self._flushed = totals
+            self._last_flush = now
+            return len(per_flag)
+
+    def close(self):
+        """Stop the background flusher and flush remaining counts."""
+        self._stop_flusher.set()
+        self.flush_evaluations()
 
 
 class FeatureFlagService:
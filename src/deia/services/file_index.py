@@ -0,0 +1,477 @@
+"""
+In-memory file tree index for project browsing.
+
+Holds (size, mtime, is_dir) for every path under a root, built once with
+os.scandir and kept current from filesystem watcher events. Name search
+(prefix, substring, fuzzy) runs against a newline-joined blob of
+lowercase names, so queries never touch the disk.
+
+The index persists to a JSON cache. On load, directories whose mtime
+changed are rescanned and every cached file is re-stat'ed, so files
+edited in place (which leave their directory's mtime alone) report their
+current size/mtime. refresh() does the same when no watcher is running.
+"""
+
+import os
+import re
+import json
+import bisect
+import fnmatch
+import logging
+import threading
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+
+
+logger = logging.getLogger(__name__)
+
+# Directory/file names never indexed (fnmatch patterns, matched per component)
+DEFAULT_IGNORE = (
+    ".git", ".hg", ".svn",
+    "node_modules", "__pycache__", "*.pyc",
+    ".venv", "venv", ".tox",
+    ".mypy_cache", ".pytest_cache", ".ruff_cache",
+)
+
+CACHE_VERSION = 1
+
+# (size, mtime, is_dir); size is 0 for directories
+Entry = Tuple[int, float, bool]
+
+
+class _IndexEventHandler(FileSystemEventHandler):
+    """Forward watchdog events to a FileIndex."""
+
+    def __init__(self, index: "FileIndex"):
+        self.index = index
+
+    def on_created(self, event):
+        self.index.apply_event("created", event.src_path)
+
+    def on_modified(self, event):
+        self.index.apply_event("modified", event.src_path)
+
+    def on_deleted(self, event):
+        self.index.apply_event("deleted", event.src_path)
+
+    def on_moved(self, event):
+        self.index.apply_event("moved", event.src_path, event.dest_path)
+
+
+class FileIndex:
+    """Path -> (size, mtime, is_dir) index of a directory tree."""
+
+    def __init__(
+        self,
+        root: str,
+        ignore: Optional[Tuple[str, ...]] = None,
+        cache_file: Optional[str] = None
+    ):
+        """
+        Initialize index (nothing is scanned until first use).
+
+        Args:
+            root: Directory to index
+            ignore: Name patterns to skip. Defaults to DEFAULT_IGNORE
+            cache_file: JSON file to persist the index to (None = memory only)
+        """
+        self.root = os.path.abspath(root)
+        self.ignore = tuple(DEFAULT_IGNORE if ignore is None else ignore)
+        self._ignore_re = re.compile(
+            "|".join(fnmatch.translate(p) for p in self.ignore) or "(?!)"
+        )
+        self.cache_file = cache_file
+        self._skip: Set[str] = set()
+        if cache_file:
+            cache_rel = os.path.relpath(os.path.abspath(cache_file), self.root)
+            self._skip = {cache_rel, cache_rel + ".tmp"}
+
+        self.entries: Dict[str, Entry] = {}
+        self.children: Dict[str, Set[str]] = {}
+        self.unreadable: Set[str] = set()
+
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._version = 0
+        self._saved_version = -1
+        self._names: Optional[Tuple[int, str, List[int], List[str]]] = None
+        self._observer = None
+
+    # ----- building -----
+
+    def ensure(self) -> None:
+        """Load (cache + revalidate) or build the index on first use."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if not self._load_cache():
+                self._scan("")
+            self._loaded = True
+            self.save()
+
+    def rebuild(self) -> None:
+        """Rescan the whole tree from scratch."""
+        with self._lock:
+            self.entries.clear()
+            self.children.clear()
+            self.unreadable.clear()
+            self._scan("")
+            self._loaded = True
+            self.save()
+
+    def refresh(self) -> int:
+        """
+        Rescan directories whose mtime changed (adds, deletes, renames).
+
+        Without a running watcher, files are also re-stat'ed to pick up
+        in-place edits.
+
+        Returns:
+            Number of directories rescanned
+        """
+        self.ensure()
+        with self._lock:
+            rescanned = self._revalidate()
+            if self._observer is None:
+                self._restat_files()
+            return rescanned
+
+    def is_ignored(self, name: str) -> bool:
+        return self._ignore_re.match(name) is not None
+
+    def _abs(self, rel: str) -> str:
+        return os.path.join(self.root, rel) if rel else self.root
+
+    def _scan(self, top: str) -> None:
+        """Index directory `top` (relative) and everything below it."""
+        if top == "":
+            try:
+                self.entries[""] = (0, os.stat(self.root).st_mtime, True)
+            except OSError:
+                return
+        stack = [top]
+        while stack:
+            stack.extend(self._scan_dir(stack.pop()))
+        self._version += 1
+
+    def _scan_dir(self, rel: str) -> List[str]:
+        """(Re)list one directory; returns subdirectories that need scanning."""
+        old = self.children.get(rel, set())
+        names: Set[str] = set()
+        subdirs: List[str] = []
+        try:
+            with os.scandir(self._abs(rel)) as it:
+                for item in it:
+                    if self._ignore_re.match(item.name):
+                        continue
+                    child = os.path.join(rel, item.name) if rel else item.name
+                    if child in self._skip:
+                        continue
+                    try:
+                        is_dir = item.is_dir(follow_symlinks=False)
+                        previous = self.entries.get(child)
+                        if is_dir and previous is not None and previous[2] and child in self.children:
+                            names.add(item.name)
+                            continue  # Keeps its last-scanned mtime for _revalidate
+                        st = item.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    names.add(item.name)
+                    self.entries[child] = (0 if is_dir else st.st_size, st.st_mtime, is_dir)
+                    if is_dir:
+                        subdirs.append(child)
+                    elif previous is not None and previous[2]:
+                        self._remove_children(child)
+            self.unreadable.discard(rel)
+        except PermissionError:
+            self.unreadable.add(rel)
+        except OSError:
+            pass
+        for gone in old - names:
+            self._remove(os.path.join(rel, gone) if rel else gone)
+        self.children[rel] = names
+        return subdirs
+
+    def _revalidate(self) -> int:
+        rescanned = 0
+        for rel in sorted(d for d, entry in self.entries.items() if entry[2]):
+            if rel not in self.entries:
+                continue  # Removed with a parent earlier in this pass
+            try:
+                mtime = os.stat(self._abs(rel)).st_mtime
+            except OSError:
+                self._remove(rel)
+                continue
+            if mtime != self.entries[rel][1]:
+                self.entries[rel] = (0, mtime, True)
+                for subdir in self._scan_dir(rel):
+                    self._scan(subdir)
+                rescanned += 1
+        if rescanned:
+            self._version += 1
+        return rescanned
+
+    def _restat_files(self) -> int:
+        """Update size/mtime of indexed files; returns how many changed."""
+        changed = 0
+        for rel in [rel for rel, entry in self.entries.items() if not entry[2]]:
+            try:
+                st = os.lstat(self._abs(rel))
+            except OSError:
+                self._remove(rel)
+                continue
+            entry = (st.st_size, st.st_mtime, False)
+            if entry != self.entries[rel]:
+                self.entries[rel] = entry
+                changed += 1
+        if changed:
+            self._version += 1
+        return changed
+
+    def _remove(self, rel: str) -> None:
+        if self.entries.pop(rel, None) is None:
+            return
+        self._remove_children(rel)
+        parent, name = os.path.split(rel)
+        self.children.get(parent, set()).discard(name)
+        self._version += 1
+
+    def _remove_children(self, rel: str) -> None:
+        for name in self.children.pop(rel, ()):
+            child = os.path.join(rel, name)
+            entry = self.entries.pop(child, None)
+            if entry is not None and entry[2]:
+                self._remove_children(child)
+        self.unreadable.discard(rel)
+
+    # ----- watcher -----
+
+    def apply_event(self, kind: str, src_path: str, dest_path: Optional[str] = None) -> None:
+        """
+        Apply a filesystem event.
+
+        Args:
+            kind: "created", "modified", "deleted" or "moved"
+            src_path: Absolute path the event refers to
+            dest_path: New path for "moved" events
+        """
+        if not self._loaded:
+            return  # Picked up by the initial scan
+        with self._lock:
+            if kind in ("deleted", "moved"):
+                rel = self._relative(src_path)
+                if rel:
+                    self._remove(rel)
+            if kind == "moved":
+                src_path = dest_path
+            if kind != "deleted" and src_path:
+                rel = self._relative(src_path)
+                if rel is not None:
+                    self._upsert(rel)
+
+    def _relative(self, path: str) -> Optional[str]:
+        """Indexable relative path, or None if outside the root or ignored."""
+        rel = os.path.relpath(os.path.abspath(path), self.root)
+        if rel == ".":
+            return ""
+        if rel == os.pardir or rel.startswith(os.pardir + os.sep) or rel in self._skip:
+            return None
+        if any(self._ignore_re.match(part) for part in rel.split(os.sep)):
+            return None
+        return rel
+
+    def _upsert(self, rel: str) -> None:
+        try:
+            st = os.lstat(self._abs(rel))
+        except OSError:
+            self._remove(rel)
+            return
+        parent, name = os.path.split(rel)
+        if rel and parent not in self.children:
+            self._upsert(parent)
+            return  # Scanning the new parent indexed this path too
+        is_dir = os.path.isdir(self._abs(rel)) and not os.path.islink(self._abs(rel))
+        previous = self.entries.get(rel)
+        self.entries[rel] = (0 if is_dir else st.st_size, st.st_mtime, is_dir)
+        if rel:
+            self.children[parent].add(name)
+        if is_dir and (previous is None or not previous[2]):
+            self._scan(rel)
+        elif not is_dir and previous is not None and previous[2]:
+            self._remove_children(rel)
+        self._version += 1
+
+    def watch(self) -> None:
+        """Keep the index current from watchdog events until stop()."""
+        self.ensure()
+        if self._observer is not None:
+            return
+        observer = Observer()
+        observer.schedule(_IndexEventHandler(self), self.root, recursive=True)
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+        # Catch anything changed between the scan and the watch starting
+        self.refresh()
+
+    def stop(self) -> None:
+        """Stop watching and persist the index."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._loaded:
+            self.save()
+
+    # ----- persistence -----
+
+    def _load_cache(self) -> bool:
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return False
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION or data.get("root") != self.root \
+                    or data.get("ignore") != list(self.ignore):
+                return False
+            self.entries = {rel: tuple(entry) for rel, entry in data["entries"].items()}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable file index cache: {e}")
+            self.entries = {}
+            return False
+
+        self.children = {rel: set() for rel, entry in self.entries.items() if entry[2]}
+        for rel in self.entries:
+            if rel:
+                parent, name = os.path.split(rel)
+                self.children.setdefault(parent, set()).add(name)
+        self._version += 1
+        self._saved_version = self._version
+        self._revalidate()
+        self._restat_files()
+        return True
+
+    def save(self) -> None:
+        """Persist the index if it changed (atomic replace)."""
+        if not self.cache_file:
+            return
+        with self._lock:
+            if self._saved_version == self._version:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+                temp_file = f"{self.cache_file}.tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump({
+                        "version": CACHE_VERSION,
+                        "root": self.root,
+                        "ignore": list(self.ignore),
+                        "entries": self.entries
+                    }, f)
+                os.replace(temp_file, self.cache_file)
+                self._saved_version = self._version
+            except Exception as e:
+                logger.error(f"Error saving file index: {e}")
+
+    # ----- queries -----
+
+    def get(self, rel: str) -> Optional[Entry]:
+        self.ensure()
+        return self.entries.get(rel)
+
+    def list_dir(self, rel: str) -> List[str]:
+        """Sorted child names of an indexed directory."""
+        self.ensure()
+        with self._lock:
+            return sorted(self.children.get(rel, ()))
+
+    def walk(self, top: str = "") -> Iterator[Tuple[str, Entry]]:
+        """Yield (rel_path, entry) for everything below `top`."""
+        self.ensure()
+        with self._lock:
+            if not top:
+                items = list(self.entries.items())
+            else:
+                prefix = top + os.sep
+                items = [(rel, e) for rel, e in self.entries.items() if rel.startswith(prefix)]
+        for rel, entry in items:
+            if rel:
+                yield rel, entry
+
+    def _name_table(self) -> Tuple[str, List[int], List[str]]:
+        """(blob, line starts, paths) for name search; rebuilt after changes."""
+        table = self._names
+        if table is not None and table[0] == self._version:
+            return table[1:]
+        with self._lock:
+            paths = [rel for rel in self.entries if rel]
+            names = [os.path.basename(rel).lower() for rel in paths]
+            starts = []
+            offset = 0
+            for name in names:
+                starts.append(offset)
+                offset += len(name) + 1
+            table = (self._version, "\n".join(names), starts, paths)
+            self._names = table
+        return table[1:]
+
+    def search(self, query: str, mode: str = "substring", limit: Optional[int] = None) -> List[str]:
+        """
+        Find paths by name (case-insensitive).
+
+        Args:
+            query: Text to match against file/directory names
+            mode: "prefix", "substring", or "fuzzy" (characters in order)
+            limit: Maximum results
+
+        Returns:
+            Relative paths; sorted by path, or best match first for fuzzy
+        """
+        self.ensure()
+        query = query.lower()
+        if "\n" in query:
+            return []
+        blob, starts, paths = self._name_table()
+        if not query:
+            hits = list(range(len(paths)))
+        elif mode == "fuzzy":
+            return self._fuzzy(query, blob, starts, paths, limit)
+        else:
+            hits = []
+            needle = "\n" + query if mode == "prefix" else query
+            blob_search = "\n" + blob if mode == "prefix" else blob
+            pos = blob_search.find(needle)
+            while pos != -1:
+                line = bisect.bisect_right(starts, pos) - 1
+                if not hits or hits[-1] != line:
+                    hits.append(line)
+                nxt = starts[line + 1] if line + 1 < len(starts) else len(blob_search)
+                pos = blob_search.find(needle, max(pos + 1, nxt))
+        results = sorted(paths[i] for i in hits)
+        return results[:limit] if limit else results
+
+    @staticmethod
+    def _fuzzy(query, blob, starts, paths, limit) -> List[str]:
+        pattern = re.compile("[^\n]*?".join(re.escape(c) for c in query))
+        scored = []
+        pos = 0
+        while True:
+            match = pattern.search(blob, pos)
+            if match is None:
+                break
+            line = bisect.bisect_right(starts, match.start()) - 1
+            end = starts[line + 1] - 1 if line + 1 < len(starts) else len(blob)
+            # Tighter spans and shorter names rank first
+            scored.append((match.end() - match.start(), end - starts[line], paths[line]))
+            pos = end + 1
+        scored.sort()
+        results = [path for _, _, path in scored]
+        return results[:limit] if limit else results
+
+    def __len__(self) -> int:
+        self.ensure()
+        return max(len(self.entries) - 1, 0)
@@ -21,9 +21,13 @@ import os
 import yaml
 import json
 import re
+import hashlib
+import struct
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Iterable, Set
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
@@ -98,6 +102,168 @@ class IndexEntry:
         return {k: v for k, v in data.items() if v is not None}
 
 
+# MinHash/LSH parameters for near-duplicate title detection. 16 bands of
+# 2 rows make pairs with title similarity > 0.8 collide with probability
+# > 0.9999999, so candidates are exhaustive in practice.
+MINHASH_PERMUTATIONS = 32
+MINHASH_BANDS = MINHASH_PERMUTATIONS // 2
+_SEARCH_SEPARATOR = "\x00"
+
+
+def _title_words(title: str) -> Set[str]:
+    return set(re.findall(r'\w+', title.lower()))
+
+
+@lru_cache(maxsize=65536)
+def _word_hashes(word: str) -> Tuple[int, ...]:
+    """32 independent 32-bit hashes of a word (two keyed blake2b digests)"""
+    data = word.encode('utf-8')
+    return (struct.unpack('<16I', hashlib.blake2b(data, person=b'deia-minhash-0').digest())
+            + struct.unpack('<16I', hashlib.blake2b(data, person=b'deia-minhash-1').digest()))
+
+
+def _minhash(words: Iterable[str]) -> Tuple[int, ...]:
+    """MinHash signature of a word set (stable across processes)"""
+    return tuple(map(min, zip(*(_word_hashes(word) for word in words))))
+
+
+class PatternIndex(list):
+    """
+    List of IndexEntry objects with lookup structures kept alongside it.
+
+    Maintains:
+    - category and tag inverted indexes (entry positions)
+    - exact lowercased-title index
+    - pre-lowered searchable text (title, summary, tags) per entry, joined
+      into one string so substring search runs as str.find
+    - MinHash LSH buckets over title words for near-duplicate candidates
+
+    Structures are built lazily on first lookup. append/extend update them
+    incrementally; any other list mutation marks them for rebuild. Fields
+    are read when an entry is added, so replace an entry (rather than edit
+    its title/summary/tags in place) to have it re-indexed.
+    """
+
+    def __init__(self, entries: Iterable[IndexEntry] = ()):
+        super().__init__(entries)
+        self._built = False
+
+    def append(self, entry: IndexEntry) -> None:
+        super().append(entry)
+        if self._built:
+            self._add(len(self) - 1, entry)
+
+    def extend(self, entries: Iterable[IndexEntry]) -> None:
+        start = len(self)
+        super().extend(entries)
+        if self._built:
+            for pos in range(start, len(self)):
+                self._add(pos, self[pos])
+
+    def __iadd__(self, entries: Iterable[IndexEntry]) -> "PatternIndex":
+        self.extend(entries)
+        return self
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        self.by_category: Dict[str, Set[int]] = {}
+        self.by_tag: Dict[str, Set[int]] = {}
+        self.by_title: Dict[str, List[int]] = {}
+        self.search_text: List[str] = []
+        self._offsets: List[int] = []
+        self._text_length = 0
+        self._blob: Optional[str] = None
+        self.lsh_buckets: List[Dict[int, List[int]]] = [{} for _ in range(MINHASH_BANDS)]
+        self._built = True
+        for pos, entry in enumerate(self):
+            self._add(pos, entry)
+
+    def _add(self, pos: int, entry: IndexEntry) -> None:
+        self.by_category.setdefault(entry.category, set()).add(pos)
+        for tag in entry.tags:
+            self.by_tag.setdefault(tag, set()).add(pos)
+        self.by_title.setdefault(entry.title.lower(), []).append(pos)
+        text = f"{entry.title} {entry.summary} {' '.join(entry.tags)}".lower()
+        self.search_text.append(text)
+        self._offsets.append(self._text_length)
+        self._text_length += len(text) + 1
+        self._blob = None
+        words = _title_words(entry.title)
+        if words:
+            for buckets, key in zip(self.lsh_buckets, self._band_keys(_minhash(words))):
+                bucket = buckets.get(key)
+                if bucket is None:
+                    buckets[key] = [pos]
+                else:
+                    bucket.append(pos)
+
+    @staticmethod
+    def _band_keys(signature: Tuple[int, ...]) -> List[int]:
+        """One integer key per band (2 rows of 32-bit hashes each)"""
+        return [signature[i] << 32 | signature[i + 1] for i in range(0, MINHASH_PERMUTATIONS, 2)]
+
+    def filter_positions(self, category: Optional[str] = None,
+                         tags: Optional[List[str]] = None) -> Iterable[int]:
+        """Positions matching category and any of tags, in index order"""
+        self._ensure_built()
+        if not category and not tags:
+            return range(len(self))
+        positions = None
+        if category:
+            positions = set(self.by_category.get(category, ()))
+        if tags:
+            tagged = set()
+            for tag in tags:
+                tagged |= self.by_tag.get(tag, set())
+            positions = tagged if positions is None else positions & tagged
+        return sorted(positions)
+
+    def text_matches(self, query_lower: str) -> List[int]:
+        """Positions whose searchable text contains query_lower, in index order"""
+        self._ensure_built()
+        if _SEARCH_SEPARATOR in query_lower:
+            return [pos for pos, text in enumerate(self.search_text) if query_lower in text]
+        if self._blob is None:
+            self._blob = _SEARCH_SEPARATOR.join(self.search_text)
+        matches = []
+        offsets = self._offsets
+        i = self._blob.find(query_lower)
+        while i != -1:
+            pos = bisect_right(offsets, i) - 1
+            matches.append(pos)
+            if pos + 1 >= len(offsets):
+                break
+            i = self._blob.find(query_lower, offsets[pos + 1])
+        return matches
+
+    def duplicate_candidates(self, title: str) -> List[int]:
+        """Positions with the same title or a likely-similar title, in index order"""
+        self._ensure_built()
+        candidates = set(self.by_title.get(title.lower(), ()))
+        words = _title_words(title)
+        if words:
+            for buckets, key in zip(self.lsh_buckets, self._band_keys(_minhash(words))):
+                candidates.update(buckets.get(key, ()))
+        return sorted(candidates)
+
+
+def _invalidating(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._built = False
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ('insert', 'pop', 'remove', 'clear', 'sort', 'reverse',
+              '__setitem__', '__delitem__', '__imul__'):
+    setattr(PatternIndex, _name, _invalidating(_name))
+
+
 @dataclass
 class ReviewResult:
     """Result of submission review"""
@@ -151,7 +317,16 @@ class MasterLibrarian:
         self._ensure_directories()
 
         # Load index
-        self.index: List[IndexEntry] = self._load_index()
+        self.index = self._load_index()
+
+    @property
+    def index(self) -> PatternIndex:
+        """Master index entries (a list, with search/duplicate indexes)"""
+        return self._index
+
+    @index.setter
+    def index(self, entries: Iterable[IndexEntry]) -> None:
+        self._index = entries if isinstance(entries, PatternIndex) else PatternIndex(entries)
 
     def _find_project_root(self) -> Path:
         """Find project root by looking for .deia directory"""
@@ -361,10 +536,16 @@ class MasterLibrarian:
         )
 
     def _find_duplicate(self, title: str, tags: List[str]) -> Optional[IndexEntry]:
-        """Check if similar pattern already exists in BOK"""
+        """
+        Check if similar pattern already exists in BOK.
+
+        Only exact-title matches and MinHash/LSH near-duplicate candidates
+        are compared, instead of every entry in the index.
+        """
         title_lower = title.lower()
 
-        for entry in self.index:
+        for pos in self.index.duplicate_candidates(title):
+            entry = self.index[pos]
             # Exact title match
             if entry.title.lower() == title_lower:
                 return entry
@@ -522,27 +703,25 @@ class MasterLibrarian:
         query_lower = query.lower()
         results = []
 
-        for entry in self.index:
-            # Skip deprecated unless explicitly searched
-            if entry.deprecated and "deprecated" not in query_lower:
-                continue
+        # Category/tag filters come from the inverted indexes, keywords from
+        # one substring scan over the pre-lowered search text
+        if query:
+            positions = self.index.text_matches(query_lower)
+            if category or tags:
+                allowed = set(self.index.filter_positions(category, tags))
+                positions = [pos for pos in positions if pos in allowed]
+        else:
+            # No query, just filters
+            positions = self.index.filter_positions(category, tags)
 
-            # Category filter
-            if category and entry.category != category:
-                continue
+        for pos in positions:
+            entry = self.index[pos]
 
-            # Tag filter
-            if tags and not any(tag in entry.tags for tag in tags):
+            # Skip deprecated unless explicitly searched
+            if entry.deprecated and "deprecated" not in query_lower:
                 continue
 
-            # Keyword search
-            if query:
-                searchable = f"{entry.title} {entry.summary} {' '.join(entry.tags)}".lower()
-                if query_lower in searchable:
-                    results.append(entry)
-            else:
-                # No query, just filters
-                results.append(entry)
+            results.append(entry)
 
         return results
 
@@ -3,22 +3,37 @@ Project Browser API for DEIA Chat Interface Phase 2
 
 Provides tree view, filtering, and search capabilities for .deia project structure.
 Designed for safe web interface integration with JSON serialization.
+
+Queries are served from an in-memory FileIndex (cached in
+.deia/cache/file-index.json); pass watch=True to keep it current from
+filesystem events, call refresh() to pick up changes, or rebuild() to
+rescan the whole tree.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Tuple
+
+from .file_index import FileIndex
 
 
 class ProjectBrowser:
     """Generate tree views and browse DEIA project structure"""
 
-    def __init__(self, project_root: Optional[Path] = None):
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        watch: bool = False,
+        ignore: Optional[Tuple[str, ...]] = None
+    ):
         """
         Initialize Project Browser
 
         Args:
             project_root: Root directory of DEIA project. If None, searches upward for .deia/
+            watch: Keep the file index current from filesystem events
+            ignore: Name patterns to exclude (default: VCS, cache and venv dirs)
         """
         if project_root is None:
             project_root = self._find_project_root()
@@ -29,6 +44,26 @@ class ProjectBrowser:
         if not self.deia_dir.exists():
             raise ValueError(f"Not a DEIA project: .deia/ not found in {self.project_root}")
 
+        self.index = FileIndex(
+            str(self.project_root),
+            ignore=ignore,
+            cache_file=str(self.deia_dir / "cache" / "file-index.json")
+        )
+        if watch:
+            self.index.watch()
+
+    def refresh(self) -> int:
+        """Pick up added/removed/renamed paths and edited files without a full rescan."""
+        return self.index.refresh()
+
+    def rebuild(self):
+        """Rescan the whole project tree, discarding the cached index."""
+        self.index.rebuild()
+
+    def close(self):
+        """Stop watching and persist the file index."""
+        self.index.stop()
+
     @staticmethod
     def _find_project_root() -> Path:
         """Find project root by searching upward for .deia/ directory"""
@@ -74,43 +109,50 @@ class ProjectBrowser:
         if not start_path.is_relative_to(self.project_root):
             raise ValueError(f"Path outside project boundary: {path}")
 
-        return self._build_tree_node(start_path, max_depth, show_hidden, current_depth=0)
+        return self._build_tree_node(self._rel(start_path), max_depth, show_hidden, current_depth=0)
+
+    def _rel(self, path: Path) -> str:
+        """Index key for a path ("" for the project root)."""
+        rel = str(path.resolve().relative_to(self.project_root))
+        return "" if rel == "." else rel
 
     def _build_tree_node(
         self,
-        path: Path,
+        rel: str,
         max_depth: int,
         show_hidden: bool,
         current_depth: int
     ) -> Dict:
         """Recursively build tree node"""
+        entry = self.index.get(rel)
+        is_dir = entry is None or entry[2]
+        name = os.path.basename(rel) if rel else self.project_root.name
         node = {
-            "name": path.name if path != self.project_root else self.project_root.name,
-            "path": str(path.relative_to(self.project_root)),
-            "type": "directory" if path.is_dir() else "file",
+            "name": name,
+            "path": rel or ".",
+            "type": "directory" if is_dir else "file",
         }
 
         # Add file metadata
-        if path.is_file():
-            node["size"] = path.stat().st_size
-            node["extension"] = path.suffix
+        if not is_dir:
+            node["size"] = entry[0]
+            node["extension"] = os.path.splitext(name)[1]
 
         # Recurse into directories
-        if path.is_dir() and current_depth < max_depth:
+        if is_dir and current_depth < max_depth:
             children = []
-            try:
-                for child in sorted(path.iterdir()):
-                    # Skip hidden unless requested
-                    if not show_hidden and child.name.startswith(".") and child.name != ".deia":
-                        continue
-
-                    # Always include .deia at root level
-                    if child == self.deia_dir:
-                        children.append(self._build_tree_node(child, max_depth, show_hidden, current_depth + 1))
-                    elif child.is_relative_to(self.deia_dir) or child.parent == self.project_root:
-                        children.append(self._build_tree_node(child, max_depth, show_hidden, current_depth + 1))
-
-            except PermissionError:
+            in_deia = rel == ".deia" or rel.startswith(".deia" + os.sep)
+            for child_name in self.index.list_dir(rel):
+                # Skip hidden unless requested
+                if not show_hidden and child_name.startswith(".") and child_name != ".deia":
+                    continue
+
+                # Show the top level and everything under .deia
+                if in_deia or not rel:
+                    child = os.path.join(rel, child_name) if rel else child_name
+                    children.append(self._build_tree_node(child, max_depth, show_hidden, current_depth + 1))
+
+            if rel in self.index.unreadable:
                 node["error"] = "permission_denied"
 
             if children:
@@ -138,58 +180,75 @@ class ProjectBrowser:
         if not search_path.exists():
             raise ValueError(f"Path does not exist: {path}")
 
-        results = []
-        extensions_set = set(ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in extensions)
-
-        for file_path in search_path.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in extensions_set:
-                results.append(self._file_metadata(file_path))
-
+        extensions_set = self._normalize_extensions(extensions)
+        results = [
+            self._entry_metadata(rel, entry)
+            for rel, entry in self.index.walk(self._rel(search_path))
+            if not entry[2] and os.path.splitext(rel)[1].lower() in extensions_set
+        ]
         return sorted(results, key=lambda x: x["path"])
 
-    def search(self, query: str, file_types: Optional[List[str]] = None) -> List[Dict]:
+    @staticmethod
+    def _normalize_extensions(extensions: List[str]) -> set:
+        return set(ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in extensions)
+
+    def search(
+        self,
+        query: str,
+        file_types: Optional[List[str]] = None,
+        mode: str = "substring",
+        limit: Optional[int] = None
+    ) -> List[Dict]:
         """
         Search for files/directories by name
 
         Args:
-            query: Search string (case-insensitive, partial match)
-            file_types: Optional list of extensions to limit search
+            query: Search string (case-insensitive)
+            file_types: Optional list of extensions to limit search (files only)
+            mode: "substring" (default), "prefix", or "fuzzy" (characters in order,
+                best match first)
+            limit: Maximum number of results
 
         Returns:
             List of matching items with metadata
         """
+        extensions_set = self._normalize_extensions(file_types) if file_types else None
         results = []
-        query_lower = query.lower()
-
-        for item_path in self.project_root.rglob("*"):
-            # Check if name matches query
-            if query_lower in item_path.name.lower():
-                # If file_types specified, only include matching files
-                if file_types:
-                    if item_path.is_file() and item_path.suffix.lower() in file_types:
-                        results.append(self._file_metadata(item_path))
-                else:
-                    # Include both files and directories
-                    if item_path.is_file():
-                        results.append(self._file_metadata(item_path))
-                    elif item_path.is_dir():
-                        results.append({
-                            "name": item_path.name,
-                            "path": str(item_path.relative_to(self.project_root)),
-                            "type": "directory"
-                        })
-
-        return sorted(results, key=lambda x: x["path"])
+        for rel in self.index.search(query, mode=mode):
+            entry = self.index.get(rel)
+            if entry is None:
+                continue
+            if extensions_set is not None and (entry[2] or os.path.splitext(rel)[1].lower() not in extensions_set):
+                continue
+            results.append(self._entry_metadata(rel, entry))
+            if limit and len(results) >= limit:
+                break
+        return results
 
     def _file_metadata(self, path: Path) -> Dict:
         """Extract file metadata"""
+        stat = path.stat()
         return {
             "name": path.name,
             "path": str(path.relative_to(self.project_root)),
             "type": "file",
-            "size": path.stat().st_size,
+            "size": stat.st_size,
             "extension": path.suffix,
-            "modified": path.stat().st_mtime
+            "modified": stat.st_mtime
+        }
+
+    def _entry_metadata(self, rel: str, entry: Tuple[int, float, bool]) -> Dict:
+        """Metadata for an indexed path (no filesystem access)"""
+        name = os.path.basename(rel)
+        if entry[2]:
+            return {"name": name, "path": rel, "type": "directory"}
+        return {
+            "name": name,
+            "path": rel,
+            "type": "file",
+            "size": entry[0],
+            "extension": os.path.splitext(name)[1],
+            "modified": entry[1]
         }
 
     def get_deia_structure(self) -> Dict:
@@ -224,7 +283,9 @@ class ProjectBrowser:
             }
 
             if dir_path.exists():
-                structure["directories"][dir_name]["file_count"] = len(list(dir_path.rglob("*")))
+                structure["directories"][dir_name]["file_count"] = sum(
+                    1 for _ in self.index.walk(self._rel(dir_path))
+                )
 
         return structure
 
@@ -255,28 +316,24 @@ class ProjectBrowser:
             "by_directory": {}
         }
 
-        for item in self.project_root.rglob("*"):
-            if item.is_file():
-                stats["total_files"] += 1
-                size = item.stat().st_size
-                stats["total_size"] += size
-
-                # By extension
-                ext = item.suffix or "(no extension)"
-                if ext not in stats["by_extension"]:
-                    stats["by_extension"][ext] = {"count": 0, "size": 0}
-                stats["by_extension"][ext]["count"] += 1
-                stats["by_extension"][ext]["size"] += size
-
-                # By top-level directory
-                try:
-                    rel_path = item.relative_to(self.project_root)
-                    top_dir = str(rel_path.parts[0]) if rel_path.parts else "root"
-                    if top_dir not in stats["by_directory"]:
-                        stats["by_directory"][top_dir] = {"count": 0, "size": 0}
-                    stats["by_directory"][top_dir]["count"] += 1
-                    stats["by_directory"][top_dir]["size"] += size
-                except ValueError:
-                    pass
+        for rel, (size, _, is_dir) in self.index.walk():
+            if is_dir:
+                continue
+            stats["total_files"] += 1
+            stats["total_size"] += size
+
+            # By extension
+            ext = os.path.splitext(rel)[1] or "(no extension)"
+            if ext not in stats["by_extension"]:
+                stats["by_extension"][ext] = {"count": 0, "size": 0}
+            stats["by_extension"][ext]["count"] += 1
+            stats["by_extension"][ext]["size"] += size
+
+            # By top-level directory
+            top_dir = rel.split(os.sep, 1)[0]
+            if top_dir not in stats["by_directory"]:
+                stats["by_directory"][top_dir] = {"count": 0, "size": 0}
+            stats["by_directory"][top_dir]["count"] += 1
+            stats["by_directory"][top_dir]["size"] += size
 
         return stats
@@ -2,19 +2,68 @@
 Service Registry - Bot discovery and management with persistence and recovery.
 
 Maintains registry of all running bots with their service endpoints.
-Persists to disk every 10s for recovery after crashes.
 Cleans stale entries and prevents duplicate bot launches.
 Provides audit trail of all registry changes.
+
+Storage layout (next to registry.json):
+- registry.json: static bot records, rewritten only on register/unregister/cleanup
+- registry-heartbeats/<bot>.json: one small file per bot, rewritten on heartbeat
+- registry.json.lock: inter-process lock held while mutating registry.json
+
+Every write goes to a temp file and is renamed into place, so readers never
+see a half-written file. Reads are served from an in-process cache that is
+invalidated when a file's inode/mtime/size changes.
 """
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 import json
 import hashlib
 import os
+import re
+import tempfile
+import time
 import psutil
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _stat_key(stat: os.stat_result) -> Tuple[int, int, int]:
+    """Cache key for a file; rename-based writes always change the inode."""
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _atomic_write_json(path: Path, data: Dict, durable: bool = False) -> None:
+    """Write JSON to a temp file in the same directory and rename it into place."""
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(",", ":"))
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        for attempt in range(5):
+            try:
+                os.replace(tmp_path, path)
+                return
+            except PermissionError:
+                # Windows refuses to replace a file another process has open
+                if attempt == 4:
+                    raise
+                time.sleep(0.01 * (attempt + 1))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class ServiceRegistry:
     """
@@ -59,34 +108,129 @@ class ServiceRegistry:
         self.registry_path = Path(registry_path)
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self.lock_path = self.registry_path.with_name(self.registry_path.name + ".lock")
+        self.heartbeat_dir = self.registry_path.parent / f"{self.registry_path.stem}-heartbeats"
+        self.heartbeat_dir.mkdir(exist_ok=True)
+
         # Audit trail for registry changes
         self.audit_log_path = self.registry_path.parent / "registry-changes.jsonl"
 
+        # In-process read caches, keyed by file stat
+        self._registry_cache: Optional[Tuple[Tuple[int, int, int], Dict]] = None
+        self._heartbeat_cache: Dict[str, Tuple[Tuple[int, int, int], Dict]] = {}
+
         # Initialize if doesn't exist
         if not self.registry_path.exists():
-            self._save({"bots": {}, "updated_at": datetime.now().isoformat()})
+            with self._locked():
+                if not self.registry_path.exists():
+                    self._save({"bots": {}})
 
         # Clean up stale entries on startup
         self.cleanup_stale_entries()
 
-    def _load(self) -> Dict:
-        """Load registry from disk."""
+    @contextmanager
+    def _locked(self):
+        """Hold the inter-process registry lock for a read-modify-write."""
+        with open(self.lock_path, 'a+b') as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            else:
+                handle.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue  # LK_LOCK gives up after ~10s; keep waiting
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                else:
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _load(self, fresh: bool = False) -> Dict:
+        """
+        Load static registry records (cached until the file changes).
+
+        Args:
+            fresh: Bypass the cache; used under the lock before read-modify-write
+        """
         try:
+            key = _stat_key(os.stat(self.registry_path))
+            if not fresh and self._registry_cache is not None and self._registry_cache[0] == key:
+                return self._registry_cache[1]
             with open(self.registry_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                data = json.load(f)
+            self._registry_cache = (key, data)
+            return data
         except Exception as e:
             print(f"[REGISTRY] Error loading: {e}")
             return {"bots": {}, "updated_at": datetime.now().isoformat()}
 
     def _save(self, data: Dict):
-        """Save registry to disk."""
+        """Atomically replace registry.json. Callers hold the registry lock."""
         try:
             data["updated_at"] = datetime.now().isoformat()
-            with open(self.registry_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            _atomic_write_json(self.registry_path, data, durable=True)
+            self._registry_cache = None
         except Exception as e:
             print(f"[REGISTRY] Error saving: {e}")
 
+    def _heartbeat_path(self, bot_id: str) -> Path:
+        return self.heartbeat_dir / (re.sub(r"[^A-Za-z0-9._-]", "_", bot_id) + ".json")
+
+    def _load_heartbeats(self) -> Dict[str, Dict]:
+        """Load per-bot heartbeat files, re-reading only those that changed."""
+        heartbeats = {}
+        seen = set()
+        try:
+            entries = list(os.scandir(self.heartbeat_dir))
+        except OSError:
+            entries = []
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            seen.add(entry.name)
+            try:
+                key = _stat_key(entry.stat())
+                cached = self._heartbeat_cache.get(entry.name)
+                if cached is None or cached[0] != key:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        cached = (key, json.load(f))
+                    self._heartbeat_cache[entry.name] = cached
+            except (OSError, ValueError):
+                continue  # Replaced or removed mid-read; next read picks it up
+            data = cached[1]
+            if "bot_id" in data:
+                heartbeats[data["bot_id"]] = data
+        for name in set(self._heartbeat_cache) - seen:
+            del self._heartbeat_cache[name]
+        return heartbeats
+
+    def _remove_heartbeat(self, bot_id: str) -> None:
+        try:
+            self._heartbeat_path(bot_id).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[REGISTRY] Failed to remove heartbeat for {bot_id}: {e}")
+
+    def _bots(self) -> Dict[str, Dict]:
+        """Static records overlaid with the latest heartbeat status/time."""
+        bots = self._load().get("bots", {})
+        heartbeats = self._load_heartbeats()
+        merged = {}
+        for bot_id, info in bots.items():
+            merged[bot_id] = dict(info)
+            beat = heartbeats.get(bot_id)
+            if beat:
+                merged[bot_id]["status"] = beat.get("status", info.get("status"))
+                merged[bot_id]["last_heartbeat"] = beat.get("last_heartbeat", info.get("last_heartbeat"))
+        return merged
+
     def assign_port(self, bot_id: str) -> int:
         """
         Assign port number to bot.
@@ -137,6 +281,8 @@ class ServiceRegistry:
         Register bot in registry.
 
         Prevents duplicate bot launches - returns False if bot already running.
+        The duplicate check and the write happen under the registry lock, so
+        two processes racing to launch the same bot cannot both succeed.
 
         Args:
             bot_id: Full bot ID (e.g., "deiasolutions-CLAUDE-CODE-001")
@@ -148,14 +294,6 @@ class ServiceRegistry:
         Returns:
             True if registered successfully, False if bot already running
         """
-        # Check for duplicate
-        if self.check_duplicate_bot(bot_id):
-            print(f"[REGISTRY] ERROR: Bot {bot_id} is already running!")
-            return False
-
-        registry = self._load()
-        bots = registry.get("bots", {})
-
         # Extract repo from bot_id if not provided
         if repo is None and "-" in bot_id:
             repo = bot_id.split("-")[0]
@@ -164,19 +302,30 @@ class ServiceRegistry:
         if pid is None:
             pid = os.getpid()
 
-        bot_info = {
-            "port": port,
-            "pid": pid,
-            "repo": repo,
-            "status": status,
-            "registered_at": datetime.now().isoformat(),
-            "last_heartbeat": datetime.now().isoformat(),
-            "metadata": metadata or {}
-        }
+        with self._locked():
+            registry = self._load(fresh=True)
 
-        bots[bot_id] = bot_info
-        registry["bots"] = bots
-        self._save(registry)
+            # Check for duplicate
+            if self.check_duplicate_bot(bot_id):
+                print(f"[REGISTRY] ERROR: Bot {bot_id} is already running!")
+                return False
+
+            bots = dict(registry.get("bots", {}))
+
+            now = datetime.now().isoformat()
+            bots[bot_id] = {
+                "port": port,
+                "pid": pid,
+                "repo": repo,
+                "status": status,
+                "registered_at": now,
+                "last_heartbeat": now,
+                "metadata": metadata or {}
+            }
+
+            # A heartbeat left over from a previous run would mask the new status
+            self._remove_heartbeat(bot_id)
+            self._save({**registry, "bots": bots})
 
         # Audit log
         self._audit_log("registered", bot_id, {"port": port, "pid": pid})
@@ -191,36 +340,41 @@ class ServiceRegistry:
         Args:
             bot_id: Bot ID to unregister
         """
-        registry = self._load()
-        bots = registry.get("bots", {})
-
-        if bot_id in bots:
-            bot_info = bots[bot_id]
-            del bots[bot_id]
-            registry["bots"] = bots
-            self._save(registry)
+        with self._locked():
+            registry = self._load(fresh=True)
+            bots = dict(registry.get("bots", {}))
+            if bot_id not in bots:
+                return
+            bot_info = bots.pop(bot_id)
+            self._save({**registry, "bots": bots})
+            self._remove_heartbeat(bot_id)
 
-            # Audit log
-            self._audit_log("unregistered", bot_id, {"port": bot_info.get("port")})
+        # Audit log
+        self._audit_log("unregistered", bot_id, {"port": bot_info.get("port")})
 
-            print(f"[REGISTRY] Unregistered {bot_id}")
+        print(f"[REGISTRY] Unregistered {bot_id}")
 
     def heartbeat(self, bot_id: str, status: str = "active"):
         """
         Update bot heartbeat.
 
+        Writes only this bot's heartbeat file; registry.json is untouched and
+        no lock is needed since each bot is the sole writer of its heartbeat.
+
         Args:
             bot_id: Bot ID
             status: Current status (active, idle, working, etc.)
         """
-        registry = self._load()
-        bots = registry.get("bots", {})
-
-        if bot_id in bots:
-            bots[bot_id]["last_heartbeat"] = datetime.now().isoformat()
-            bots[bot_id]["status"] = status
-            registry["bots"] = bots
-            self._save(registry)
+        if bot_id not in self._load().get("bots", {}):
+            return
+        try:
+            _atomic_write_json(self._heartbeat_path(bot_id), {
+                "bot_id": bot_id,
+                "status": status,
+                "last_heartbeat": datetime.now().isoformat()
+            })
+        except Exception as e:
+            print(f"[REGISTRY] Error writing heartbeat for {bot_id}: {e}")
 
     def get_bot(self, bot_id: str) -> Optional[Dict]:
         """
@@ -229,13 +383,14 @@ class ServiceRegistry:
         Returns:
             Bot metadata dict or None if not found
         """
-        registry = self._load()
-        return registry.get("bots", {}).get(bot_id)
+        info = self._load().get("bots", {}).get(bot_id)
+        if info is None:
+            return None
+        return self._bots().get(bot_id)
 
     def get_all_bots(self) -> Dict[str, Dict]:
         """Get all registered bots."""
-        registry = self._load()
-        return registry.get("bots", {})
+        return self._bots()
 
     def get_bots_by_repo(self, repo: str) -> Dict[str, Dict]:
         """Get all bots for a specific repository."""
@@ -253,29 +408,14 @@ class ServiceRegistry:
         Returns:
             URL like "http://localhost:8001" or None if not found
         """
-        bot = self.get_bot(bot_id)
+        bot = self._load().get("bots", {}).get(bot_id)
         if bot and "port" in bot:
             return f"http://localhost:{bot['port']}"
         return None
 
-    def cleanup_stale_entries(self, timeout_seconds: int = 300) -> List[str]:
-        """
-        Clean up stale bot entries (processes that have exited).
-
-        A bot is considered stale if its PID doesn't exist or last heartbeat > timeout.
-
-        Args:
-            timeout_seconds: Consider entry stale if no heartbeat in this many seconds
-
-        Returns:
-            List of removed bot IDs
-        """
-        registry = self._load()
-        bots = registry.get("bots", {})
-        removed = []
-        cutoff_time = datetime.now() - timedelta(seconds=timeout_seconds)
-
-        for bot_id, info in list(bots.items()):
+    def _find_stale(self, bots: Dict[str, Dict], cutoff_time: datetime) -> List[str]:
+        stale = []
+        for bot_id, info in bots.items():
             # Check if PID is alive
             pid = info.get("pid")
             is_alive = False
@@ -302,14 +442,45 @@ class ServiceRegistry:
                 is_stale = True
 
             if not is_alive or is_stale:
-                removed.append(bot_id)
-                del bots[bot_id]
-                self._audit_log("stale_entry_removed", bot_id, info)
-                print(f"[REGISTRY] Removed stale entry: {bot_id} (PID {pid})")
+                stale.append(bot_id)
+        return stale
+
+    def cleanup_stale_entries(self, timeout_seconds: int = 300) -> List[str]:
+        """
+        Clean up stale bot entries (processes that have exited).
 
-        if removed:
-            registry["bots"] = bots
-            self._save(registry)
+        A bot is considered stale if its PID doesn't exist or last heartbeat > timeout.
+        The check runs against the cached view first and only takes the lock
+        (and rewrites registry.json) when something actually needs removing.
+
+        Args:
+            timeout_seconds: Consider entry stale if no heartbeat in this many seconds
+
+        Returns:
+            List of removed bot IDs
+        """
+        cutoff_time = datetime.now() - timedelta(seconds=timeout_seconds)
+        if not self._find_stale(self._bots(), cutoff_time):
+            return []
+
+        with self._locked():
+            # Re-check under the lock: another process may have cleaned up or re-registered
+            self._load(fresh=True)
+            merged = self._bots()
+            removed = self._find_stale(merged, cutoff_time)
+            if removed:
+                registry = self._load()
+                bots = dict(registry.get("bots", {}))
+                for bot_id in removed:
+                    del bots[bot_id]
+                self._save({**registry, "bots": bots})
+                for bot_id in removed:
+                    self._remove_heartbeat(bot_id)
+
+        for bot_id in removed:
+            info = merged[bot_id]
+            self._audit_log("stale_entry_removed", bot_id, info)
+            print(f"[REGISTRY] Removed stale entry: {bot_id} (PID {info.get('pid')})")
 
         return removed
 
@@ -323,7 +494,7 @@ class ServiceRegistry:
         Returns:
             True if bot is already running
         """
-        bot = self.get_bot(bot_id)
+        bot = self._load().get("bots", {}).get(bot_id)
         if not bot:
             return False
 
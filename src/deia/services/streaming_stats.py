@@ -0,0 +1,348 @@
+"""
+Streaming Statistics - Constant-cost summaries for metric streams.
+
+Provides:
+- RunningStats: count/mean/variance (Welford), min/max, EWMA; mergeable (Chan et al.)
+- QuantileSketch: DDSketch-style log-bucket histogram with bounded relative error;
+  mergeable and serializable, used for p50/p95/p99 without keeping raw values
+- WindowedStats: time-bucketed window of the above that expires old buckets
+
+All three serialize to plain dicts so baselines can be persisted and merged
+across bots.
+"""
+
+from typing import Dict, Optional, Any
+from collections import deque
+import math
+
+
+class RunningStats:
+    """Welford running mean/variance with min/max and an EWMA."""
+
+    def __init__(self, ewma_alpha: float = 0.1):
+        self.ewma_alpha = ewma_alpha
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.ewma: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """Add a single observation in O(1)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if self.ewma is None:
+            self.ewma = value
+        else:
+            self.ewma += self.ewma_alpha * (value - self.ewma)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Merge another summary into this one (parallel variance formula)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max, self.ewma = other.min, other.max, other.ewma
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if other.ewma is not None:
+            self.ewma = other.ewma if self.ewma is None else (self.ewma + other.ewma) / 2
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ewma_alpha": self.ewma_alpha,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "ewma": self.ewma,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunningStats":
+        stats = cls(ewma_alpha=data.get("ewma_alpha", 0.1))
+        stats.count = data.get("count", 0)
+        stats.mean = data.get("mean", 0.0)
+        stats.m2 = data.get("m2", 0.0)
+        if stats.count:
+            stats.min = data["min"]
+            stats.max = data["max"]
+        stats.ewma = data.get("ewma")
+        return stats
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees (DDSketch).
+
+    Values map to logarithmic buckets so any quantile is returned within
+    `relative_accuracy` of the true value. Insert is O(1); quantile queries
+    walk the (small, bounded) bucket map. When more than `max_buckets` are in
+    use the lowest buckets are collapsed, trading accuracy at the low end
+    for bounded memory - the tail quantiles we alert on stay accurate.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _key(self, value: float) -> int:
+        return int(math.ceil(math.log(value) / self._log_gamma))
+
+    def _value(self, key: int) -> float:
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add an observation in O(1)."""
+        if value > 0:
+            key = self._key(value)
+            self.positive[key] = self.positive.get(key, 0) + count
+            if len(self.positive) > self.max_buckets:
+                self._collapse(self.positive)
+        elif value < 0:
+            key = self._key(-value)
+            self.negative[key] = self.negative.get(key, 0) + count
+            if len(self.negative) > self.max_buckets:
+                self._collapse(self.negative)
+        else:
+            self.zero_count += count
+        self.count += count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def _collapse(self, store: Dict[int, int]) -> None:
+        keys = sorted(store)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        for key in keys[:excess]:
+            store[target] += store.pop(key)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch with the same accuracy into this one."""
+        if other.count == 0:
+            return
+        if not math.isclose(other.gamma, self.gamma):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, c in other.positive.items():
+            self.positive[key] = self.positive.get(key, 0) + c
+        for key, c in other.negative.items():
+            self.negative[key] = self.negative.get(key, 0) + c
+        for store in (self.positive, self.negative):
+            while len(store) > self.max_buckets:
+                self._collapse(store)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-th quantile (0 <= q <= 1); None if empty."""
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = 0
+        # Negative values: largest magnitude first
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return self._clamp(-self._value(key))
+        seen += self.zero_count
+        if seen > rank:
+            return self._clamp(0.0)
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._clamp(self._value(key))
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_buckets": self.max_buckets,
+            "positive": {str(k): v for k, v in self.positive.items()},
+            "negative": {str(k): v for k, v in self.negative.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(
+            relative_accuracy=data.get("relative_accuracy", 0.01),
+            max_buckets=data.get("max_buckets", 2048),
+        )
+        sketch.positive = {int(k): v for k, v in data.get("positive", {}).items()}
+        sketch.negative = {int(k): v for k, v in data.get("negative", {}).items()}
+        sketch.zero_count = data.get("zero_count", 0)
+        sketch.count = data.get("count", 0)
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+
+class WindowedStats:
+    """
+    Time-windowed RunningStats + QuantileSketch built from fixed buckets.
+
+    The window is split into `num_buckets` slots. Each observation is added
+    to its slot and to the window totals in O(1). When slots fall out of the
+    window the totals are rebuilt by merging the surviving slots, which
+    happens at most once per slot width rather than per observation.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        num_buckets: int = 24,
+        ewma_alpha: float = 0.1,
+        relative_accuracy: float = 0.01
+    ):
+        self.window_seconds = window_seconds
+        self.num_buckets = num_buckets
+        self.bucket_seconds = window_seconds / num_buckets
+        self.ewma_alpha = ewma_alpha
+        self.relative_accuracy = relative_accuracy
+        self.buckets: deque = deque()  # (bucket_index, RunningStats, QuantileSketch)
+        self.stats = RunningStats(ewma_alpha)
+        self.sketch = QuantileSketch(relative_accuracy)
+        self.version = 0
+
+    def _new_bucket(self, index: int):
+        return (index, RunningStats(self.ewma_alpha), QuantileSketch(self.relative_accuracy))
+
+    def add(self, value: float, timestamp: float) -> None:
+        """Add an observation taken at `timestamp` (epoch seconds)."""
+        index = int(timestamp // self.bucket_seconds)
+        if not self.buckets or index > self.buckets[-1][0]:
+            self.buckets.append(self._new_bucket(index))
+            self.expire(timestamp)
+            bucket = self.buckets[-1]
+        elif index == self.buckets[-1][0]:
+            bucket = self.buckets[-1]
+        else:
+            # Late arrival: find its slot, dropping it if already outside the window
+            bucket = next((b for b in self.buckets if b[0] == index), None)
+            if bucket is None:
+                if index <= self.buckets[-1][0] - self.num_buckets:
+                    return
+                self.buckets.append(self._new_bucket(index))
+                self.buckets = deque(sorted(self.buckets, key=lambda b: b[0]))
+                bucket = next(b for b in self.buckets if b[0] == index)
+        bucket[1].add(value)
+        bucket[2].add(value)
+        self.stats.add(value)
+        self.sketch.add(value)
+        self.version += 1
+
+    def expire(self, now: float) -> bool:
+        """Drop buckets older than the window; returns True if any expired."""
+        oldest_live = int(now // self.bucket_seconds) - self.num_buckets + 1
+        expired = False
+        while self.buckets and self.buckets[0][0] < oldest_live:
+            self.buckets.popleft()
+            expired = True
+        if expired:
+            self._rebuild()
+        return expired
+
+    def _rebuild(self) -> None:
+        ewma = self.stats.ewma
+        self.stats = RunningStats(self.ewma_alpha)
+        self.sketch = QuantileSketch(self.relative_accuracy)
+        for _, stats, sketch in self.buckets:
+            self.stats.merge(stats)
+            self.sketch.merge(sketch)
+        # EWMA already decays on its own; keep it across bucket expiry
+        self.stats.ewma = ewma if self.stats.count else None
+        self.version += 1
+
+    def merge(self, other: "WindowedStats") -> None:
+        """Merge another window (e.g. from another bot) bucket by bucket."""
+        mine = {b[0]: b for b in self.buckets}
+        for index, stats, sketch in other.buckets:
+            if index not in mine:
+                mine[index] = self._new_bucket(index)
+            mine[index][1].merge(stats)
+            mine[index][2].merge(sketch)
+        self.buckets = deque(mine[i] for i in sorted(mine))
+        if self.buckets:
+            newest = self.buckets[-1][0]
+            while self.buckets[0][0] <= newest - self.num_buckets:
+                self.buckets.popleft()
+        ewma = self.stats.ewma
+        self._rebuild()
+        if other.stats.ewma is not None:
+            self.stats.ewma = other.stats.ewma if ewma is None else (ewma + other.stats.ewma) / 2
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "window_seconds": self.window_seconds,
+            "num_buckets": self.num_buckets,
+            "ewma_alpha": self.ewma_alpha,
+            "relative_accuracy": self.relative_accuracy,
+            "ewma": self.stats.ewma,
+            "buckets": [
+                {"index": index, "stats": stats.to_dict(), "sketch": sketch.to_dict()}
+                for index, stats, sketch in self.buckets
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WindowedStats":
+        window = cls(
+            window_seconds=data["window_seconds"],
+            num_buckets=data.get("num_buckets", 24),
+            ewma_alpha=data.get("ewma_alpha", 0.1),
+            relative_accuracy=data.get("relative_accuracy", 0.01),
+        )
+        window.buckets = deque(
+            (b["index"], RunningStats.from_dict(b["stats"]), QuantileSketch.from_dict(b["sketch"]))
+            for b in sorted(data.get("buckets", []), key=lambda b: b["index"])
+        )
+        window._rebuild()
+        window.stats.ewma = data.get("ewma") if window.stats.count else None
+        return window
+
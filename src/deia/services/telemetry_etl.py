@@ -7,6 +7,11 @@ Goals:
 - Normalize to NDJSON staging (append-only, partitioned by date)
 - Optionally initialize DuckDB catalog with views over Parquet (if available)
 
+Session and hive markdown parsing can fan out over a process pool: files are
+split into chunked batches and results are reassembled in sorted file order,
+so output is identical to a serial run. Worker count is read from the
+analytics config (`workers`, `chunk_size`).
+
 Note: Parquet writing and full YAML parsing are deferred to Phase 2. This module
 works with only the Python standard library (DuckDB optional if installed).
 """
@@ -15,6 +20,8 @@ from __future__ import annotations
 
 import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
@@ -32,6 +39,9 @@ TABLES = [
     "agents",
 ]
 
+DEFAULT_CHUNK_SIZE = 64
+MAX_AUTO_WORKERS = 8
+
 
 def _ts_iso(dt: Optional[datetime] = None) -> str:
     dt = dt or datetime.now(timezone.utc)
@@ -69,6 +79,8 @@ def ensure_setup(project_root: Path) -> Dict[str, Path]:
                     "redactions": [],
                     "autorun_on_launch": False,
                     "since": None,
+                    "workers": None,
+                    "chunk_size": DEFAULT_CHUNK_SIZE,
                 },
                 indent=2,
             ),
@@ -113,7 +125,7 @@ def _init_duckdb_views_if_available(db_path: Path, warehouse: Path) -> None:
 def _iter_session_files(project_root: Path) -> Iterator[Path]:
     sessions_dir = project_root / ".deia" / "sessions"
     if sessions_dir.is_dir():
-        yield from sessions_dir.glob("*.md")
+        yield from sorted(sessions_dir.glob("*.md"))
 
 
 def _parse_session_md(md_path: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
@@ -285,46 +297,101 @@ def _parse_hive_body(fp: Path) -> Dict[str, Any]:
     return out
 
 
+def _parse_hive_message(fp: Path, box: str) -> Dict[str, Any]:
+    """Build a hive_tasks/hive_responses row from a message file name and body."""
+    name = fp.name
+    m = _HIVE_FILE_RE.match(name)
+    if not m:
+        # fallback: parse body only
+        body = _parse_hive_body(fp)
+        return {
+            "ts": _ts_iso(),
+            "from": body.get("from"),
+            "to": body.get("to"),
+            "type": body.get("title_type"),
+            "subject": body.get("subject") or body.get("title") or name,
+            "path": str(fp),
+            "box": box,
+        }
+    year, month, day, hhmm, frm, to, typ, subject = m.groups()
+    # Build timestamp in local naive; mark as ISO
+    try:
+        ts = datetime(int(year), int(month), int(day), int(hhmm[:2]), int(hhmm[2:]), tzinfo=timezone.utc).isoformat()
+    except Exception:
+        ts = _ts_iso()
+    body = _parse_hive_body(fp)
+    return {
+        "ts": ts,
+        "from": frm,
+        "to": to,
+        "type": typ.upper(),
+        "subject": body.get("subject") or body.get("title") or subject,
+        "path": str(fp),
+        "box": box,
+    }
+
+
+def _iter_hive_files(project_root: Path, box: str) -> Iterator[Path]:
+    hive_dir = project_root / ".deia" / "hive" / box
+    if hive_dir.is_dir():
+        yield from sorted(hive_dir.glob("*.md"))
+
+
 def _iter_hive_messages(project_root: Path, box: str) -> Iterator[Dict[str, Any]]:
     """Iterate hive tasks or responses directory and parse filenames.
 
     box: 'tasks' or 'responses'
     """
-    hive_dir = project_root / ".deia" / "hive" / box
-    if not hive_dir.is_dir():
-        return
-    for fp in sorted(hive_dir.glob("*.md")):
-        name = fp.name
-        m = _HIVE_FILE_RE.match(name)
-        if not m:
-            # fallback: parse body only
-            body = _parse_hive_body(fp)
-            yield {
-                "ts": _ts_iso(),
-                "from": body.get("from"),
-                "to": body.get("to"),
-                "type": body.get("title_type"),
-                "subject": body.get("subject") or body.get("title") or name,
-                "path": str(fp),
-                "box": box,
-            }
-            continue
-        year, month, day, hhmm, frm, to, typ, subject = m.groups()
-        # Build timestamp in local naive; mark as ISO
+    for fp in _iter_hive_files(project_root, box):
+        yield _parse_hive_message(fp, box)
+
+
+# ------------------------ Parallel extraction ------------------------
+
+
+def _parse_session_batch(paths: List[Path]) -> List[Optional[Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]]]:
+    """Parse a batch of session files; unreadable files yield None (skipped)."""
+    out = []
+    for md in paths:
         try:
-            ts = datetime(int(year), int(month), int(day), int(hhmm[:2]), int(hhmm[2:]), tzinfo=timezone.utc).isoformat()
+            out.append(_parse_session_md(md))
         except Exception:
-            ts = _ts_iso()
-        body = _parse_hive_body(fp)
-        yield {
-            "ts": ts,
-            "from": frm,
-            "to": to,
-            "type": typ.upper(),
-            "subject": body.get("subject") or body.get("title") or subject,
-            "path": str(fp),
-            "box": box,
-        }
+            out.append(None)
+    return out
+
+
+def _parse_hive_batch(batch: Tuple[str, List[Path]]) -> List[Dict[str, Any]]:
+    box, paths = batch
+    return [_parse_hive_message(fp, box) for fp in paths]
+
+
+def _chunked(items: List[Any], size: int) -> List[List[Any]]:
+    size = max(1, int(size))
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """Normalize a configured worker count (None/0 means auto)."""
+    if workers is None or int(workers) <= 0:
+        return max(1, min(os.cpu_count() or 1, MAX_AUTO_WORKERS))
+    return int(workers)
+
+
+def map_batches(func, batches: List[Any], workers: int) -> List[Any]:
+    """Apply func to each batch, in a process pool when worthwhile.
+
+    Results come back in batch order regardless of completion order, so
+    callers get deterministic output. Falls back to serial execution when
+    only one batch/worker is involved or the pool cannot be started.
+    """
+    workers = min(workers, len(batches))
+    if workers <= 1:
+        return [func(b) for b in batches]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, batches))
+    except (OSError, RuntimeError, ImportError):
+        return [func(b) for b in batches]
 
 
 # --------------------------- Writers & ETL ---------------------------
@@ -381,20 +448,21 @@ def write_parquet_if_available(table: str, rows: Iterable[Dict[str, Any]], wareh
     return out_path
 
 
-def extract_sessions(project_root: Path) -> Dict[str, List[Dict[str, Any]]]:
+def extract_sessions(project_root: Path, workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, List[Dict[str, Any]]]:
     sessions: List[Dict[str, Any]] = []
     decisions: List[Dict[str, Any]] = []
     action_items: List[Dict[str, Any]] = []
     files_modified: List[Dict[str, Any]] = []
-    for md in _iter_session_files(project_root):
-        try:
-            s, d, a, fm = _parse_session_md(md)
+    batches = _chunked(list(_iter_session_files(project_root)), chunk_size)
+    for results in map_batches(_parse_session_batch, batches, workers):
+        for parsed in results:
+            if parsed is None:
+                continue
+            s, d, a, fm = parsed
             sessions.append(s)
             decisions.extend(d)
             action_items.extend(a)
             files_modified.extend(fm)
-        except Exception:
-            continue
     return {
         "sessions": sessions,
         "session_decisions": decisions,
@@ -411,10 +479,16 @@ def extract_heartbeats(project_root: Path) -> List[Dict[str, Any]]:
     return list(_iter_heartbeats(project_root))
 
 
-def extract_hive_boxes(project_root: Path) -> Dict[str, List[Dict[str, Any]]]:
-    tasks = list(_iter_hive_messages(project_root, "tasks"))
-    responses = list(_iter_hive_messages(project_root, "responses"))
-    return {"hive_tasks": tasks, "hive_responses": responses}
+def extract_hive_boxes(project_root: Path, workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, List[Dict[str, Any]]]:
+    # Both boxes share one pool; batch order keeps tasks before responses
+    batches: List[Tuple[str, List[Path]]] = []
+    for box in ("tasks", "responses"):
+        for chunk in _chunked(list(_iter_hive_files(project_root, box)), chunk_size):
+            batches.append((box, chunk))
+    out: Dict[str, List[Dict[str, Any]]] = {"hive_tasks": [], "hive_responses": []}
+    for (box, _), rows in zip(batches, map_batches(_parse_hive_batch, batches, workers)):
+        out[f"hive_{box}"].extend(rows)
+    return out
 
 
 def derive_agents(events: List[Dict[str, Any]], heartbeats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -471,28 +545,52 @@ def autorun(project_root: Path) -> Dict[str, Any]:
         except Exception:
             cfg = {}
     targets = cfg.get("targets", ["staging_ndjson"]) or ["staging_ndjson"]
+    workers = resolve_workers(cfg.get("workers"))
+    chunk_size = cfg.get("chunk_size") or DEFAULT_CHUNK_SIZE
+
+    # Per-stage timing and row counts, recorded in the manifest
+    stages: Dict[str, Dict[str, Any]] = {}
+
+    def timed(stage: str, fn, *args, **kwargs):
+        started = time.perf_counter()
+        result = fn(*args, **kwargs)
+        if isinstance(result, dict):
+            rows = sum(len(v) for v in result.values())
+        else:
+            rows = len(result)
+        stages[stage] = {"seconds": round(time.perf_counter() - started, 4), "rows": rows}
+        return result
 
     # For autorun, just write a daily partition with current snapshots
-    sess = extract_sessions(project_root)
-    events = extract_events(project_root)
-    heartbeats = extract_heartbeats(project_root)
-    hive_boxes = extract_hive_boxes(project_root)
-    agents = derive_agents(events, heartbeats)
+    sess = timed("sessions", extract_sessions, project_root, workers=workers, chunk_size=chunk_size)
+    events = timed("events", extract_events, project_root)
+    heartbeats = timed("heartbeats", extract_heartbeats, project_root)
+    hive_boxes = timed("hive", extract_hive_boxes, project_root, workers=workers, chunk_size=chunk_size)
+    agents = timed("agents", derive_agents, events, heartbeats)
 
     dt = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     written: Dict[str, str] = {}
+    rows_written = 0
     # helper to fan-out to targets
     def emit(table: str, rows: List[Dict[str, Any]]):
+        nonlocal rows_written
         if not rows:
             return
+        emitted = False
         if "staging_ndjson" in targets:
             nd = write_ndjson(table, rows, staging_root, dt)
             written[table] = str(nd)
+            emitted = True
         if "parquet" in targets:
             pqpath = write_parquet_if_available(table, rows, warehouse_root, dt)
             if pqpath:
                 written[f"{table}_parquet"] = str(pqpath)
+                emitted = True
+        # Count each table's rows once, however many targets received them
+        if emitted:
+            rows_written += len(rows)
 
+    write_started = time.perf_counter()
     for table, rows in sess.items():
         emit(table, rows)
     emit("events", events)
@@ -500,6 +598,7 @@ def autorun(project_root: Path) -> Dict[str, Any]:
     for table, rows in hive_boxes.items():
         emit(table, rows)
     emit("agents", agents)
+    stages["write"] = {"seconds": round(time.perf_counter() - write_started, 4), "rows": rows_written}
 
     # Update manifest
     manifest = (paths["analytics"]) / "manifest.json"
@@ -510,6 +609,8 @@ def autorun(project_root: Path) -> Dict[str, Any]:
         "written": written,
         "schema_version": 1,
         "targets": targets,
+        "workers": workers,
+        "stages": stages,
     }
     try:
         if manifest.exists():
@@ -524,7 +625,7 @@ def autorun(project_root: Path) -> Dict[str, Any]:
     except Exception:
         pass
 
-    return {"paths": {k: str(v) for k, v in paths.items()}, "written": written}
+    return {"paths": {k: str(v) for k, v in paths.items()}, "written": written, "stages": stages}
 
 
 def maybe_autorun_on_launch(project_root: Path) -> Optional[Dict[str, Any]]:
@@ -3,6 +3,10 @@ Stream Processing Engine - Real-time data processing with windowing, aggregation
 
 Provides streaming capabilities: sources, sinks, windowing (tumbling/sliding/session),
 aggregations, joins, state management, backpressure handling, and fault tolerance.
+
+Continuous aggregation (WindowedAggregator) assigns each record to its windows once
+on arrival and keeps only O(1) aggregate state per open window; watermarks close
+and emit windows.
 """
 
 from typing import Dict, List, Optional, Any, Callable, Union, Tuple, Set
@@ -174,6 +178,230 @@ class AggregationFunction:
         return [r.value for r in records]
 
 
+# ===== INCREMENTAL AGGREGATION =====
+
+class WindowAggregate:
+    """Running count/sum/min/max for one window, updated in O(1) per value."""
+
+    __slots__ = ("count", "sum_value", "min_value", "max_value")
+
+    def __init__(self):
+        """Initialize empty aggregate."""
+        self.count = 0
+        self.sum_value = 0.0
+        self.min_value: Optional[float] = None
+        self.max_value: Optional[float] = None
+
+    def add(self, value: Optional[float]) -> None:
+        """Fold one value in (None counts the record without a value)."""
+        self.count += 1
+        if value is None:
+            return
+        self.sum_value += value
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if self.max_value is None or value > self.max_value:
+            self.max_value = value
+
+    def merge(self, other: "WindowAggregate") -> None:
+        """Fold another aggregate in (used when session windows merge)."""
+        self.count += other.count
+        self.sum_value += other.sum_value
+        if other.min_value is not None and (self.min_value is None or other.min_value < self.min_value):
+            self.min_value = other.min_value
+        if other.max_value is not None and (self.max_value is None or other.max_value > self.max_value):
+            self.max_value = other.max_value
+
+    @property
+    def avg_value(self) -> float:
+        """Average value."""
+        return self.sum_value / self.count if self.count else 0.0
+
+    def to_result(self, group_key: Any, window_key: str, start: float, end: float) -> AggregationResult:
+        """Convert to an AggregationResult."""
+        return AggregationResult(
+            group_key=group_key,
+            window_key=window_key,
+            count=self.count,
+            sum_value=self.sum_value,
+            avg_value=self.avg_value,
+            min_value=self.min_value,
+            max_value=self.max_value,
+            state={"start": start, "end": end}
+        )
+
+
+@dataclass
+class OpenWindow:
+    """A window that has not been closed by the watermark yet."""
+    group_key: Any
+    start_time: float
+    end_time: float
+    aggregate: WindowAggregate = field(default_factory=WindowAggregate)
+
+
+class WindowedAggregator:
+    """
+    Continuous windowed aggregation over an unbounded stream.
+
+    Each record is assigned to its window(s) once on arrival and folded into
+    that window's WindowAggregate; no records are retained. Windows are
+    closed and emitted when the watermark passes their end (plus
+    allowed_lateness). Records arriving for already-closed windows are
+    dropped and counted in `late_records`. Session windows are kept per
+    group key and merge whenever a record falls within `window_size` (the
+    gap) of an existing session.
+    """
+
+    def __init__(self, window_type: WindowType, window_size: float,
+                 key_extractor: Optional[Callable] = None,
+                 value_extractor: Optional[Callable] = None,
+                 slide_interval: Optional[float] = None,
+                 allowed_lateness: float = 0.0,
+                 watermark_delay: Optional[float] = None):
+        """
+        Initialize aggregator.
+
+        Args:
+            window_type: Tumbling, sliding or session windows
+            window_size: Window length (session: inactivity gap)
+            key_extractor: Group key per record (default: one group "all")
+            value_extractor: Numeric value per record (default: count only)
+            slide_interval: Slide for sliding windows (default: window_size / 2)
+            allowed_lateness: Keep windows open this long past their end
+            watermark_delay: If set, the watermark follows max event time minus this delay
+        """
+        self.window_type = window_type
+        self.window_size = window_size
+        self.slide_interval = slide_interval or window_size / 2
+        self.key_extractor = key_extractor or (lambda r: "all")
+        self.value_extractor = value_extractor
+        self.allowed_lateness = allowed_lateness
+        self.watermark_delay = watermark_delay
+        self.watermark = float("-inf")
+        self.max_event_time = float("-inf")
+        self.windows: Dict[Any, OpenWindow] = {}
+        self.sessions: Dict[Any, List[Any]] = defaultdict(list)  # group -> window ids
+        self._close_heap: List[Tuple[float, int, Any]] = []
+        self._seq = 0
+        self.late_records = 0
+
+    def _window_key(self, window: OpenWindow) -> str:
+        prefix = {WindowType.TUMBLING: "tumble", WindowType.SLIDING: "slide",
+                  WindowType.SESSION: "session"}[self.window_type]
+        return f"{prefix}_{window.start_time}_{window.end_time}"
+
+    def _is_closed(self, end_time: float) -> bool:
+        return end_time + self.allowed_lateness <= self.watermark
+
+    def _schedule(self, window_id: Any, window: OpenWindow) -> None:
+        self._seq += 1
+        heapq.heappush(self._close_heap, (window.end_time, self._seq, window_id))
+
+    def add(self, record: StreamRecord) -> List[AggregationResult]:
+        """
+        Fold a record into its window(s).
+
+        Watermark records advance the watermark instead. Returns the results
+        of any windows this closed.
+        """
+        if record.is_watermark:
+            return self.advance_watermark(record.timestamp)
+
+        group = self.key_extractor(record)
+        value = self.value_extractor(record) if self.value_extractor else None
+        ts = record.timestamp
+
+        if self.window_type == WindowType.SESSION:
+            self._add_to_session(group, ts, value)
+        else:
+            if self.window_type == WindowType.TUMBLING:
+                bounds = [WindowFunction.tumbling_window(ts, self.window_size)]
+            else:
+                bounds = WindowFunction.sliding_window(ts, self.window_size, self.slide_interval)
+            assigned = False
+            for start, end in bounds:
+                if self._is_closed(end):
+                    continue
+                window_id = (group, start)
+                window = self.windows.get(window_id)
+                if window is None:
+                    window = self.windows[window_id] = OpenWindow(group, start, end)
+                    self._schedule(window_id, window)
+                window.aggregate.add(value)
+                assigned = True
+            if not assigned:
+                self.late_records += 1
+
+        if ts > self.max_event_time:
+            self.max_event_time = ts
+            if self.watermark_delay is not None:
+                return self.advance_watermark(ts - self.watermark_delay)
+        return []
+
+    def _add_to_session(self, group: Any, ts: float, value: Optional[float]) -> None:
+        gap = self.window_size
+        start, end = ts, ts + gap
+        overlapping = [
+            wid for wid in self.sessions.get(group, ())
+            if self.windows[wid].start_time < end and ts < self.windows[wid].end_time
+        ]
+        if not overlapping and self._is_closed(end):
+            self.late_records += 1
+            return
+
+        aggregate = WindowAggregate()
+        aggregate.add(value)
+        for wid in overlapping:
+            merged = self.windows.pop(wid)
+            start = min(start, merged.start_time)
+            end = max(end, merged.end_time)
+            aggregate.merge(merged.aggregate)
+        remaining = [wid for wid in self.sessions.get(group, ()) if wid not in overlapping]
+
+        self._seq += 1
+        window_id = (group, "session", self._seq)
+        window = self.windows[window_id] = OpenWindow(group, start, end, aggregate)
+        remaining.append(window_id)
+        self.sessions[group] = remaining
+        self._schedule(window_id, window)
+
+    def advance_watermark(self, timestamp: float) -> List[AggregationResult]:
+        """Move the watermark forward and emit every window it closes."""
+        if timestamp <= self.watermark:
+            return []
+        self.watermark = timestamp
+        results = []
+        while self._close_heap and self._is_closed(self._close_heap[0][0]):
+            end_time, _, window_id = heapq.heappop(self._close_heap)
+            window = self.windows.get(window_id)
+            if window is None or window.end_time != end_time:
+                continue  # Merged into a newer session window
+            results.append(self._close(window_id))
+        return results
+
+    def _close(self, window_id: Any) -> AggregationResult:
+        window = self.windows.pop(window_id)
+        if self.window_type == WindowType.SESSION:
+            sessions = self.sessions[window.group_key]
+            sessions.remove(window_id)
+            if not sessions:
+                del self.sessions[window.group_key]
+        return window.aggregate.to_result(
+            window.group_key, self._window_key(window), window.start_time, window.end_time
+        )
+
+    def flush(self) -> List[AggregationResult]:
+        """Emit all open windows regardless of the watermark (end of stream)."""
+        pending = sorted(self.windows.items(), key=lambda item: (item[1].end_time, item[1].start_time))
+        self._close_heap.clear()
+        return [self._close(window_id) for window_id, _ in pending]
+
+    def open_windows(self) -> List[OpenWindow]:
+        """Windows still accumulating, ordered by end time."""
+        return sorted(self.windows.values(), key=lambda w: (w.end_time, w.start_time))
+
+
 # ===== STATE MANAGEMENT =====
 
 class StateStore:
@@ -223,99 +451,149 @@ class StateStore:
 class StreamProcessor:
     """Process streaming data with operators."""
 
-    def __init__(self, buffer_size: int = 10000):
-        """Initialize processor."""
+    def __init__(self, buffer_size: int = 10000, retain_records: bool = True):
+        """
+        Initialize processor.
+
+        Args:
+            buffer_size: Max buffered records before backpressure
+            retain_records: Buffer records for apply_window/get_records. Set False
+                for pure continuous aggregation, which keeps no raw records.
+
+        Closed-window results wait for poll_results() in a buffer of the same
+        size; if it overflows the oldest results are dropped and counted in
+        `dropped_results`.
+        """
         self.buffer_size = buffer_size
+        self.retain_records = retain_records
         self.queue: deque = deque(maxlen=buffer_size)
         self.state_store = StateStore()
         self.windows: Dict[str, WindowBucket] = {}
+        self.aggregators: Dict[str, WindowedAggregator] = {}
+        self.results: deque = deque(maxlen=buffer_size)
+        self.dropped_results = 0
         self.lock = threading.RLock()
         self.running = False
 
     def add_record(self, record: StreamRecord) -> bool:
-        """Add record to stream."""
+        """Add record to stream, feeding registered aggregations on arrival."""
         with self.lock:
-            if len(self.queue) >= self.buffer_size:
+            if record.is_watermark:
+                self.advance_watermark(record.timestamp)
+                return True
+            if self.retain_records and len(self.queue) >= self.buffer_size:
                 return False  # Backpressure: queue full
-            self.queue.append(record)
+            for aggregator in self.aggregators.values():
+                self._collect(aggregator.add(record))
+            if self.retain_records:
+                self.queue.append(record)
             return True
 
+    def register_aggregation(self, name: str, window_type: WindowType, window_size: float,
+                             key_extractor: Optional[Callable] = None,
+                             value_extractor: Optional[Callable] = None,
+                             **options) -> WindowedAggregator:
+        """
+        Register a continuous windowed aggregation.
+
+        Records added afterwards are folded in on arrival; closed windows are
+        collected for poll_results(). Extra options go to WindowedAggregator.
+        """
+        aggregator = WindowedAggregator(window_type, window_size, key_extractor, value_extractor, **options)
+        with self.lock:
+            self.aggregators[name] = aggregator
+        return aggregator
+
+    def advance_watermark(self, timestamp: float) -> List[AggregationResult]:
+        """Advance the watermark on all aggregations; returns (and collects) closed windows."""
+        emitted = []
+        with self.lock:
+            for aggregator in self.aggregators.values():
+                emitted.extend(aggregator.advance_watermark(timestamp))
+            self._collect(emitted)
+        return emitted
+
+    def _collect(self, results: List[AggregationResult]) -> None:
+        """Queue results for poll_results(), counting any pushed out (caller holds lock)."""
+        overflow = len(self.results) + len(results) - self.buffer_size
+        if overflow > 0:
+            self.dropped_results += overflow
+        self.results.extend(results)
+
+    def poll_results(self) -> List[AggregationResult]:
+        """Drain results of windows closed so far."""
+        with self.lock:
+            results = list(self.results)
+            self.results.clear()
+            return results
+
     def apply_window(self, window_type: WindowType, window_size: float, key_extractor: Callable) -> Dict[str, WindowBucket]:
-        """Apply windowing to stream."""
-        windowed = {}
+        """Apply windowing to the buffered records in one pass."""
+        windowed: Dict[str, WindowBucket] = {}
+        by_bounds: Dict[Tuple[float, float], WindowBucket] = {}
+
+        def bucket_for(prefix: str, start: float, end: float) -> WindowBucket:
+            bucket = by_bounds.get((start, end))
+            if bucket is None:
+                window_key = f"{prefix}_{start}_{end}"
+                bucket = by_bounds[(start, end)] = windowed[window_key] = WindowBucket(window_key, start, end)
+            return bucket
 
         with self.lock:
-            for record in self.queue:
-                key = key_extractor(record)
+            if window_type == WindowType.SESSION:
+                # Sessions split wherever consecutive records are window_size or more apart
+                bucket = None
+                for record in sorted(self.queue, key=lambda r: r.timestamp):
+                    if bucket is None or record.timestamp >= bucket.end_time:
+                        if bucket is not None:
+                            windowed[bucket.window_key] = bucket
+                        bucket = WindowBucket("", record.timestamp, record.timestamp)
+                    bucket.records.append(record)
+                    bucket.end_time = record.timestamp + window_size
+                    bucket.window_key = f"session_{bucket.start_time}_{bucket.end_time}"
+                if bucket is not None:
+                    windowed[bucket.window_key] = bucket
+                return windowed
 
+            for record in self.queue:
                 if window_type == WindowType.TUMBLING:
                     start, end = WindowFunction.tumbling_window(record.timestamp, window_size)
-                    window_key = f"tumble_{start}_{end}"
-
+                    bucket_for("tumble", start, end).records.append(record)
                 elif window_type == WindowType.SLIDING:
-                    windows = WindowFunction.sliding_window(record.timestamp, window_size, window_size / 2)
-                    for start, end in windows:
-                        window_key = f"slide_{start}_{end}"
-                        if window_key not in windowed:
-                            windowed[window_key] = WindowBucket(window_key, start, end)
-                        windowed[window_key].records.append(record)
-                    continue
-
-                elif window_type == WindowType.SESSION:
-                    window_key = WindowFunction.session_window(record.timestamp, window_size, {})
-
-                if window_key not in windowed:
-                    if window_type == WindowType.TUMBLING:
-                        windowed[window_key] = WindowBucket(window_key, start, end)
-                    else:
-                        windowed[window_key] = WindowBucket(window_key, time.time(), time.time() + window_size)
-
-                windowed[window_key].records.append(record)
+                    for start, end in WindowFunction.sliding_window(record.timestamp, window_size, window_size / 2):
+                        bucket_for("slide", start, end).records.append(record)
 
         return windowed
 
     def aggregate(self, windows: Dict[str, WindowBucket], agg_type: str,
                   value_extractor: Optional[Callable] = None, key_extractor: Optional[Callable] = None) -> List[AggregationResult]:
-        """Aggregate windowed data."""
+        """Aggregate windowed data (one pass per bucket)."""
         results = []
 
         for window_key, bucket in windows.items():
-            if agg_type == "count":
-                result = AggregationResult(
-                    group_key="all",
-                    window_key=window_key,
-                    count=AggregationFunction.count(bucket.records)
-                )
-
-            elif agg_type == "sum" and value_extractor:
-                result = AggregationResult(
-                    group_key="all",
-                    window_key=window_key,
-                    sum_value=AggregationFunction.sum(bucket.records, value_extractor)
-                )
-
-            elif agg_type == "avg" and value_extractor:
-                result = AggregationResult(
-                    group_key="all",
-                    window_key=window_key,
-                    avg_value=AggregationFunction.avg(bucket.records, value_extractor),
-                    count=len(bucket.records)
-                )
+            if agg_type != "count" and not value_extractor:
+                results.append(AggregationResult(group_key="all", window_key=window_key))
+                continue
 
-            elif agg_type == "min" and value_extractor:
-                result = AggregationResult(
-                    group_key="all",
-                    window_key=window_key,
-                    min_value=AggregationFunction.min(bucket.records, value_extractor)
-                )
+            aggregate = WindowAggregate()
+            for record in bucket.records:
+                aggregate.add(value_extractor(record) if agg_type != "count" else None)
 
-            elif agg_type == "max" and value_extractor:
+            if agg_type == "count":
+                result = AggregationResult(group_key="all", window_key=window_key, count=aggregate.count)
+            elif agg_type == "sum":
+                result = AggregationResult(group_key="all", window_key=window_key, sum_value=aggregate.sum_value)
+            elif agg_type == "avg":
                 result = AggregationResult(
                     group_key="all",
                     window_key=window_key,
-                    max_value=AggregationFunction.max(bucket.records, value_extractor)
+                    avg_value=aggregate.avg_value,
+                    count=aggregate.count
                 )
-
+            elif agg_type == "min":
+                result = AggregationResult(group_key="all", window_key=window_key, min_value=aggregate.min_value)
+            elif agg_type == "max":
+                result = AggregationResult(group_key="all", window_key=window_key, max_value=aggregate.max_value)
             else:
                 result = AggregationResult(group_key="all", window_key=window_key)
 
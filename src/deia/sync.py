@@ -9,6 +9,8 @@ Features:
 - Unsubmitted draft provenance
 - Safe temp staging (copies, not moves)
 - State persistence across runs
+- Batched pipeline: debounced watch events, parallel parse/route workers,
+  and a content-hash ledger that skips already-routed files on restart
 """
 
 import os
@@ -18,6 +20,9 @@ import time
 import shutil
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Optional, Tuple, List
@@ -33,6 +38,31 @@ except ImportError as e:
 
 from .sync_state import StateManager
 from .sync_provenance import ProvenanceTracker
+from .sync_ledger import ProcessedLedger
+
+
+@dataclass
+class SyncStats:
+    """Throughput counters for a batch of files (or a syncer's lifetime)."""
+    files_seen: int = 0
+    routed: int = 0
+    skipped: int = 0     # Content already routed (ledger hit)
+    errors: int = 0
+    seconds: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files_seen / self.seconds if self.seconds else 0.0
+
+    def merge(self, other: "SyncStats") -> None:
+        self.files_seen += other.files_seen
+        self.routed += other.routed
+        self.skipped += other.skipped
+        self.errors += other.errors
+        self.seconds += other.seconds
+
+    def to_dict(self) -> Dict:
+        return {**asdict(self), "files_per_second": round(self.files_per_second, 2)}
 
 
 class DownloadsSyncer(FileSystemEventHandler):
@@ -58,9 +88,30 @@ class DownloadsSyncer(FileSystemEventHandler):
         ))
         self.state_manager = StateManager(state_file)
 
+        # Initialize processed-file ledger (content hash -> routed target)
+        ledger_file = self.config.get('ledger_file', os.path.join(
+            os.path.dirname(state_file),
+            "ledger.json"
+        ))
+        self.ledger = ProcessedLedger(ledger_file)
+
         # Initialize provenance tracker
         self.provenance_tracker = ProvenanceTracker(self.config)
 
+        # Pipeline settings
+        processing = self.config.get('processing', {})
+        self.workers = max(1, int(processing.get('workers', 4)))
+        self.debounce_seconds = float(processing.get('debounce_seconds', 0.5))
+        self.metrics = SyncStats()
+
+        # Guards state, provenance and target-path reservation across workers
+        self._lock = threading.RLock()
+        self._reserved_targets = set()
+
+        # Watch events waiting out the debounce window: path -> last event time
+        self._pending: Dict[str, float] = {}
+        self._pending_lock = threading.Lock()
+
     def _load_config(self, config_path: Optional[str]) -> Dict:
         """
         Load routing configuration from JSON file.
@@ -270,6 +321,11 @@ class DownloadsSyncer(FileSystemEventHandler):
         Returns:
             (success: bool, message: str)
         """
+        success, msg, _ = self._route(file_path)
+        return success, msg
+
+    def _route(self, file_path: str) -> Tuple[bool, str, Optional[str]]:
+        """route_file() that also returns the target path on success."""
         filename = os.path.basename(file_path)
 
         # Parse frontmatter
@@ -278,13 +334,13 @@ class DownloadsSyncer(FileSystemEventHandler):
         if not frontmatter:
             msg = f"No valid YAML frontmatter in {filename}"
             self.logger.warning(msg)
-            return False, msg
+            return False, msg, None
 
         # Check for deia_routing section
         if 'deia_routing' not in frontmatter:
             msg = f"No deia_routing section in {filename}"
             self.logger.warning(msg)
-            return False, msg
+            return False, msg, None
 
         routing = frontmatter['deia_routing']
 
@@ -295,13 +351,13 @@ class DownloadsSyncer(FileSystemEventHandler):
         if not project:
             msg = f"No project specified in {filename}"
             self.logger.warning(msg)
-            return False, msg
+            return False, msg, None
 
         # Check if project exists in config
         if project not in self.config['projects']:
             msg = f"Unknown project '{project}' in {filename}"
             self.logger.error(msg)
-            return False, msg
+            return False, msg, None
 
         # Build target path
         project_path = self.config['projects'][project]
@@ -337,16 +393,24 @@ class DownloadsSyncer(FileSystemEventHandler):
                         f"UNSUBMITTED DRAFT: {filename} replaces v{replaced_version} "
                         f"which was never submitted"
                     )
-                    self.provenance_tracker.track_unsubmitted_draft(replace_info, project_path, filename)
-
-        # Handle conflicts
-        if os.path.exists(target_path):
-            # Add timestamp to avoid overwrite
-            name, ext = os.path.splitext(filename)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}{ext}"
-            target_path = os.path.join(target_dir, filename)
-            self.logger.warning(f"File conflict resolved by adding timestamp: {filename}")
+                    with self._lock:
+                        self.provenance_tracker.track_unsubmitted_draft(replace_info, project_path, filename)
+
+        # Handle conflicts (targets being written by other workers count too)
+        with self._lock:
+            if os.path.exists(target_path) or target_path in self._reserved_targets:
+                # Add timestamp to avoid overwrite
+                name, ext = os.path.splitext(filename)
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"{name}_{timestamp}{ext}"
+                target_path = os.path.join(target_dir, filename)
+                counter = 1
+                while os.path.exists(target_path) or target_path in self._reserved_targets:
+                    filename = f"{name}_{timestamp}_{counter}{ext}"
+                    target_path = os.path.join(target_dir, filename)
+                    counter += 1
+                self.logger.warning(f"File conflict resolved by adding timestamp: {filename}")
+            self._reserved_targets.add(target_path)
 
         # Copy or move file depending on temp staging config
         use_temp_staging = self.config.get('processing', {}).get('use_temp_staging', False)
@@ -364,15 +428,20 @@ class DownloadsSyncer(FileSystemEventHandler):
                 self.logger.info(msg)
 
             # Record to state
-            self.state_manager.add_processed_file(filename)
-            self._record_processed(filename, target_path)
+            with self._lock:
+                self.state_manager.add_processed_file(filename)
+                self._record_processed(filename, target_path)
 
-            return True, msg
+            return True, msg, target_path
 
         except Exception as e:
             msg = f"Error routing {filename}: {e}"
             self.logger.error(msg)
-            return False, msg
+            return False, msg, None
+
+        finally:
+            with self._lock:
+                self._reserved_targets.discard(target_path)
 
     def _record_processed(self, filename: str, target_path: str):
         """Record successfully processed file."""
@@ -389,7 +458,8 @@ class DownloadsSyncer(FileSystemEventHandler):
         try:
             shutil.move(file_path, error_path)
             self.logger.error(f"Moved {filename} to error folder: {error_msg}")
-            self.state_manager.increment_error_count()
+            with self._lock:
+                self.state_manager.increment_error_count()
 
             # Create error log
             error_log = os.path.join(self.config['error_folder'], f"{filename}.error.txt")
@@ -411,14 +481,18 @@ class DownloadsSyncer(FileSystemEventHandler):
         # Get all .md files in Downloads
         md_files = []
         try:
-            for filename in os.listdir(downloads_folder):
+            with os.scandir(downloads_folder) as entries:
+                entries = list(entries)
+
+            for entry in entries:
+                filename = entry.name
                 if not filename.lower().endswith('.md'):
                     continue
 
-                file_path = os.path.join(downloads_folder, filename)
+                file_path = entry.path
 
                 # Check if it's a file (not directory)
-                if not os.path.isfile(file_path):
+                if not entry.is_file():
                     continue
 
                 # Determine if file needs processing
@@ -429,7 +503,7 @@ class DownloadsSyncer(FileSystemEventHandler):
                     needs_processing = True
                 else:
                     # Case 2: File modified after last run
-                    mtime = datetime.fromtimestamp(os.path.getmtime(file_path), tz=timezone.utc)
+                    mtime = datetime.fromtimestamp(entry.stat().st_mtime, tz=timezone.utc)
                     if mtime > last_run:
                         needs_processing = True
                     # Case 3: File not in processed list (might have been an error before)
@@ -444,21 +518,95 @@ class DownloadsSyncer(FileSystemEventHandler):
 
         return md_files
 
-    def process_file(self, file_path: str):
-        """Process a single file (stage -> route -> handle errors)."""
-        # Step 1: Move to temp staging if enabled
+    def process_file(self, file_path: str) -> str:
+        """
+        Process a single file (hash -> stage -> route -> handle errors).
+
+        Returns:
+            "routed", "skipped" (content already routed) or "error"
+        """
+        filename = os.path.basename(file_path)
+
+        # Step 1: Skip content the ledger says was already routed
+        try:
+            digest = self.ledger.file_hash(file_path)
+        except OSError as e:
+            self.logger.error(f"Error reading {filename}: {e}")
+            return "error"
+
+        previous = self.ledger.get(digest)
+        if previous:
+            self.logger.info(f"Skipping {filename}: already routed to {previous['target']}")
+            return "skipped"
+
+        # Step 2: Move to temp staging if enabled
         staged, staged_path = self.move_to_temp_staging(file_path)
 
         if not staged:
-            self.logger.error(f"Failed to stage {os.path.basename(file_path)}")
-            return
+            self.logger.error(f"Failed to stage {filename}")
+            return "error"
 
-        # Step 2: Route file from temp (or original location)
-        success, message = self.route_file(staged_path)
+        # Step 3: Route file from temp (or original location)
+        success, message, target_path = self._route(staged_path)
 
-        # Step 3: Handle errors (file stays in temp or moves to error folder)
-        if not success and os.path.exists(staged_path):
+        if success:
+            self.ledger.record(digest, filename, target_path)
+            return "routed"
+
+        # Step 4: Handle errors (file stays in temp or moves to error folder)
+        if os.path.exists(staged_path):
             self.handle_error(staged_path, message)
+        return "error"
+
+    def process_files(self, file_paths: List[str]) -> SyncStats:
+        """
+        Process a batch of files on the worker pool.
+
+        State and ledger are saved once for the whole batch.
+
+        Returns:
+            Stats for this batch (also added to self.metrics)
+        """
+        stats = SyncStats(files_seen=len(file_paths))
+        start = time.perf_counter()
+
+        with self.state_manager.deferred_save():
+            workers = min(self.workers, len(file_paths))
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="deia-sync") as pool:
+                    outcomes = list(pool.map(self._process_file_safely, file_paths))
+            else:
+                outcomes = [self._process_file_safely(path) for path in file_paths]
+        self.ledger.save()
+
+        stats.routed = outcomes.count("routed")
+        stats.skipped = outcomes.count("skipped")
+        stats.errors = outcomes.count("error")
+        stats.seconds = time.perf_counter() - start
+        self.metrics.merge(stats)
+
+        if file_paths:
+            self.logger.info(
+                f"Processed {stats.files_seen} files in {stats.seconds:.2f}s "
+                f"({stats.files_per_second:.1f} files/s): {stats.routed} routed, "
+                f"{stats.skipped} already routed, {stats.errors} errors"
+            )
+        return stats
+
+    def _process_file_safely(self, file_path: str) -> str:
+        try:
+            return self.process_file(file_path)
+        except Exception as e:
+            self.logger.error(f"Error processing {os.path.basename(file_path)}: {e}")
+            return "error"
+
+    def get_metrics(self) -> Dict:
+        """Lifetime throughput metrics for this syncer."""
+        return {
+            **self.metrics.to_dict(),
+            "pending_events": len(self._pending),
+            "ledger_entries": len(self.ledger)
+        }
 
     def process_existing_files(self) -> None:
         """One-time scan and process existing files."""
@@ -480,10 +628,7 @@ class DownloadsSyncer(FileSystemEventHandler):
         # Process files found during scan
         if files_to_process:
             self.logger.info(f"Processing {len(files_to_process)} files...")
-            for file_path in files_to_process:
-                filename = os.path.basename(file_path)
-                self.logger.info(f"Processing: {filename}")
-                self.process_file(file_path)
+            self.process_files(files_to_process)
             self.logger.info(f"Startup scan complete.")
 
         # Update last run timestamp
@@ -519,26 +664,62 @@ class DownloadsSyncer(FileSystemEventHandler):
         print(f"\nAll-time stats:")
         print(f"  Processed: {self.state_manager.state['processed_count']} files")
         print(f"  Errors: {self.state_manager.state['errors_count']} files")
+        print(f"  Ledger: {len(self.ledger)} routed documents")
 
         print("="*60 + "\n")
 
     def on_created(self, event):
         """Handle file creation events."""
-        if event.is_directory:
-            return
-
-        file_path = event.src_path
-
+        if not event.is_directory:
+            self._queue_event(event.src_path)
+
+    def on_modified(self, event):
+        """Restart the debounce window for files still being written."""
+        if not event.is_directory:
+            with self._pending_lock:
+                if event.src_path in self._pending:
+                    self._pending[event.src_path] = time.monotonic()
+
+    def on_moved(self, event):
+        """Handle renames into place (e.g. browser partial downloads)."""
+        if not event.is_directory:
+            self._queue_event(event.dest_path)
+
+    def _queue_event(self, file_path: str) -> None:
+        """Queue a file until its events go quiet for debounce_seconds."""
         # Only process .md files
         if not file_path.lower().endswith('.md'):
             return
 
-        # Give the file time to finish writing
-        time.sleep(0.5)
+        with self._pending_lock:
+            self._pending[file_path] = time.monotonic()
+
+    def flush_pending(self, now: Optional[float] = None, force: bool = False) -> Optional[SyncStats]:
+        """
+        Process queued files whose debounce window has passed, as one batch.
+
+        Args:
+            now: Current time.monotonic() (for testing)
+            force: Process everything queued regardless of debounce
+
+        Returns:
+            Batch stats, or None if nothing was ready
+        """
+        now = time.monotonic() if now is None else now
+        with self._pending_lock:
+            ready = [
+                path for path, last_event in self._pending.items()
+                if force or now - last_event >= self.debounce_seconds
+            ]
+            for path in ready:
+                del self._pending[path]
+
+        ready = [path for path in ready if os.path.isfile(path)]
+        if not ready:
+            return None
 
-        # Process the file
-        self.logger.info(f"Detected new file: {os.path.basename(file_path)}")
-        self.process_file(file_path)
+        self.logger.info(f"Detected {len(ready)} new file(s)")
+        return self.process_files(ready)
 
     def run_interactive(self) -> None:
         """Watch Downloads folder interactively (foreground)."""
@@ -561,9 +742,11 @@ class DownloadsSyncer(FileSystemEventHandler):
 
         try:
             while True:
-                time.sleep(1)
+                time.sleep(min(1.0, max(self.debounce_seconds / 2, 0.05)))
+                self.flush_pending()
         except KeyboardInterrupt:
             observer.stop()
+            self.flush_pending(force=True)
             print("\nSync stopped")
 
         observer.join()
@@ -0,0 +1,93 @@
+"""
+Processed-file ledger for sync operations.
+
+Records every routed document by content hash, so a restarted syncer can
+skip files it has already routed (including re-downloads under a new name)
+without parsing them again.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from typing import Dict, Optional
+from datetime import datetime
+
+
+class ProcessedLedger:
+    """Persistent content-hash -> routing record map."""
+
+    def __init__(self, ledger_file: Optional[str] = None):
+        """
+        Initialize ledger.
+
+        Args:
+            ledger_file: Path to ledger file. Defaults to ~/.deia/sync/ledger.json
+        """
+        if ledger_file is None:
+            ledger_file = os.path.join(
+                os.path.expanduser("~"),
+                ".deia",
+                "sync",
+                "ledger.json"
+            )
+
+        self.ledger_file = ledger_file
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load ledger from file, or start empty."""
+        if os.path.exists(self.ledger_file):
+            try:
+                with open(self.ledger_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception:
+                pass  # Fall through to empty ledger
+        return {}
+
+    @staticmethod
+    def file_hash(file_path: str) -> str:
+        """SHA256 of a file's contents, read in blocks."""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def contains(self, digest: str) -> bool:
+        """Check if content with this hash was already routed."""
+        return digest in self.entries
+
+    def get(self, digest: str) -> Optional[Dict]:
+        return self.entries.get(digest)
+
+    def record(self, digest: str, filename: str, target_path: str) -> None:
+        """Record a routed file (persisted on the next save())."""
+        with self._lock:
+            self.entries[digest] = {
+                "filename": filename,
+                "target": target_path,
+                "routed_at": datetime.now().isoformat()
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the ledger if it changed (atomic replace)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.ledger_file), exist_ok=True)
+                temp_file = f"{self.ledger_file}.tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.entries, f)
+                os.replace(temp_file, self.ledger_file)
+                self._dirty = False
+            except Exception as e:
+                logging.error(f"Error saving sync ledger: {e}")
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -8,6 +8,7 @@ timestamps, and error counts.
 import os
 import json
 import logging
+from contextlib import contextmanager
 from typing import Dict, Optional
 from datetime import datetime, timezone
 
@@ -32,6 +33,10 @@ class StateManager:
 
         self.state_file = state_file
         self.state = self._load_state()
+        # Set mirror of last_processed_files for O(1) lookups during scans
+        self._processed = set(self.state['last_processed_files'])
+        self._deferred = 0
+        self._dirty = False
 
     def _load_state(self) -> Dict:
         """Load state from file, or create default state."""
@@ -50,8 +55,23 @@ class StateManager:
             "errors_count": 0
         }
 
+    @contextmanager
+    def deferred_save(self):
+        """Batch state changes into a single save at the end of the block."""
+        self._deferred += 1
+        try:
+            yield self
+        finally:
+            self._deferred -= 1
+            if not self._deferred and self._dirty:
+                self.save_state()
+
     def save_state(self):
         """Persist state to disk."""
+        if self._deferred:
+            self._dirty = True
+            return
+        self._dirty = False
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
@@ -68,7 +88,8 @@ class StateManager:
 
     def add_processed_file(self, filename: str):
         """Record a successfully processed file."""
-        if filename not in self.state['last_processed_files']:
+        if filename not in self._processed:
+            self._processed.add(filename)
             self.state['last_processed_files'].append(filename)
         self.state['processed_count'] += 1
         self.save_state()
@@ -86,4 +107,4 @@ class StateManager:
 
     def was_file_processed(self, filename: str) -> bool:
         """Check if file was successfully processed before."""
-        return filename in self.state['last_processed_files']
+        return filename in self._processed
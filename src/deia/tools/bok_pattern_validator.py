@@ -23,6 +23,10 @@ Usage:
     reports = validator.validate_patterns()
     print(validator.generate_report(reports))
 
+Link checking runs concurrently (bounded overall and per host) and results
+can be persisted to a JSON cache with a TTL, so repeated validations and
+URLs shared between patterns are only checked once.
+
 Author: CLAUDE-CODE-004 (Documentation Curator / Master Librarian)
 Date: 2025-10-18
 Version: 1.0 (Enhanced from Agent BC Phase 3 delivery)
@@ -30,10 +34,16 @@ Version: 1.0 (Enhanced from Agent BC Phase 3 delivery)
 
 import os
 import re
+import json
+import time
+import asyncio
 import logging
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterable
+from urllib.parse import urlsplit
 
 # Optional dependencies (graceful degradation if not installed)
 try:
@@ -52,6 +62,150 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+
+class LinkChecker:
+    """
+    Concurrent HTTP link checker with per-host limits and a result cache.
+
+    Each URL is checked with a HEAD request (requests.head, run on a worker
+    thread) under an overall concurrency limit and a per-host concurrency
+    limit; `per_host_interval` additionally spaces out requests to the same
+    host. HTTP responses are cached in memory and, if `cache_path` is set,
+    persisted as JSON and reused until `cache_ttl` seconds old. Network
+    errors and timeouts count as broken but are not cached, so transient
+    failures are retried next run.
+
+    Attributes:
+        requests_made (int): HEAD requests issued (cache misses)
+    """
+
+    def __init__(
+        self,
+        timeout: float = 5,
+        max_concurrency: int = 16,
+        per_host_concurrency: int = 2,
+        per_host_interval: float = 0.0,
+        cache_path: Optional[Path] = None,
+        cache_ttl: float = 86400
+    ):
+        """
+        Args:
+            timeout: Per-request timeout in seconds
+            max_concurrency: Max requests in flight overall
+            per_host_concurrency: Max requests in flight per host
+            per_host_interval: Min seconds between request starts to one host
+            cache_path: JSON file for persisting results (None = memory only)
+            cache_ttl: Seconds a cached result stays valid
+        """
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_interval = per_host_interval
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.cache_ttl = cache_ttl
+        self.requests_made = 0
+        self._lock = threading.Lock()
+        self.cache: Dict[str, Dict] = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable link cache {self.cache_path}: {e}")
+            return {}
+
+    def save_cache(self) -> None:
+        """Persist cached results (expired entries are dropped)."""
+        if not self.cache_path:
+            return
+        now = time.time()
+        fresh = {url: r for url, r in self.cache.items() if now - r["checked_at"] < self.cache_ttl}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(fresh, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save link cache {self.cache_path}: {e}")
+
+    def cached(self, url: str) -> Optional[bool]:
+        """Cached broken/ok result for url, or None if missing or expired."""
+        entry = self.cache.get(url)
+        if entry and time.time() - entry["checked_at"] < self.cache_ttl:
+            return entry["broken"]
+        return None
+
+    def _head(self, url: str) -> Tuple[bool, Optional[int]]:
+        """Blocking HEAD request; returns (broken, status or None on error)."""
+        with self._lock:
+            self.requests_made += 1
+        try:
+            response = requests.head(url, timeout=self.timeout, allow_redirects=True)
+            return response.status_code >= 400, response.status_code
+        except requests.exceptions.Timeout:
+            logger.warning(f"Timeout checking link: {url}")
+            return True, None
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Error checking link {url}: {e}")
+            return True, None
+
+    async def check_async(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """Check URLs concurrently; returns {url: broken}."""
+        results = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            cached = self.cached(url)
+            if cached is None:
+                pending.append(url)
+            else:
+                results[url] = cached
+        if not pending:
+            return results
+
+        loop = asyncio.get_running_loop()
+        overall = asyncio.Semaphore(self.max_concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+        host_next_start: Dict[str, float] = {}
+
+        async def check_one(url: str, executor: ThreadPoolExecutor) -> None:
+            host = urlsplit(url).netloc.lower()
+            if host not in host_limits:
+                host_limits[host] = asyncio.Semaphore(self.per_host_concurrency)
+            async with host_limits[host], overall:
+                if self.per_host_interval:
+                    now = loop.time()
+                    start = max(now, host_next_start.get(host, now))
+                    host_next_start[host] = start + self.per_host_interval
+                    if start > now:
+                        await asyncio.sleep(start - now)
+                broken, status = await loop.run_in_executor(executor, self._head, url)
+            results[url] = broken
+            if status is not None:
+                self.cache[url] = {"broken": broken, "status": status, "checked_at": time.time()}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(pending)))) as executor:
+            await asyncio.gather(*(check_one(url, executor) for url in pending))
+        return results
+
+    def check(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """Synchronous wrapper around check_async (safe inside a running event loop)."""
+        urls = list(urls)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.check_async(urls))
+
+        # Already inside an event loop (e.g. FastAPI handler): run on a helper thread
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(asyncio.run, self.check_async(urls)).result()
+
+
 class BOKPatternValidator:
     """
     Validates BOK patterns against Master Librarian Specification v1.0 quality standards.
@@ -71,13 +225,18 @@ class BOKPatternValidator:
         required_sections (List[str]): Minimum required section names
         security_patterns (Dict[str, re.Pattern]): Regex patterns for security checks
         link_check_timeout (int): Timeout in seconds for link checking
+        link_checker (LinkChecker): Concurrent, cached checker for HTTP links
     """
 
     def __init__(
         self,
         bok_dir: str,
         required_sections: Optional[List[str]] = None,
-        link_check_timeout: int = 5
+        link_check_timeout: int = 5,
+        link_concurrency: int = 16,
+        per_host_concurrency: int = 2,
+        link_cache_path: Optional[str] = None,
+        link_cache_ttl: float = 86400
     ):
         """
         Initialize the BOK Pattern Validator.
@@ -87,6 +246,10 @@ class BOKPatternValidator:
             required_sections: Optional list of required section names
                               (defaults to Problem, Solution, Tags)
             link_check_timeout: Timeout in seconds for HTTP link checks (default 5)
+            link_concurrency: Max link checks in flight (default 16)
+            per_host_concurrency: Max link checks in flight per host (default 2)
+            link_cache_path: Optional JSON file to persist link results across runs
+            link_cache_ttl: Seconds a cached link result stays valid (default 1 day)
         """
         self.bok_dir = Path(bok_dir)
         self.required_sections = required_sections or [
@@ -95,6 +258,16 @@ class BOKPatternValidator:
             "Tags"
         ]
         self.link_check_timeout = link_check_timeout
+        self.link_checker = LinkChecker(
+            timeout=link_check_timeout,
+            max_concurrency=link_concurrency,
+            per_host_concurrency=per_host_concurrency,
+            cache_path=Path(link_cache_path) if link_cache_path else None,
+            cache_ttl=link_cache_ttl
+        )
+        # Link results for the current validate_patterns() run, failures
+        # included, so each URL is requested at most once per run
+        self._run_link_results: Optional[Dict[str, bool]] = None
 
         # Security patterns for detecting PII, secrets, API keys
         self.security_patterns = {
@@ -133,12 +306,30 @@ class BOKPatternValidator:
         patterns = self._get_pattern_files()
         validation_reports = {}
 
+        # Read every file first so links from all patterns are checked in one
+        # concurrent batch, instead of each file waiting on its own requests
+        contents = {}
         for pattern_file in patterns:
-            logger.info(f"Validating pattern: {pattern_file}")
             try:
                 # Read with UTF-8 encoding, handle encoding errors
                 with open(pattern_file, "r", encoding='utf-8', errors='replace') as f:
-                    content = f.read()
+                    contents[pattern_file] = f.read()
+            except Exception as e:
+                contents[pattern_file] = e
+
+        self._run_link_results = {}
+        if REQUESTS_AVAILABLE:
+            self._run_link_results = self.link_checker.check(
+                url for content in contents.values() if isinstance(content, str)
+                for url in self._extract_http_links(content)
+            )
+
+        for pattern_file in patterns:
+            logger.info(f"Validating pattern: {pattern_file}")
+            try:
+                content = contents[pattern_file]
+                if isinstance(content, Exception):
+                    raise content
 
                 report = self._validate_pattern(content)
                 report["file"] = str(pattern_file)
@@ -159,6 +350,8 @@ class BOKPatternValidator:
                     "quality_score": 0
                 }
 
+        self._run_link_results = None
+        self.link_checker.save_cache()
         return validation_reports
 
     def _get_pattern_files(self) -> List[Path]:
@@ -520,10 +713,21 @@ class BOKPatternValidator:
 
         return max(0, score)
 
+    def _extract_http_links(self, content: str) -> List[str]:
+        """Extract HTTP/HTTPS link targets from markdown links."""
+        return [
+            url for _, url in LINK_PATTERN.findall(content)
+            if url.startswith("http://") or url.startswith("https://")
+        ]
+
     def _check_broken_links(self, content: str) -> List[str]:
         """
         Check for broken HTTP/HTTPS links.
 
+        Unique links are checked concurrently. Results from the current
+        validate_patterns() run (including failures) or the link cache are
+        reused.
+
         Args:
             content: Full markdown content
 
@@ -534,27 +738,15 @@ class BOKPatternValidator:
             logger.warning("requests library not available - skipping link checks")
             return []
 
-        broken_links = []
-
-        # Extract HTTP/HTTPS links from markdown
-        link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-        links = re.findall(link_pattern, content)
-
-        for link_text, url in links:
-            # Only check HTTP/HTTPS links
-            if url.startswith("http://") or url.startswith("https://"):
-                try:
-                    response = requests.head(url, timeout=self.link_check_timeout, allow_redirects=True)
-                    if response.status_code >= 400:
-                        broken_links.append(url)
-                except requests.exceptions.Timeout:
-                    logger.warning(f"Timeout checking link: {url}")
-                    broken_links.append(url)
-                except requests.exceptions.RequestException as e:
-                    logger.warning(f"Error checking link {url}: {e}")
-                    broken_links.append(url)
+        links = self._extract_http_links(content)
+        if not links:
+            return []
 
-        return broken_links
+        results = self._run_link_results if self._run_link_results is not None else {}
+        missing = [url for url in links if url not in results]
+        if missing:
+            results.update(self.link_checker.check(missing))
+        return [url for url in links if results[url]]
 
     def _check_internal_links(self, content: str) -> List[str]:
         """
@@ -765,6 +957,8 @@ if __name__ == "__main__":
         sys.exit(1)
 
     bok_dir = sys.argv[1]
-    validator = BOKPatternValidator(bok_dir)
+    cache_dir = Path.cwd() / ".deia"
+    link_cache = cache_dir / "cache" / "bok-link-cache.json" if cache_dir.exists() else None
+    validator = BOKPatternValidator(bok_dir, link_cache_path=link_cache)
     reports = validator.validate_patterns()
     print(validator.generate_report(reports))
@@ -16,9 +16,11 @@ import sys
 import os
 import json
 import argparse
+import re
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Tuple, Union
 
 try:
     from rapidfuzz import fuzz
@@ -38,10 +40,13 @@ REPO_ROOT = Path(__file__).parent.parent.parent.parent
 INDEX_PATH = REPO_ROOT / ".deia" / "index" / "master-index.yaml"
 LOGS_DIR = REPO_ROOT / ".deia" / "logs"
 USAGE_LOG_PATH = LOGS_DIR / "librarian-queries.jsonl"
+COMPILED_INDEX_PATH = REPO_ROOT / ".deia" / "cache" / "master-index.compiled.json"
 
 # Configuration
 FUZZY_THRESHOLD = 80  # Minimum similarity score for fuzzy match (0-100)
 DEFAULT_LIMIT = 5     # Number of results to show
+FUZZY_CANDIDATE_LIMIT = 50  # Max terms scored per fuzzy keyword (by shared trigrams)
+COMPILED_INDEX_VERSION = 2
 
 
 def ensure_logs_dir():
@@ -80,7 +85,6 @@ def load_index() -> Dict:
 
 def extract_keywords(query: str) -> Set[str]:
     """Extract keywords from query string"""
-    import re
     tokens = re.findall(r'\w+', query.lower())
     return set(tokens)
 
@@ -105,8 +109,200 @@ def fuzzy_match(text: str, query_keywords: Set[str], threshold: int = FUZZY_THRE
     return best_score >= threshold, best_score
 
 
+def trigrams(term: str) -> Set[str]:
+    """Padded character trigrams of a term (short terms still get some)"""
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CompiledIndex:
+    """
+    Master index compiled for repeated queries.
+
+    Built once from the YAML index:
+    - keyword_docs: exact keyword (cluster keywords, doc keywords, title and
+      summary words) -> doc ids
+    - title_terms / summary_terms: tokenized title/summary term -> doc ids
+    - term_trigrams: trigram -> title/summary terms, so fuzzy matching only
+      scores terms that share trigrams with the query keyword
+    - urgency/audience/platform postings for filters
+    """
+
+    def __init__(self, index: Dict):
+        self.index = index
+        self.docs: List[Dict] = []
+        self.keyword_docs: Dict[str, Set[int]] = {}
+        self.title_terms: Dict[str, Set[int]] = {}
+        self.summary_terms: Dict[str, Set[int]] = {}
+        self.term_trigrams: Dict[str, Set[str]] = {}
+        self.urgency_docs: Dict[str, Set[int]] = {}
+        self.audience_docs: Dict[str, Set[int]] = {}
+        self.platform_docs: Dict[str, Set[int]] = {}
+        self.source_mtime_ns: Optional[int] = None
+        self._fuzzy_cache: Dict[Tuple[str, int], Tuple[Dict[int, int], Dict[int, int]]] = {}
+        self._compile()
+
+    def _compile(self):
+        for cluster_name, cluster_data in self.index.get('clusters', {}).items():
+            if not isinstance(cluster_data, dict):
+                continue
+
+            cluster_keywords = set(k.lower() for k in cluster_data.get('keywords', []))
+
+            documents = cluster_data.get('documents', [])
+            if not isinstance(documents, list):
+                continue
+
+            for doc in documents:
+                if not isinstance(doc, dict):
+                    continue
+
+                # Skip cross-reference IDs (strings without full metadata)
+                if not doc.get('path'):
+                    continue
+
+                doc_id = len(self.docs)
+                title = doc.get('title', '').lower()
+                summary = doc.get('summary', '').lower()
+                title_words = set(title.split())
+                summary_words = set(summary.split())
+                doc_keywords = set(k.lower() for k in doc.get('keywords', []))
+                self.docs.append({'doc': doc, 'cluster': cluster_name, 'title_words': title_words})
+
+                for keyword in cluster_keywords | doc_keywords | title_words | summary_words:
+                    self.keyword_docs.setdefault(keyword, set()).add(doc_id)
+                for term in re.findall(r'\w+', title):
+                    self.title_terms.setdefault(term, set()).add(doc_id)
+                for term in re.findall(r'\w+', summary):
+                    self.summary_terms.setdefault(term, set()).add(doc_id)
+
+                self.urgency_docs.setdefault((doc.get('urgency') or '').lower(), set()).add(doc_id)
+                self.audience_docs.setdefault((doc.get('audience') or '').lower(), set()).add(doc_id)
+                for platform in doc.get('platforms', []):
+                    self.platform_docs.setdefault(platform.lower(), set()).add(doc_id)
+
+        for term in set(self.title_terms) | set(self.summary_terms):
+            for gram in trigrams(term):
+                self.term_trigrams.setdefault(gram, set()).add(term)
+
+    _POSTINGS = ('keyword_docs', 'title_terms', 'summary_terms', 'term_trigrams',
+                 'urgency_docs', 'audience_docs', 'platform_docs')
+
+    def to_state(self) -> Dict:
+        """JSON-serializable form of the compiled index (sets become sorted lists)"""
+        state = {name: {key: sorted(values) for key, values in getattr(self, name).items()}
+                 for name in self._POSTINGS}
+        state['index'] = self.index
+        state['docs'] = [dict(entry, title_words=sorted(entry['title_words'])) for entry in self.docs]
+        state['source_mtime_ns'] = self.source_mtime_ns
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict) -> 'CompiledIndex':
+        """Rebuild a compiled index from to_state() output without recompiling"""
+        compiled = cls.__new__(cls)
+        for name in cls._POSTINGS:
+            setattr(compiled, name, {key: set(values) for key, values in state[name].items()})
+        compiled.index = state['index']
+        compiled.docs = [dict(entry, title_words=set(entry['title_words'])) for entry in state['docs']]
+        compiled.source_mtime_ns = state['source_mtime_ns']
+        compiled._fuzzy_cache = {}
+        return compiled
+
+    def filtered_docs(self, urgency_filter: Optional[str] = None,
+                      platform_filter: Optional[str] = None,
+                      audience_filter: Optional[str] = None) -> Set[int]:
+        """Doc ids passing all filters, answered from the filter postings"""
+        allowed = set(range(len(self.docs)))
+        if urgency_filter:
+            allowed &= self.urgency_docs.get(urgency_filter.lower(), set())
+        if platform_filter:
+            allowed &= self.platform_docs.get(platform_filter.lower(), set())
+        if audience_filter:
+            allowed &= self.audience_docs.get(audience_filter.lower(), set())
+        return allowed
+
+    def fuzzy_docs(self, keyword: str, threshold: int = FUZZY_THRESHOLD) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """
+        Fuzzy-match a keyword against title and summary terms.
+
+        Only the FUZZY_CANDIDATE_LIMIT terms sharing the most trigrams with
+        the keyword are scored. Returns ({doc_id: score} for title matches,
+        {doc_id: score} for summary matches).
+        """
+        cache_key = (keyword, threshold)
+        if cache_key in self._fuzzy_cache:
+            return self._fuzzy_cache[cache_key]
+
+        shared = Counter()
+        for gram in trigrams(keyword):
+            shared.update(self.term_trigrams.get(gram, ()))
+
+        title_hits: Dict[int, int] = {}
+        summary_hits: Dict[int, int] = {}
+        if FUZZY_AVAILABLE:
+            for term, _ in shared.most_common(FUZZY_CANDIDATE_LIMIT):
+                score = int(fuzz.partial_ratio(keyword, term))
+                if score < threshold:
+                    continue
+                for hits, postings in ((title_hits, self.title_terms), (summary_hits, self.summary_terms)):
+                    for doc_id in postings.get(term, ()):
+                        if score > hits.get(doc_id, 0):
+                            hits[doc_id] = score
+
+        self._fuzzy_cache[cache_key] = (title_hits, summary_hits)
+        return title_hits, summary_hits
+
+
+_last_compiled: Optional[Tuple[int, CompiledIndex]] = None
+
+
+def _index_fingerprint(index: Dict) -> int:
+    """Content fingerprint of an index dict, so in-place edits are noticed"""
+    return hash(json.dumps(index, default=str))
+
+
+def compile_index(index: Dict) -> CompiledIndex:
+    """Compile an index, reusing the last compilation while its content is unchanged"""
+    global _last_compiled
+    fingerprint = _index_fingerprint(index)
+    if _last_compiled is None or _last_compiled[0] != fingerprint or _last_compiled[1].index is not index:
+        _last_compiled = (fingerprint, CompiledIndex(index))
+    return _last_compiled[1]
+
+
+def load_compiled_index() -> CompiledIndex:
+    """Load the compiled index from cache, recompiling if the YAML changed"""
+    if not INDEX_PATH.exists():
+        print(f"Error: Index file not found at {INDEX_PATH}")
+        sys.exit(1)
+
+    source_mtime_ns = INDEX_PATH.stat().st_mtime_ns
+    try:
+        with open(COMPILED_INDEX_PATH, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') == COMPILED_INDEX_VERSION and state.get('source_mtime_ns') == source_mtime_ns:
+            return CompiledIndex.from_state(state['data'])
+    except Exception:
+        # Missing, stale or unreadable cache: rebuild from the YAML
+        pass
+
+    compiled = CompiledIndex(load_index())
+    compiled.source_mtime_ns = source_mtime_ns
+    try:
+        COMPILED_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        state = {'version': COMPILED_INDEX_VERSION, 'source_mtime_ns': source_mtime_ns, 'data': compiled.to_state()}
+        temp_path = COMPILED_INDEX_PATH.with_name(COMPILED_INDEX_PATH.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, default=str)
+        os.replace(temp_path, COMPILED_INDEX_PATH)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Failed to cache compiled index: {e}", file=sys.stderr)
+    return compiled
+
+
 def search_index(
-    index: Dict,
+    index: Union[Dict, CompiledIndex],
     query_keywords: Set[str],
     logic_mode: str = "AND",
     urgency_filter: Optional[str] = None,
@@ -118,7 +314,7 @@ def search_index(
     Search index for matching documents with advanced filtering
 
     Args:
-        index: Loaded index data
+        index: Loaded index data (or a CompiledIndex)
         query_keywords: Set of keywords to search for
         logic_mode: "AND" (all keywords) or "OR" (any keyword)
         urgency_filter: Filter by urgency level (critical, high, medium, low)
@@ -126,124 +322,61 @@ def search_index(
         audience_filter: Filter by audience
         use_fuzzy: Enable fuzzy matching for typo tolerance
     """
-    results = []
-
-    # Search through clusters
-    for cluster_name, cluster_data in index.get('clusters', {}).items():
-        if not isinstance(cluster_data, dict):
-            continue
-
-        # Check cluster keywords
-        cluster_keywords = set(k.lower() for k in cluster_data.get('keywords', []))
-
-        # Search documents in cluster
-        documents = cluster_data.get('documents', [])
-        if not isinstance(documents, list):
-            continue
+    compiled = index if isinstance(index, CompiledIndex) else compile_index(index)
+    allowed = compiled.filtered_docs(urgency_filter, platform_filter, audience_filter)
+    use_fuzzy = use_fuzzy and FUZZY_AVAILABLE
+
+    # Per keyword: exact doc ids, fuzzy title hits, fuzzy summary hits
+    matches = {}
+    for kw in query_keywords:
+        exact = compiled.keyword_docs.get(kw, set())
+        title_hits, summary_hits = compiled.fuzzy_docs(kw) if use_fuzzy else ({}, {})
+        matches[kw] = (exact, title_hits, summary_hits)
+
+    candidates = None
+    for exact, title_hits, summary_hits in matches.values():
+        docs = exact | title_hits.keys() | summary_hits.keys()
+        if logic_mode == "AND":
+            candidates = docs if candidates is None else candidates & docs
+        else:
+            candidates = docs if candidates is None else candidates | docs
+    candidates = (candidates or set()) & allowed
 
-        for doc in documents:
-            if not isinstance(doc, dict):
-                continue
-
-            # Skip cross-reference IDs (strings without full metadata)
-            if not doc.get('path'):
-                continue
-
-            # Apply filters first
-            if urgency_filter and doc.get('urgency', '').lower() != urgency_filter.lower():
-                continue
-
-            if platform_filter:
-                doc_platforms = [p.lower() for p in doc.get('platforms', [])]
-                if platform_filter.lower() not in doc_platforms:
-                    continue
-
-            if audience_filter and doc.get('audience', '').lower() != audience_filter.lower():
-                continue
-
-            # Check doc keywords
-            doc_keywords = set(k.lower() for k in doc.get('keywords', []))
-
-            # Combine all searchable text
-            title_words = set(doc.get('title', '').lower().split())
-            summary_words = set(doc.get('summary', '').lower().split())
-            all_doc_keywords = cluster_keywords | doc_keywords | title_words | summary_words
-
-            # Calculate match score
-            score = 0
-            matched_keywords = set()
-            fuzzy_matches = []
-
-            # Exact keyword matching
-            exact_matches = query_keywords & all_doc_keywords
-
-            if logic_mode == "AND":
-                # AND mode: all keywords must match (exact or fuzzy)
-                keywords_matched = 0
-
-                for kw in query_keywords:
-                    if kw in all_doc_keywords:
-                        keywords_matched += 1
-                        matched_keywords.add(kw)
-                        score += 2
-                    elif use_fuzzy and FUZZY_AVAILABLE:
-                        # Try fuzzy matching on title and summary
-                        title_match, title_score = fuzzy_match(doc.get('title', ''), {kw})
-                        summary_match, summary_score = fuzzy_match(doc.get('summary', ''), {kw})
-
-                        if title_match:
-                            keywords_matched += 1
-                            matched_keywords.add(kw)
-                            score += 1
-                            fuzzy_matches.append(f"{kw}~{title_score}")
-                        elif summary_match:
-                            keywords_matched += 1
-                            matched_keywords.add(kw)
-                            score += 0.5
-                            fuzzy_matches.append(f"{kw}~{summary_score}")
-
-                # Skip if not all keywords matched in AND mode
-                if keywords_matched < len(query_keywords):
-                    continue
-
-            else:  # OR mode
-                # OR mode: any keyword match is good
-                if exact_matches:
-                    matched_keywords.update(exact_matches)
-                    score += len(exact_matches) * 2
-
-                # Try fuzzy for unmatched keywords
-                if use_fuzzy and FUZZY_AVAILABLE:
-                    for kw in query_keywords - exact_matches:
-                        title_match, title_score = fuzzy_match(doc.get('title', ''), {kw})
-                        summary_match, summary_score = fuzzy_match(doc.get('summary', ''), {kw})
-
-                        if title_match:
-                            matched_keywords.add(kw)
-                            score += 1
-                            fuzzy_matches.append(f"{kw}~{title_score}")
-                        elif summary_match:
-                            matched_keywords.add(kw)
-                            score += 0.5
-                            fuzzy_matches.append(f"{kw}~{summary_score}")
-
-                # Skip if no matches at all in OR mode
-                if not matched_keywords:
-                    continue
-
-            # Boost score for title matches
-            if query_keywords & title_words:
-                score += 3
-
-            # Add to results
-            if score > 0:
-                results.append({
-                    'doc': doc,
-                    'cluster': cluster_name,
-                    'score': score,
-                    'matched_keywords': matched_keywords,
-                    'fuzzy_matches': fuzzy_matches
-                })
+    results = []
+    for doc_id in sorted(candidates):
+        entry = compiled.docs[doc_id]
+
+        # Calculate match score
+        score = 0
+        matched_keywords = set()
+        fuzzy_matches = []
+
+        for kw, (exact, title_hits, summary_hits) in matches.items():
+            if doc_id in exact:
+                matched_keywords.add(kw)
+                score += 2
+            elif doc_id in title_hits:
+                matched_keywords.add(kw)
+                score += 1
+                fuzzy_matches.append(f"{kw}~{title_hits[doc_id]}")
+            elif doc_id in summary_hits:
+                matched_keywords.add(kw)
+                score += 0.5
+                fuzzy_matches.append(f"{kw}~{summary_hits[doc_id]}")
+
+        # Boost score for title matches
+        if query_keywords & entry['title_words']:
+            score += 3
+
+        # Add to results
+        if score > 0:
+            results.append({
+                'doc': entry['doc'],
+                'cluster': entry['cluster'],
+                'score': score,
+                'matched_keywords': matched_keywords,
+                'fuzzy_matches': fuzzy_matches
+            })
 
     # Sort by score (highest first)
     results.sort(key=lambda x: x['score'], reverse=True)
@@ -337,7 +470,8 @@ def main():
 
     # Load index
     print("Loading index...")
-    index = load_index()
+    compiled = load_compiled_index()
+    index = compiled.index
     print(f"Loaded {index.get('total_documents', 0)} documents in {index.get('total_clusters', 0)} clusters\n")
 
     # Display search parameters
@@ -364,7 +498,7 @@ def main():
     print(f"Keywords: {', '.join(sorted(keywords))}\n")
 
     results = search_index(
-        index,
+        compiled,
         keywords,
         logic_mode=logic_mode,
         urgency_filter=args.urgency,
@@ -10,12 +10,14 @@ from dataclasses import dataclass, field
 from enum import Enum
 import uuid
 import time
+import heapq
+import itertools
 import threading
 from datetime import datetime, timedelta
 import logging
 import json
-from collections import deque, defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,8 @@ class TaskDefinition:
     timeout: Optional[float] = None
     condition: Optional[Callable[[Dict[str, Any]], bool]] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    priority: int = 0  # Lower runs first when several tasks are ready
+    cpu_bound: bool = False  # Run in a process pool (handler and inputs must be picklable)
 
 
 @dataclass
@@ -145,7 +149,8 @@ class WorkflowBuilder:
 
     def add_task(self, task_id: str, name: str, handler: Callable, depends_on: List[str] = None,
                  retries: int = 0, timeout: Optional[float] = None,
-                 condition: Optional[Callable] = None) -> "WorkflowBuilder":
+                 condition: Optional[Callable] = None, priority: int = 0,
+                 cpu_bound: bool = False) -> "WorkflowBuilder":
         """Add task to workflow."""
         self.tasks[task_id] = TaskDefinition(
             task_id=task_id,
@@ -154,7 +159,9 @@ class WorkflowBuilder:
             depends_on=depends_on or [],
             retries=retries,
             timeout=timeout,
-            condition=condition
+            condition=condition,
+            priority=priority,
+            cpu_bound=cpu_bound
         )
 
         if self.start_task is None:
@@ -180,14 +187,40 @@ class WorkflowBuilder:
 
 # ===== EXECUTION ENGINE =====
 
-class WorkflowExecutor:
-    """Execute workflows with state management."""
+def _run_handler(handler: Callable[[Dict[str, Any]], Any], context: Dict[str, Any],
+                 task_exec: TaskExecution) -> Any:
+    """Thread-pool entry point: record the real start time, then run the handler."""
+    if task_exec.start_time is None:
+        task_exec.start_time = time.time()
+    return handler(context)
 
-    def __init__(self, max_workers: int = 4):
+
+class WorkflowExecutor:
+    """
+    Execute workflows with state management.
+
+    Scheduling is event-driven: each task's unfinished-dependency count is
+    computed once along with a reverse-dependency map, and a task joins the
+    priority-ordered ready heap when its count reaches zero. A dependent
+    runs once all of its dependencies have finished, whatever their status;
+    use `condition` to skip it on upstream failure.
+
+    Timeouts are enforced by the scheduler thread (works from any thread):
+    a task that exceeds its timeout is marked failed or retried and its
+    late result is ignored. Python cannot interrupt a running thread, so a
+    hung thread handler keeps its worker until it returns; cpu_bound tasks
+    run in a process pool instead.
+    """
+
+    def __init__(self, max_workers: int = 4, process_workers: Optional[int] = None,
+                 retry_delay: float = 1.0):
         """Initialize executor."""
         self.max_workers = max_workers
+        self.process_workers = process_workers
+        self.retry_delay = retry_delay
         self.lock = threading.RLock()
         self.executions: Dict[str, WorkflowExecution] = {}
+        self._cancel_signals: Dict[str, Future] = {}
 
     def execute(self, workflow: WorkflowDefinition) -> WorkflowExecution:
         """Execute workflow."""
@@ -199,6 +232,7 @@ class WorkflowExecutor:
 
         with self.lock:
             self.executions[execution.execution_id] = execution
+            self._cancel_signals[execution.execution_id] = Future()
 
         execution.start_time = time.time()
         execution.status = WorkflowStatus.RUNNING
@@ -206,7 +240,9 @@ class WorkflowExecutor:
         try:
             self._execute_tasks(workflow, execution)
 
-            if any(t.status == TaskStatus.FAILED for t in execution.tasks.values()):
+            if execution.status == WorkflowStatus.CANCELLED:
+                pass
+            elif any(t.status == TaskStatus.FAILED for t in execution.tasks.values()):
                 execution.status = WorkflowStatus.FAILED
             else:
                 execution.status = WorkflowStatus.SUCCESS
@@ -214,108 +250,212 @@ class WorkflowExecutor:
         except Exception as e:
             execution.status = WorkflowStatus.FAILED
             execution.errors.append(str(e))
+        finally:
+            with self.lock:
+                self._cancel_signals.pop(execution.execution_id, None)
 
         execution.end_time = time.time()
         return execution
 
-    def _execute_tasks(self, workflow: WorkflowDefinition, execution: WorkflowExecution) -> None:
-        """Execute tasks with dependency ordering."""
-        executed = set()
-        ready_queue = deque()
+    @staticmethod
+    def _plan(workflow: WorkflowDefinition) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+        """
+        Build dependency counts and the reverse-dependency map.
+
+        Raises:
+            ValueError: If a task depends on an unknown task or the graph has a cycle
+        """
+        indegree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for task_id, task_def in workflow.tasks.items():
+            deps = set(task_def.depends_on)
+            for dep in deps:
+                if dep not in workflow.tasks:
+                    raise ValueError(f"Task {task_id} depends on unknown task {dep}")
+                dependents[dep].append(task_id)
+            indegree[task_id] = len(deps)
+
+        # Kahn's algorithm: anything left unvisited sits on a cycle
+        remaining = dict(indegree)
+        stack = [task_id for task_id, count in remaining.items() if count == 0]
+        visited = 0
+        while stack:
+            task_id = stack.pop()
+            visited += 1
+            for child in dependents.get(task_id, ()):
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    stack.append(child)
+        if visited != len(indegree):
+            cyclic = sorted(t for t, count in remaining.items() if count > 0)
+            raise ValueError(f"Workflow has a dependency cycle involving: {', '.join(cyclic[:10])}")
+
+        return indegree, dependents
 
-        # Find all starting tasks (no dependencies or dependencies in ready_queue)
-        if workflow.start_task and workflow.start_task in workflow.tasks:
-            ready_queue.append(workflow.start_task)
+    def _execute_tasks(self, workflow: WorkflowDefinition, execution: WorkflowExecution) -> None:
+        """Execute tasks in dependency order, highest priority first."""
+        tasks = workflow.tasks
+        indegree, dependents = self._plan(workflow)
+        cancel_signal = self._cancel_signals[execution.execution_id]
+
+        for task_id, task_def in tasks.items():
+            execution.tasks[task_id] = TaskExecution(task_id=task_id, name=task_def.name)
+
+        seq = itertools.count()
+        ready: List[Tuple[int, int, str]] = []  # (priority, seq, task_id)
+        delayed: List[Tuple[float, int, str]] = []  # retries waiting out their backoff
+        for task_id, count in indegree.items():
+            if count == 0:
+                heapq.heappush(ready, (tasks[task_id].priority, next(seq), task_id))
+
+        running: Dict[Future, Tuple[str, Optional[float]]] = {}  # future -> (task_id, deadline)
+        running_counts = {False: 0, True: 0}  # keyed by cpu_bound
+        hung: Dict[Future, bool] = {}  # timed-out future still holding a worker -> cpu_bound
+        limits = {False: self.max_workers, True: self.process_workers or self.max_workers}
+        remaining = len(tasks)
+        abandoned = False  # a timed-out handler may still be running
+
+        thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        process_pool = None
+        if any(t.cpu_bound for t in tasks.values()):
+            process_pool = ProcessPoolExecutor(max_workers=limits[True])
+
+        def finish(task_id: str, status: TaskStatus) -> None:
+            nonlocal remaining
+            task_exec = execution.tasks[task_id]
+            task_exec.status = status
+            task_exec.end_time = time.time()
+            remaining -= 1
+            for child in dependents.get(task_id, ()):
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    heapq.heappush(ready, (tasks[child].priority, next(seq), child))
+
+        def fail(task_id: str, error: str) -> None:
+            task_exec = execution.tasks[task_id]
+            if task_exec.attempts <= tasks[task_id].retries:
+                task_exec.status = TaskStatus.RETRYING
+                heapq.heappush(delayed, (time.time() + self.retry_delay, next(seq), task_id))
+                return
+            task_exec.error = error
+            execution.errors.append(f"{task_id}: {error}")
+            finish(task_id, TaskStatus.FAILED)
+
+        def submit(task_id: str) -> None:
+            task_def = tasks[task_id]
+            task_exec = execution.tasks[task_id]
+            if task_exec.attempts == 0 and task_def.condition:
+                try:
+                    should_run = task_def.condition(execution.outputs)
+                except Exception as e:
+                    task_exec.error = f"condition error: {e}"
+                    execution.errors.append(f"{task_id}: {task_exec.error}")
+                    finish(task_id, TaskStatus.FAILED)
+                    return
+                if not should_run:
+                    finish(task_id, TaskStatus.SKIPPED)
+                    return
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {}
+            task_exec.attempts += 1
+            task_exec.status = TaskStatus.RUNNING
+            context = {dep: execution.tasks[dep].result for dep in task_def.depends_on}
+            if task_def.cpu_bound:
+                if task_exec.start_time is None:
+                    task_exec.start_time = time.time()
+                future = process_pool.submit(task_def.handler, context)
+            else:
+                future = thread_pool.submit(_run_handler, task_def.handler, context, task_exec)
+            deadline = time.time() + task_def.timeout if task_def.timeout else None
+            running[future] = (task_id, deadline)
+            running_counts[task_def.cpu_bound] += 1
 
-            while ready_queue or futures:
-                # Submit ready tasks
-                while ready_queue:
-                    task_id = ready_queue.popleft()
+        try:
+            while remaining:
+                if cancel_signal.done():
+                    self._skip_unfinished(execution, running)
+                    return
 
-                    if task_id in executed:
+                now = time.time()
+                while delayed and delayed[0][0] <= now:
+                    _, _, task_id = heapq.heappop(delayed)
+                    heapq.heappush(ready, (tasks[task_id].priority, next(seq), task_id))
+
+                # A timed-out handler keeps its worker until it actually returns
+                for future in [f for f in hung if f.done()]:
+                    running_counts[hung.pop(future)] -= 1
+
+                # Fill free worker slots from the ready heap, skipping tasks whose pool is full
+                blocked = []
+                while ready:
+                    entry = heapq.heappop(ready)
+                    cpu_bound = tasks[entry[2]].cpu_bound
+                    if running_counts[cpu_bound] >= limits[cpu_bound]:
+                        blocked.append(entry)
+                        if running_counts[not cpu_bound] >= limits[not cpu_bound]:
+                            break
                         continue
-
-                    task_def = workflow.tasks[task_id]
-                    task_exec = TaskExecution(task_id=task_id, name=task_def.name)
-                    execution.tasks[task_id] = task_exec
-
-                    # Check if dependencies are ready
-                    if all(dep in executed for dep in task_def.depends_on):
-                        future = executor.submit(
-                            self._execute_task,
-                            task_def,
-                            task_exec,
-                            execution
-                        )
-                        futures[future] = task_id
-
-                # Wait for at least one task to complete
-                if futures:
-                    done_futures, _ = next(iter([as_completed(futures, timeout=1)]))
-
-                    for future in done_futures:
-                        task_id = futures.pop(future)
-                        executed.add(task_id)
-
-                        # Find next ready tasks
-                        for other_task_id, other_task in workflow.tasks.items():
-                            if other_task_id not in executed and task_id in other_task.depends_on:
-                                ready_queue.append(other_task_id)
-
-    def _execute_task(self, task_def: TaskDefinition, task_exec: TaskExecution,
-                      execution: WorkflowExecution) -> None:
-        """Execute single task with retry logic."""
-        task_exec.status = TaskStatus.RUNNING
-        task_exec.start_time = time.time()
-
-        for attempt in range(task_def.retries + 1):
-            try:
-                task_exec.attempts = attempt + 1
-
-                if task_def.condition:
-                    if not task_def.condition(execution.outputs):
-                        task_exec.status = TaskStatus.SKIPPED
-                        task_exec.end_time = time.time()
-                        return
-
-                # Get dependencies outputs
-                context = {dep: execution.tasks[dep].result for dep in task_def.depends_on}
-
-                # Execute with timeout
-                if task_def.timeout:
-                    import signal
-
-                    def timeout_handler(signum, frame):
-                        raise TimeoutError(f"Task {task_def.task_id} timeout")
-
-                    signal.signal(signal.SIGALRM, timeout_handler)
-                    signal.alarm(int(task_def.timeout))
-
-                result = task_def.handler(context)
-
-                if task_def.timeout:
-                    signal.alarm(0)
-
-                task_exec.result = result
-                task_exec.status = TaskStatus.SUCCESS
-                execution.outputs[task_def.task_id] = result
-
-                task_exec.end_time = time.time()
-                return
-
-            except Exception as e:
-                if attempt < task_def.retries:
-                    task_exec.status = TaskStatus.RETRYING
-                    time.sleep(1)  # Backoff
-                else:
-                    task_exec.status = TaskStatus.FAILED
-                    task_exec.error = str(e)
-                    execution.errors.append(f"{task_def.task_id}: {str(e)}")
-                    task_exec.end_time = time.time()
-                    return
+                    submit(entry[2])
+                for entry in blocked:
+                    heapq.heappush(ready, entry)
+
+                if not running:
+                    if not delayed and not hung:
+                        raise RuntimeError("Workflow scheduler stalled with unfinished tasks")
+                    timeout = max(0.0, delayed[0][0] - time.time()) if delayed else None
+                    wait([cancel_signal, *hung], timeout=timeout, return_when=FIRST_COMPLETED)
+                    continue
+
+                wakeups = [d for _, d in running.values() if d is not None]
+                if delayed:
+                    wakeups.append(delayed[0][0])
+                timeout = max(0.0, min(wakeups) - time.time()) if wakeups else None
+                done, _ = wait(list(running) + list(hung) + [cancel_signal], timeout=timeout,
+                               return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if future is cancel_signal or future in hung:
+                        continue
+                    task_id, _ = running.pop(future)
+                    running_counts[tasks[task_id].cpu_bound] -= 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        fail(task_id, str(e))
+                        continue
+                    execution.tasks[task_id].result = result
+                    execution.outputs[task_id] = result
+                    finish(task_id, TaskStatus.SUCCESS)
+
+                now = time.time()
+                for future, (task_id, deadline) in list(running.items()):
+                    if deadline is not None and deadline <= now and not future.done():
+                        # Can't interrupt the handler; stop waiting for it and ignore its result
+                        future.cancel()
+                        del running[future]
+                        hung[future] = tasks[task_id].cpu_bound
+                        abandoned = True
+                        fail(task_id, f"Task {task_id} timeout")
+        finally:
+            # Drop queued work ourselves; shutdown(cancel_futures=...) needs 3.9+
+            for future in running:
+                future.cancel()
+            block = not (running or abandoned)
+            thread_pool.shutdown(wait=block)
+            if process_pool is not None:
+                process_pool.shutdown(wait=block)
+
+    @staticmethod
+    def _skip_unfinished(execution: WorkflowExecution, running: Dict[Future, Tuple[str, Optional[float]]]) -> None:
+        """Mark every task that has not finished as skipped after cancellation."""
+        for future in running:
+            future.cancel()
+        now = time.time()
+        for task_exec in execution.tasks.values():
+            if task_exec.status in (TaskStatus.PENDING, TaskStatus.READY,
+                                    TaskStatus.RUNNING, TaskStatus.RETRYING):
+                task_exec.status = TaskStatus.SKIPPED
+                task_exec.error = "cancelled"
+                task_exec.end_time = now
 
     def get_execution(self, execution_id: str) -> Optional[WorkflowExecution]:
         """Get execution by ID."""
@@ -328,10 +468,14 @@ class WorkflowExecutor:
         return execution.status if execution else None
 
     def cancel_execution(self, execution_id: str) -> None:
-        """Cancel execution."""
-        execution = self.get_execution(execution_id)
-        if execution:
-            execution.status = WorkflowStatus.CANCELLED
+        """Cancel execution; running tasks finish but no new tasks start."""
+        with self.lock:
+            execution = self.executions.get(execution_id)
+            cancel_signal = self._cancel_signals.get(execution_id)
+            if execution:
+                execution.status = WorkflowStatus.CANCELLED
+            if cancel_signal is not None and not cancel_signal.done():
+                cancel_signal.set_result(True)
 
 
 # ===== STATE MANAGEMENT =====
@@ -1,6 +1,7 @@
 """
 Pytest configuration and shared fixtures for DEIA tests
 """
+import os
 import pytest
 import tempfile
 import shutil
@@ -8,6 +9,16 @@ from pathlib import Path
 import json
 
 
+# Keep apps that open a chat database at import time (chat_interface_app)
+# off the repository's tracked .deia/chat_history.db
+_CHAT_DB_DIR = tempfile.mkdtemp(prefix="deia-chat-db-")
+os.environ.setdefault("DEIA_CHAT_DB", str(Path(_CHAT_DB_DIR) / "chat_history.db"))
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_CHAT_DB_DIR, ignore_errors=True)
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test isolation"""
@@ -0,0 +1 @@
+"""Performance benchmarks for DEIA hot paths (marked slow)"""
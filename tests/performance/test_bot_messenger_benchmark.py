@@ -0,0 +1,48 @@
+"""
+Benchmark: BotMessenger delivery with a large outgoing queue.
+
+Run with: pytest tests/performance -m slow -s
+"""
+
+import time
+import pytest
+from src.deia.services.bot_messenger import BotMessenger, MessageStatus
+
+
+QUEUED_MESSAGES = 100_000
+
+
+@pytest.mark.slow
+def test_process_100k_queued_messages(tmp_path):
+    """100k queued messages deliver in priority order within seconds."""
+    messenger = BotMessenger(tmp_path, max_history=1000)
+    messenger._log_event = lambda *args, **kwargs: None  # Measure queueing, not disk
+
+    priorities = ["P0", "P1", "P2", "P3"]
+    start = time.perf_counter()
+    for i in range(QUEUED_MESSAGES):
+        messenger.send_message(f"bot-{i % 10}", f"bot-{i % 50}", f"msg {i}", priorities[i % 4])
+    enqueue_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = messenger.process_outgoing_queue()
+    deliver_s = time.perf_counter() - start
+
+    assert len(result["delivered"]) == QUEUED_MESSAGES
+    assert result["pending"] == 0
+    assert len(messenger.message_history) == 1000
+
+    # Per-priority inbox index and O(1) mark_read
+    inbox = messenger.get_inbox("bot-0")
+    p0 = messenger.retrieve_messages("bot-0", "P0")
+    assert all(m["priority"] == "P0" for m in p0)
+    start = time.perf_counter()
+    for message in inbox.messages:
+        inbox.mark_read(message.message_id)
+    mark_s = time.perf_counter() - start
+    assert all(m.status == MessageStatus.READ for m in inbox.messages)
+
+    print(f"\nenqueue {QUEUED_MESSAGES}: {enqueue_s:.2f}s, deliver: {deliver_s:.2f}s, "
+          f"mark_read {len(inbox)}: {mark_s * 1000:.1f}ms")
+    # Generous bound: the old list.remove loop took minutes at this size
+    assert deliver_s < 30
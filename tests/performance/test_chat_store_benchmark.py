@@ -0,0 +1,57 @@
+"""
+Benchmark: ChatDatabase inserts, latest-page reads and full-text search.
+
+Defaults to 200k messages; set DEIA_CHAT_BENCH_MESSAGES=10000000 for the
+full-size run.
+
+Run with: pytest tests/performance -m slow -s
+"""
+
+import os
+import time
+
+import pytest
+
+from src.deia.services.chat_database import ChatDatabase
+
+
+MESSAGES = int(os.environ.get("DEIA_CHAT_BENCH_MESSAGES", "200000"))
+BOTS = 100
+
+
+@pytest.mark.slow
+def test_chat_history_insert_and_page(tmp_path):
+    db = ChatDatabase(str(tmp_path / "bench.db"))
+
+    start = time.perf_counter()
+    for i in range(MESSAGES):
+        db.add_message(f"BOT-{i % BOTS:03d}", "user" if i % 2 else "assistant", f"message body {i}")
+    db.flush()
+    insert_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reads = 0
+    for n in range(BOTS):
+        before_id = None
+        for _ in range(5):
+            page = db.get_messages(f"BOT-{n:03d}", limit=50, before_id=before_id)
+            before_id = page[0]["id"]
+            reads += 1
+    read_seconds = time.perf_counter() - start
+
+    print(
+        f"\n{MESSAGES:,} inserts: {MESSAGES / insert_seconds:,.0f} msg/s; "
+        f"{reads} page reads: {read_seconds / reads * 1000:.2f} ms/page"
+    )
+    start = time.perf_counter()
+    hits = db.search("body", bot_id="BOT-042", limit=20)
+    exact = db.search(str(MESSAGES - 1))
+    search_seconds = time.perf_counter() - start
+    print(f"2 searches: {search_seconds * 1000:.1f} ms")
+    assert len(hits) == 20
+    assert exact[0]["bot_id"] == f"BOT-{(MESSAGES - 1) % BOTS:03d}"
+
+    latest = db.get_messages("BOT-099", limit=1)
+    assert latest[0]["content"] == f"message body {MESSAGES - 1}"
+    assert read_seconds / reads < 0.05
+    db.close()
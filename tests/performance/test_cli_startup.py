@@ -0,0 +1,94 @@
+"""
+Benchmark: `deia` startup cost, measured with `python -X importtime`.
+
+Importing the library must not pull in the CLI, and starting the CLI must
+not import rich or service modules until a command needs them.
+
+Run with: pytest tests/performance/test_cli_startup.py -s
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Modules that only specific commands need
+HEAVY_MODULES = [
+    "rich",
+    "deia.core",
+    "deia.bok",
+    "deia.installer",
+    "deia.logger",
+    "deia.minutes",
+    "deia.services.telemetry_etl",
+]
+
+CLI_IMPORT_BUDGET_US = 300_000
+
+
+def import_times(code):
+    """Run code under -X importtime and return {module: cumulative microseconds}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); {code}"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def heavy_imports(times):
+    return [m for m in times if any(m == h or m.startswith(h + ".") for h in HEAVY_MODULES)]
+
+
+def test_import_deia_does_not_load_cli():
+    times = import_times("import deia")
+    assert "deia.cli" not in times
+    assert "click" not in times
+    assert heavy_imports(times) == []
+
+
+def test_cli_help_does_not_load_command_dependencies():
+    times = import_times("from deia.cli import main; main(['--help'], standalone_mode=False)")
+    assert "deia.cli" in times
+    assert heavy_imports(times) == []
+
+
+def loaded_after(args):
+    """Run the CLI with args and return the deia modules it imported."""
+    code = (
+        f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); from deia.cli import main; "
+        f"main({args!r}, standalone_mode=False); "
+        "print(' '.join(m for m in sys.modules if m.startswith('deia.')))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return set(result.stdout.splitlines()[-1].split())
+
+
+def test_lazy_group_imported_only_when_invoked():
+    # importtime does not report importlib.import_module() loads, so check sys.modules
+    assert "deia.cli_doctor" not in loaded_after(["status", "--help"])
+    modules = loaded_after(["doctor", "--help"])
+    assert "deia.cli_doctor" in modules
+    assert "deia.doctor" not in modules
+
+
+@pytest.mark.slow
+def test_cli_import_time_budget():
+    """Best of 3 to keep scheduler noise out of the measurement."""
+    best = min(import_times("import deia.cli")["deia.cli"] for _ in range(3))
+    print(f"\nimport deia.cli: {best / 1000:.1f} ms (budget {CLI_IMPORT_BUDGET_US / 1000:.0f} ms)")
+    assert best < CLI_IMPORT_BUDGET_US
@@ -0,0 +1,35 @@
+"""
+Benchmark: FeatureFlagManager.evaluate on a targeted, partially rolled-out flag.
+
+Run with: pytest tests/performance -m slow -s
+"""
+
+import time
+
+import pytest
+
+from src.deia.services.feature_flags import FeatureFlagManager
+
+
+EVALUATIONS = 200000
+
+
+@pytest.mark.slow
+def test_flag_evaluation_throughput(tmp_path):
+    manager = FeatureFlagManager(tmp_path, flush_interval=None)
+    flag = manager.create_flag("checkout_v2", enabled=True, rollout_percentage=30)
+    flag.target_users = [f"user-{i}" for i in range(0, 10000, 2)]
+    users = [f"user-{i}" for i in range(10000)]
+
+    start = time.perf_counter()
+    enabled = 0
+    for i in range(EVALUATIONS):
+        enabled += manager.evaluate("checkout_v2", users[i % len(users)])
+    seconds = time.perf_counter() - start
+    manager.close()
+
+    print(f"\n{EVALUATIONS:,} evaluations: {seconds / EVALUATIONS * 1e6:.2f} us/eval")
+    assert 0 < enabled < EVALUATIONS / 2
+    assert sum(manager.get_evaluation_counts()["checkout_v2"].values()) == EVALUATIONS
+    # One aggregated line, not one per evaluation
+    assert len(manager.evaluations_log.read_text().splitlines()) == 1
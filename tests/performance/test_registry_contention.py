@@ -0,0 +1,59 @@
+"""
+Benchmark: ServiceRegistry under multi-process contention.
+
+Run with: pytest tests/performance -m slow -s
+"""
+
+import multiprocessing
+import time
+import pytest
+from src.deia.services.registry import ServiceRegistry
+
+
+PROCESSES = 8
+BOTS_PER_PROCESS = 5
+HEARTBEATS_PER_BOT = 40
+
+
+def _bot_worker(registry_path, worker_id):
+    registry = ServiceRegistry(registry_path=registry_path)
+    bot_ids = [f"bench-BOT-{worker_id:02d}-{i}" for i in range(BOTS_PER_PROCESS)]
+    for i, bot_id in enumerate(bot_ids):
+        registry.register(bot_id, 8001 + worker_id * BOTS_PER_PROCESS + i, pid=-1)
+    for beat in range(HEARTBEATS_PER_BOT):
+        for bot_id in bot_ids:
+            registry.heartbeat(bot_id, status=f"beat-{beat}")
+        registry.get_all_bots()
+
+
+@pytest.mark.slow
+def test_registry_contention(tmp_path):
+    """Concurrent register/heartbeat/read across processes loses no updates."""
+    registry_path = tmp_path / ".deia" / "hive" / "registry.json"
+    ServiceRegistry(registry_path=registry_path)
+    registry_mtime = registry_path.stat().st_mtime_ns
+
+    start = time.perf_counter()
+    workers = [
+        multiprocessing.Process(target=_bot_worker, args=(registry_path, n))
+        for n in range(PROCESSES)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    bots = ServiceRegistry(registry_path=registry_path).get_all_bots()
+    assert len(bots) == PROCESSES * BOTS_PER_PROCESS
+    assert all(b["status"] == f"beat-{HEARTBEATS_PER_BOT - 1}" for b in bots.values())
+
+    # registry.json is written once per registration, never per heartbeat
+    audit_lines = (registry_path.parent / "registry-changes.jsonl").read_text().splitlines()
+    assert len(audit_lines) == PROCESSES * BOTS_PER_PROCESS
+    assert registry_path.stat().st_mtime_ns > registry_mtime
+
+    total_heartbeats = PROCESSES * BOTS_PER_PROCESS * HEARTBEATS_PER_BOT
+    print(f"\n{PROCESSES} processes, {total_heartbeats} heartbeats: {elapsed:.2f}s")
+    assert elapsed < 60
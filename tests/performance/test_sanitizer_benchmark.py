@@ -0,0 +1,39 @@
+"""
+Benchmark: sanitizing a multi-megabyte session transcript.
+
+Run with: pytest tests/performance -m slow -s
+"""
+
+import time
+
+import pytest
+
+from src.deia.sanitizer import Sanitizer
+
+
+LINE = (
+    "User dave@example.com ran /home/dave/app/main.py against 10.0.0.12 "
+    "and pasted token: abcd1234 plus some ordinary discussion of the parser.\n"
+)
+
+
+@pytest.mark.slow
+def test_sanitize_large_transcript(tmp_path):
+    text = LINE * 40_000
+    source = tmp_path / "transcript.md"
+    source.write_text(text, encoding="utf-8")
+    sanitizer = Sanitizer()
+
+    start = time.perf_counter()
+    sanitized, warnings = sanitizer.sanitize(text)
+    whole = time.perf_counter() - start
+
+    start = time.perf_counter()
+    streamed_warnings = sanitizer.sanitize_file(source, tmp_path / "out.md", chunk_size=1 << 16)
+    streamed = time.perf_counter() - start
+
+    mb = len(text) / 1e6
+    print(f"\n{mb:.1f} MB: whole {mb / whole:.1f} MB/s, streamed {mb / streamed:.1f} MB/s")
+    assert (tmp_path / "out.md").read_text(encoding="utf-8") == sanitized
+    assert streamed_warnings == warnings
+    assert "Found 40000 email pattern(s)" in warnings
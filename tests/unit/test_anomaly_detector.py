@@ -73,9 +73,9 @@ class TestBaselineCalculation:
 
         baseline = detector.baselines["test"]
 
-        # Verify calculations
-        assert baseline.mean == statistics.mean(values)
-        assert baseline.std == statistics.stdev(values)
+        # Verify calculations (streaming Welford: equal up to float rounding)
+        assert baseline.mean == pytest.approx(statistics.mean(values))
+        assert baseline.std == pytest.approx(statistics.stdev(values))
         assert baseline.min == min(values)
         assert baseline.max == max(values)
 
@@ -93,6 +93,59 @@ class TestBaselineCalculation:
         assert 98 <= baseline.p99 <= 100
 
 
+class TestStreamingBaselines:
+    """Tests for windowed, persistable streaming baselines."""
+
+    def test_old_values_expire_from_window(self, detector):
+        """Test values older than HISTORY_WINDOW_HOURS leave the baseline."""
+        old = datetime.now() - timedelta(hours=detector.HISTORY_WINDOW_HOURS + 2)
+        for v in range(10):
+            detector.record_metric("test", 1000.0 + v, timestamp=old)
+        for v in range(10):
+            detector.record_metric("test", float(v))
+
+        baseline = detector.baselines["test"]
+        assert baseline.count == 10
+        assert baseline.max == 9.0
+
+    def test_ewma_tracks_recent_values(self, detector):
+        """Test EWMA is weighted toward recent values."""
+        for v in [10.0] * 10 + [20.0] * 10:
+            detector.record_metric("test", v)
+
+        baseline = detector.baselines["test"]
+        assert baseline.mean == pytest.approx(15.0)
+        assert baseline.ewma > baseline.mean
+
+    def test_save_and_load_baselines(self, detector, tmp_path):
+        """Test baselines persist and reload into a fresh detector."""
+        for v in range(1, 21):
+            detector.record_metric("test", float(v))
+        detector.save_baselines()
+
+        restored = AnomalyDetector(tmp_path)
+        assert restored.load_baselines()
+        assert restored.baselines["test"].count == 20
+        assert restored.baselines["test"].mean == pytest.approx(10.5)
+
+    def test_merge_baselines_across_bots(self, tmp_path):
+        """Test merging baselines from two detectors."""
+        bot_a = AnomalyDetector(tmp_path / "a")
+        bot_b = AnomalyDetector(tmp_path / "b")
+        values_a = [float(v) for v in range(1, 11)]
+        values_b = [float(v) for v in range(11, 21)]
+        for v in values_a:
+            bot_a.record_metric("latency", v)
+        for v in values_b:
+            bot_b.record_metric("latency", v)
+
+        bot_a.merge_baselines(bot_b.export_baselines())
+        merged = bot_a.baselines["latency"]
+        assert merged.count == 20
+        assert merged.mean == pytest.approx(statistics.mean(values_a + values_b))
+        assert merged.std == pytest.approx(statistics.stdev(values_a + values_b))
+
+
 class TestAnomalyDetection:
     """Tests for anomaly detection logic."""
 
@@ -388,6 +441,7 @@ class TestEdgeCases:
 # Coverage summary
 COVERAGE_TARGETS = {
     "Baseline Calculation": "✅ 4 tests",
+    "Streaming Baselines": "✅ 4 tests",
     "Anomaly Detection": "✅ 3 tests",
     "Severity Classification": "✅ 2 tests",
     "Root Cause Analysis": "✅ 3 tests",
@@ -397,7 +451,7 @@ COVERAGE_TARGETS = {
     "Confidence Calculation": "✅ 3 tests",
     "Context Integration": "✅ 1 test",
     "Edge Cases": "✅ 3 tests",
-    "Total Tests": "26 tests",
+    "Total Tests": "30 tests",
     "Target Coverage": "70%+"
 }
 
@@ -0,0 +1,102 @@
+"""
+Unit tests for the BOK search index behind deia.bok.search_bok.
+"""
+
+import os
+import pytest
+from src.deia import bok
+from src.deia.bok import BokIndex, search_bok
+
+
+PATTERN = """---
+title: {title}
+platform: {platform}
+category: {category}
+---
+
+# {title}
+
+{body}
+"""
+
+
+def write_entry(path, title, platform="Platform-Agnostic", category="Pattern", body=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(PATTERN.format(title=title, platform=platform, category=category, body=body),
+                    encoding="utf-8")
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """DEIA project with a small BOK."""
+    (tmp_path / ".deia").mkdir()
+    write_entry(tmp_path / "bok" / "patterns" / "git-flow.md", "Git Flow",
+                body="Use GitHub pull requests for review.")
+    write_entry(tmp_path / "bok" / "platforms" / "windows-encoding.md", "Windows Encoding",
+                platform="Windows", category="Anti-Pattern", body="Always pass encoding='utf-8'.")
+    write_entry(tmp_path / "bok" / "patterns" / "testing.md", "Test Before Asking",
+                body="Run curl before asking a human to test.")
+    monkeypatch.chdir(tmp_path)
+    bok._indexes.clear()
+    yield tmp_path
+    bok._indexes.clear()
+
+
+class TestSearchBok:
+    """search_bok answers from the persistent index."""
+
+    def test_substring_match(self, project):
+        # "git" matches inside "github" just like the old full-text scan
+        results = search_bok("git")
+        assert [r["file"] for r in results] == ["git-flow.md"]
+
+    def test_phrase_match(self, project):
+        assert [r["file"] for r in search_bok("pull requests")] == ["git-flow.md"]
+        assert search_bok("requests pull") == []
+        assert [r["file"] for r in search_bok("encoding='utf-8'")] == ["windows-encoding.md"]
+
+    def test_filters(self, project):
+        assert [r["title"] for r in search_bok("", platform="Windows")] == ["Windows Encoding"]
+        assert len(search_bok("", category="Pattern")) == 2
+        assert search_bok("git", category="Anti-Pattern") == []
+
+    def test_index_persisted(self, project):
+        search_bok("git")
+        assert (project / ".deia" / "cache" / bok.INDEX_FILENAME).exists()
+
+    def test_picks_up_changes(self, project):
+        assert search_bok("kubernetes") == []
+        write_entry(project / "bok" / "patterns" / "k8s.md", "Kubernetes Rollouts")
+        assert [r["file"] for r in search_bok("kubernetes")] == ["k8s.md"]
+        (project / "bok" / "patterns" / "git-flow.md").unlink()
+        assert search_bok("github") == []
+
+
+class TestBokIndex:
+    """Index refresh only re-reads changed files."""
+
+    def test_refresh_is_incremental(self, project, monkeypatch):
+        index_path = project / "index.json"
+        index = BokIndex(project / "bok", index_path)
+        assert index.refresh()
+        assert not index.refresh()
+
+        target = project / "bok" / "patterns" / "testing.md"
+        write_entry(target, "Test Before Asking", body="Now mentions pytest.")
+        stat = target.stat()
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        parsed = []
+        original = bok._parse_bok_entry
+        monkeypatch.setattr(bok, "_parse_bok_entry", lambda c: parsed.append(c) or original(c))
+        assert index.refresh()
+        assert len(parsed) == 1
+        assert [r["file"] for r in index.search("pytest")] == ["testing.md"]
+
+    def test_reload_from_disk(self, project):
+        index_path = project / "index.json"
+        BokIndex(project / "bok", index_path).refresh()
+        reloaded = BokIndex(project / "bok", index_path)
+        assert len(reloaded.entries) == 3
+        assert not reloaded.refresh()
+        assert [r["file"] for r in reloaded.search("curl")] == ["testing.md"]
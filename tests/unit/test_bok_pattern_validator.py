@@ -17,10 +17,14 @@ Target Coverage: >80%
 import pytest
 import tempfile
 import shutil
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from src.deia.tools.bok_pattern_validator import BOKPatternValidator
+from src.deia.tools.bok_pattern_validator import BOKPatternValidator, LinkChecker
 
 
 # Test fixtures
@@ -921,3 +925,139 @@ This pattern applies to any Python project requiring validation.
     assert "unique_value_score" in pattern_report
     assert "safety_score" in pattern_report
     assert "quality_score" in pattern_report
+
+
+# Concurrent, cached link checking
+
+@pytest.fixture
+def link_server():
+    """Local HTTP server: /ok -> 200, /missing -> 404, /slow -> 200 after 0.2s"""
+    state = {"hits": {}, "in_flight": 0, "max_in_flight": 0, "lock": threading.Lock()}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_HEAD(self):
+            with state["lock"]:
+                state["hits"][self.path] = state["hits"].get(self.path, 0) + 1
+                state["in_flight"] += 1
+                state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            try:
+                if self.path.startswith("/slow"):
+                    time.sleep(0.2)
+                self.send_response(404 if self.path.startswith("/missing") else 200)
+                self.end_headers()
+            finally:
+                with state["lock"]:
+                    state["in_flight"] -= 1
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["base"] = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_link_checker_dedupes_and_caches(link_server):
+    """Each unique URL is requested once; repeats come from the cache"""
+    base = link_server["base"]
+    checker = LinkChecker(timeout=2)
+
+    results = checker.check([f"{base}/ok", f"{base}/missing", f"{base}/ok"])
+    assert results == {f"{base}/ok": False, f"{base}/missing": True}
+
+    checker.check([f"{base}/ok", f"{base}/missing"])
+    assert link_server["hits"] == {"/ok": 1, "/missing": 1}
+    assert checker.requests_made == 2
+
+
+def test_link_checker_persistent_cache_and_ttl(link_server, tmp_path):
+    """Results persist across checkers and expire after the TTL"""
+    base = link_server["base"]
+    cache_path = tmp_path / "cache" / "links.json"
+
+    first = LinkChecker(timeout=2, cache_path=cache_path)
+    first.check([f"{base}/ok"])
+    first.save_cache()
+    assert json.loads(cache_path.read_text())[f"{base}/ok"]["status"] == 200
+
+    second = LinkChecker(timeout=2, cache_path=cache_path)
+    assert second.check([f"{base}/ok"]) == {f"{base}/ok": False}
+    assert second.requests_made == 0
+
+    expired = LinkChecker(timeout=2, cache_path=cache_path, cache_ttl=0)
+    expired.check([f"{base}/ok"])
+    assert expired.requests_made == 1
+    assert link_server["hits"]["/ok"] == 2
+
+
+def test_link_checker_network_errors_not_cached(tmp_path):
+    """Connection failures are broken but retried on the next check"""
+    checker = LinkChecker(timeout=1, cache_path=tmp_path / "links.json")
+    url = "http://127.0.0.1:9/unreachable"
+    assert checker.check([url]) == {url: True}
+    assert checker.cached(url) is None
+
+
+def test_link_checker_runs_concurrently(link_server):
+    """Slow links on different hosts overlap instead of running serially"""
+    base = link_server["base"]
+    port = base.rsplit(":", 1)[1]
+    # Same server, distinct host names so the per-host limit does not apply
+    urls = [f"http://127.0.0.1:{port}/slow/{i}" for i in range(4)]
+    urls += [f"http://localhost:{port}/slow/{i}" for i in range(4)]
+    checker = LinkChecker(timeout=5, max_concurrency=8, per_host_concurrency=4)
+
+    start = time.perf_counter()
+    results = checker.check(urls)
+    elapsed = time.perf_counter() - start
+
+    assert not any(results.values())
+    assert elapsed < 0.2 * len(urls) / 2
+    assert link_server["max_in_flight"] > 2
+
+
+def test_link_checker_respects_per_host_limit(link_server):
+    """No more than per_host_concurrency requests hit one host at a time"""
+    base = link_server["base"]
+    checker = LinkChecker(timeout=5, max_concurrency=16, per_host_concurrency=2)
+    checker.check([f"{base}/slow/{i}" for i in range(6)])
+    assert link_server["max_in_flight"] == 2
+
+
+def test_validate_patterns_checks_shared_links_once(temp_bok_dir, link_server):
+    """Links shared across patterns are checked once per validation run"""
+    base = link_server["base"]
+    for i in range(3):
+        (temp_bok_dir / f"pattern-{i}.md").write_text(
+            f"# Pattern {i}\n\n## Problem\nSee [docs]({base}/ok) and [gone]({base}/missing).\n"
+            f"\n## Solution\nFix it.\n\n## Tags\ntest\n"
+        )
+    validator = BOKPatternValidator(str(temp_bok_dir), link_cache_path=str(temp_bok_dir / "links.json"))
+
+    reports = validator.validate_patterns()
+
+    assert link_server["hits"] == {"/ok": 1, "/missing": 1}
+    for i in range(3):
+        assert reports[str(temp_bok_dir / f"pattern-{i}.md")]["broken_links"] == [f"{base}/missing"]
+    assert (temp_bok_dir / "links.json").exists()
+
+
+def test_validate_patterns_requests_dead_links_once(temp_bok_dir):
+    """Failed links are remembered for the run instead of re-requested per pattern"""
+    dead = "http://127.0.0.1:9/unreachable"
+    for i in range(3):
+        (temp_bok_dir / f"pattern-{i}.md").write_text(
+            f"# Pattern {i}\n\n## Problem\nSee [gone]({dead}).\n"
+            f"\n## Solution\nFix it.\n\n## Tags\ntest\n"
+        )
+    validator = BOKPatternValidator(str(temp_bok_dir), link_check_timeout=1)
+
+    reports = validator.validate_patterns()
+
+    assert validator.link_checker.requests_made == 1
+    for i in range(3):
+        assert reports[str(temp_bok_dir / f"pattern-{i}.md")]["broken_links"] == [dead]
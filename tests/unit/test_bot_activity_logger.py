@@ -319,3 +319,95 @@ class TestLogMetrics:
 
         errors = logger.get_errors()
         assert len(errors) >= 2
+
+
+class TestTailIndexedQueries:
+    """Test newest-first, indexed queries across rotated segments."""
+
+    def test_query_returns_most_recent(self, logger):
+        """Test limit keeps the newest events, newest first."""
+        for i in range(10):
+            logger.log_event(EventType.STATUS_UPDATE, f"op-{i}")
+
+        events = logger.query_events(limit=3)
+        assert [e["operation"] for e in events] == ["op-9", "op-8", "op-7"]
+
+    def test_query_by_task_and_type(self, logger):
+        """Test indexed lookups, including events logged after the first query."""
+        logger.log_event(EventType.TASK_RECEIVED, "receive", task_id="t1")
+        logger.log_event(EventType.TASK_RECEIVED, "receive", task_id="t2")
+        assert len(logger.query_events(task_id="t1")) == 1
+
+        logger.log_event(EventType.TASK_COMPLETED, "complete", task_id="t1")
+        history = logger.get_task_history("t1")
+        assert [e["operation"] for e in history] == ["complete", "receive"]
+        assert len(logger.query_events(event_type=EventType.TASK_RECEIVED)) == 2
+        assert logger.query_events(event_type=EventType.TASK_COMPLETED, task_id="t2") == []
+
+    def test_sidecar_index_reused(self, temp_work_dir):
+        """Test the index persists on close and picks up later appends."""
+        first = BotActivityLogger("test-bot-003", temp_work_dir)
+        first.log_event(EventType.TASK_STARTED, "start", task_id="t1")
+        first.query_events(task_id="t1")
+        first.close()
+        assert first.index_file.exists()
+
+        # Appended by a logger that never loads the index
+        other = BotActivityLogger("test-bot-003", temp_work_dir)
+        other.log_event(EventType.TASK_FAILED, "fail", task_id="t1")
+        other.close()
+
+        reader = BotActivityLogger("test-bot-003", temp_work_dir)
+        assert [e["operation"] for e in reader.query_events(task_id="t1")] == ["fail", "start"]
+
+    def test_shared_log_sees_other_writers(self, temp_work_dir):
+        """Test two live loggers on one log see each other's events."""
+        writer = BotActivityLogger("test-bot-006", temp_work_dir)
+        reader = BotActivityLogger("test-bot-006", temp_work_dir)
+        writer.log_event(EventType.TASK_RECEIVED, "receive", task_id="theirs")
+        assert len(reader.query_events()) == 1
+
+        writer.log_event(EventType.TASK_COMPLETED, "complete", task_id="theirs")
+        reader.log_event(EventType.TASK_RECEIVED, "mine", task_id="mine")
+        writer.log_event(EventType.TASK_FAILED, "fail", task_id="theirs")
+
+        assert [e["operation"] for e in reader.query_events(task_id="mine")] == ["mine"]
+        assert [e["operation"] for e in reader.query_events(task_id="theirs")] == \
+            ["fail", "complete", "receive"]
+        assert [e["operation"] for e in reader.query_events(limit=2)] == ["fail", "mine"]
+        assert [e["operation"] for e in writer.query_events(task_id="mine")] == ["mine"]
+        writer.close()
+        reader.close()
+
+    def test_queries_span_rotated_segments(self, temp_work_dir):
+        """Test rotated .jsonl.gz segments are searched, newest first."""
+        logger = BotActivityLogger("test-bot-004", temp_work_dir)
+        logger.max_log_size = 2000
+        for i in range(60):
+            logger.log_event(EventType.TASK_COMPLETED, f"task {i}", task_id=f"t{i % 3}")
+
+        segments = logger._rotated_segments()
+        assert len(segments) >= 2
+        assert all(logger._segment_index_path(s).exists() for s in segments)
+
+        t0 = logger.query_events(task_id="t0", limit=100)
+        assert [e["operation"] for e in t0] == [f"task {i}" for i in range(57, -1, -3)]
+        completed = logger.query_events(event_type=EventType.TASK_COMPLETED, limit=100)
+        assert len(completed) == 60
+
+        # Segments rotated before indexing get an index on first query
+        for segment in segments:
+            logger._segment_index_path(segment).unlink()
+        assert len(logger.query_events(task_id="t1", limit=100)) == 20
+        assert all(logger._segment_index_path(s).exists() for s in segments)
+
+    def test_buffered_writes(self, temp_work_dir):
+        """Test buffered events reach disk on flush and are visible to queries."""
+        logger = BotActivityLogger("test-bot-005", temp_work_dir, buffer_events=100)
+        for i in range(5):
+            logger.log_event(EventType.HEALTH_CHECK, f"check {i}")
+        assert logger.activity_log_file.stat().st_size == 0
+
+        assert len(logger.query_events()) == 5
+        assert len(logger.activity_log_file.read_text().splitlines()) == 5
+        logger.close()
@@ -327,6 +327,59 @@ class TestBotMessenger:
         assert len(messages) == 0
 
 
+class TestIndexedDelivery:
+    """Test heap delivery order, inbox indexes and bounded history."""
+
+    def test_delivery_in_priority_order(self, messenger):
+        """Test higher priority messages are delivered first."""
+        messenger.send_message("bot-1", "bot-2", "low", "P3")
+        messenger.send_message("bot-1", "bot-2", "normal", "P2")
+        messenger.send_message("bot-1", "bot-2", "urgent", "P0")
+
+        result = messenger.process_outgoing_queue(max_messages=1)
+        assert len(result["delivered"]) == 1
+        assert result["pending"] == 2
+        inbox = messenger.get_inbox("bot-2")
+        assert inbox.messages[0].content == "urgent"
+
+        messenger.process_outgoing_queue()
+        assert [m.content for m in inbox.messages] == ["urgent", "normal", "low"]
+
+    def test_priority_index_tracks_messages(self):
+        """Test get_by_priority uses the per-priority index."""
+        box = MessageBox(bot_id="bot-1")
+        for i, priority in enumerate([MessagePriority.P0, MessagePriority.P1, MessagePriority.P0]):
+            box.add_message(Message(message_id=str(i), from_bot="s", to_bot="bot-1",
+                                    content="x", priority=priority))
+        assert [m.message_id for m in box.get_by_priority(MessagePriority.P0)] == ["0", "2"]
+        box.remove("0")
+        assert [m.message_id for m in box.get_by_priority(MessagePriority.P0)] == ["2"]
+        assert not box.mark_read("0")
+
+    def test_remove_expired_uses_ttl(self):
+        """Test expired pending messages are removed, handled ones kept."""
+        box = MessageBox(bot_id="bot-1")
+        old = (datetime.now() - timedelta(seconds=10)).isoformat()
+        box.add_message(Message(message_id="pending", from_bot="s", to_bot="bot-1",
+                                content="x", ttl_seconds=1, created_at=old))
+        box.add_message(Message(message_id="read", from_bot="s", to_bot="bot-1",
+                                content="x", ttl_seconds=1, created_at=old,
+                                status=MessageStatus.READ))
+        box.add_message(Message(message_id="fresh", from_bot="s", to_bot="bot-1", content="x"))
+
+        assert box.remove_expired() == ["pending"]
+        assert [m.message_id for m in box.messages] == ["read", "fresh"]
+        assert box.remove_expired(include_handled=True) == ["read"]
+
+    def test_history_is_bounded(self, temp_dir):
+        """Test message_history keeps only the newest messages."""
+        messenger = BotMessenger(temp_dir, max_history=3)
+        ids = [messenger.send_message("bot-1", "bot-2", f"m{i}") for i in range(5)]
+
+        assert list(messenger.message_history) == ids[2:]
+        assert len(messenger.outgoing_queue) == 5
+
+
 class TestMessageRetry:
     """Test message retry logic."""
 
@@ -2,7 +2,9 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock, Mock
+from unittest.mock import patch, MagicMock, Mock, AsyncMock
+import asyncio
+import time
 import json
 from pathlib import Path
 
@@ -111,7 +113,7 @@ class TestStopBotEndpoint:
         """Test successful bot stop"""
         with patch.object(service_registry, 'get_bot', return_value={"port": 8001, "pid": 12345}):
             with patch.object(service_registry, 'get_bot_url', return_value="http://localhost:8001"):
-                with patch('requests.post') as mock_post:
+                with patch('deia.services.chat_interface_app.bot_request', new_callable=AsyncMock) as mock_post:
                     mock_post.return_value.status_code = 200
                     with patch.object(service_registry, 'unregister'):
                         response = client.post("/api/bot/stop/BOT-001")
@@ -161,6 +163,36 @@ class TestBotStatusEndpoint:
                     assert data["success"] is True
                     assert "BOT-001" in data["bots"]
 
+    def test_get_bots_status_polls_concurrently(self):
+        """Test bots are polled in parallel and slow bots are cut off at the deadline"""
+        from deia.services import chat_interface_app
+        mock_bots = {f"BOT-00{i}": {"status": "idle", "port": 8000 + i} for i in range(1, 5)}
+        mock_bots["BOT-009"] = {"status": "idle", "port": 8009}
+
+        async def fake_request(method, url, **kwargs):
+            await asyncio.sleep(10 if ":8009" in url else 0.2)
+            response = MagicMock(status_code=200)
+            response.json.return_value = {"status": "busy", "current_task": url}
+            return response
+
+        with patch.object(service_registry, 'get_all_bots', return_value=mock_bots), \
+                patch.object(service_registry, 'get_bot_url',
+                             side_effect=lambda bot_id: f"http://localhost:{mock_bots[bot_id]['port']}"), \
+                patch.object(chat_interface_app, 'bot_request', side_effect=fake_request) as mock_request, \
+                patch.object(chat_interface_app, 'BOT_STATUS_DEADLINE', 0.5), \
+                patch.dict(chat_interface_app._bot_status_cache, clear=True):
+            start = time.monotonic()
+            data = client.get("/api/bots/status").json()
+            assert time.monotonic() - start < 2
+
+            assert data["bots"]["BOT-001"]["status"] == "busy"
+            assert data["bots"]["BOT-009"]["status"] == "idle"
+
+            # Answers within the TTL are served from the cache
+            calls = mock_request.call_count
+            client.get("/api/bots/status")
+            assert mock_request.call_count == calls
+
 
 class TestChatHistoryEndpoint:
     """Test GET /api/chat/history endpoint"""
@@ -3,6 +3,8 @@ Tests for ChatDatabase module
 """
 
 import pytest
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from deia.services.chat_database import ChatDatabase, ChatMessage
@@ -153,3 +155,147 @@ class TestChatDatabase:
 
             assert len(messages) == 1
             assert messages[0]["content"] == "Persistent message"
+
+
+class TestChatDatabaseBatchingAndPaging:
+    """Write-behind batching, WAL and keyset pagination"""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        database = ChatDatabase(str(tmp_path / "chat.db"))
+        yield database
+        database.close()
+
+    def test_wal_mode_enabled(self, db):
+        assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_limit_returns_latest_messages(self, db):
+        for i in range(10):
+            db.add_message("BOT-001", "user", f"Message {i}")
+
+        messages = db.get_messages("BOT-001", limit=3)
+        assert [m["content"] for m in messages] == ["Message 7", "Message 8", "Message 9"]
+
+    def test_keyset_pagination(self, db):
+        for i in range(25):
+            db.add_message("BOT-001", "user", f"Message {i}")
+            db.add_message("BOT-002", "user", f"Other {i}")
+
+        pages = []
+        before_id = None
+        while True:
+            page = db.get_messages("BOT-001", limit=10, before_id=before_id)
+            if not page:
+                break
+            pages.append([m["content"] for m in page])
+            before_id = page[0]["id"]
+
+        assert [len(p) for p in pages] == [10, 10, 5]
+        assert pages[-1][0] == "Message 0"
+        assert pages[0][-1] == "Message 24"
+
+    def test_concurrent_writers(self, db):
+        import threading
+
+        def write(bot):
+            for i in range(200):
+                db.add_message(bot, "user", f"{bot} {i}")
+
+        threads = [threading.Thread(target=write, args=(f"BOT-{n}",)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for n in range(4):
+            messages = db.get_messages(f"BOT-{n}", limit=1000)
+            assert [m["content"] for m in messages] == [f"BOT-{n} {i}" for i in range(200)]
+
+    def test_close_flushes_buffered_writes(self, tmp_path):
+        db_path = str(tmp_path / "chat.db")
+        db1 = ChatDatabase(db_path)
+        for i in range(50):
+            db1.add_message("BOT-001", "assistant", f"Reply {i}")
+        db1.close()
+
+        db2 = ChatDatabase(db_path, write_behind=False)
+        assert db2.get_session_count("BOT-001") == 50
+        db2.close()
+
+    def test_buffered_writes_flushed_at_exit(self, tmp_path):
+        db_path = str(tmp_path / "chat.db")
+        src_dir = Path(__file__).resolve().parents[2] / "src"
+        script = (
+            "from deia.services.chat_database import ChatDatabase\n"
+            f"db = ChatDatabase({db_path!r})\n"
+            "for i in range(50):\n"
+            "    db.add_message('BOT-001', 'assistant', f'Reply {i}')\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True, env={"PYTHONPATH": str(src_dir)})
+
+        db = ChatDatabase(db_path, write_behind=False)
+        assert db.get_session_count("BOT-001") == 50
+        db.close()
+
+    def test_composite_index_used(self, db):
+        plan = db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM messages WHERE bot_id = ? AND id < ? ORDER BY id DESC LIMIT 10",
+            ("BOT-001", 100),
+        ).fetchall()
+        assert any("idx_messages_bot_id_id" in row[-1] for row in plan)
+
+
+class TestChatSearch:
+    """Full-text search over chat history"""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        database = ChatDatabase(str(tmp_path / "chat.db"))
+        database.add_message("BOT-001", "user", "Deploy the staging server", "2025-10-01T09:00:00")
+        database.add_message("BOT-001", "assistant", "Deployment finished; staging server is healthy", "2025-10-02T09:00:00")
+        database.add_message("BOT-002", "assistant", "The staging deploy failed: disk full", "2025-10-03T09:00:00")
+        database.add_message("BOT-002", "user", "Unrelated question about lunch", "2025-10-04T09:00:00")
+        yield database
+        database.close()
+
+    def test_search_ranks_and_highlights(self, db):
+        results = db.search("staging server")
+        assert len(results) == 2
+        assert {r["bot_id"] for r in results} == {"BOT-001"}
+        assert "[staging]" in results[0]["snippet"]
+        assert results[0]["rank"] <= results[1]["rank"]
+
+    def test_prefix_and_filters(self, db):
+        assert len(db.search("deploy*")) == 3
+        assert [r["bot_id"] for r in db.search("deploy*", bot_id="BOT-002")] == ["BOT-002"]
+        assert len(db.search("deploy*", since="2025-10-02T00:00:00", until="2025-10-03T00:00:00")) == 1
+
+    def test_operators_are_literal(self, db):
+        assert db.search('"staging" OR NEAR(') == []
+        assert db.search("   ") == []
+        assert [r["bot_id"] for r in db.search("full:")] == ["BOT-002"]
+
+    def test_index_follows_deletes(self, db):
+        db.clear_messages("BOT-002")
+        assert db.search("disk") == []
+        assert len(db.search("staging")) == 2
+
+    def test_existing_history_is_indexed(self, tmp_path):
+        import sqlite3
+
+        path = tmp_path / "old.db"
+        conn = sqlite3.connect(path)
+        conn.execute("""
+            CREATE TABLE messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, bot_id TEXT NOT NULL,
+                role TEXT NOT NULL, content TEXT NOT NULL, timestamp TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("INSERT INTO messages (bot_id, role, content, timestamp) VALUES ('B', 'user', 'legacy needle', 't')")
+        conn.commit()
+        conn.close()
+
+        db = ChatDatabase(str(path))
+        assert [r["id"] for r in db.search("needle")] == [1]
+        db.close()
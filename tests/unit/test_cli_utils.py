@@ -2,10 +2,14 @@
 Tests for CLI Utility Functions
 """
 
+import click
 import pytest
+from click.testing import CliRunner
 from unittest.mock import MagicMock, patch
 from rich.console import Console
-from src.deia.cli_utils import safe_print, emergency_print, get_symbol, UNICODE_FALLBACKS
+from src.deia.cli_utils import (
+    safe_print, emergency_print, get_symbol, UNICODE_FALLBACKS, LazyConsole, LazyGroup
+)
 
 
 class TestSafePrint:
@@ -206,3 +210,68 @@ class TestUnicodeFallbacks:
     def test_unicode_fallbacks_warning(self):
         """Test warning symbol has ASCII fallback"""
         assert '\u26A0' in UNICODE_FALLBACKS  # ⚠
+
+
+class TestLazyConsole:
+    """Tests for LazyConsole"""
+
+    def test_console_created_on_first_use(self):
+        """Test the Rich Console is only built when an attribute is used"""
+        console = LazyConsole(width=42)
+        assert console._console is None
+
+        assert console.width == 42
+        assert isinstance(console._console, Console)
+
+    def test_safe_print_accepts_lazy_console(self, capsys):
+        """Test safe_print works with a LazyConsole"""
+        assert safe_print(LazyConsole(), "hello") is True
+        assert "hello" in capsys.readouterr().out
+
+
+@click.command()
+def _lazy_hello():
+    """Say hello"""
+    click.echo("hello")
+
+
+class TestLazyGroup:
+    """Tests for LazyGroup"""
+
+    def _group(self, spec):
+        @click.group(cls=LazyGroup, lazy_subcommands={'hello': spec})
+        def cli():
+            pass
+
+        @cli.command()
+        def eager():
+            click.echo("eager")
+
+        return cli
+
+    def test_lazy_and_eager_commands_listed(self):
+        """Test lazy commands appear alongside regular ones"""
+        cli = self._group(f'{__name__}:_lazy_hello')
+        result = CliRunner().invoke(cli, ['--help'])
+        assert result.exit_code == 0
+        assert 'eager' in result.output
+        assert 'Say hello' in result.output
+
+    def test_lazy_command_invoked(self):
+        """Test a lazy command is imported and run on demand"""
+        cli = self._group(f'{__name__}:_lazy_hello')
+        assert CliRunner().invoke(cli, ['hello']).output == "hello\n"
+        assert CliRunner().invoke(cli, ['eager']).output == "eager\n"
+
+    def test_relative_spec_resolved_against_package(self):
+        """Test '.module:attr' specs resolve inside the deia package"""
+        cli = self._group('.cli_doctor:doctor')
+        result = CliRunner().invoke(cli, ['hello', '--help'])
+        assert result.exit_code == 0
+        assert 'docs' in result.output
+
+    def test_non_command_rejected(self):
+        """Test a spec pointing at a non-command raises"""
+        cli = self._group(f'{__name__}:TestLazyGroup')
+        result = CliRunner().invoke(cli, ['hello'])
+        assert isinstance(result.exception, ValueError)
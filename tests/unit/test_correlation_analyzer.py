@@ -11,12 +11,22 @@ sys.path.insert(0, str(project_root))
 from src.deia.services.correlation_analyzer import CorrelationAnalyzer
 
 
+START = datetime.now() - timedelta(days=1)
+
+
 @pytest.fixture
 def analyzer(tmp_path):
     """Provide CorrelationAnalyzer instance."""
     return CorrelationAnalyzer(tmp_path)
 
 
+def record_at(analyzer, minute, **values):
+    """Record one sample per metric in the given one-minute bucket."""
+    timestamp = START + timedelta(minutes=minute)
+    for name, value in values.items():
+        analyzer.record_metric(name, value, timestamp=timestamp)
+
+
 class TestMetricRecording:
     """Tests for metric recording."""
 
@@ -43,8 +53,7 @@ class TestCorrelationCalculation:
         """Test positive correlation detection."""
         # Create perfectly correlated metrics (y = x + 10)
         for i in range(20):
-            analyzer.record_metric("metric_a", float(i))
-            analyzer.record_metric("metric_b", float(i + 10))
+            record_at(analyzer, i, metric_a=float(i), metric_b=float(i + 10))
 
         correlations = analyzer.analyze_correlations(7)
 
@@ -58,8 +67,7 @@ class TestCorrelationCalculation:
         """Test negative correlation detection."""
         # Create inversely correlated metrics
         for i in range(20):
-            analyzer.record_metric("cpu", float(i))
-            analyzer.record_metric("idle", float(100 - i))
+            record_at(analyzer, i, cpu=float(i), idle=float(100 - i))
 
         correlations = analyzer.analyze_correlations(7)
 
@@ -73,8 +81,7 @@ class TestCorrelationCalculation:
         # Random unrelated data
         import random
         for i in range(20):
-            analyzer.record_metric("random_a", float(random.random() * 100))
-            analyzer.record_metric("random_b", float(random.random() * 100))
+            record_at(analyzer, i, random_a=random.random() * 100, random_b=random.random() * 100)
 
         correlations = analyzer.analyze_correlations(7)
 
@@ -89,9 +96,7 @@ class TestCorrelationMatrix:
     def test_correlation_matrix_structure(self, analyzer):
         """Test correlation matrix has correct structure."""
         for i in range(15):
-            analyzer.record_metric("m1", float(i))
-            analyzer.record_metric("m2", float(i * 2))
-            analyzer.record_metric("m3", float(i + 5))
+            record_at(analyzer, i, m1=float(i), m2=float(i * 2), m3=float(i + 5))
 
         matrix = analyzer.get_correlation_matrix(7)
 
@@ -103,8 +108,7 @@ class TestCorrelationMatrix:
     def test_matrix_symmetry(self, analyzer):
         """Test correlation matrix is symmetric."""
         for i in range(15):
-            analyzer.record_metric("a", float(i))
-            analyzer.record_metric("b", float(i * 2))
+            record_at(analyzer, i, a=float(i), b=float(i * 2))
 
         matrix = analyzer.get_correlation_matrix(7)
 
@@ -112,6 +116,112 @@ class TestCorrelationMatrix:
             assert matrix["a"]["b"] == matrix["b"]["a"]
 
 
+class TestVectorizedMatrix:
+    """Tests for the matrix-based all-pairs computation."""
+
+    def test_many_metrics_matrix(self, analyzer):
+        """Test all pairs are computed for a wide set of metrics."""
+        import random
+        base = [random.random() for _ in range(50)]
+        for i, b in enumerate(base):
+            record_at(analyzer, i, **{f"m{m}": b * (m + 1) + random.random() * 0.01 for m in range(30)})
+
+        matrix = analyzer.get_correlation_matrix(7)
+
+        assert len(matrix) == 30
+        assert all(len(row) == 29 for row in matrix.values())
+        assert matrix["m0"]["m29"] > 0.99
+
+    def test_numpy_matches_python_fallback(self, analyzer):
+        """Test vectorized and pure-Python paths agree."""
+        import random
+        for i in range(40):
+            record_at(analyzer, i, a=float(i) + random.random())
+            if i % 3:
+                record_at(analyzer, i, b=random.random() * 10)
+            if i >= 10:
+                record_at(analyzer, i, c=float(-i))
+
+        cutoff = datetime.now() - timedelta(days=7)
+        names = ["a", "b", "c"]
+        fast = analyzer._matrix_numpy(names, cutoff)
+        slow = analyzer._matrix_python(names, cutoff)
+        for i in range(3):
+            for j in range(3):
+                if i != j:
+                    assert fast[i][j][0] == pytest.approx(slow[i][j][0])
+                    assert fast[i][j][1] == slow[i][j][1]
+
+    def test_unequal_sample_counts_aligned_by_time(self, analyzer):
+        """Test metrics sampled at different rates are paired per bucket."""
+        for i in range(20):
+            record_at(analyzer, i, a=float(i))
+            # Two samples per bucket whose mean tracks a
+            record_at(analyzer, i, b=float(i) - 1)
+            record_at(analyzer, i, b=float(i) + 1)
+
+        correlations = analyzer.analyze_correlations(7)
+
+        assert len(analyzer.metric_history["b"]) == 40
+        assert len(correlations) == 1
+        assert correlations[0].sample_count == 20
+        assert correlations[0].correlation_coefficient == pytest.approx(1.0)
+
+    def test_only_shared_buckets_correlated(self, analyzer):
+        """Test pairs use the buckets both metrics cover."""
+        for i in range(10):
+            record_at(analyzer, i, a=float(i))
+        for i in range(4, 14):
+            record_at(analyzer, i, b=float(-i))
+        for i in range(8, 20):
+            record_at(analyzer, i, c=float(i))
+
+        matrix = analyzer.get_correlation_matrix(7)
+        correlations = {(c.metric_1, c.metric_2): c for c in analyzer.correlations}
+
+        assert correlations[("a", "b")].sample_count == 6
+        assert matrix["a"]["b"] == pytest.approx(-1.0)
+        assert correlations[("b", "c")].sample_count == 6
+        # a and c share only two buckets
+        assert ("a", "c") not in correlations
+
+    def test_bucket_sums_follow_expiry(self, analyzer):
+        """Test expired samples leave the bucket means."""
+        series = analyzer.metric_history["x"]
+        series.append((START, 10.0))
+        series.append((START + timedelta(seconds=1), 20.0))
+        series.append((START + timedelta(minutes=1), 30.0))
+
+        series.expire(START)
+
+        assert series.bucket_means_since(START - timedelta(minutes=1)) == {
+            int(START.timestamp() // 60): 20.0,
+            int(START.timestamp() // 60) + 1: 30.0,
+        }
+
+    def test_late_samples_kept_in_time_order(self, analyzer):
+        """Test out-of-order timestamps are inserted, merged and expired."""
+        now = datetime.now()
+        analyzer.record_metric("x", 1.0, timestamp=now)
+        analyzer.record_metric("x", 2.0, timestamp=now - timedelta(hours=2))
+        analyzer.record_metric("x", 4.0, timestamp=now - timedelta(hours=2))
+        analyzer.record_metric("x", 3.0, timestamp=now - timedelta(days=40))
+
+        series = analyzer.metric_history["x"]
+        late_bucket = int((now - timedelta(hours=2)).timestamp() // 60)
+        assert [value for _, value in series] == [2.0, 4.0, 1.0]
+        assert series.bucket_means_since(now - timedelta(days=7)) == {
+            late_bucket: 3.0,
+            int(now.timestamp() // 60): 1.0,
+        }
+
+    def test_running_mean(self, analyzer):
+        """Test series mean is maintained incrementally."""
+        for v in [10.0, 20.0, 30.0]:
+            analyzer.record_metric("x", v)
+        assert analyzer.metric_history["x"].mean == pytest.approx(20.0)
+
+
 class TestPrediction:
     """Tests for metric prediction."""
 
@@ -119,8 +229,7 @@ class TestPrediction:
         """Test basic metric prediction."""
         # Establish pattern
         for i in range(20):
-            analyzer.record_metric("temp", float(20 + i))
-            analyzer.record_metric("demand", float(100 + i * 2))
+            record_at(analyzer, i, temp=float(20 + i), demand=float(100 + i * 2))
 
         context = {"temp": 35.0}
         prediction = analyzer.predict_metric("demand", context)
@@ -146,8 +255,7 @@ class TestPatternSummary:
     def test_pattern_summary_structure(self, analyzer):
         """Test pattern summary has correct structure."""
         for i in range(15):
-            analyzer.record_metric("m1", float(i))
-            analyzer.record_metric("m2", float(i * 2))
+            record_at(analyzer, i, m1=float(i), m2=float(i * 2))
 
         summary = analyzer.get_pattern_summary()
 
@@ -159,8 +267,7 @@ class TestPatternSummary:
     def test_pattern_discovery(self, analyzer):
         """Test strong patterns are discovered."""
         for i in range(20):
-            analyzer.record_metric("x", float(i))
-            analyzer.record_metric("y", float(i * 3))
+            record_at(analyzer, i, x=float(i), y=float(i * 3))
 
         summary = analyzer.get_pattern_summary()
 
@@ -209,10 +316,11 @@ COVERAGE_TARGETS = {
     "Metric Recording": "✅ 2 tests",
     "Correlation Calculation": "✅ 3 tests",
     "Correlation Matrix": "✅ 2 tests",
+    "Vectorized Matrix": "✅ 7 tests",
     "Prediction": "✅ 2 tests",
     "Pattern Summary": "✅ 2 tests",
     "Edge Cases": "✅ 3 tests",
-    "Total Tests": "14 tests",
+    "Total Tests": "21 tests",
     "Target Coverage": "70%+"
 }
 
@@ -111,13 +111,13 @@ class TestBackupCreation:
         )
 
         assert success
-        backup_file = temp_work_dir / ".deia" / "backups" / f"{backup_id}.json"
-        assert backup_file.exists()
+        chunks = dr.backups[backup_id].chunks
+        assert chunks
+        for digest in chunks:
+            assert dr._find_chunk(digest).exists()
 
         # Verify content
-        with open(backup_file) as f:
-            saved_data = json.load(f)
-        assert saved_data == data
+        assert dict(dr.iter_backup(backup_id)) == data
 
     def test_backup_checksum_calculation(self, dr):
         """Test that checksum is calculated correctly."""
@@ -171,8 +171,8 @@ class TestBackupRestore:
         )
         assert success
 
-        # Corrupt the backup file
-        backup_file = temp_work_dir / ".deia" / "backups" / f"{backup_id}.json"
+        # Corrupt the backup data
+        backup_file = dr._find_chunk(dr.backups[backup_id].chunks[0])
         with open(backup_file, 'w') as f:
             f.write("corrupted data")
 
@@ -502,6 +502,7 @@ class TestCleanup:
         # Create backup
         success, backup_id = dr.create_backup(BackupType.REGISTRY, data)
         assert success
+        backup_file = dr._find_chunk(dr.backups[backup_id].chunks[0])
 
         # Artificially age the backup
         old_date = (datetime.now() - timedelta(days=8)).isoformat()
@@ -513,5 +514,127 @@ class TestCleanup:
         assert backup_id not in dr.backups
 
         # File should be deleted
-        backup_file = temp_work_dir / ".deia" / "backups" / f"{backup_id}.json"
         assert not backup_file.exists()
+        assert dr.get_status()["disk_usage_mb"] == 0
+
+
+def _bot_registry(count, version=0):
+    return {
+        f"bot-{n:05d}": {"type": "developer", "status": "active", "tasks": n, "version": version if n == 7 else 0}
+        for n in range(count)
+    }
+
+
+class TestChunkStore:
+    """Test deduplicated, compressed chunk storage."""
+
+    def test_identical_backup_stores_nothing_new(self, dr):
+        """A repeat backup of unchanged data writes no chunks."""
+        data = _bot_registry(2000)
+        _, first = dr.create_backup(BackupType.REGISTRY, data)
+        _, second = dr.create_backup(BackupType.REGISTRY, data)
+
+        assert dr.backups[first].stored_bytes > 0
+        assert dr.backups[second].stored_bytes == 0
+        assert dr.backups[second].chunks == dr.backups[first].chunks
+
+    def test_small_change_writes_few_chunks(self, dr):
+        """Changing one key only rewrites the chunk containing it."""
+        _, first = dr.create_backup(BackupType.REGISTRY, _bot_registry(5000))
+        _, second = dr.create_backup(BackupType.REGISTRY, _bot_registry(5000, version=1))
+
+        first_meta, second_meta = dr.backups[first], dr.backups[second]
+        assert len(first_meta.chunks) > 5
+        changed = set(second_meta.chunks) - set(first_meta.chunks)
+        assert len(changed) == 1
+        assert second_meta.stored_bytes < first_meta.stored_bytes / 5
+        assert dict(dr.iter_backup(second)) == _bot_registry(5000, version=1)
+
+    def test_restore_point_is_delta_against_latest(self, dr):
+        """Restore point backups record the previous restore point's backups as base."""
+        _, rp1 = dr.create_restore_point(registry_data=_bot_registry(10), queue_data={"queue": [1]})
+        _, rp2 = dr.create_restore_point(registry_data=_bot_registry(10), queue_data={"queue": [1, 2]})
+
+        first = {dr.backups[b].backup_type: b for b in dr.restore_points[rp1].backups}
+        for bid in dr.restore_points[rp2].backups:
+            metadata = dr.backups[bid]
+            assert metadata.base_id == first[metadata.backup_type]
+        assert dr.restore_backup(dr.restore_points[rp2].backups[1])[1] == {"queue": [1, 2]}
+
+    def test_shared_chunks_survive_cleanup(self, dr):
+        """Deleting one backup keeps chunks still used by another."""
+        from datetime import datetime, timedelta
+
+        data = _bot_registry(100)
+        _, old = dr.create_backup(BackupType.REGISTRY, data)
+        _, new = dr.create_backup(BackupType.REGISTRY, data)
+        dr.backups[old].timestamp = (datetime.now() - timedelta(days=8)).isoformat()
+
+        dr._cleanup_old_backups()
+
+        assert old not in dr.backups
+        assert dr.restore_backup(new) == (True, data)
+        assert dr.get_status()["disk_usage_mb"] > 0
+
+    @pytest.mark.parametrize("compression", ["gzip", None])
+    def test_codecs_round_trip(self, temp_work_dir, compression):
+        """Each codec restores the original data."""
+        dr = DisasterRecovery(temp_work_dir, compression=compression)
+        data = _bot_registry(300)
+        _, backup_id = dr.create_backup(BackupType.REGISTRY, data)
+        suffix = dr._find_chunk(dr.backups[backup_id].chunks[0]).suffix
+        assert suffix == (".gz" if compression else "")
+        assert dr.restore_backup(backup_id) == (True, data)
+
+    def test_unknown_compression_rejected(self, temp_work_dir):
+        with pytest.raises(ValueError):
+            DisasterRecovery(temp_work_dir, compression="lz4")
+
+    def test_oversized_value_split_and_restored(self, dr):
+        """A single value larger than the max chunk size spans several chunks."""
+        data = {"log": ["x" * 100] * 3000, "other": 1}
+        _, backup_id = dr.create_backup(BackupType.QUEUE, data)
+        assert len(dr.backups[backup_id].chunks) > 2
+        assert dr.restore_backup(backup_id) == (True, data)
+
+    def test_empty_backup_restores(self, temp_work_dir):
+        """A backup of no data has no chunks but is not a legacy backup."""
+        dr1 = DisasterRecovery(temp_work_dir)
+        success, backup_id = dr1.create_backup(BackupType.QUEUE, {})
+        assert success
+        assert dr1.backups[backup_id].chunks == []
+        assert dr1.restore_backup(backup_id) == (True, {})
+
+        dr1._save_backup_index()
+        dr2 = DisasterRecovery(temp_work_dir)
+        assert dr2.restore_backup(backup_id) == (True, {})
+
+    def test_index_reload_keeps_refs_and_usage(self, temp_work_dir):
+        """Reloading the index restores chunk refs and disk usage."""
+        dr1 = DisasterRecovery(temp_work_dir)
+        _, backup_id = dr1.create_backup(BackupType.REGISTRY, _bot_registry(500))
+        dr1._save_backup_index()
+
+        dr2 = DisasterRecovery(temp_work_dir)
+        assert dr2._calculate_disk_usage() == dr1._calculate_disk_usage()
+        _, again = dr2.create_backup(BackupType.REGISTRY, _bot_registry(500))
+        assert dr2.backups[again].stored_bytes == 0
+        assert dr2.restore_backup(backup_id) == (True, _bot_registry(500))
+
+    def test_legacy_json_backup_restores(self, dr, temp_work_dir):
+        """Backups written before chunk storage still restore."""
+        import hashlib
+
+        data = {"bot-001": {"type": "developer"}}
+        data_bytes = json.dumps(data, indent=2).encode("utf-8")
+        (temp_work_dir / ".deia" / "backups" / "legacy.json").write_bytes(data_bytes)
+        dr.backups["legacy"] = BackupMetadata(
+            backup_id="legacy",
+            backup_type=BackupType.REGISTRY,
+            timestamp="2025-01-01T00:00:00",
+            source="old",
+            size_bytes=len(data_bytes),
+            item_count=1,
+            checksum=hashlib.sha256(data_bytes).hexdigest()
+        )
+        assert dr.restore_backup("legacy") == (True, data)
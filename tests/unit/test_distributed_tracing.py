@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for Distributed Tracing System."""
 
+import json
 import pytest
 import tempfile
 import time
@@ -14,7 +15,10 @@ from deia.services.distributed_tracing import (
     SpanStatus,
     Trace,
     DistributedTracer,
-    TracingService
+    TracingService,
+    SamplingPolicy,
+    TraceStore,
+    SpanExporter
 )
 
 
@@ -309,6 +313,20 @@ class TestDistributedTracer:
         assert errors[0]["trace_id"] == trace2.trace_id
         assert errors[0]["error_count"] > 0
 
+    def test_error_traces_include_active(self, tracer):
+        """Test unfinished traces that already failed are reported."""
+        t, _ = tracer
+
+        trace = t.start_trace(operation_name="in_flight")
+        span = t.start_span(trace.trace_id, "failing_op")
+        t.finish_span(trace.trace_id, span.id, error="Failed")
+        t.start_span(trace.trace_id, "still_running")
+
+        errors = t.get_error_traces()
+
+        assert [e["trace_id"] for e in errors] == [trace.trace_id]
+        assert errors[0]["errors"] == [{"span_id": span.id, "error": "Failed"}]
+
     def test_get_metrics(self, tracer):
         """Test getting tracing metrics."""
         t, _ = tracer
@@ -329,6 +347,7 @@ class TestDistributedTracer:
 
         trace = t.start_trace(operation_name="persist_test")
         t.finish_trace(trace.trace_id)
+        t.flush()
 
         traces_log = project_root / ".deia" / "traces" / "traces.jsonl"
         assert traces_log.exists()
@@ -340,11 +359,112 @@ class TestDistributedTracer:
         trace = t.start_trace()
         span = t.start_span(trace.trace_id, "span_test")
         t.finish_span(trace.trace_id, span.id, duration_ms=50)
+        t.flush()
 
         spans_log = project_root / ".deia" / "traces" / "spans.jsonl"
         assert spans_log.exists()
 
 
+class TestSamplingAndRetention:
+    """Test sampling policies, bounded storage and batched export."""
+
+    @pytest.fixture
+    def project_root(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def test_head_sampling_is_deterministic(self):
+        """Test same trace ID always gets the same decision."""
+        policy = SamplingPolicy(sample_rate=0.5)
+        decisions = [policy.head_sampled(f"trace-{i}") for i in range(200)]
+        assert decisions == [policy.head_sampled(f"trace-{i}") for i in range(200)]
+        assert 40 < sum(decisions) < 160
+
+    def test_unsampled_trace_dropped(self, project_root):
+        """Test head-dropped traces are not kept or exported."""
+        t = DistributedTracer("svc", project_root, sampling=SamplingPolicy(sample_rate=0.0))
+        trace = t.start_trace(operation_name="op")
+        t.finish_trace(trace.trace_id)
+        t.flush()
+
+        assert t.get_trace(trace.trace_id) is None
+        assert t.get_metrics()["metrics"]["traces_dropped"] == 1
+        assert not (project_root / ".deia" / "traces" / "traces.jsonl").exists()
+        # Latency stats still see dropped traces
+        assert t.get_latency_stats()["count"] == 1
+
+    def test_tail_sampling_keeps_errors(self, project_root):
+        """Test error traces are kept even when head sampling drops them."""
+        t = DistributedTracer("svc", project_root, sampling=SamplingPolicy(sample_rate=0.0))
+        trace = t.start_trace(operation_name="op")
+        span = t.start_span(trace.trace_id, "child")
+        t.finish_span(trace.trace_id, span.id, error="boom")
+        t.finish_trace(trace.trace_id)
+        t.flush()
+
+        assert t.get_trace(trace.trace_id) is not None
+        spans_log = project_root / ".deia" / "traces" / "spans.jsonl"
+        assert len(spans_log.read_text().splitlines()) == 1
+
+    def test_store_bounded_and_keeps_errors(self, project_root):
+        """Test LRU store evicts successful traces before error traces."""
+        t = DistributedTracer("svc", project_root, max_traces=5, max_error_traces=5)
+        failing = t.start_trace(operation_name="fail")
+        span = t.start_span(failing.trace_id, "child")
+        t.finish_span(failing.trace_id, span.id, error="boom")
+        t.finish_trace(failing.trace_id)
+
+        for i in range(20):
+            trace = t.start_trace(operation_name="ok")
+            t.finish_trace(trace.trace_id)
+
+        assert len(t.traces) <= 5
+        assert t.get_trace(failing.trace_id) is not None
+        assert t.get_latency_stats("ok")["count"] == 20
+        assert t.get_metrics()["metrics"]["traces_evicted"] == 16
+
+    def test_trace_store_lru_order(self):
+        """Test recently read traces survive eviction."""
+        store = TraceStore(max_traces=2)
+        traces = [Trace(trace_id=f"t{i}") for i in range(3)]
+        for trace in traces[:2]:
+            store.add(trace)
+            trace.finish()
+            store.complete(trace)
+        store.get("t0")
+        store.add(traces[2])
+        traces[2].finish()
+        store.complete(traces[2])
+
+        assert "t0" in store
+        assert "t1" not in store
+
+    def test_latency_sketch_accuracy(self, project_root):
+        """Test streaming percentiles track the true distribution."""
+        t = DistributedTracer("svc", project_root)
+        for ms in range(1, 1001):
+            t._record_latency(Trace(operation_name="op", duration_ms=float(ms)))
+
+        stats = t.get_latency_stats("op")
+        assert stats["count"] == 1000
+        assert stats["p50"] == pytest.approx(500, rel=0.02)
+        assert stats["p99"] == pytest.approx(990, rel=0.02)
+        assert stats["min"] == 1.0
+        assert stats["max"] == 1000.0
+
+    def test_exporter_batches_in_background(self, project_root):
+        """Test background export writes batched records."""
+        exporter = SpanExporter(batch_size=10, flush_interval=0.05)
+        out = project_root / "out.jsonl"
+        for i in range(25):
+            exporter.submit(out, {"i": i})
+        exporter.close()
+
+        lines = out.read_text().splitlines()
+        assert len(lines) == 25
+        assert [json.loads(l)["i"] for l in lines] == list(range(25))
+
+
 class TestTracingService:
     """Test high-level tracing service."""
 
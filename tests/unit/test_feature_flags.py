@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Tests for Feature Flags & A/B Testing."""
 
+import json
 import pytest
 import tempfile
+import threading
 from pathlib import Path
 import sys
 
@@ -301,5 +303,125 @@ class TestRolloutStrategies:
         assert flag.rollout_percentage == 25
 
 
+class TestEvaluationSnapshot:
+    """Test compiled snapshots and aggregated evaluation logging."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create manager without background flushing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = FeatureFlagManager(Path(tmpdir), flush_interval=None)
+            yield manager
+            manager.close()
+
+    def test_direct_edits_invalidate_snapshot(self, manager):
+        """Test attribute assignment on a flag is seen by evaluate."""
+        manager.create_flag("feature1", enabled=True, rollout_percentage=100)
+        assert manager.evaluate("feature1", "user-1") is True
+
+        manager.flags["feature1"].target_users = ["user-2"]
+        assert manager.evaluate("feature1", "user-1") is False
+        assert manager.evaluate("feature1", "user-2") is True
+
+    def test_snapshot_changes_are_per_manager(self, manager, tmp_path):
+        """Test edits only invalidate the managers that compiled the object."""
+        other = FeatureFlagManager(tmp_path, flush_interval=None)
+        other.create_flag("feature1", enabled=True, rollout_percentage=100)
+        manager.create_flag("feature1", enabled=True, rollout_percentage=100)
+        manager.evaluate("feature1", "user-1")
+        other.evaluate("feature1", "user-1")
+        snapshot = other._snapshot
+
+        FeatureFlag(name="unrelated", enabled=True)
+        manager.flags["feature1"].enabled = False
+        assert manager.evaluate("feature1", "user-1") is False
+        assert other.evaluate("feature1", "user-1") is True
+        assert other._snapshot is snapshot
+        other.close()
+
+    def test_removed_flag_and_in_place_edits(self, manager):
+        """Test removal is seen, and refresh() picks up in-place mutation."""
+        manager.create_flag("feature1", enabled=True, rollout_percentage=100)
+        manager.create_flag("feature2", enabled=True, rollout_percentage=100)
+        manager.flags["feature1"].target_users = ["user-2"]
+        assert manager.evaluate("feature1", "user-1") is False
+
+        manager.flags["feature1"].target_users.append("user-1")
+        manager.refresh()
+        assert manager.evaluate("feature1", "user-1") is True
+
+        del manager.flags["feature2"]
+        assert manager.evaluate("feature2", "user-1") is False
+
+    def test_rollout_fraction(self, manager):
+        """Test rollout admits roughly the configured share, consistently."""
+        manager.create_flag("feature1", enabled=True, rollout_percentage=20)
+        users = [f"user-{i}" for i in range(2000)]
+        admitted = [u for u in users if manager.evaluate("feature1", u)]
+        assert 300 < len(admitted) < 500
+        assert admitted == [u for u in users if manager.evaluate("feature1", u)]
+
+        manager.set_rollout("feature1", 0)
+        assert not any(manager.evaluate("feature1", u) for u in users[:200])
+
+    def test_variant_weights(self, manager):
+        """Test uneven variant weights."""
+        manager.create_ab_test("test1", "feature1", [
+            Variant(name="control", weight=0.9),
+            Variant(name="treatment", weight=0.1)
+        ])
+        manager.ab_tests["test1"].enabled = True
+        names = [manager.get_variant("test1", f"user-{i}").name for i in range(2000)]
+        assert 100 < names.count("treatment") < 300
+
+    def test_flush_writes_aggregates(self, manager):
+        """Test evaluations are logged as per-flag deltas."""
+        manager.create_flag("feature1", enabled=True, rollout_percentage=100)
+        manager.create_flag("feature2", enabled=False)
+        for _ in range(5):
+            manager.evaluate("feature1", "user-1")
+        manager.evaluate("feature2", "user-1")
+
+        assert manager.flush_evaluations() == 2
+        manager.evaluate("feature1", "user-1")
+        assert manager.flush_evaluations() == 1
+        assert manager.flush_evaluations() == 0
+
+        lines = [json.loads(l) for l in manager.evaluations_log.read_text().splitlines()]
+        feature1 = [l for l in lines if l["flag"] == "feature1"]
+        assert [(l["enabled"], l["disabled"]) for l in feature1] == [(5, 0), (1, 0)]
+        assert manager.get_evaluation_counts()["feature2"] == {"enabled": 0, "disabled": 1}
+
+    def test_counts_across_threads(self, manager):
+        """Test per-thread counters are all included."""
+        manager.create_flag("feature1", enabled=True, rollout_percentage=100)
+
+        def worker():
+            for _ in range(1000):
+                manager.evaluate("feature1", "user-1")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert manager.get_evaluation_counts()["feature1"]["enabled"] == 4000
+
+    def test_finished_thread_counts_are_folded(self, manager):
+        """Test counters of finished threads are retired, not kept per thread."""
+        manager.create_flag("feature1", enabled=True, rollout_percentage=100)
+
+        for _ in range(20):
+            t = threading.Thread(target=manager.evaluate, args=("feature1", "user-1"))
+            t.start()
+            t.join()
+        assert manager.flush_evaluations() == 1
+
+        manager.evaluate("feature1", "user-1")
+        assert len(manager._thread_counts) == 1
+        assert manager.get_evaluation_counts()["feature1"]["enabled"] == 21
+        assert manager.flush_evaluations() == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""
+Unit tests for the in-memory file tree index
+"""
+
+import os
+import time
+
+import pytest
+
+from src.deia.services.file_index import FileIndex
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "project_browser.py").write_text("x" * 10)
+    (tmp_path / "src" / "pkg" / "browser_utils.py").write_text("y")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "README.md").write_text("readme")
+    (tmp_path / ".git" / "objects").mkdir(parents=True)
+    (tmp_path / ".git" / "objects" / "browser.pack").write_text("ignored")
+    return tmp_path
+
+
+class TestFileIndex:
+    """Test suite for FileIndex"""
+
+    def test_build_and_ignore(self, tree):
+        index = FileIndex(str(tree))
+        paths = {rel for rel, _ in index.walk()}
+
+        assert os.path.join("src", "pkg", "project_browser.py") in paths
+        assert not any(p.startswith(".git") for p in paths)
+        assert index.get(os.path.join("src", "pkg", "project_browser.py"))[0] == 10
+        assert index.get("docs")[2] is True
+
+    def test_search_modes(self, tree):
+        index = FileIndex(str(tree))
+
+        assert index.search("BROWSER") == [
+            os.path.join("src", "pkg", "browser_utils.py"),
+            os.path.join("src", "pkg", "project_browser.py"),
+        ]
+        assert index.search("browser", mode="prefix") == [os.path.join("src", "pkg", "browser_utils.py")]
+        assert index.search("prjbrw", mode="fuzzy") == [os.path.join("src", "pkg", "project_browser.py")]
+        assert index.search("pb", mode="fuzzy")[0] == os.path.join("src", "pkg", "project_browser.py")
+        assert index.search("missing") == []
+
+    def test_apply_events(self, tree):
+        index = FileIndex(str(tree))
+        index.ensure()
+
+        new_dir = tree / "docs" / "guides"
+        new_dir.mkdir()
+        (new_dir / "setup.md").write_text("setup")
+        index.apply_event("created", str(new_dir))
+        assert index.search("setup") == [os.path.join("docs", "guides", "setup.md")]
+
+        os.rename(tree / "docs", tree / "manual")
+        index.apply_event("moved", str(tree / "docs"), str(tree / "manual"))
+        assert index.search("setup") == [os.path.join("manual", "guides", "setup.md")]
+        assert index.get("docs") is None
+
+        (tree / "manual" / "README.md").unlink()
+        index.apply_event("deleted", str(tree / "manual" / "README.md"))
+        assert index.search("readme") == []
+
+        index.apply_event("created", str(tree / ".git" / "objects" / "new.pack"))
+        assert index.search("new.pack") == []
+
+    def test_refresh_rescans_changed_directories(self, tree):
+        index = FileIndex(str(tree))
+        index.ensure()
+
+        time.sleep(0.01)
+        (tree / "src" / "pkg" / "added.py").write_text("new")
+        (tree / "docs" / "README.md").unlink()
+
+        assert index.refresh() == 2
+        assert index.search("added") == [os.path.join("src", "pkg", "added.py")]
+        assert index.search("readme") == []
+        assert index.refresh() == 0
+
+    def test_cache_roundtrip(self, tree):
+        cache = tree / ".deia" / "cache" / "file-index.json"
+        index = FileIndex(str(tree), cache_file=str(cache))
+        index.ensure()
+        assert cache.exists()
+
+        time.sleep(0.01)
+        (tree / "docs" / "CHANGELOG.md").write_text("log")
+
+        reloaded = FileIndex(str(tree), cache_file=str(cache))
+        assert reloaded.search("changelog") == [os.path.join("docs", "CHANGELOG.md")]
+        assert reloaded.search("file-index") == []
+        assert len(reloaded) == len(FileIndex(str(tree), cache_file=str(cache)))
+
+    def test_watch(self, tree):
+        index = FileIndex(str(tree))
+        index.watch()
+        try:
+            (tree / "docs" / "watched.md").write_text("hello")
+            deadline = time.time() + 5
+            while not index.search("watched") and time.time() < deadline:
+                time.sleep(0.05)
+            assert index.search("watched") == [os.path.join("docs", "watched.md")]
+        finally:
+            index.stop()
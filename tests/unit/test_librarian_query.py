@@ -0,0 +1,152 @@
+"""Tests for the librarian query tool's compiled index."""
+
+import pytest
+
+from deia.tools import query
+from deia.tools.query import CompiledIndex, compile_index, search_index, trigrams
+
+
+@pytest.fixture
+def index():
+    return {
+        'clusters': {
+            'deployment': {
+                'keywords': ['deploy', 'release'],
+                'documents': [
+                    {
+                        'path': 'docs/netlify-dns.md',
+                        'title': 'Netlify DNS Troubleshooting',
+                        'summary': 'Fix DNS records after a Netlify deployment',
+                        'keywords': ['dns', 'netlify'],
+                        'urgency': 'critical',
+                        'platforms': ['netlify'],
+                        'audience': 'intermediate',
+                    },
+                    {
+                        'path': 'docs/release-checklist.md',
+                        'title': 'Release Checklist',
+                        'summary': 'Steps before tagging a release',
+                        'keywords': ['checklist'],
+                        'urgency': 'medium',
+                        'platforms': ['github'],
+                        'audience': 'beginner',
+                    },
+                    'cross-ref-id',
+                ],
+            },
+            'encoding': {
+                'keywords': ['unicode'],
+                'documents': [
+                    {
+                        'path': 'docs/python-encoding.md',
+                        'title': 'Python Encoding on Windows',
+                        'summary': 'Always pass encoding to open()',
+                        'keywords': ['python', 'encoding'],
+                        'urgency': 'high',
+                        'platforms': ['windows'],
+                        'audience': 'advanced',
+                    },
+                ],
+            },
+        }
+    }
+
+
+def paths(results):
+    return [r['doc']['path'] for r in results]
+
+
+class TestCompiledIndex:
+    """Index is compiled once into postings"""
+
+    def test_postings(self, index):
+        compiled = CompiledIndex(index)
+        assert len(compiled.docs) == 3
+        assert compiled.keyword_docs['deploy'] == {0, 1}
+        assert compiled.title_terms['netlify'] == {0}
+        assert 'pyt' in trigrams('python')
+        assert 'python' in compiled.term_trigrams['pyt']
+
+    def test_compile_reused_for_same_index(self, index):
+        assert compile_index(index) is compile_index(index)
+
+    def test_compile_sees_in_place_edits(self, index):
+        compiled = compile_index(index)
+        index['clusters']['encoding']['documents'][0]['keywords'].append('utf8')
+
+        recompiled = compile_index(index)
+        assert recompiled is not compiled
+        assert recompiled.keyword_docs['utf8'] == {2}
+        assert compile_index(index) is recompiled
+
+    def test_filters_from_postings(self, index):
+        compiled = CompiledIndex(index)
+        assert compiled.filtered_docs(urgency_filter='CRITICAL') == {0}
+        assert compiled.filtered_docs(platform_filter='windows', audience_filter='advanced') == {2}
+        assert compiled.filtered_docs(platform_filter='windows', urgency_filter='low') == set()
+
+
+class TestSearchIndex:
+    """Search results and scoring"""
+
+    def test_and_requires_all_keywords(self, index):
+        results = search_index(index, {'netlify', 'dns'}, use_fuzzy=False)
+        assert paths(results) == ['docs/netlify-dns.md']
+        assert results[0]['score'] == 2 + 2 + 3
+        assert search_index(index, {'netlify', 'python'}, use_fuzzy=False) == []
+
+    def test_or_ranks_by_score(self, index):
+        results = search_index(index, {'release', 'python'}, logic_mode='OR', use_fuzzy=False)
+        assert paths(results) == ['docs/release-checklist.md', 'docs/python-encoding.md', 'docs/netlify-dns.md']
+
+    def test_filters_applied(self, index):
+        results = search_index(index, {'deploy'}, urgency_filter='medium', use_fuzzy=False)
+        assert paths(results) == ['docs/release-checklist.md']
+
+    @pytest.mark.skipif(not query.FUZZY_AVAILABLE, reason="rapidfuzz not installed")
+    def test_fuzzy_typo_matches_title_term(self, index):
+        results = search_index(index, {'pyhton'})
+        assert paths(results) == ['docs/python-encoding.md']
+        assert results[0]['fuzzy_matches'][0].startswith('pyhton~')
+        assert results[0]['score'] == 1
+
+    @pytest.mark.skipif(not query.FUZZY_AVAILABLE, reason="rapidfuzz not installed")
+    def test_fuzzy_scores_only_trigram_candidates(self, index, monkeypatch):
+        scored = []
+        original = query.fuzz.partial_ratio
+        monkeypatch.setattr(query.fuzz, 'partial_ratio', lambda a, b: scored.append(b) or original(a, b))
+        search_index(CompiledIndex(index), {'netlfy'})
+        assert 'netlify' in scored
+        assert 'windows' not in scored
+
+
+class TestCompiledIndexCache:
+    """Compiled index is cached on disk as JSON"""
+
+    @pytest.fixture
+    def paths_in_tmp(self, tmp_path, monkeypatch, index):
+        import yaml
+        index_path = tmp_path / "master-index.yaml"
+        index_path.write_text(yaml.safe_dump(index))
+        cache_path = tmp_path / "cache" / "master-index.compiled.json"
+        monkeypatch.setattr(query, 'INDEX_PATH', index_path)
+        monkeypatch.setattr(query, 'COMPILED_INDEX_PATH', cache_path)
+        return cache_path
+
+    def test_cache_roundtrip(self, paths_in_tmp):
+        built = query.load_compiled_index()
+        assert paths_in_tmp.exists()
+
+        loaded = query.load_compiled_index()
+        assert loaded.keyword_docs == built.keyword_docs
+        assert loaded.term_trigrams == built.term_trigrams
+        assert paths(search_index(loaded, {'netlify'})) == ['docs/netlify-dns.md']
+
+    @pytest.mark.parametrize("content", [b"not json", b"\x80\x04\x95", b'{"version": 2, "source_mtime_ns": 0}', b"[]"])
+    def test_unreadable_cache_is_rebuilt(self, paths_in_tmp, content):
+        paths_in_tmp.parent.mkdir(parents=True)
+        paths_in_tmp.write_bytes(content)
+
+        compiled = query.load_compiled_index()
+        assert len(compiled.docs) == 3
+        assert query.load_compiled_index().keyword_docs == compiled.keyword_docs
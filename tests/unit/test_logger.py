@@ -154,3 +154,81 @@ class TestLoggerEdgeCases:
         assert log_file.exists()
         content = log_file.read_text(encoding='utf-8')
         assert 'Hello' in content
+
+
+@pytest.mark.unit
+class TestRealtimeSteps:
+    """Test append-only real-time step logging"""
+
+    def test_log_step_appends_journal(self, mock_deia_project, monkeypatch):
+        """Test steps go to the JSONL journal and session file"""
+        monkeypatch.chdir(mock_deia_project)
+
+        logger = ConversationLogger()
+        logger.log_step("Created auth module", files_modified=["src/auth.py"], decision="Use JWT")
+        logger.log_step("Added tests")
+
+        journal = logger.sessions_dir / "steps.jsonl"
+        steps = [json.loads(line) for line in journal.read_text(encoding='utf-8').splitlines()]
+        assert [s["action"] for s in steps] == ["Created auth module", "Added tests"]
+        assert steps[0]["files_modified"] == ["src/auth.py"]
+
+        session = logger.current_session_file.read_text(encoding='utf-8')
+        assert "Created auth module" in session
+        assert "**Decision:** Use JWT" in session
+        logger.step_journal.close()
+
+    def test_resume_view_is_bounded(self, mock_deia_project, monkeypatch):
+        """Test project_resume.md shows only the most recent steps, newest first"""
+        monkeypatch.chdir(mock_deia_project)
+
+        logger = ConversationLogger()
+        logger.step_journal.debounce_seconds = None
+        for i in range(30):
+            logger.log_step(f"step {i}")
+
+        resume = mock_deia_project / "project_resume.md"
+        assert not resume.exists()  # Not rewritten per step
+
+        logger.step_journal.materialize()
+        content = resume.read_text(encoding='utf-8')
+        lines = [l for l in content.splitlines() if l.startswith("- **[")]
+        assert len(lines) == logger.step_journal.RECENT_STEPS
+        assert lines[0].endswith("step 29")
+        assert "step 9" not in content
+
+    def test_resume_view_preserves_session_logs(self, mock_deia_project, monkeypatch):
+        """Test the view replaces only its own section"""
+        monkeypatch.chdir(mock_deia_project)
+
+        logger = ConversationLogger()
+        logger.create_session_log(
+            context="Earlier session",
+            transcript="",
+            decisions=[],
+            action_items=[],
+            files_modified=[],
+            next_steps=""
+        )
+        logger.log_step("first")
+        logger.step_journal.materialize()
+        logger.log_step("second")
+        logger.step_journal.close()
+
+        content = (mock_deia_project / "project_resume.md").read_text(encoding='utf-8')
+        assert content.count("## Current Session (Real-Time)") == 1
+        assert "Earlier session" in content
+        assert content.index("second") < content.index("first")
+
+    def test_recent_steps_seeded_from_journal(self, mock_deia_project, monkeypatch):
+        """Test a new logger picks up recent steps from an earlier process"""
+        monkeypatch.chdir(mock_deia_project)
+
+        first = ConversationLogger()
+        for i in range(5):
+            first.log_step(f"step {i}")
+        first.step_journal.close()
+
+        second = ConversationLogger()
+        recent = second.step_journal.recent_steps(limit=3)
+        assert [s["action"] for s in recent] == ["step 4", "step 3", "step 2"]
@@ -12,6 +12,7 @@ Test Coverage:
 - Search functionality
 - Pattern deprecation
 - Statistics
+- Search/duplicate indexes
 
 Author: CLAUDE-CODE-004
 Created: 2025-10-18
@@ -30,6 +31,7 @@ from deia.services.master_librarian import (
     PatternCategory,
     SubmissionMetadata,
     IndexEntry,
+    PatternIndex,
     ReviewResult,
     review_submission_cli,
     integrate_submission_cli,
@@ -785,3 +787,83 @@ class TestCLIWrappers:
             assert "title" in results[0]
         finally:
             os.chdir(original_cwd)
+
+
+def _entry(n, title, category="Pattern", tags=None, summary="Summary"):
+    return IndexEntry(
+        id=f"entry-{n}", path=f"bok\\patterns\\entry-{n}.md", title=title,
+        category=category, tags=tags or [], confidence="Experimental",
+        date="2025-10-18", created_by="test", summary=summary
+    )
+
+
+class TestPatternIndex:
+    """Test inverted and near-duplicate indexes kept alongside the master index"""
+
+    def test_index_is_pattern_index(self, librarian):
+        """Assigning a plain list still yields an indexed list"""
+        librarian.index = [_entry(1, "Git Workflow")]
+        assert isinstance(librarian.index, PatternIndex)
+        assert librarian.search_bok("git")[0].id == "entry-1"
+
+    def test_incremental_append_after_build(self, librarian):
+        """Entries appended after the first lookup are indexed"""
+        librarian.index.append(_entry(1, "Git Workflow", tags=["git"]))
+        assert librarian.search_bok("", tags=["git"])
+        librarian.index.append(_entry(2, "Docker Caching", category="Process", tags=["docker"]))
+        assert [e.id for e in librarian.search_bok("", category="Process")] == ["entry-2"]
+        assert [e.id for e in librarian.search_bok("caching")] == ["entry-2"]
+
+    def test_other_mutations_rebuild(self, librarian):
+        """Removing or replacing entries invalidates the indexes"""
+        librarian.index.extend([_entry(1, "Git Workflow"), _entry(2, "Docker Caching")])
+        assert len(librarian.search_bok("")) == 2
+        del librarian.index[0]
+        assert [e.id for e in librarian.search_bok("")] == ["entry-2"]
+        librarian.index[0] = _entry(3, "Release Checklist")
+        assert librarian.search_bok("docker") == []
+        assert librarian.search_bok("release")[0].id == "entry-3"
+
+    def test_filters_keep_index_order(self, librarian):
+        """Category + tag filters intersect and preserve index order"""
+        librarian.index.extend([
+            _entry(1, "A", category="Pattern", tags=["x"]),
+            _entry(2, "B", category="Process", tags=["x"]),
+            _entry(3, "C", category="Pattern", tags=["y"]),
+            _entry(4, "D", category="Pattern", tags=["x", "y"]),
+        ])
+        results = librarian.search_bok("", category="Pattern", tags=["y", "x"])
+        assert [e.id for e in results] == ["entry-1", "entry-3", "entry-4"]
+
+    def test_duplicate_matches_brute_force(self, librarian):
+        """LSH candidates find the same duplicates as comparing every entry"""
+        import random
+        rng = random.Random(7)
+        words = ["git", "workflow", "docker", "cache", "release", "deploy", "agent",
+                 "queue", "encoding", "windows", "testing", "review", "hive", "bot"]
+        tag_pool = ["a", "b", "c", "d"]
+        for n in range(400):
+            librarian.index.append(_entry(
+                n, " ".join(rng.sample(words, rng.randint(2, 5))).title(),
+                tags=rng.sample(tag_pool, rng.randint(1, 3))
+            ))
+
+        def brute_force(title, tags):
+            title_lower = title.lower()
+            for entry in librarian.index:
+                if entry.title.lower() == title_lower:
+                    return entry
+                if tags and entry.tags:
+                    overlap = len(set(tags) & set(entry.tags)) / len(set(tags) | set(entry.tags))
+                    if overlap > 0.7 and librarian._title_similarity(title_lower, entry.title.lower()) > 0.8:
+                        return entry
+            return None
+
+        found = 0
+        for _ in range(200):
+            title = " ".join(rng.sample(words, rng.randint(2, 5)))
+            tags = rng.sample(tag_pool, rng.randint(1, 3))
+            expected = brute_force(title, tags)
+            assert librarian._find_duplicate(title, tags) is expected
+            found += expected is not None
+        assert found > 0
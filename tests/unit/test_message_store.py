@@ -0,0 +1,97 @@
+"""Tests for the raqcoon MessageStore."""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from deia_raqcoon.runtime.store import MessageStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    message_store = MessageStore(tmp_path / "messages.db")
+    yield message_store
+    message_store.close()
+
+
+def test_latest_page_in_order(store):
+    for i in range(10):
+        store.add_message("general", "human", f"msg {i}", lane="chat", provider="claude", token_count=i)
+
+    page = store.get_messages("general", limit=4)
+    assert [m["content"] for m in page] == ["msg 6", "msg 7", "msg 8", "msg 9"]
+    assert page[-1]["token_count"] == 9
+
+
+def test_keyset_pagination_across_channels(store):
+    for i in range(15):
+        store.add_message("a", "human", f"a{i}")
+        store.add_message("b", "human", f"b{i}")
+
+    first = store.get_messages("a", limit=10)
+    second = store.get_messages("a", limit=10, before_id=first[0]["id"])
+    assert [m["content"] for m in second + first] == [f"a{i}" for i in range(15)]
+    assert len(store.get_messages(limit=7)) == 7
+
+
+def test_channels_and_summary(store):
+    store.add_message("b", "bot", "x", provider="codex", token_count=5)
+    store.add_message("a", "bot", "y", lane="build", token_count=7)
+
+    assert store.get_channels() == ["a", "b"]
+    summary = store.get_summary()
+    assert summary["total_messages"] == 2
+    assert summary["total_tokens"] == 12
+    assert summary["by_provider"] == {"codex": 1}
+    assert summary["by_lane"] == {"build": 1}
+
+
+def test_concurrent_writes_persist_after_close(tmp_path):
+    path = tmp_path / "messages.db"
+    store = MessageStore(path)
+    threads = [
+        threading.Thread(target=lambda n=n: [store.add_message(f"c{n}", "bot", str(i)) for i in range(100)])
+        for n in range(3)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    store.close()
+
+    reopened = MessageStore(path, write_behind=False)
+    assert reopened.get_summary()["total_messages"] == 300
+    assert [m["content"] for m in reopened.get_messages("c1", limit=100)] == [str(i) for i in range(100)]
+    reopened.close()
+
+
+def test_buffered_writes_flushed_at_exit(tmp_path):
+    path = tmp_path / "messages.db"
+    repo_root = Path(__file__).resolve().parents[2]
+    script = (
+        "from pathlib import Path\n"
+        "from deia_raqcoon.runtime.store import MessageStore\n"
+        f"store = MessageStore(Path({str(path)!r}))\n"
+        "for i in range(50):\n"
+        "    store.add_message('c1', 'bot', str(i))\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, env={"PYTHONPATH": str(repo_root)})
+
+    reopened = MessageStore(path, write_behind=False)
+    assert reopened.get_summary()["total_messages"] == 50
+    reopened.close()
+
+
+def test_search_with_channel_filter(store):
+    store.add_message("ops", "bot", "rollback completed for payments service")
+    store.add_message("dev", "bot", "payments service tests are green")
+    store.add_message("dev", "human", "what's for lunch")
+
+    results = store.search("payments")
+    assert len(results) == 2
+    assert all("[payments]" in r["snippet"] for r in results)
+    assert [r["channel_id"] for r in store.search("payments", channel_id="ops")] == ["ops"]
+    assert store.search("AND (") == []
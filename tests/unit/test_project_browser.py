@@ -273,3 +273,49 @@ class TestProjectBrowser:
         # Should handle gracefully, not crash
         tree = browser.get_tree()
         assert tree["type"] == "directory"
+
+    def test_search_modes_and_limit(self, tmp_path):
+        """Test prefix/fuzzy search served from the index"""
+        (tmp_path / ".deia").mkdir()
+        (tmp_path / "project_browser.py").write_text("code")
+        (tmp_path / "browser_test.py").write_text("test")
+
+        browser = ProjectBrowser(tmp_path)
+
+        assert [r["name"] for r in browser.search("browser", mode="prefix")] == ["browser_test.py"]
+        assert browser.search("pjbr", mode="fuzzy")[0]["name"] == "project_browser.py"
+        assert len(browser.search("browser", limit=1)) == 1
+
+    def test_refresh_picks_up_changes(self, tmp_path):
+        """Test new files appear after refresh()"""
+        (tmp_path / ".deia").mkdir()
+        browser = ProjectBrowser(tmp_path)
+        assert browser.search("later") == []
+
+        (tmp_path / "later.md").write_text("added")
+        browser.refresh()
+
+        results = browser.search("later")
+        assert len(results) == 1
+        assert results[0]["size"] == 5
+
+    def test_cached_index_sees_in_place_edits(self, tmp_path):
+        """Test a new browser reports current sizes for files edited in place"""
+        (tmp_path / ".deia").mkdir()
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "notes.md").write_text("x")
+        ProjectBrowser(tmp_path).close()
+
+        (tmp_path / "docs" / "notes.md").write_text("x" * 1000)
+        browser = ProjectBrowser(tmp_path)
+
+        assert browser.get_stats()["total_size"] == 1000
+        assert browser.filter_by_extension([".md"])[0]["size"] == 1000
+
+        (tmp_path / "docs" / "notes.md").write_text("x" * 10)
+        browser.refresh()
+        assert browser.get_stats()["total_size"] == 10
+
+        (tmp_path / "docs" / "notes.md").write_text("x" * 20)
+        browser.rebuild()
+        assert browser.get_stats()["total_size"] == 20
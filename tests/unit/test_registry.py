@@ -0,0 +1,121 @@
+"""
+Unit tests for ServiceRegistry persistence.
+
+Tests atomic writes, separate heartbeat storage, the read cache, and
+lock-protected registration.
+"""
+
+import json
+import threading
+import pytest
+from src.deia.services.registry import ServiceRegistry
+
+
+@pytest.fixture
+def registry_path(tmp_path):
+    return tmp_path / ".deia" / "hive" / "registry.json"
+
+
+@pytest.fixture
+def registry(registry_path):
+    return ServiceRegistry(registry_path=registry_path)
+
+
+class TestRegistration:
+    """Register/unregister round-trips through disk."""
+
+    def test_register_and_get(self, registry):
+        assert registry.register("deiasolutions-BOT-001", 8001, status="ready", pid=-1)
+        bot = registry.get_bot("deiasolutions-BOT-001")
+        assert bot["port"] == 8001
+        assert bot["repo"] == "deiasolutions"
+        assert bot["status"] == "ready"
+        assert registry.get_bot_url("deiasolutions-BOT-001") == "http://localhost:8001"
+
+    def test_duplicate_rejected(self, registry):
+        assert registry.register("BOT-001", 8001, pid=-1)
+        assert not registry.register("BOT-001", 8002, pid=-1)
+
+    def test_unregister_removes_heartbeat(self, registry):
+        registry.register("BOT-001", 8001, pid=-1)
+        registry.heartbeat("BOT-001", status="working")
+        registry.unregister("BOT-001")
+        assert registry.get_bot("BOT-001") is None
+        assert list(registry.heartbeat_dir.iterdir()) == []
+
+    def test_registry_file_is_valid_json(self, registry, registry_path):
+        registry.register("BOT-001", 8001, pid=-1)
+        data = json.loads(registry_path.read_text(encoding="utf-8"))
+        assert "BOT-001" in data["bots"]
+        # No temp files left behind by the rename-based writes
+        assert not list(registry_path.parent.glob(".registry.json.*"))
+
+
+class TestHeartbeats:
+    """Heartbeats live outside registry.json."""
+
+    def test_heartbeat_does_not_rewrite_registry(self, registry, registry_path):
+        registry.register("BOT-001", 8001, pid=-1)
+        before = registry_path.stat()
+        for status in ("active", "working", "idle"):
+            registry.heartbeat("BOT-001", status=status)
+        after = registry_path.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        assert registry.get_bot("BOT-001")["status"] == "idle"
+
+    def test_heartbeat_unknown_bot_ignored(self, registry):
+        registry.heartbeat("GHOST-001")
+        assert list(registry.heartbeat_dir.iterdir()) == []
+
+    def test_reregister_discards_old_heartbeat(self, registry):
+        registry.register("BOT-001", 8001, pid=-1)
+        registry.heartbeat("BOT-001", status="working")
+        registry.unregister("BOT-001")
+        registry.register("BOT-001", 8001, status="starting", pid=-1)
+        assert registry.get_bot("BOT-001")["status"] == "starting"
+
+
+class TestReadCache:
+    """The in-process cache follows writes from other instances."""
+
+    def test_cache_invalidated_by_other_writer(self, registry_path):
+        reader = ServiceRegistry(registry_path=registry_path)
+        writer = ServiceRegistry(registry_path=registry_path)
+        assert reader.get_all_bots() == {}
+        writer.register("BOT-001", 8001, pid=-1)
+        assert "BOT-001" in reader.get_all_bots()
+        writer.heartbeat("BOT-001", status="busy")
+        assert reader.get_bot("BOT-001")["status"] == "busy"
+
+    def test_cache_reused_when_unchanged(self, registry):
+        registry.register("BOT-001", 8001, pid=-1)
+        first = registry._load()
+        assert registry._load() is first
+
+    def test_returned_records_are_copies(self, registry):
+        registry.register("BOT-001", 8001, pid=-1)
+        registry.get_bot("BOT-001")["port"] = 9999
+        assert registry.get_bot("BOT-001")["port"] == 8001
+
+
+class TestConcurrency:
+    """Concurrent writers don't lose each other's updates."""
+
+    def test_threads_with_separate_instances(self, registry_path):
+        ServiceRegistry(registry_path=registry_path)
+
+        def worker(n):
+            registry = ServiceRegistry(registry_path=registry_path)
+            for i in range(10):
+                registry.register(f"BOT-{n}-{i}", 8001 + n * 10 + i, pid=-1)
+                registry.heartbeat(f"BOT-{n}-{i}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        bots = ServiceRegistry(registry_path=registry_path).get_all_bots()
+        assert len(bots) == 40
+        assert all(b["status"] == "active" for b in bots.values())
@@ -0,0 +1,133 @@
+"""Tests for the single-pass, streaming and batch sanitizer."""
+
+import re
+
+import pytest
+
+from src.deia.core import sanitize_file
+from src.deia.sanitizer import Sanitizer, StreamingSanitizer, sanitize_directory
+
+
+SAMPLE = (
+    "Contact dave@example.com or see https://internal.corp/wiki/page.\n"
+    "Logs at /home/dave/project/ and C:\\Users\\dave\\Documents\\notes.txt\n"
+    "api_key = 'abc123secret' and sk_live1234567890abcdefghij\n"
+    "Server 192.168.1.20 db postgres://user:pw@db/app\n"
+    "Public docs: https://github.com/deiasolutions/deia\n"
+)
+
+
+OVERLAPPING = [
+    "postgres://db.internal/app?password= hunter2",
+    "mysql://u@h/x?token = hunter2 done",
+    "see http://wiki.corp/page?api_key: hunter2",
+    "/home/alice/notes secret = hunter2",
+    "host 192.168.1.20http://wiki.corp/page",
+    "key sk_abcdefghijklmnopqrstuvwx" + "http://wiki.corp/x",
+    "mongodb://h/x password=\"hunter2\" and 192.168.1.20",
+]
+
+
+def sequential_sanitize(sanitizer, text):
+    """Reference: apply each pattern in turn, as the sanitizer used to."""
+    for pattern, replacement in sanitizer.patterns.values():
+        if '\\1' not in replacement:
+            # Literal replacement (the Windows path one contains backslashes)
+            replacement = lambda match, literal=replacement: literal
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+@pytest.fixture
+def sanitizer():
+    return Sanitizer()
+
+
+class TestSanitize:
+    def test_redacts_all_patterns(self, sanitizer):
+        sanitized, warnings = sanitizer.sanitize(SAMPLE)
+        assert "dave@example.com" not in sanitized
+        assert "[email]" in sanitized
+        assert "[url]" in sanitized
+        assert "/home/[user]/project/" in sanitized
+        assert "C:\\Users\\[user]\\Documents" in sanitized
+        assert "api_key: [redacted]" in sanitized
+        assert "[api-key]" in sanitized
+        assert "[internal-ip]" in sanitized
+        assert "[database-url]" in sanitized
+        assert "https://github.com/deiasolutions/deia" in sanitized
+        assert "Found 1 email pattern(s)" in warnings
+        assert "Found 1 windows_path pattern(s)" in warnings
+
+    def test_clean_content_unchanged(self, sanitizer):
+        text = "Refactored the parser in Python.\n"
+        assert sanitizer.sanitize(text) == (text, [])
+
+    def test_high_entropy_and_names(self, sanitizer):
+        text = "token-ish aB3dE5gH7jK9mN1pQ3rS5tU7 and Alice met Alice then Alice left"
+        _, warnings = sanitizer.sanitize(text)
+        assert any("1 high-entropy" in w for w in warnings)
+        assert "Content may contain personal names. Review manually." in warnings
+
+    def test_excluded_names_not_flagged(self, sanitizer):
+        _, warnings = sanitizer.sanitize("Python Python Python Docker Docker Docker")
+        assert warnings == []
+
+    def test_overlapping_secret_after_url(self, sanitizer):
+        sanitized, warnings = sanitizer.sanitize("postgres://db.internal/app?password= hunter2")
+        assert sanitized == "[database-url] [redacted]"
+        assert "Found 1 secret_pattern pattern(s)" in warnings
+
+    @pytest.mark.parametrize("text", OVERLAPPING)
+    def test_hides_everything_sequential_passes_hid(self, sanitizer, text):
+        expected = sequential_sanitize(sanitizer, text)
+        sanitized, _ = sanitizer.sanitize(text)
+        for word in ("hunter2", "10.0.0.1", "192.168.1.20", "sk_abcdefghijklmnopqrstuvwx", "db.internal", "wiki.corp"):
+            if word in text and word not in expected:
+                assert word not in sanitized
+
+
+class TestStreaming:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64])
+    def test_stream_matches_whole(self, sanitizer, chunk_size):
+        text = SAMPLE * 20
+        expected, expected_warnings = sanitizer.sanitize(text)
+        stream = StreamingSanitizer(sanitizer, overlap=128)
+        parts = [stream.feed(text[i:i + chunk_size]) for i in range(0, len(text), chunk_size)]
+        parts.append(stream.close())
+        assert "".join(parts) == expected
+        assert stream.warnings() == expected_warnings
+
+    def test_match_across_chunk_boundary(self, sanitizer):
+        report = sanitizer.new_report()
+        chunks = ["mail dave@exa", "mple.com now"]
+        out = "".join(sanitizer.sanitize_stream(chunks, report, overlap=32))
+        assert out == "mail [email] now"
+        assert report.counts["email"] == 1
+
+    def test_sanitize_file(self, tmp_path):
+        source = tmp_path / "session.md"
+        source.write_text(SAMPLE * 50, encoding="utf-8")
+        output = sanitize_file(str(source))
+        assert output.name == "session_SANITIZED.md"
+        assert output.read_text(encoding="utf-8") == Sanitizer().sanitize(SAMPLE * 50)[0]
+        assert (tmp_path / "session_SANITIZED_WARNINGS.txt").exists()
+
+
+class TestSanitizeDirectory:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_batch(self, tmp_path, workers):
+        for n in range(4):
+            (tmp_path / f"s{n}.md").write_text(SAMPLE if n % 2 else "nothing here\n", encoding="utf-8")
+        (tmp_path / "old_SANITIZED.md").write_text(SAMPLE, encoding="utf-8")
+        out_dir = tmp_path / "out"
+
+        results = sanitize_directory(tmp_path, out_dir, workers=workers)
+
+        assert [p.rsplit("/", 1)[-1] for p in results] == ["s0.md", "s1.md", "s2.md", "s3.md"]
+        assert results[str(tmp_path / "s0.md")] == []
+        assert "Found 1 email pattern(s)" in results[str(tmp_path / "s1.md")]
+        assert (out_dir / "s1_SANITIZED.md").exists()
+        assert (out_dir / "s1_SANITIZED_WARNINGS.txt").exists()
+        assert not (out_dir / "s0_SANITIZED_WARNINGS.txt").exists()
+        assert not (out_dir / "old_SANITIZED_SANITIZED.md").exists()
@@ -0,0 +1,117 @@
+"""Unit tests for ScrumMaster change-driven monitoring."""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.deia.scrum_master import ScrumMaster
+
+
+class FakeClient:
+    """Anthropic-compatible client returning a fixed verdict."""
+
+    def __init__(self, verdict=None):
+        self.verdict = verdict or {"compliant": True, "violations": [], "severity": "minor"}
+        self.calls = []
+        self.lock = threading.Lock()
+        self.messages = self
+
+    def create(self, model, max_tokens, messages):
+        prompt = messages[0]["content"]
+        with self.lock:
+            self.calls.append(prompt)
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(self.verdict))])
+
+
+@pytest.fixture
+def hive(tmp_path):
+    board = {"bots": {f"BOT-{i:03d}": {"role": "worker"} for i in range(1, 6)}}
+    board["bots"]["CLAUDE-CODE-001"] = {"role": "queen"}
+    (tmp_path / ".deia").mkdir()
+    (tmp_path / ".deia" / "bot-status-board.json").write_text(json.dumps(board))
+    return tmp_path
+
+
+def write_heartbeat(hive, bot_id, minutes_ago=0):
+    timestamp = (datetime.now() - timedelta(minutes=minutes_ago)).isoformat()
+    path = hive / ".deia" / "hive" / "heartbeats" / f"{bot_id}-heartbeat.yaml"
+    path.write_text(f'timestamp: "{timestamp}"\nstatus: working\n')
+
+
+class TestMonitorCycle:
+    """Test change detection and verdict reuse."""
+
+    def test_unchanged_bots_reuse_verdicts(self, hive):
+        client = FakeClient()
+        sm = ScrumMaster(hive, client=client, max_workers=4)
+        for i in range(1, 6):
+            write_heartbeat(hive, f"BOT-{i:03d}")
+
+        first = sm.monitor_cycle()
+        assert first["bots_checked"] == 5
+        assert first["llm_checks"] == 5
+        assert len(first["compliant"]) == 5
+
+        second = sm.monitor_cycle()
+        assert second["llm_checks"] == 0
+        assert second["unchanged"] == 5
+        assert len(second["compliant"]) == 5
+
+        # A new response only re-checks its bot
+        (sm.response_dir / "2025-01-01-1200-BOT-003-done.md").write_text("finished task")
+        third = sm.monitor_cycle()
+        assert third["llm_checks"] == 1
+        assert "finished task" in client.calls[-1]
+
+    def test_stale_heartbeat_triggers_recheck(self, hive):
+        client = FakeClient()
+        sm = ScrumMaster(hive, client=client)
+        write_heartbeat(hive, "BOT-001", minutes_ago=1)
+        sm.monitor_cycle()
+
+        assert sm.monitor_cycle()["llm_checks"] == 0
+
+        # Same heartbeat file, but it has now aged past the threshold
+        sm.HEARTBEAT_STALE_MINUTES = 0.5
+        assert sm.monitor_cycle()["llm_checks"] == 1
+
+    def test_repeat_violation_without_new_llm_call(self, hive):
+        client = FakeClient({"compliant": False, "violations": ["sitting idle"], "severity": "minor"})
+        sm = ScrumMaster(hive, client=client)
+
+        sm.monitor_cycle()
+        calls = len(client.calls)
+        second = sm.monitor_cycle()
+
+        assert len(client.calls) == calls
+        assert sm.out_of_order_bots == {f"BOT-{i:03d}" for i in range(1, 6)}
+        assert second["reports_sent"] == 5
+
+    def test_failed_checks_are_not_cached(self, hive):
+        client = FakeClient()
+        client.create = lambda **kwargs: (_ for _ in ()).throw(RuntimeError("API down"))
+        sm = ScrumMaster(hive, client=client)
+
+        assert len(sm.monitor_cycle()["compliant"]) == 5
+        assert sm.verdicts == {}
+
+    def test_response_index_picks_latest_per_bot(self, hive):
+        sm = ScrumMaster(hive, client=FakeClient())
+        for n in range(5):
+            path = sm.response_dir / f"2025-01-01-120{n}-BOT-001-r{n}.md"
+            path.write_text(f"response {n}")
+            stamp = 1_700_000_000 + n
+            os.utime(path, (stamp, stamp))
+        (sm.response_dir / "2025-01-01-1200-BOT-002-x.md").write_text("other")
+
+        index = sm._index_responses(["BOT-001", "BOT-002"])
+        assert [p.name for p in index["BOT-001"]] == [
+            "2025-01-01-1204-BOT-001-r4.md",
+            "2025-01-01-1203-BOT-001-r3.md",
+            "2025-01-01-1202-BOT-001-r2.md",
+        ]
+        assert len(index["BOT-002"]) == 1
@@ -9,7 +9,7 @@ import time
 from src.deia.stream_processor import (
     StreamRecord, StreamProcessor, WindowType, JoinType,
     AggregationFunction, StateStore, WindowFunction,
-    MemoryStreamSource, MemoryStreamSink
+    MemoryStreamSource, MemoryStreamSink, WindowedAggregator, WindowAggregate
 )
 
 
@@ -196,6 +196,122 @@ class TestStreamProcessor:
         assert results[0].sum_value == 820
 
 
+# ===== INCREMENTAL AGGREGATION TESTS =====
+
+class TestWindowedAggregator:
+    """Test continuous windowed aggregation."""
+
+    def test_window_aggregate(self):
+        """Test O(1) aggregate state and merging."""
+        agg = WindowAggregate()
+        for v in (3, 1, 2):
+            agg.add(v)
+        other = WindowAggregate()
+        other.add(10)
+        agg.merge(other)
+        assert (agg.count, agg.sum_value, agg.min_value, agg.max_value) == (4, 16, 1, 10)
+        assert agg.avg_value == 4.0
+
+    def test_tumbling_emits_on_watermark(self, sample_records):
+        """Windows close only once the watermark passes their end."""
+        aggregator = WindowedAggregator(WindowType.TUMBLING, 100.0, value_extractor=lambda r: r.value)
+        for record in sample_records:
+            assert aggregator.add(record) == []
+        assert len(aggregator.open_windows()) == 3
+
+        closed = aggregator.advance_watermark(1200.0)
+        assert [(r.window_key, r.count, r.sum_value) for r in closed] == [
+            ("tumble_1000.0_1100.0", 2, 300),
+            ("tumble_1100.0_1200.0", 2, 400),
+        ]
+        assert closed[0].min_value == 100 and closed[0].max_value == 200
+        assert len(aggregator.open_windows()) == 1
+
+        remaining = aggregator.flush()
+        assert [(r.count, r.avg_value) for r in remaining] == [(1, 120)]
+
+    def test_late_records_dropped(self):
+        """Records for closed windows are counted, not aggregated."""
+        aggregator = WindowedAggregator(WindowType.TUMBLING, 10.0)
+        aggregator.add(StreamRecord(key="a", value=1, timestamp=5.0))
+        aggregator.advance_watermark(20.0)
+        aggregator.add(StreamRecord(key="a", value=1, timestamp=8.0))
+        assert aggregator.late_records == 1
+        assert aggregator.open_windows() == []
+
+    def test_allowed_lateness(self):
+        """Allowed lateness keeps windows open past their end."""
+        aggregator = WindowedAggregator(WindowType.TUMBLING, 10.0, allowed_lateness=5.0)
+        aggregator.add(StreamRecord(key="a", value=1, timestamp=5.0))
+        assert aggregator.advance_watermark(12.0) == []
+        aggregator.add(StreamRecord(key="a", value=1, timestamp=8.0))
+        assert aggregator.advance_watermark(15.0)[0].count == 2
+
+    def test_sliding_assigns_each_window(self):
+        """A record lands in every sliding window that covers it."""
+        aggregator = WindowedAggregator(WindowType.SLIDING, 10.0, slide_interval=5.0)
+        aggregator.add(StreamRecord(key="a", value=1, timestamp=7.0))
+        assert [(w.start_time, w.end_time) for w in aggregator.open_windows()] == [(0, 10.0), (5, 15.0)]
+
+    def test_sessions_merge_by_gap(self):
+        """Session windows merge per key when records fall within the gap."""
+        aggregator = WindowedAggregator(
+            WindowType.SESSION, 10.0, key_extractor=lambda r: r.key, value_extractor=lambda r: r.value
+        )
+        for key, ts in [("a", 0.0), ("a", 25.0), ("a", 5.0), ("b", 3.0), ("a", 12.0), ("a", 18.0)]:
+            aggregator.add(StreamRecord(key=key, value=1, timestamp=ts))
+
+        windows = {(w.group_key, w.start_time, w.end_time): w.aggregate.count for w in aggregator.open_windows()}
+        # 18 bridges [0, 22) and [25, 35) into one session for "a"; "b" has its own
+        assert windows == {("b", 3.0, 13.0): 1, ("a", 0.0, 35.0): 5}
+
+        closed = aggregator.advance_watermark(40.0)
+        assert sorted(r.group_key for r in closed) == ["a", "b"]
+        assert aggregator.sessions == {}
+
+    def test_watermark_delay(self):
+        """Watermark can follow event time automatically."""
+        aggregator = WindowedAggregator(WindowType.TUMBLING, 10.0, watermark_delay=2.0)
+        aggregator.add(StreamRecord(key="a", value=1, timestamp=1.0))
+        closed = aggregator.add(StreamRecord(key="a", value=1, timestamp=12.0))
+        assert [r.window_key for r in closed] == ["tumble_0.0_10.0"]
+
+    def test_processor_continuous_aggregation(self, sample_records):
+        """Processor feeds registered aggregations without buffering records."""
+        processor = StreamProcessor(buffer_size=2, retain_records=False)
+        processor.register_aggregation("per_user", WindowType.TUMBLING, 1000.0,
+                                       key_extractor=lambda r: r.key, value_extractor=lambda r: r.value)
+        for record in sample_records:
+            assert processor.add_record(record)
+        assert processor.get_buffer_size() == 0
+
+        processor.add_record(StreamRecord(key=None, value=None, timestamp=2000.0, is_watermark=True))
+        results = {r.group_key: r.sum_value for r in processor.poll_results()}
+        assert results == {"user1": 370, "user2": 450}
+        assert processor.poll_results() == []
+
+    def test_unpolled_results_overflow_is_counted(self, sample_records):
+        """Results past the buffer are dropped oldest-first and counted."""
+        processor = StreamProcessor(buffer_size=1, retain_records=False)
+        processor.register_aggregation("per_user", WindowType.TUMBLING, 1000.0,
+                                       key_extractor=lambda r: r.key, value_extractor=lambda r: r.value)
+        for record in sample_records:
+            processor.add_record(record)
+        assert processor.dropped_results == 0
+
+        processor.add_record(StreamRecord(key=None, value=None, timestamp=2000.0, is_watermark=True))
+        assert len(processor.poll_results()) == 1
+        assert processor.dropped_results == 1
+
+    def test_apply_window_sessions(self, processor, sample_records):
+        """Batch session windows split on gaps."""
+        for record in sample_records:
+            processor.add_record(record)
+        processor.add_record(StreamRecord(key="user1", value=1, timestamp=5000.0))
+        windowed = processor.apply_window(WindowType.SESSION, 100.0, lambda r: r.key)
+        assert sorted(len(b.records) for b in windowed.values()) == [1, 5]
+
+
 # ===== STATE STORE TESTS =====
 
 class TestStateStore:
@@ -0,0 +1,100 @@
+"""Tests for streaming statistics primitives."""
+
+import random
+import statistics
+import pytest
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.deia.services.streaming_stats import RunningStats, QuantileSketch, WindowedStats
+
+
+class TestRunningStats:
+    """Welford mean/variance and merging."""
+
+    def test_matches_statistics_module(self):
+        values = [random.uniform(-50, 500) for _ in range(500)]
+        stats = RunningStats()
+        for v in values:
+            stats.add(v)
+        assert stats.count == 500
+        assert stats.mean == pytest.approx(statistics.mean(values))
+        assert stats.std == pytest.approx(statistics.stdev(values))
+        assert stats.min == min(values)
+        assert stats.max == max(values)
+
+    def test_merge_equals_single_pass(self):
+        a, b = RunningStats(), RunningStats()
+        left = [float(v) for v in range(50)]
+        right = [float(v) * 3 for v in range(80)]
+        for v in left:
+            a.add(v)
+        for v in right:
+            b.add(v)
+        a.merge(b)
+        assert a.count == 130
+        assert a.mean == pytest.approx(statistics.mean(left + right))
+        assert a.std == pytest.approx(statistics.stdev(left + right))
+
+
+class TestQuantileSketch:
+    """Relative-error quantiles."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        values = [random.lognormvariate(3, 1) for _ in range(5000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for v in values:
+            sketch.add(v)
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            expected = ordered[int(q * (len(ordered) - 1))]
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.03)
+
+    def test_handles_zero_and_negative(self):
+        sketch = QuantileSketch()
+        for v in [-10.0, -5.0, 0.0, 5.0, 10.0]:
+            sketch.add(v)
+        assert sketch.quantile(0.0) == -10.0
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == 10.0
+
+    def test_bucket_count_bounded(self):
+        sketch = QuantileSketch(max_buckets=64)
+        for i in range(1, 10000):
+            sketch.add(float(i) ** 2)
+        assert len(sketch.positive) <= 64
+        assert sketch.quantile(0.99) == pytest.approx(9900.0 ** 2, rel=0.03)
+
+    def test_round_trip_and_merge(self):
+        a, b = QuantileSketch(), QuantileSketch()
+        for v in range(1, 101):
+            a.add(float(v))
+        for v in range(101, 201):
+            b.add(float(v))
+        restored = QuantileSketch.from_dict(b.to_dict())
+        a.merge(restored)
+        assert a.count == 200
+        assert a.quantile(0.5) == pytest.approx(100.0, rel=0.03)
+
+
+class TestWindowedStats:
+    """Time-bucketed window expiry."""
+
+    def test_buckets_expire(self):
+        window = WindowedStats(window_seconds=100, num_buckets=10)
+        for t in range(0, 50):
+            window.add(1.0, float(t))
+        for t in range(150, 160):
+            window.add(2.0, float(t))
+        assert window.stats.count == 10
+        assert window.stats.mean == 2.0
+
+    def test_late_arrival_within_window(self):
+        window = WindowedStats(window_seconds=100, num_buckets=10)
+        window.add(1.0, 50.0)
+        window.add(3.0, 25.0)
+        assert window.stats.count == 2
+        assert [b[0] for b in window.buckets] == [2, 5]
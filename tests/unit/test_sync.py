@@ -0,0 +1,122 @@
+"""Tests for the batched DownloadsSyncer pipeline."""
+
+import json
+import os
+
+import pytest
+from watchdog.events import FileCreatedEvent, FileModifiedEvent
+
+from src.deia.sync import DownloadsSyncer
+
+
+DOC = """---
+deia_routing:
+  project: demo
+  destination: docs/specs
+---
+# Document {n}
+"""
+
+
+@pytest.fixture
+def sync_env(tmp_path):
+    downloads = tmp_path / "Downloads"
+    downloads.mkdir()
+    project = tmp_path / "demo"
+    sync_dir = tmp_path / "sync"
+    config = {
+        "downloads_folder": str(downloads),
+        "projects": {"demo": str(project)},
+        "log_file": str(sync_dir / "sync.log"),
+        "state_file": str(sync_dir / "state.json"),
+        "processed_folder": str(sync_dir / "processed"),
+        "error_folder": str(sync_dir / "errors"),
+        "temp_staging_folder": str(downloads / ".deia-staging"),
+        "processing": {"use_temp_staging": False, "workers": 4, "debounce_seconds": 0.5},
+    }
+    config_path = tmp_path / "routing-config.json"
+    config_path.write_text(json.dumps(config), encoding="utf-8")
+    return {
+        "config": str(config_path),
+        "downloads": downloads,
+        "target": project / "docs" / "specs",
+        "sync_dir": sync_dir,
+    }
+
+
+def _write_docs(folder, count, start=0):
+    for n in range(start, start + count):
+        (folder / f"doc-{n:03d}.md").write_text(DOC.format(n=n), encoding="utf-8")
+
+
+class TestBatchProcessing:
+    def test_process_existing_files_parallel(self, sync_env):
+        _write_docs(sync_env["downloads"], 25)
+        (sync_env["downloads"] / "broken.md").write_text("no frontmatter", encoding="utf-8")
+
+        syncer = DownloadsSyncer(config_path=sync_env["config"])
+        syncer.process_existing_files()
+
+        routed = sorted(p.name for p in sync_env["target"].iterdir())
+        assert routed == [f"doc-{n:03d}.md" for n in range(25)]
+        assert (sync_env["sync_dir"] / "errors" / "broken.md").exists()
+
+        metrics = syncer.get_metrics()
+        assert metrics["files_seen"] == 26
+        assert metrics["routed"] == 25
+        assert metrics["errors"] == 1
+        assert metrics["ledger_entries"] == 25
+
+        state = json.loads((sync_env["sync_dir"] / "state.json").read_text(encoding="utf-8"))
+        assert state["processed_count"] == 25
+        assert state["errors_count"] == 1
+
+    def test_restart_skips_already_routed_content(self, sync_env):
+        _write_docs(sync_env["downloads"], 5)
+        DownloadsSyncer(config_path=sync_env["config"]).process_existing_files()
+
+        # Same content downloaded again under another name, after state was lost
+        os.remove(sync_env["sync_dir"] / "state.json")
+        (sync_env["downloads"] / "doc-000 (1).md").write_text(DOC.format(n=0), encoding="utf-8")
+        _write_docs(sync_env["downloads"], 1, start=5)
+
+        syncer = DownloadsSyncer(config_path=sync_env["config"])
+        stats = syncer.process_files(syncer.scan_existing_files(str(sync_env["downloads"])))
+
+        assert (stats.routed, stats.skipped, stats.errors) == (1, 1, 0)
+        assert len(list(sync_env["target"].iterdir())) == 6
+        assert (sync_env["downloads"] / "doc-000 (1).md").exists()
+
+    def test_conflicting_targets_get_unique_names(self, sync_env):
+        sync_env["target"].mkdir(parents=True)
+        (sync_env["target"] / "doc-000.md").write_text("existing", encoding="utf-8")
+        _write_docs(sync_env["downloads"], 1)
+
+        syncer = DownloadsSyncer(config_path=sync_env["config"])
+        syncer.process_existing_files()
+
+        assert len(list(sync_env["target"].iterdir())) == 2
+        assert (sync_env["target"] / "doc-000.md").read_text(encoding="utf-8") == "existing"
+
+
+class TestDebouncedEvents:
+    def test_events_coalesce_until_quiet(self, sync_env):
+        syncer = DownloadsSyncer(config_path=sync_env["config"])
+        _write_docs(sync_env["downloads"], 3)
+        paths = [str(p) for p in sorted(sync_env["downloads"].glob("*.md"))]
+
+        for path in paths:
+            syncer.on_created(FileCreatedEvent(path))
+            syncer.on_created(FileCreatedEvent(path))
+        syncer.on_created(FileCreatedEvent(str(sync_env["downloads"] / "image.png")))
+        assert len(syncer._pending) == 3
+
+        # Still being written: a modify event restarts the window
+        syncer.on_modified(FileModifiedEvent(paths[0]))
+        assert syncer.flush_pending(now=syncer._pending[paths[1]] + 0.1) is None
+
+        stats = syncer.flush_pending(now=syncer._pending[paths[0]] + 1.0)
+        assert stats.files_seen == 3
+        assert stats.routed == 3
+        assert syncer._pending == {}
+        assert syncer.flush_pending(force=True) is None
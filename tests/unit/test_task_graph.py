@@ -0,0 +1,120 @@
+"""
+Tests for the deia_raqcoon TaskGraph (incremental readiness, critical path).
+"""
+
+import random
+
+import pytest
+
+from deia_raqcoon.runtime.task_graph import TaskGraph, build_task_graph
+
+
+def spec(*tasks):
+    return {
+        "spec_id": "SPEC-TEST",
+        "title": "Test",
+        "tasks": [
+            {"task_id": tid, "title": tid, "intent": "code", "depends_on": deps, **extra}
+            for tid, deps, extra in tasks
+        ],
+    }
+
+
+def brute_force_ready(graph):
+    return {
+        tid for tid, node in graph.nodes.items()
+        if node.status in ("pending", "ready")
+        and all(graph.nodes[d].status == "complete" for d in node.depends_on if d in graph.nodes)
+    }
+
+
+class TestReadiness:
+    """Incremental ready-set tracking."""
+
+    def test_mark_complete_returns_newly_ready(self):
+        graph = build_task_graph(spec(
+            ("A", [], {}), ("B", ["A"], {}), ("C", ["A"], {}), ("D", ["B", "C"], {}),
+        ))
+
+        assert [t.task_id for t in graph.get_ready_tasks()] == ["A"]
+        assert graph.mark_complete("A") == ["B", "C"]
+        assert graph.mark_complete("B") == []
+        assert graph.mark_complete("C") == ["D"]
+        assert graph.nodes["D"].status == "ready"
+        assert graph.mark_complete("A") == []
+
+    def test_unknown_dependencies_ignored(self):
+        graph = build_task_graph(spec(("A", ["EXTERNAL"], {}), ("B", ["A", "A"], {})))
+
+        assert [t.task_id for t in graph.get_ready_tasks()] == ["A"]
+        assert graph.mark_complete("A") == ["B"]
+
+    def test_in_progress_and_blocked_leave_ready_set(self):
+        graph = build_task_graph(spec(("A", [], {}), ("B", [], {}), ("C", ["A"], {})))
+
+        graph.mark_in_progress("A")
+        graph.mark_blocked("B")
+        assert graph.get_ready_tasks() == []
+
+        graph.mark_complete("A")
+        graph.mark_in_progress("A")  # re-opened: C waits again
+        assert graph.get_ready_tasks() == []
+
+    def test_matches_brute_force_on_random_dag(self):
+        rng = random.Random(7)
+        tasks = []
+        for i in range(200):
+            deps = [f"T{j:03d}" for j in rng.sample(range(i), min(i, rng.randint(0, 4)))]
+            tasks.append((f"T{i:03d}", deps, {}))
+        graph = build_task_graph(spec(*tasks))
+
+        while True:
+            ready = graph.get_ready_tasks()
+            assert {t.task_id for t in ready} == brute_force_ready(graph)
+            if not ready:
+                break
+            graph.mark_complete(rng.choice(ready).task_id)
+        assert all(node.status == "complete" for node in graph.nodes.values())
+
+
+class TestCriticalPath:
+    """Ready tasks are ordered by remaining critical path."""
+
+    def test_longest_chain_first(self):
+        graph = build_task_graph(spec(
+            ("SHORT", [], {"priority": "P0"}),
+            ("LONG", [], {}),
+            ("LONG-2", ["LONG"], {}),
+            ("LONG-3", ["LONG-2"], {"estimate": 3}),
+        ))
+
+        assert graph.critical_path["LONG"] == 5
+        assert graph.critical_path["SHORT"] == 1
+        assert [t.task_id for t in graph.get_ready_tasks()] == ["LONG", "SHORT"]
+        assert graph.get_parallel_groups()[0] == ["LONG", "SHORT"]
+
+    def test_priority_breaks_ties(self):
+        graph = build_task_graph(spec(("A", [], {"priority": "P2"}), ("B", [], {"priority": "P0"})))
+
+        assert [t.task_id for t in graph.get_ready_tasks()] == ["B", "A"]
+
+    def test_circular_dependency(self):
+        with pytest.raises(ValueError, match="Circular"):
+            build_task_graph(spec(("A", ["B"], {}), ("B", ["A"], {})))
+
+
+class TestPersistence:
+    """Graph state round-trips through save/load."""
+
+    def test_save_and_load_preserves_progress(self, tmp_path):
+        graph = build_task_graph(spec(("A", [], {}), ("B", ["A"], {}), ("C", ["B"], {"estimate": 2})))
+        graph.mark_complete("A")
+        path = tmp_path / "graph.json"
+        graph.save(path)
+
+        restored = TaskGraph.load(path)
+
+        assert restored.nodes["A"].status == "complete"
+        assert [t.task_id for t in restored.get_ready_tasks()] == ["B"]
+        assert restored.critical_path == graph.critical_path
+        assert restored.mark_complete("B") == ["C"]
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Tests for Telemetry ETL parallel extraction."""
+
+import json
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from deia.services.telemetry_etl import (
+    autorun,
+    extract_hive_boxes,
+    extract_sessions,
+    resolve_workers,
+)
+
+
+SESSION_TEMPLATE = """# Session {n}
+
+**Date:** 2025-10-{day:02d}T10:00:00
+**Session ID:** session-{n:03d}
+**Status:** Completed
+
+## Context
+Working on item {n}
+
+## Key Decisions Made
+- Decision {n}a
+- Decision {n}b
+
+## Action Items
+- Follow up {n}
+
+## Files Modified
+- `src/file_{n}.py`
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with session and hive files."""
+    sessions = tmp_path / ".deia" / "sessions"
+    sessions.mkdir(parents=True)
+    for n in range(12):
+        (sessions / f"session-{n:03d}.md").write_text(
+            SESSION_TEMPLATE.format(n=n, day=(n % 28) + 1), encoding="utf-8"
+        )
+    for box in ("tasks", "responses"):
+        box_dir = tmp_path / ".deia" / "hive" / box
+        box_dir.mkdir(parents=True)
+        for n in range(7):
+            name = f"2025-10-20-{1000 + n:04d}-Q33N-BOT{n}-TASK-item-{n}.md"
+            (box_dir / name).write_text(f"# TASK: Item {n}\n\nSubject: {box} {n}\n", encoding="utf-8")
+    return tmp_path
+
+
+def _strip_ingest_ts(result):
+    for row in result["sessions"]:
+        row.pop("ts_ingested", None)
+    return result
+
+
+class TestParallelExtraction:
+    """Process-pool extraction matches serial output."""
+
+    def test_sessions_parallel_matches_serial(self, project):
+        serial = _strip_ingest_ts(extract_sessions(project))
+        parallel = _strip_ingest_ts(extract_sessions(project, workers=3, chunk_size=4))
+        assert parallel == serial
+        assert [s["session_id"] for s in serial["sessions"]] == [f"session-{n:03d}" for n in range(12)]
+        assert len(serial["session_decisions"]) == 24
+
+    def test_hive_parallel_matches_serial(self, project):
+        serial = extract_hive_boxes(project)
+        parallel = extract_hive_boxes(project, workers=2, chunk_size=3)
+        assert parallel == serial
+        assert len(serial["hive_tasks"]) == 7
+        assert all(row["box"] == "responses" for row in serial["hive_responses"])
+        assert serial["hive_tasks"][0]["subject"] == "tasks 0"
+
+    def test_resolve_workers(self):
+        assert resolve_workers(1) == 1
+        assert resolve_workers(4) == 4
+        assert resolve_workers(None) >= 1
+        assert resolve_workers(0) >= 1
+
+
+class TestAutorunManifest:
+    """Autorun records stage metrics in the manifest."""
+
+    def test_manifest_records_stages(self, project):
+        result = autorun(project)
+        manifest = json.loads((project / ".deia" / "analytics" / "manifest.json").read_text(encoding="utf-8"))
+        entry = manifest[-1]
+        assert entry["workers"] >= 1
+        assert entry["stages"]["sessions"]["rows"] == result["stages"]["sessions"]["rows"]
+        assert entry["stages"]["hive"]["rows"] == 14
+        assert "seconds" in entry["stages"]["write"]
+        extract_stages = ("sessions", "events", "heartbeats", "hive", "agents")
+        extracted = sum(entry["stages"][stage]["rows"] for stage in extract_stages)
+        assert entry["stages"]["write"]["rows"] == extracted
+
+    def test_config_workers_honored(self, project):
+        analytics = project / ".deia" / "analytics"
+        analytics.mkdir(parents=True, exist_ok=True)
+        (analytics / "config.json").write_text(json.dumps({"targets": ["staging_ndjson"], "workers": 2, "chunk_size": 5}))
+        autorun(project)
+        manifest = json.loads((analytics / "manifest.json").read_text(encoding="utf-8"))
+        assert manifest[-1]["workers"] == 2
@@ -0,0 +1,207 @@
+"""
+Tests for WorkflowExecutor dependency scheduling.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.deia.workflow_orchestrator import (
+    WorkflowBuilder,
+    WorkflowExecutor,
+    TaskStatus,
+    WorkflowStatus,
+)
+
+
+def cpu_square(context):
+    """Module-level so the process pool can pickle it."""
+    return sum(context.values()) ** 2
+
+
+def constant(value):
+    return lambda context: value
+
+
+class TestScheduling:
+    """Dependency ordering and ready-set tracking."""
+
+    def test_diamond_passes_dependency_results(self):
+        workflow = (
+            WorkflowBuilder(name="diamond")
+            .add_task("a", "A", constant(1))
+            .add_task("b", "B", lambda ctx: ctx["a"] + 1, depends_on=["a"])
+            .add_task("c", "C", lambda ctx: ctx["a"] + 2, depends_on=["a"])
+            .add_task("d", "D", lambda ctx: ctx["b"] * ctx["c"], depends_on=["b", "c"])
+            .build()
+        )
+
+        execution = WorkflowExecutor().execute(workflow)
+
+        assert execution.status == WorkflowStatus.SUCCESS
+        assert execution.outputs == {"a": 1, "b": 2, "c": 3, "d": 6}
+        assert all(t.status == TaskStatus.SUCCESS for t in execution.tasks.values())
+
+    def test_every_root_runs(self):
+        workflow = (
+            WorkflowBuilder()
+            .add_task("a", "A", constant("a"))
+            .add_task("b", "B", constant("b"))
+            .add_task("c", "C", lambda ctx: ctx, depends_on=["a", "b"])
+            .build()
+        )
+
+        execution = WorkflowExecutor().execute(workflow)
+
+        assert execution.outputs["c"] == {"a": "a", "b": "b"}
+
+    def test_ready_tasks_run_in_priority_order(self):
+        order = []
+        builder = WorkflowBuilder().add_task("root", "Root", constant(None))
+        for task_id, priority in [("low", 5), ("high", 0), ("mid", 2)]:
+            builder.add_task(task_id, task_id, lambda ctx, t=task_id: order.append(t),
+                             depends_on=["root"], priority=priority)
+
+        WorkflowExecutor(max_workers=1).execute(builder.build())
+
+        assert order == ["high", "mid", "low"]
+
+    def test_dependents_run_after_failure_unless_condition_skips(self):
+        def boom(ctx):
+            raise RuntimeError("boom")
+
+        workflow = (
+            WorkflowBuilder()
+            .add_task("a", "A", boom)
+            .add_task("b", "B", constant("ran"), depends_on=["a"])
+            .add_task("c", "C", constant("ran"), depends_on=["a"],
+                      condition=lambda outputs: "a" in outputs)
+            .build()
+        )
+
+        execution = WorkflowExecutor().execute(workflow)
+
+        assert execution.status == WorkflowStatus.FAILED
+        assert execution.tasks["a"].status == TaskStatus.FAILED
+        assert execution.tasks["b"].status == TaskStatus.SUCCESS
+        assert execution.tasks["c"].status == TaskStatus.SKIPPED
+        assert execution.errors == ["a: boom"]
+
+    def test_retries(self):
+        calls = []
+
+        def flaky(ctx):
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("not yet")
+            return "ok"
+
+        workflow = WorkflowBuilder().add_task("a", "A", flaky, retries=2).build()
+        execution = WorkflowExecutor(retry_delay=0).execute(workflow)
+
+        assert execution.tasks["a"].status == TaskStatus.SUCCESS
+        assert execution.tasks["a"].attempts == 3
+
+    @pytest.mark.parametrize("depends_on", [["missing"], ["b"]])
+    def test_invalid_graph_fails(self, depends_on):
+        workflow = (
+            WorkflowBuilder()
+            .add_task("a", "A", constant(1), depends_on=depends_on)
+            .add_task("b", "B", constant(1), depends_on=["a"])
+            .build()
+        )
+
+        execution = WorkflowExecutor().execute(workflow)
+
+        assert execution.status == WorkflowStatus.FAILED
+        assert execution.errors
+
+
+class TestTimeoutsAndCancellation:
+    """Timeouts and cancellation work outside the main thread."""
+
+    def test_timeout_from_worker_thread(self):
+        release = threading.Event()
+        workflow = (
+            WorkflowBuilder()
+            .add_task("slow", "Slow", lambda ctx: release.wait(5), timeout=0.1)
+            .add_task("after", "After", constant("ran"), depends_on=["slow"])
+            .build()
+        )
+        result = {}
+
+        def run():
+            result["execution"] = WorkflowExecutor().execute(workflow)
+
+        start = time.perf_counter()
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join(3)
+        elapsed = time.perf_counter() - start
+        release.set()
+
+        execution = result["execution"]
+        assert elapsed < 2
+        assert execution.tasks["slow"].status == TaskStatus.FAILED
+        assert "timeout" in execution.tasks["slow"].error
+        assert execution.tasks["after"].status == TaskStatus.SUCCESS
+
+    def test_hung_task_keeps_its_worker_slot(self):
+        workflow = (
+            WorkflowBuilder()
+            .add_task("a", "A", lambda ctx: time.sleep(1), timeout=0.2)
+            .add_task("b", "B", lambda ctx: (time.sleep(0.01), "ran")[1], timeout=0.5)
+            .build()
+        )
+
+        execution = WorkflowExecutor(max_workers=1).execute(workflow)
+
+        assert execution.tasks["a"].status == TaskStatus.FAILED
+        assert "timeout" in execution.tasks["a"].error
+        # b waits for a's worker instead of timing out in the pool queue
+        assert execution.tasks["b"].status == TaskStatus.SUCCESS
+        assert execution.outputs["b"] == "ran"
+
+    def test_cancel_stops_scheduling(self):
+        started = threading.Event()
+        release = threading.Event()
+        workflow = (
+            WorkflowBuilder()
+            .add_task("a", "A", lambda ctx: (started.set(), release.wait(5)))
+            .add_task("b", "B", constant("ran"), depends_on=["a"])
+            .build()
+        )
+        executor = WorkflowExecutor()
+        result = {}
+        thread = threading.Thread(target=lambda: result.update(execution=executor.execute(workflow)))
+        thread.start()
+        assert started.wait(2)
+
+        execution_id = next(iter(executor.executions))
+        executor.cancel_execution(execution_id)
+        thread.join(2)
+        release.set()
+
+        execution = result["execution"]
+        assert execution.status == WorkflowStatus.CANCELLED
+        assert execution.tasks["b"].status == TaskStatus.SKIPPED
+        assert execution.tasks["b"].error == "cancelled"
+
+
+class TestProcessPool:
+    """cpu_bound tasks run in a process pool."""
+
+    def test_cpu_bound_tasks(self):
+        workflow = (
+            WorkflowBuilder()
+            .add_task("a", "A", constant(2))
+            .add_task("b", "B", constant(3))
+            .add_task("sq", "Square", cpu_square, depends_on=["a", "b"], cpu_bound=True)
+            .build()
+        )
+
+        execution = WorkflowExecutor(process_workers=2).execute(workflow)
+
+        assert execution.status == WorkflowStatus.SUCCESS
+        assert execution.outputs["sq"] == 25